@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import json
+from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
 
-from ..core.pipeline import EMBEDDING_BACKEND, model
+from .. import models
+from ..core.pipeline_profiler import summarize_pipeline_runs
+from ..core.query_embedding_cache import encode_query, query_embedding_cache
+from ..core.search_cache import search_result_cache
 from ..core.vector_store import vector_store
+from ..database import get_db
 from .auth import get_current_admin_user
 
 
@@ -62,12 +69,7 @@ def search_debug(q: str, limit: int = 10):
         }
 
     top_k = max(1, min(limit, 30))
-    query_vector = []
-
-    if EMBEDDING_BACKEND != "fallback":
-        query_vector = model.encode(query)
-        if hasattr(query_vector, "tolist"):
-            query_vector = query_vector.tolist()
+    query_vector = encode_query(query)
 
     request_id = uuid4().hex
     debug_payload = vector_store.debug_search(query, query_vector, top_k=top_k)
@@ -94,3 +96,66 @@ def search_debug(q: str, limit: int = 10):
     )
 
     return response
+
+
+def _pipeline_runs_query(db: Session, status: str, doc_id: Optional[int]):
+    status_value = (status or "all").strip().lower()
+    if status_value not in {"all", "indexed", "skipped", "failed"}:
+        raise HTTPException(status_code=400, detail="status must be all|indexed|skipped|failed")
+
+    query = db.query(models.DocumentPipelineRun)
+    if status_value != "all":
+        query = query.filter(models.DocumentPipelineRun.status == status_value)
+    if doc_id is not None:
+        query = query.filter(models.DocumentPipelineRun.doc_id == doc_id)
+    return query.order_by(models.DocumentPipelineRun.id.desc())
+
+
+@router.get("/pipeline_runs")
+def list_pipeline_runs(
+    status: str = "all",
+    doc_id: Optional[int] = None,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+):
+    limit = max(1, min(limit, 500))
+    runs = _pipeline_runs_query(db, status, doc_id).limit(limit).all()
+    return [
+        {
+            "id": run.id,
+            "doc_id": run.doc_id,
+            "attempt": run.attempt,
+            "status": run.status,
+            "total_ms": run.total_ms,
+            "page_count": run.page_count,
+            "chunk_count": run.chunk_count,
+            "stages": json.loads(run.stages_json or "{}"),
+            "counts": json.loads(run.counts_json or "{}"),
+            "error": run.error,
+            "created_at": run.created_at,
+        }
+        for run in runs
+    ]
+
+
+@router.get("/pipeline_runs/summary")
+def summarize_pipeline_stage_timings(
+    status: str = "indexed",
+    limit: int = 1000,
+    db: Session = Depends(get_db),
+):
+    """Per-stage p50/p95 over the most recent runs, to show where ingest time goes."""
+    limit = max(1, min(limit, 10000))
+    runs = _pipeline_runs_query(db, status, None).limit(limit).all()
+    summary = summarize_pipeline_runs(runs)
+    summary["status"] = (status or "all").strip().lower()
+    return summary
+
+
+@router.get("/search_cache")
+def search_cache_stats():
+    """Hit rate and size of the /documents/search result and query-embedding caches."""
+    stats = search_result_cache.stats()
+    stats["index_generation"] = vector_store.index_generation
+    stats["query_embedding"] = query_embedding_cache.stats()
+    return stats
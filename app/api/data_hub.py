@@ -22,7 +22,7 @@ from ..core.data_hub_ai import (
     normalize_query,
 )
 from ..core.gemini_client import GeminiClient
-from ..core.pipeline import EMBEDDING_BACKEND, model
+from ..core.query_embedding_cache import encode_query
 from ..core.vector_store import vector_store
 from ..database import get_db
 from .auth import get_current_admin_user, get_current_user
@@ -269,14 +269,10 @@ def ask_data_hub(
         return _ask_agenda_summary(query, db=db, user=user)
 
     # 1) Retrieve candidate chunks from ES (keyword + optional vector).
-    query_vector = []
-    if EMBEDDING_BACKEND != "fallback":
-        try:
-            query_vector = model.encode(query)
-            if hasattr(query_vector, "tolist"):
-                query_vector = query_vector.tolist()
-        except Exception:  # noqa: BLE001
-            query_vector = []
+    try:
+        query_vector = encode_query(query)
+    except Exception:  # noqa: BLE001
+        query_vector = []
 
     candidate_k = max(int(payload.top_k) * 6, 30)
     debug_payload = vector_store.debug_search(query, query_vector, top_k=candidate_k)
@@ -1,4 +1,5 @@
-import html
+import asyncio
+import bisect
 import mimetypes
 import os
 import re
@@ -7,21 +8,32 @@ import threading
 import uuid
 
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from .. import models
 from ..core.auth_utils import to_iso, utcnow
-from ..core.document_summary import (
-    classify_document_types,
-    parse_document_types,
-    serialize_document_types,
-)
+from ..core.document_summary import parse_document_types
 from ..core.dedup.policies import resolve_policy, search_penalty_for_non_primary
 from ..core.dedup.service import compute_document_hashes
-from ..core.pipeline import EMBEDDING_BACKEND, process_document, model
-from ..core.vector_store import vector_store
+from ..core.display_text import alnum_ratio, clean_display_text, hit_display, sentence_spans
+from ..core.pipeline import process_document
+from ..core.query_embedding_cache import encode_query
+from ..core.search_cache import CachedSearch, normalize_search_query, search_result_cache
+from ..core.search_cursor import (
+    LegCursor,
+    SearchCursor,
+    SearchCursorStateExpired,
+    decode_search_cursor,
+    encode_search_cursor,
+    search_cursor_key,
+    search_cursor_states,
+)
+from ..core.search_filters import NO_FILTERS, SearchFilters, parse_search_filters
+from ..core.search_replay import SearchTrace, search_record, search_replay_log
+from ..core.vector_store import RRF_K, SearchCursorExpired, vector_store
 from .auth import get_current_user
 
 router = APIRouter(
@@ -44,13 +56,18 @@ SNIPPET_RADIUS_AFTER = 168
 SNIPPET_MAX_LENGTH = 240
 SUMMARY_MAX_LENGTH = 160
 EVIDENCE_MAX_SENTENCES = 2
-SEARCH_CANDIDATE_MULTIPLIER = 4
-SEARCH_CANDIDATE_MIN = 20
+# Candidates reranked per request: max(page * page_size * multiplier, min). Tune with
+# `python -m benchmarks.replay` (latency and overlap@k against a baseline run).
+SEARCH_CANDIDATE_MULTIPLIER = max(1, int(os.getenv("SEARCH_CANDIDATE_MULTIPLIER", "4")))
+SEARCH_CANDIDATE_MIN = max(1, int(os.getenv("SEARCH_CANDIDATE_MIN", "20")))
 SEARCH_CLUSTER_DIVERSITY = (
     os.getenv("SEARCH_CLUSTER_DIVERSITY", "true").strip().lower()
     in {"1", "true", "yes", "on"}
 )
-_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。！？])\s+|\s+\|\s+|\n+")
+# Cursor pages fetch page_size * multiplier hits per retrieval leg and round.
+SEARCH_CURSOR_WINDOW_MULTIPLIER = max(1, int(os.getenv("SEARCH_CURSOR_WINDOW_MULTIPLIER", "3")))
+SEARCH_CURSOR_MAX_ROUNDS = 4
+SEARCH_CURSOR_MAX_PAGE_SIZE = max(1, int(os.getenv("SEARCH_CURSOR_MAX_PAGE_SIZE", "100")))
 _QUERY_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*|[가-힣]+")
 SUPPORTED_UPLOAD_EXTENSIONS = {".pdf", ".xlsx", ".xlsm", ".xltx", ".xltm", ".csv"}
 SPREADSHEET_EXTENSIONS = {".xlsx", ".xlsm", ".xltx", ".xltm", ".csv"}
@@ -148,37 +165,66 @@ def _tokenize_query(query: str) -> list[str]:
     return sorted(tokens, key=len, reverse=True)
 
 
-def _clean_display_text(value: str) -> str:
-    text = html.unescape(value or "")
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
-
-
-def _split_sentences(text: str) -> list[str]:
-    sentences = []
-    for segment in _SENTENCE_SPLIT_PATTERN.split(text or ""):
-        cleaned = segment.strip()
-        if cleaned:
-            sentences.append(cleaned)
-    return sentences
-
+class _QueryMatcher:
+    """Query tokens and patterns prepared once per search and applied to every candidate hit."""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.query_lower = query.strip().lower()
+        self.tokens = _tokenize_query(query)
+        self.lowered_tokens = [token.lower() for token in self.tokens]
+        # Longest alternatives first (tokens are sorted by length), so a match start is the
+        # earliest position any token occurs at.
+        self._token_pattern = (
+            re.compile("|".join(re.escape(token) for token in self.lowered_tokens))
+            if self.lowered_tokens
+            else None
+        )
 
-def _build_snippet(content: str, query: str) -> str:
-    text = _clean_display_text(content)
+    def token_counts(self, text_lower: str) -> list[int]:
+        return [text_lower.count(token) for token in self.lowered_tokens]
+
+    def matched_terms(self, counts: list[int]) -> list[str]:
+        return [token for token, count in zip(self.tokens, counts) if count]
+
+    def phrase_count(self, text_lower: str) -> int:
+        return text_lower.count(self.query_lower) if self.query_lower else 0
+
+    def first_hit(self, text_lower: str) -> int:
+        if self._token_pattern is None:
+            return -1
+        match = self._token_pattern.search(text_lower)
+        return match.start() if match else -1
+
+    def sentences_with_hits(
+        self,
+        text: str,
+        text_lower: str,
+        spans: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[int, str]]:
+        """(index, sentence) pairs that contain a query token, in document order.
+
+        One token-pattern pass over the whole text marks the sentences worth scoring; tokens
+        carry no whitespace, so no match crosses a sentence separator. A phrase match always
+        contains a token, except for queries without tokens, which scan every sentence.
+        `spans` are the sentence offsets stored at index time, if any.
+        """
+        if self._token_pattern is None or len(text_lower) != len(text):
+            return [(index, text[start:end]) for index, (start, end) in enumerate(spans or sentence_spans(text))]
+        hit_positions = [match.start() for match in self._token_pattern.finditer(text_lower)]
+        if not hit_positions:
+            return []
+        spans = spans if spans is not None else sentence_spans(text)
+        starts = [start for start, _ in spans]
+        indexes = sorted({bisect.bisect_right(starts, position) - 1 for position in hit_positions})
+        return [(index, text[spans[index][0]:spans[index][1]]) for index in indexes if index >= 0]
+
+
+def _build_snippet(text: str, matcher: _QueryMatcher, lowered: str | None = None) -> str:
     if not text:
         return ""
 
-    lowered = text.lower()
-    first_hit = -1
-    for token in _tokenize_query(query):
-        position = lowered.find(token.lower())
-        if position == -1:
-            continue
-        if first_hit == -1 or position < first_hit:
-            first_hit = position
+    first_hit = matcher.first_hit(lowered if lowered is not None else text.lower())
 
     if first_hit == -1:
         snippet = text[:SNIPPET_MAX_LENGTH].strip()
@@ -201,25 +247,30 @@ def _extract_highlight_snippet(hit: dict) -> str:
         return ""
 
     for fragment in fragments:
-        snippet = _clean_display_text(fragment)
+        snippet = clean_display_text(fragment)
         if snippet:
             return snippet
     return ""
 
 
-def _extract_evidence_sentences(content: str, query: str, tokens: list[str]) -> list[str]:
-    body = _clean_display_text(content)
+def _extract_evidence_sentences(
+    body: str,
+    matcher: _QueryMatcher,
+    lowered: str | None = None,
+    spans: list[tuple[int, int]] | None = None,
+) -> list[str]:
     if not body:
         return []
 
-    query_lower = query.strip().lower()
+    lowered = lowered if lowered is not None else body.lower()
     scored = []
 
-    for index, sentence in enumerate(_split_sentences(body)):
+    for index, sentence in matcher.sentences_with_hits(body, lowered, spans):
         sentence_lower = sentence.lower()
-        phrase_hits = sentence_lower.count(query_lower) if query_lower else 0
-        token_hits = sum(1 for token in tokens if token.lower() in sentence_lower)
-        token_freq = sum(sentence_lower.count(token.lower()) for token in tokens)
+        phrase_hits = matcher.phrase_count(sentence_lower)
+        counts = matcher.token_counts(sentence_lower)
+        token_hits = sum(1 for count in counts if count)
+        token_freq = sum(counts)
 
         if phrase_hits == 0 and token_hits == 0:
             continue
@@ -250,9 +301,7 @@ def _extract_evidence_sentences(content: str, query: str, tokens: list[str]) ->
         return evidence
 
     fallback_windows = []
-    lowered = body.lower()
-    for token in tokens:
-        token_lower = token.lower()
+    for token_lower in matcher.lowered_tokens:
         position = lowered.find(token_lower)
         if position == -1:
             continue
@@ -272,7 +321,7 @@ def _extract_evidence_sentences(content: str, query: str, tokens: list[str]) ->
     if fallback_windows:
         return fallback_windows
 
-    fallback = _build_snippet(body, query)
+    fallback = _build_snippet(body, matcher, lowered)
     return [fallback] if fallback else []
 
 
@@ -300,13 +349,13 @@ def _build_summary(
     return summary
 
 
-def _text_noise_penalty(text: str) -> float:
+def _text_noise_penalty(text: str, ratio: float | None = None) -> float:
     body = text or ""
     if not body:
         return 1.2
 
-    meaningful = sum(1 for ch in body if ch.isalnum())
-    ratio = meaningful / max(len(body), 1)
+    if ratio is None:
+        ratio = alnum_ratio(body)
     if ratio >= 0.6:
         return 0.0
     return (0.6 - ratio) * 2.5
@@ -370,16 +419,19 @@ def _should_filter_low_evidence_spreadsheet_or_failure_doc(
     return len(matched_terms) < required_token_matches
 
 
-def _rerank_hits(hits: list[dict], query: str) -> list[dict]:
-    tokens = _tokenize_query(query)
-    query_lower = query.strip().lower()
+def _rerank_hits(hits: list[dict], query: str, build_display: bool = True) -> list[dict]:
+    """Score and sort hits; `build_display=False` leaves snippet/evidence/summary to `_attach_display`."""
+    matcher = _QueryMatcher(query)
+    tokens = matcher.tokens
+    query_lower = matcher.query_lower
     reranked = []
     dedup_policy = resolve_policy()
 
     for hit in hits:
         source = hit.get("_source", {})
-        content = _clean_display_text(source.get("content") or "")
-        filename = _clean_display_text(source.get("filename") or "")
+        display = hit_display(source)
+        content = display.text
+        filename = clean_display_text(source.get("filename") or "")
         document_types = parse_document_types(source.get("document_types"))
         content_lower = content.lower()
 
@@ -387,9 +439,10 @@ def _rerank_hits(hits: list[dict], query: str) -> list[dict]:
             continue
 
         base_score = float(hit.get("_score") or 0.0)
-        matched_terms = [token for token in tokens if token.lower() in content_lower]
-        token_frequency = sum(content_lower.count(token.lower()) for token in tokens)
-        phrase_count = content_lower.count(query_lower) if query_lower else 0
+        token_counts = matcher.token_counts(content_lower)
+        matched_terms = matcher.matched_terms(token_counts)
+        token_frequency = sum(token_counts)
+        phrase_count = matcher.phrase_count(content_lower)
         all_terms_matched = bool(tokens) and len(matched_terms) == len(tokens)
 
         if _should_filter_low_evidence_spreadsheet_or_failure_doc(
@@ -402,9 +455,11 @@ def _rerank_hits(hits: list[dict], query: str) -> list[dict]:
         ):
             continue
 
-        filename_hits = sum(1 for token in tokens if token.lower() in filename.lower())
-        highlight_bonus = 0.35 if _extract_highlight_snippet(hit) else 0.0
-        noise_penalty = _text_noise_penalty(content)
+        filename_lower = filename.lower()
+        filename_hits = sum(1 for token in matcher.lowered_tokens if token in filename_lower)
+        highlight_snippet = _extract_highlight_snippet(hit)
+        highlight_bonus = 0.35 if highlight_snippet else 0.0
+        noise_penalty = _text_noise_penalty(content, display.alnum_ratio)
         placeholder_penalty = 0.0
         dedup_penalty = search_penalty_for_non_primary(
             source,
@@ -424,22 +479,15 @@ def _rerank_hits(hits: list[dict], query: str) -> list[dict]:
             - dedup_penalty
         )
 
-        highlight_snippet = _extract_highlight_snippet(hit)
-        snippet = highlight_snippet or _build_snippet(content, query)
-        evidence = _extract_evidence_sentences(content, query, tokens)
-        summary = _build_summary(filename, query, snippet, evidence, matched_terms)
-
-        reranked.append(
-            {
-                "hit": hit,
-                "snippet": snippet,
-                "summary": summary,
-                "evidence": evidence,
-                "matched_terms": matched_terms,
-                "rerank_score": rerank_score,
-                "raw_score": base_score,
-            }
-        )
+        result = {
+            "hit": hit,
+            "matched_terms": matched_terms,
+            "rerank_score": rerank_score,
+            "raw_score": base_score,
+        }
+        if build_display:
+            _build_result_display(result, matcher, display, content_lower, filename, highlight_snippet)
+        reranked.append(result)
 
     reranked.sort(
         key=lambda item: (item["rerank_score"], item["raw_score"]),
@@ -448,6 +496,50 @@ def _rerank_hits(hits: list[dict], query: str) -> list[dict]:
     return reranked
 
 
+def _build_result_display(
+    result: dict,
+    matcher: _QueryMatcher,
+    display,
+    content_lower: str,
+    filename: str,
+    highlight_snippet: str,
+) -> None:
+    display_text = display.evidence_text
+    display_lower = content_lower if display_text is display.text else display_text.lower()
+    snippet = highlight_snippet or _build_snippet(display_text, matcher, display_lower)
+    evidence = _extract_evidence_sentences(display_text, matcher, display_lower, display.spans)
+    summary = _build_summary(filename, matcher.query, snippet, evidence, result["matched_terms"])
+    # Cached entries are shared across requests: publish all fields in one update, with
+    # "summary" last, which is the key _attach_display checks.
+    result.update({"snippet": snippet, "evidence": evidence, "summary": summary})
+
+
+def _attach_display(results: list[dict], query: str) -> list[dict]:
+    """Fill snippet/evidence/summary for the served page only.
+
+    Results are the (cached) rerank entries themselves, so a page rendered once is not
+    rebuilt when it is served again from the search cache.
+    """
+    matcher = None
+    for result in results:
+        if "summary" in result:
+            continue
+        if matcher is None:
+            matcher = _QueryMatcher(query)
+        hit = result["hit"]
+        source = hit.get("_source", {})
+        display = hit_display(source)
+        _build_result_display(
+            result,
+            matcher,
+            display,
+            display.text.lower(),
+            clean_display_text(source.get("filename") or ""),
+            _extract_highlight_snippet(hit),
+        )
+    return results
+
+
 def _apply_cluster_diversity(reranked_hits: list[dict], limit: int) -> list[dict]:
     if not SEARCH_CLUSTER_DIVERSITY:
         return reranked_hits[:limit]
@@ -533,98 +625,55 @@ async def upload_document(
 
     return {"id": db_doc.id, "status": "pending"}
 
-@router.get("/search")
-def search_documents(
-    q: str,
-    page: int = 1,
-    page_size: int = 10,
-    limit: int | None = None,
-    db: Session = Depends(get_db),
-):
-    query = (q or "").strip()
-    page = max(1, int(page or 1))
-    if limit is not None:
-        page_size = int(limit)
-    page_size = max(1, min(int(page_size or 10), 20))
-    if not query:
-        return {
-            "items": [],
-            "page": page,
-            "page_size": page_size,
-            "total": 0,
-        }
 
-    end_index = page * page_size
-    start_index = max(0, (page - 1) * page_size)
-    candidate_limit = max(end_index * SEARCH_CANDIDATE_MULTIPLIER, SEARCH_CANDIDATE_MIN)
-
-    # 1. Generate query vector (disabled when fallback embedder is active).
-    query_vector = []
-    if EMBEDDING_BACKEND != "fallback":
-        query_vector = model.encode(query)
-        if hasattr(query_vector, "tolist"):
-            query_vector = query_vector.tolist()
-    
-    # 2. Search ES
-    results = vector_store.search(query, query_vector, top_k=candidate_limit)
-    
-    hits = results.get("hits", {}).get("hits", [])
-    reranked_hits = _rerank_hits(hits, query)
-    reranked_hits = _apply_cluster_diversity(reranked_hits, limit=end_index)
-    total = len(reranked_hits)
-    paged_hits = reranked_hits[start_index:end_index]
+def _related_chunks(hit: dict) -> list[dict]:
+    """Next-best chunks of the same document from ES collapse inner_hits (ES_COLLAPSE_INNER_HITS)."""
+    inner = hit.get("inner_hits", {}).get("best_chunks", {}).get("hits", {}).get("hits", [])
+    chunks = []
+    for item in inner:
+        if item.get("_id") == hit.get("_id"):
+            continue
+        source = item.get("_source", {})
+        chunks.append({"chunk_id": source.get("chunk_id"), "page": source.get("page")})
+    return chunks
+
 
+def _load_search_documents(paged_hits: list[dict], db: Session) -> dict[int, models.Document]:
     doc_ids = {
         result.get("hit", {}).get("_source", {}).get("doc_id")
         for result in paged_hits
     }
     doc_ids = {doc_id for doc_id in doc_ids if isinstance(doc_id, int)}
-    document_map = {}
-    if doc_ids:
-        docs = db.query(models.Document).filter(models.Document.id.in_(doc_ids)).all()
-        document_map = {item.id: item for item in docs}
+    if not doc_ids:
+        return {}
+    docs = db.query(models.Document).filter(models.Document.id.in_(doc_ids)).all()
+    return {item.id: item for item in docs}
 
+
+def _format_search_results(paged_hits: list[dict], document_map: dict[int, models.Document]) -> list[dict]:
     output = []
-    has_doc_type_updates = False
     for result in paged_hits:
         hit = result["hit"]
         source = hit.get("_source", {})
         doc_id = source.get("doc_id")
         db_doc = document_map.get(doc_id)
 
-        title = _clean_display_text(
+        title = clean_display_text(
             source.get("ai_title")
             or (db_doc.ai_title if db_doc else "")
             or source.get("filename")
             or ""
         )
-        doc_summary = _clean_display_text(
+        doc_summary = clean_display_text(
             source.get("ai_summary_short")
             or (db_doc.ai_summary_short if db_doc else "")
             or ""
         )
-        source_doc_types = parse_document_types(source.get("document_types"))
-        db_doc_types = parse_document_types(db_doc.document_types if db_doc else "")
-        document_types = source_doc_types or db_doc_types
-        if not document_types:
-            type_hint_text = "\n".join(
-                part
-                for part in (
-                    _clean_display_text(source.get("content") or ""),
-                    title,
-                    doc_summary,
-                    _clean_display_text(source.get("filename") or ""),
-                )
-                if part
-            )
-            inferred_types = classify_document_types(
-                filename=source.get("filename") or (db_doc.filename if db_doc else ""),
-                content_text=type_hint_text,
-            )
-            document_types = inferred_types
-            if db_doc and inferred_types and not db_doc_types:
-                db_doc.document_types = serialize_document_types(inferred_types)
-                has_doc_type_updates = True
+        # Read-only: documents stored without types are classified by the background
+        # backfill (core/document_type_backfill.py), not by search requests.
+        document_types = parse_document_types(source.get("document_types")) or parse_document_types(
+            db_doc.document_types if db_doc else ""
+        )
         if not doc_summary:
             doc_summary = result["summary"]
 
@@ -637,10 +686,12 @@ def search_documents(
             "chunk_type": source.get("chunk_type"),
             "table_cell_refs": source.get("table_cell_refs"),
             "table_layout": source.get("table_layout"),
+            "table_id": source.get("table_id"),
             "dedup_status": source.get("dedup_status"),
             "dedup_primary_doc_id": source.get("dedup_primary_doc_id"),
             "dedup_cluster_id": source.get("dedup_cluster_id"),
             "document_types": document_types,
+            "related_chunks": _related_chunks(hit),
             "snippet": result["snippet"],
             "summary": doc_summary,
             "evidence": result["evidence"],
@@ -649,10 +700,315 @@ def search_documents(
             "raw_score": result["raw_score"],
         })
 
-    if has_doc_type_updates:
-        db.commit()
+    return output
+
+
+def _fuse_leg_pages(
+    keyword_hits: list[dict],
+    vector_hits: list[dict],
+    state: SearchCursor,
+    seen_doc_ids: set,
+) -> list[dict]:
+    """RRF over one page of each leg with ranks continuing from earlier pages, best hit per doc."""
+    fused: dict[str, dict] = {}
+    for leg, hits in ((state.keyword, keyword_hits), (state.vector, vector_hits)):
+        for rank, hit in enumerate(hits, start=leg.rank + 1):
+            hit_id = hit.get("_id")
+            if not hit_id:
+                continue
+            # Keyword hits come first, so a fused entry keeps the keyword highlight.
+            entry = fused.setdefault(hit_id, {"hit": hit, "score": 0.0})
+            entry["score"] += 1.0 / (RRF_K + rank)
+
+    best_by_doc: dict[int, dict] = {}
+    for entry in fused.values():
+        doc_id = entry["hit"].get("_source", {}).get("doc_id")
+        if doc_id is None or doc_id in seen_doc_ids:
+            continue
+        current = best_by_doc.get(doc_id)
+        if current is None or entry["score"] > current["score"]:
+            best_by_doc[doc_id] = entry
+
+    candidates = []
+    for entry in sorted(best_by_doc.values(), key=lambda item: item["score"], reverse=True):
+        hit = dict(entry["hit"])
+        hit["_score"] = entry["score"]
+        candidates.append(hit)
+    return candidates
+
+
+def _advance_leg(leg: LegCursor, hits: list[dict], window: int, seen_doc_ids: set) -> None:
+    # Move past the longest prefix of hits whose documents are settled; ranked-but-unserved
+    # hits after it are fetched again with the next page.
+    consumed = 0
+    for hit in hits:
+        doc_id = hit.get("_source", {}).get("doc_id")
+        if doc_id is not None and doc_id not in seen_doc_ids:
+            break
+        consumed += 1
+    if consumed:
+        leg.after = hits[consumed - 1].get("sort")
+        leg.rank += consumed
+    leg.exhausted = len(hits) < window and consumed == len(hits)
+
+
+def _search_cursor_page(
+    query: str,
+    cursor: str | None,
+    page_size: int,
+    trace: SearchTrace,
+    filters: SearchFilters = NO_FILTERS,
+) -> tuple[list[dict], SearchCursor]:
+    dedup_policy = resolve_policy()
+    # Unfiltered keys are unchanged, so cursors issued before filters existed stay valid.
+    filter_parts = [repr(filters.key)] if filters.active else []
+    query_key = search_cursor_key(query, dedup_policy.dedup_mode, dedup_policy.index_policy, *filter_parts)
+    if cursor:
+        try:
+            state = decode_search_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid search cursor.")
+        if state.query_key != query_key:
+            raise HTTPException(status_code=400, detail="Search cursor does not match the query.")
+    else:
+        state = SearchCursor(query_key=query_key, pit_id=vector_store.open_point_in_time())
+
+    try:
+        seen_doc_ids, seen_clusters = search_cursor_states.load(state.settled)
+    except SearchCursorStateExpired:
+        raise HTTPException(status_code=410, detail="Search cursor expired. Run the search again.")
+    settled_doc_ids, settled_clusters = set(seen_doc_ids), set(seen_clusters)
+
+    query_vector = trace.timed("encode", encode_query, query)
+    window = max(page_size * SEARCH_CURSOR_WINDOW_MULTIPLIER, SEARCH_CANDIDATE_MIN)
+    page_results: list[dict] = []
+
+    for _ in range(SEARCH_CURSOR_MAX_ROUNDS):
+        if len(page_results) >= page_size or state.exhausted:
+            break
+        leg_hits = {}
+        for name, leg in (("keyword", state.keyword), ("vector", state.vector)):
+            if leg.exhausted:
+                leg_hits[name] = []
+                continue
+            try:
+                with trace.stage(name):
+                    response = vector_store.search_leg_page(
+                        name,
+                        query,
+                        query_vector,
+                        window,
+                        backend=state.backend,
+                        pit_id=state.pit_id,
+                        search_after=leg.after,
+                        filters=filters,
+                    )
+            except SearchCursorExpired:
+                raise HTTPException(status_code=410, detail="Search cursor expired. Run the search again.")
+            state.backend = response["backend"]
+            state.pit_id = response["pit_id"]
+            leg_hits[name] = response["hits"]
+
+        candidates = trace.timed(
+            "fuse", _fuse_leg_pages, leg_hits["keyword"], leg_hits["vector"], state, seen_doc_ids
+        )
+        reranked = trace.timed("rerank", _rerank_hits, candidates, query)
+        # Documents dropped by reranking filters are settled too, as in page mode.
+        seen_doc_ids.update(hit["_source"]["doc_id"] for hit in candidates)
+        pending_doc_ids = set()
+        for result in reranked:
+            source = result["hit"].get("_source", {})
+            cluster_id = source.get("dedup_cluster_id")
+            cluster_key = "" if cluster_id in (None, "") else str(cluster_id)
+            if SEARCH_CLUSTER_DIVERSITY and cluster_key and cluster_key in seen_clusters:
+                continue
+            if len(page_results) >= page_size:
+                pending_doc_ids.add(source.get("doc_id"))
+                continue
+            page_results.append(result)
+            if cluster_key:
+                seen_clusters.add(cluster_key)
+        seen_doc_ids -= pending_doc_ids
+
+        _advance_leg(state.keyword, leg_hits["keyword"], window, seen_doc_ids)
+        _advance_leg(state.vector, leg_hits["vector"], window, seen_doc_ids)
+
+    if not state.exhausted:
+        state.settled = search_cursor_states.save(
+            state.settled, seen_doc_ids - settled_doc_ids, seen_clusters - settled_clusters
+        )
+    state.page += 1
+    state.served += len(page_results)
+    return page_results, state
+
+
+def _search_documents_by_cursor(
+    query: str,
+    cursor: str | None,
+    page_size: int,
+    db: Session,
+    trace: SearchTrace,
+    filters: SearchFilters = NO_FILTERS,
+) -> dict:
+    paged_hits, state = _search_cursor_page(query, cursor, page_size, trace, filters)
+    next_cursor = None
+    if state.exhausted:
+        vector_store.close_point_in_time(state.pit_id)
+    else:
+        next_cursor = encode_search_cursor(state)
     return {
-        "items": output,
+        "items": _format_search_results(paged_hits, trace.timed("db", _load_search_documents, paged_hits, db)),
+        "page": state.page,
+        "page_size": page_size,
+        "total": state.served,
+        "next_cursor": next_cursor,
+    }
+
+
+async def _search_candidates(
+    query: str,
+    candidate_limit: int,
+    trace: SearchTrace,
+    filters: SearchFilters = NO_FILTERS,
+) -> list[dict]:
+    """Hybrid candidates with the keyword leg running while the query is being encoded.
+
+    Embedding and Elasticsearch clients are blocking, so each step runs in the threadpool;
+    the vector leg starts as soon as its vector is ready. Filters are applied inside both
+    legs, so the candidate budget is spent on matching documents only.
+    """
+
+    async def vector_leg():
+        query_vector = await run_in_threadpool(trace.timed, "encode", encode_query, query)
+        return await run_in_threadpool(
+            trace.timed, "vector", vector_store.search_vector_leg, query_vector, candidate_limit, filters
+        )
+
+    keyword, vector = await asyncio.gather(
+        run_in_threadpool(trace.timed, "keyword", vector_store.search_keyword_leg, query, candidate_limit, filters),
+        vector_leg(),
+    )
+    with trace.stage("fuse"):
+        results = vector_store.fuse_search_legs(query, keyword, vector, candidate_limit)
+    return results.get("hits", {}).get("hits", [])
+
+
+def _rerank_candidates(hits: list[dict], query: str) -> list[dict]:
+    # Snippets and evidence are only built for the page that is served (_attach_display).
+    reranked_hits = _rerank_hits(hits, query, build_display=False)
+    # Keep the whole diversified candidate list so later pages are served by slicing.
+    return _apply_cluster_diversity(reranked_hits, limit=len(reranked_hits))
+
+
+def _record_search(
+    query: str,
+    page: int,
+    page_size: int,
+    mode: str,
+    items: list[dict],
+    trace: SearchTrace,
+    cached: bool = False,
+    filters: SearchFilters = NO_FILTERS,
+) -> None:
+    if search_replay_log.enabled:
+        doc_ids = [item.get("doc_id") for item in items]
+        search_replay_log.record(
+            search_record(
+                query, page, page_size, mode, doc_ids, trace, cached=cached, filters=filters.as_params()
+            )
+        )
+
+
+@router.get("/search")
+async def search_documents(
+    q: str,
+    page: int = 1,
+    page_size: int = 10,
+    limit: int | None = None,
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    project_id: str | None = None,
+    doc_types: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """Page mode (`page`) reranks a candidate list covering every page up to the requested one.
+
+    Cursor mode (`use_cursor=true` for the first page, then `cursor=<next_cursor>`) pages
+    through a point-in-time snapshot with search_after, costing about one page of work per
+    request; `total` is then the number of results served so far.
+
+    Blocking work (encoding, Elasticsearch, reranking, the DB) runs in the threadpool with
+    independent steps overlapped, so a request holds a worker thread per step, not for the
+    sum of all of them.
+
+    Optional filters, applied inside the index before ranking: `project_id` and `doc_types`
+    (comma-separated, any value matches) and `date_from`/`date_to` (YYYY-MM-DD, inclusive,
+    on the document's upload date).
+    """
+    try:
+        filters = parse_search_filters(project_id, doc_types, date_from, date_to)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    query = normalize_search_query(q)
+    page = max(1, int(page or 1))
+    if limit is not None:
+        page_size = int(limit)
+    cursor_mode = bool(cursor) or use_cursor
+    max_page_size = SEARCH_CURSOR_MAX_PAGE_SIZE if cursor_mode else 20
+    page_size = max(1, min(int(page_size or 10), max_page_size))
+    if not query:
+        response = {
+            "items": [],
+            "page": page,
+            "page_size": page_size,
+            "total": 0,
+        }
+        if cursor_mode:
+            response["next_cursor"] = None
+        return response
+
+    trace = SearchTrace()
+    if cursor_mode:
+        response = await run_in_threadpool(
+            _search_documents_by_cursor, query, cursor, page_size, db, trace, filters
+        )
+        _record_search(query, response["page"], page_size, "cursor", response["items"], trace, filters=filters)
+        return response
+
+    end_index = page * page_size
+    start_index = max(0, (page - 1) * page_size)
+    dedup_policy = resolve_policy()
+    cache_key = (query, dedup_policy.dedup_mode, dedup_policy.index_policy, filters.key)
+    # Read before searching: a write that lands mid-search leaves this entry already stale.
+    generation = vector_store.index_generation
+    cached = search_result_cache.get(cache_key, generation, end_index)
+    cache_hit = cached is not None
+    if cached is None:
+        candidate_limit = max(end_index * SEARCH_CANDIDATE_MULTIPLIER, SEARCH_CANDIDATE_MIN)
+        hits = await _search_candidates(query, candidate_limit, trace, filters)
+        reranked_hits = await run_in_threadpool(trace.timed, "rerank", _rerank_candidates, hits, query)
+        cached = CachedSearch(
+            results=reranked_hits,
+            generation=generation,
+            exhausted=len(hits) < candidate_limit,
+        )
+        search_result_cache.put(cache_key, cached)
+
+    reranked_hits = cached.results[:end_index]
+    total = len(reranked_hits)
+    paged_hits = reranked_hits[start_index:end_index]
+
+    # The document lookup overlaps with snippet/evidence building for the page.
+    document_map, _ = await asyncio.gather(
+        run_in_threadpool(trace.timed, "db", _load_search_documents, paged_hits, db),
+        run_in_threadpool(trace.timed, "display", _attach_display, paged_hits, query),
+    )
+    items = _format_search_results(paged_hits, document_map)
+    _record_search(query, page, page_size, "page", items, trace, cached=cache_hit, filters=filters)
+    return {
+        "items": items,
         "page": page,
         "page_size": page_size,
         "total": total,
@@ -677,6 +1033,26 @@ def download_document(doc_id: int, db: Session = Depends(get_db)):
         media_type=media_type,
     )
 
+@router.get("/{doc_id}/tables/{table_id}")
+def get_document_table(doc_id: int, table_id: str, db: Session = Depends(get_db)):
+    table = (
+        db.query(models.DocumentTable)
+        .filter(models.DocumentTable.doc_id == doc_id, models.DocumentTable.table_id == table_id)
+        .first()
+    )
+    if not table:
+        raise HTTPException(status_code=404, detail="Table not found")
+    return {
+        "doc_id": int(table.doc_id),
+        "table_id": table.table_id,
+        "page": table.page,
+        "table_index": table.table_index,
+        "section_title": table.section_title,
+        "raw_text": table.raw_text,
+        "markdown": table.markdown,
+    }
+
+
 @router.get("/{doc_id}")
 def get_document_status(doc_id: int, db: Session = Depends(get_db)):
     doc = db.query(models.Document).filter(models.Document.id == doc_id).first()
@@ -692,6 +1068,7 @@ def get_document_status(doc_id: int, db: Session = Depends(get_db)):
         "document_types": doc.document_types,
         "ai_title": doc.ai_title,
         "ai_summary_short": doc.ai_summary_short,
+        "ai_summary_status": doc.ai_summary_status,
         "dedup_status": doc.dedup_status,
         "dedup_primary_doc_id": doc.dedup_primary_doc_id,
         "dedup_cluster_id": doc.dedup_cluster_id,
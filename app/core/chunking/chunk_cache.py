@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from dataclasses import asdict, fields
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..parsing.reflow import ReflowConfig
+from .chunker import ChunkRecord, TableEntity, chunker_from_env
+
+# Bump when parsing/chunking code changes in a way that alters output for the same config.
+PARSE_CACHE_VERSION = "5"
+
+CHUNK_CACHE_ENABLED = os.getenv("CHUNK_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+CHUNK_CACHE_DIR = os.getenv("CHUNK_CACHE_DIR", "uploads/.cache/chunks").strip() or "uploads/.cache/chunks"
+# Least-recently-used entries are removed once the cache directory grows past this (0 = unbounded).
+CHUNK_CACHE_MAX_BYTES = max(0, int(os.getenv("CHUNK_CACHE_MAX_BYTES", "1073741824")))
+# A sweep trims the cache to this fraction of the budget so it does not run on every store.
+_SWEEP_TARGET_RATIO = 0.9
+
+# Embedding fields belong to downstream stages; they are restamped on load instead of keyed.
+_DOWNSTREAM_FIELDS = {"embedding_model_name", "embedding_model_version"}
+_RECORD_FIELDS = [item.name for item in fields(ChunkRecord) if item.name not in _DOWNSTREAM_FIELDS]
+_TABLE_FIELDS = [item.name for item in fields(TableEntity)]
+
+
+def build_parse_fingerprint(extra: Optional[dict] = None) -> str:
+    payload = {
+        "version": PARSE_CACHE_VERSION,
+        "reflow": asdict(ReflowConfig.from_env()),
+        "chunker": chunker_from_env(),
+        "extra": extra or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _cache_path(file_sha256: str, fingerprint: str, cache_dir: Optional[str]) -> Path:
+    return Path(cache_dir or CHUNK_CACHE_DIR) / file_sha256[:2] / f"{file_sha256}-{fingerprint[:24]}.jsonl"
+
+
+# Estimated size per cache directory (bytes at the last sweep plus bytes stored since then).
+_cache_bytes: Dict[str, int] = {}
+_sweep_lock = threading.Lock()
+
+
+def _sweep(cache_dir: Path, max_bytes: int) -> int:
+    """Delete least-recently-used entries until the directory fits `_SWEEP_TARGET_RATIO` of the budget."""
+    entries = []
+    for path in cache_dir.glob("*/*.jsonl"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return total
+    target = int(max_bytes * _SWEEP_TARGET_RATIO)
+    evicted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= target:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    print(f"[chunk-cache] evicted {evicted} entries from {cache_dir}; {total} bytes remain")
+    return total
+
+
+def _account_store(cache_dir: Path, size: int) -> None:
+    if CHUNK_CACHE_MAX_BYTES <= 0:
+        return
+    key = str(cache_dir)
+    with _sweep_lock:
+        estimate = _cache_bytes.get(key)
+        # The first store in a process and any store that pushes the estimate past the budget
+        # rescan the directory; other processes may write to it too.
+        if estimate is None or estimate + size > CHUNK_CACHE_MAX_BYTES:
+            _cache_bytes[key] = _sweep(cache_dir, CHUNK_CACHE_MAX_BYTES)
+        else:
+            _cache_bytes[key] = estimate + size
+
+
+def remove_chunk_records(file_sha256: str, *, keep: Optional[Path] = None, cache_dir: Optional[str] = None) -> int:
+    """Delete every cached parse of `file_sha256` (other than `keep`); returns the number removed."""
+    if not file_sha256:
+        return 0
+    removed = 0
+    for path in (Path(cache_dir or CHUNK_CACHE_DIR) / file_sha256[:2]).glob(f"{file_sha256}-*.jsonl"):
+        if keep is not None and path == keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        removed += 1
+    return removed
+
+
+def load_chunk_records(
+    file_sha256: str,
+    fingerprint: str,
+    *,
+    embedding_model_name: str,
+    embedding_model_version: str,
+    cache_dir: Optional[str] = None,
+) -> Optional[Tuple[str, str, List[ChunkRecord], List[TableEntity]]]:
+    """Return cached parse output (texts, chunk records, table entities), or None on miss."""
+    if not file_sha256:
+        return None
+
+    path = _cache_path(file_sha256, fingerprint, cache_dir)
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            header = json.loads(handle.readline())
+            if header.get("fingerprint") != fingerprint:
+                return None
+            table_count = int(header.get("table_count", 0))
+            tables = []
+            records = []
+            for line in handle:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if len(tables) < table_count:
+                    tables.append(TableEntity(**{name: item.get(name) for name in _TABLE_FIELDS}))
+                    continue
+                records.append(
+                    ChunkRecord(
+                        **{name: item.get(name) for name in _RECORD_FIELDS},
+                        embedding_model_name=embedding_model_name,
+                        embedding_model_version=embedding_model_version,
+                    )
+                )
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        print(f"[chunk-cache] failed to read {path}: {exc}")
+        return None
+
+    if len(tables) != table_count or len(records) != int(header.get("chunk_count", -1)):
+        return None
+    try:
+        # mtime doubles as the last-use time for LRU eviction.
+        os.utime(path)
+    except OSError:
+        pass
+    return header.get("raw_text", ""), header.get("clean_text", ""), records, tables
+
+
+def store_chunk_records(
+    file_sha256: str,
+    fingerprint: str,
+    raw_text: str,
+    clean_text: str,
+    chunk_records: List[ChunkRecord],
+    tables: Optional[List[TableEntity]] = None,
+    *,
+    cache_dir: Optional[str] = None,
+) -> None:
+    if not file_sha256:
+        return
+
+    tables = tables or []
+    path = _cache_path(file_sha256, fingerprint, cache_dir)
+    header = {
+        "fingerprint": fingerprint,
+        "file_sha256": file_sha256,
+        "raw_text": raw_text,
+        "clean_text": clean_text,
+        "table_count": len(tables),
+        "chunk_count": len(chunk_records),
+    }
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("w", encoding="utf-8") as handle:
+            handle.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n")
+            for table in tables:
+                item = {name: getattr(table, name) for name in _TABLE_FIELDS}
+                handle.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+            for record in chunk_records:
+                item = {name: getattr(record, name) for name in _RECORD_FIELDS}
+                handle.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(temp_path, path)
+        # Parses under an older fingerprint (config or version change) are never read again.
+        remove_chunk_records(file_sha256, keep=path, cache_dir=cache_dir)
+        _account_store(Path(cache_dir or CHUNK_CACHE_DIR), path.stat().st_size)
+    except Exception as exc:  # noqa: BLE001
+        print(f"[chunk-cache] failed to write {path}: {exc}")
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
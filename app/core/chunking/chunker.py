@@ -6,6 +6,7 @@ import re
 from typing import List, Optional, Sequence, Tuple
 
 from .sentence_splitter import split_sentences
+from .token_counter import TokenCounter
 
 
 @dataclass
@@ -17,6 +18,7 @@ class SourceSegment:
     section_title: str = ""
     table_cell_refs: str = ""
     table_layout: str = ""
+    table_id: str = ""
 
 
 @dataclass
@@ -33,6 +35,7 @@ class ChunkRecord:
     embedding_model_version: str
     table_cell_refs: str = ""
     table_layout: str = ""
+    table_id: str = ""
 
 
 @dataclass
@@ -42,6 +45,46 @@ class TableRowSentence:
     layout: str
 
 
+@dataclass
+class TableEntity:
+    """A table stored once per document; row chunks point at it through `table_id`."""
+
+    table_id: str
+    page: Optional[int]
+    table_index: int
+    section_title: str
+    raw_text: str
+    markdown: str
+
+
+_TABLE_ID_RE = re.compile(r"^p(\d+)-t(\d+)$")
+
+
+def table_entity_id(page: Optional[int], table_index: int) -> str:
+    return f"p{int(page or 0)}-t{int(table_index)}"
+
+
+def collect_table_entities(segments: Sequence[SourceSegment]) -> List[TableEntity]:
+    tables: List[TableEntity] = []
+    seen = set()
+    for segment in segments:
+        if segment.chunk_type != "table_raw" or not segment.table_id or segment.table_id in seen:
+            continue
+        seen.add(segment.table_id)
+        match = _TABLE_ID_RE.match(segment.table_id)
+        tables.append(
+            TableEntity(
+                table_id=segment.table_id,
+                page=segment.page,
+                table_index=int(match.group(2)) if match else len(tables),
+                section_title=segment.section_title,
+                raw_text=segment.raw_text,
+                markdown=segment.text,
+            )
+        )
+    return tables
+
+
 def chunker_from_env() -> dict:
     dedup_identical_chunks = os.getenv("DEDUP_IDENTICAL_CHUNKS", "true").strip().lower()
     return {
@@ -53,6 +96,9 @@ def chunker_from_env() -> dict:
         "dedup_identical_chunks": dedup_identical_chunks in {"1", "true", "yes", "on"},
         "dedup_identical_chunks_min_chars": max(1, int(os.getenv("DEDUP_IDENTICAL_CHUNKS_MIN_CHARS", "40"))),
         "max_chunks_per_doc": max(0, int(os.getenv("MAX_CHUNKS_PER_DOC", "400"))),
+        "token_sizing": os.getenv("CHUNK_TOKEN_SIZING", "true").strip().lower() in {"1", "true", "yes", "on"},
+        # 0 = the embedding model's max sequence length minus special tokens.
+        "max_tokens": max(0, int(os.getenv("CHUNK_MAX_TOKENS", "0"))),
         "table_row_sentence_max_per_table": max(
             0,
             int(os.getenv("TABLE_ROW_SENTENCE_MAX_PER_TABLE", "240")),
@@ -115,11 +161,47 @@ def _split_long_sentence(sentence: str, max_chars: int) -> List[str]:
     return pieces
 
 
+def _split_to_token_budget(sentence: str, token_counter: TokenCounter) -> List[str]:
+    """Split a sentence on spaces so each piece fits the token budget."""
+    budget = token_counter.max_tokens
+    if token_counter.count(sentence) <= budget:
+        return [sentence]
+
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def _flush() -> None:
+        nonlocal current, current_tokens
+        if current:
+            pieces.append(" ".join(current))
+        current = []
+        current_tokens = 0
+
+    for word in sentence.split():
+        word_tokens = token_counter.count(word)
+        if word_tokens > budget:
+            # A single unbroken run (URL, long code): cut it proportionally by characters.
+            _flush()
+            step = max(1, len(word) * budget // word_tokens)
+            pieces.extend(word[start : start + step] for start in range(0, len(word), step))
+            continue
+        if current and current_tokens + word_tokens > budget:
+            _flush()
+        current.append(word)
+        current_tokens += word_tokens
+    _flush()
+    return pieces
+
+
 def _build_sentence_chunks(
     sentences: Sequence[str],
     max_chars: int,
     overlap_sentences: int,
+    token_counter: Optional[TokenCounter] = None,
 ) -> List[str]:
+    """Pack sentences into chunks of at most `max_chars` and, with a token counter, at most
+    `token_counter.max_tokens` tokens so the embedding model never truncates a chunk."""
     if not sentences:
         return []
 
@@ -128,43 +210,62 @@ def _build_sentence_chunks(
         cleaned = sentence.strip()
         if not cleaned:
             continue
-        normalized.extend(_split_long_sentence(cleaned, max_chars=max_chars))
+        for piece in _split_long_sentence(cleaned, max_chars=max_chars):
+            if token_counter is None:
+                normalized.append(piece)
+            else:
+                normalized.extend(_split_to_token_budget(piece, token_counter))
 
     if not normalized:
         return []
 
+    token_counts = [token_counter.count(item) for item in normalized] if token_counter is not None else []
+    max_tokens = token_counter.max_tokens if token_counter is not None else 0
+
     chunks: List[str] = []
-    window: List[str] = []
+    window: List[int] = []
     window_len = 0
+    window_tokens = 0
 
     def _flush_with_overlap() -> None:
-        nonlocal window, window_len
+        nonlocal window, window_len, window_tokens
         if not window:
             return
 
-        chunk = " ".join(window).strip()
+        chunk = " ".join(normalized[index] for index in window).strip()
         if chunk:
             chunks.append(chunk)
 
         if overlap_sentences <= 0:
             window = []
             window_len = 0
+            window_tokens = 0
             return
 
         overlap = window[-overlap_sentences:]
         window = list(overlap)
-        window_len = sum(len(item) + 1 for item in window)
+        window_len = sum(len(normalized[index]) + 1 for index in window)
+        window_tokens = sum(token_counts[index] for index in window) if token_counts else 0
 
-    for sentence in normalized:
+    for index, sentence in enumerate(normalized):
         sentence_len = len(sentence) + 1
-        if window and window_len + sentence_len > max_chars:
+        sentence_tokens = token_counts[index] if token_counts else 0
+        if window and (
+            window_len + sentence_len > max_chars or (max_tokens and window_tokens + sentence_tokens > max_tokens)
+        ):
             _flush_with_overlap()
+            if max_tokens and window_tokens + sentence_tokens > max_tokens:
+                # Overlap that would push the next chunk past the model limit is dropped.
+                window = []
+                window_len = 0
+                window_tokens = 0
 
-        window.append(sentence)
+        window.append(index)
         window_len += sentence_len
+        window_tokens += sentence_tokens
 
     if window:
-        chunk = " ".join(window).strip()
+        chunk = " ".join(normalized[index] for index in window).strip()
         if chunk:
             chunks.append(chunk)
 
@@ -218,7 +319,8 @@ def _split_table_row(row_text: str) -> List[str]:
     return [row]
 
 
-def _is_header_row(cells: Sequence[str]) -> bool:
+def is_header_row(cells: Sequence[str]) -> bool:
+    """True when a row reads like column labels (at least as many text cells as numeric ones)."""
     if not cells:
         return False
 
@@ -321,7 +423,10 @@ def _build_horizontal_row_sentences(
     return results
 
 
-def _build_vertical_row_sentences(rows: Sequence[Sequence[str]]) -> List[TableRowSentence]:
+def _build_vertical_row_sentences(
+    rows: Sequence[Sequence[str]],
+    row_offset: int = 0,
+) -> List[TableRowSentence]:
     if not _looks_like_matrix_table(rows):
         return []
 
@@ -350,8 +455,8 @@ def _build_vertical_row_sentences(rows: Sequence[Sequence[str]]) -> List[TableRo
                 continue
 
             parts.append(f"{column_label} {row_label}: {value}")
-            refs.append(_cell_ref(ridx + 1, 1))
-            refs.append(_cell_ref(ridx + 1, cidx + 1))
+            refs.append(_cell_ref(ridx + 1 + row_offset, 1))
+            refs.append(_cell_ref(ridx + 1 + row_offset, cidx + 1))
 
         if parts:
             results.append(
@@ -365,7 +470,15 @@ def _build_vertical_row_sentences(rows: Sequence[Sequence[str]]) -> List[TableRo
     return results
 
 
-def table_group_to_structured_text(table_lines: Sequence[str]) -> Tuple[str, List[TableRowSentence]]:
+def table_group_to_structured_text(
+    table_lines: Sequence[str],
+    row_offset: int = 0,
+) -> Tuple[str, List[TableRowSentence]]:
+    """Render table lines as markdown plus row sentences.
+
+    `row_offset` shifts data-row cell refs for windows cut from a larger table whose
+    header line was repeated at the top; header refs stay on row 1.
+    """
     rows = [_split_table_row(line) for line in table_lines if line.strip()]
     rows = [row for row in rows if row]
     if not rows:
@@ -377,7 +490,7 @@ def table_group_to_structured_text(table_lines: Sequence[str]) -> Tuple[str, Lis
         padded = list(row) + [""] * (col_count - len(row))
         normalized_rows.append(padded)
 
-    has_explicit_header = len(normalized_rows) > 1 and _is_header_row(normalized_rows[0])
+    has_explicit_header = len(normalized_rows) > 1 and is_header_row(normalized_rows[0])
     if len(normalized_rows) == 1:
         header = [f"col_{idx+1}" for idx in range(col_count)]
         data_rows = normalized_rows
@@ -401,9 +514,9 @@ def table_group_to_structured_text(table_lines: Sequence[str]) -> Tuple[str, Lis
     row_sentences = _build_horizontal_row_sentences(
         header=header,
         data_rows=data_rows,
-        data_start_row_index=data_start_row_index,
+        data_start_row_index=data_start_row_index + row_offset,
     )
-    row_sentences.extend(_build_vertical_row_sentences(normalized_rows))
+    row_sentences.extend(_build_vertical_row_sentences(normalized_rows, row_offset=row_offset))
 
     deduped_sentences: List[TableRowSentence] = []
     seen_text = set()
@@ -451,11 +564,13 @@ def _merge_table_row_sentence_chunks(
 
         while index < len(chunks):
             candidate = chunks[index]
-            if (
-                candidate.chunk_type == "table_row_sentence"
-                and candidate.page == current.page
-                and (candidate.raw_text or "") == (current.raw_text or "")
-            ):
+            # Rows of one table share its id; records without one (legacy) still compare raw text.
+            same_table = (
+                candidate.table_id == current.table_id
+                if current.table_id
+                else not candidate.table_id and (candidate.raw_text or "") == (current.raw_text or "")
+            )
+            if candidate.chunk_type == "table_row_sentence" and candidate.page == current.page and same_table:
                 group.append(candidate)
                 index += 1
                 continue
@@ -507,12 +622,20 @@ def _merge_table_row_sentence_chunks(
                         )
                     ),
                     table_layout=template.table_layout if len(layouts) <= 1 else "mixed",
+                    table_id=template.table_id,
                 )
             )
 
     return merged
 
 
+def _apply_chunk_budget(chunks: Sequence[ChunkRecord], max_chunks: int) -> List[ChunkRecord]:
+    """Keep the `max_chunks` highest quality chunks (earlier first on ties), in document order."""
+    ranked = sorted(range(len(chunks)), key=lambda index: (-chunks[index].quality_score, index))
+    keep = sorted(ranked[:max_chunks])
+    return [chunks[index] for index in keep]
+
+
 def build_chunks(
     segments: Sequence[SourceSegment],
     embedding_model_name: str,
@@ -527,6 +650,7 @@ def build_chunks(
     max_chunks_per_doc: int = 400,
     table_row_sentence_max_per_table: int = 240,
     table_row_sentence_merge_size: int = 3,
+    token_counter: Optional[TokenCounter] = None,
 ) -> List[ChunkRecord]:
     chunks: List[ChunkRecord] = []
     chunk_index = 0
@@ -544,6 +668,7 @@ def build_chunks(
                 sentences,
                 max_chars=max_chars,
                 overlap_sentences=overlap_sentences,
+                token_counter=token_counter,
             )
         else:
             chunk_texts = [text]
@@ -569,12 +694,14 @@ def build_chunks(
                     page=segment.page,
                     section_title=segment.section_title,
                     quality_score=quality_score,
-                    raw_text=segment.raw_text or body,
+                    # Table rows reference their table entity instead of repeating its text.
+                    raw_text=segment.raw_text or ("" if segment.table_id else body),
                     chunk_schema_version=chunk_schema_version,
                     embedding_model_name=embedding_model_name,
                     embedding_model_version=embedding_model_version,
                     table_cell_refs=segment.table_cell_refs or "",
                     table_layout=segment.table_layout or "",
+                    table_id=segment.table_id or "",
                 )
             )
             chunk_index += 1
@@ -604,14 +731,7 @@ def build_chunks(
         chunks = deduped_chunks
 
     if max_chunks_per_doc > 0 and len(chunks) > max_chunks_per_doc:
-        if max_chunks_per_doc == 1:
-            chunks = [chunks[0]]
-        else:
-            selected_indices = {
-                int(round(position * (len(chunks) - 1) / (max_chunks_per_doc - 1)))
-                for position in range(max_chunks_per_doc)
-            }
-            chunks = [record for index, record in enumerate(chunks) if index in selected_indices]
+        chunks = _apply_chunk_budget(chunks, max_chunks_per_doc)
 
     for index, record in enumerate(chunks):
         record.chunk_index = index
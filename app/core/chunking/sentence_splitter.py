@@ -19,42 +19,47 @@ _ABBREVIATIONS = {
     "vol.",
     "al.",
 }
+_MAX_ABBREVIATION_LEN = max(len(item) for item in _ABBREVIATIONS)
+
+# A terminator only ends a sentence when followed by whitespace, a closing quote/bracket or
+# the end of text. Digits never follow, so decimal points ("3.14") are excluded up front.
+_BOUNDARY_RE = re.compile(r"[.?!。！？](?=[ \n\t\"')\]}]|\Z)")
+_LINE_BREAKS_RE = re.compile(r"\n+")
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 
 def _normalize_text(text: str) -> str:
     body = (text or "").replace("\r\n", "\n").replace("\r", "\n")
-    body = re.sub(r"[ \t]+", " ", body)
-    body = re.sub(r"\n{3,}", "\n\n", body)
+    body = _INLINE_SPACE_RE.sub(" ", body)
+    body = _EXTRA_BLANK_LINES_RE.sub("\n\n", body)
     return body.strip()
 
 
-def _last_token(lowered: str) -> str:
-    if not lowered:
-        return ""
-    parts = re.split(r"\s+", lowered)
-    return parts[-1] if parts else ""
-
-
-def _is_decimal_point(text: str, index: int) -> bool:
-    if text[index] != ".":
-        return False
-
-    prev_char = text[index - 1] if index > 0 else ""
-    next_char = text[index + 1] if index + 1 < len(text) else ""
-    return prev_char.isdigit() and next_char.isdigit()
-
+def _is_abbreviation(body: str, dot_index: int, start: int) -> bool:
+    """Check the token ending at `body[dot_index]` (a period) without looking past `start`.
 
-def _is_abbreviation(buffer: str) -> bool:
-    lowered = buffer.lower().strip()
-    token = _last_token(lowered)
-    if token in _ABBREVIATIONS:
+    Only a bounded window behind the period is inspected, so every check is O(1).
+    """
+    token_start = dot_index
+    limit = max(start, dot_index - _MAX_ABBREVIATION_LEN + 1)
+    while token_start > limit and not body[token_start - 1].isspace():
+        token_start -= 1
+    token_is_short = token_start == start or body[token_start - 1].isspace()
+    if token_is_short and body[token_start : dot_index + 1].lower() in _ABBREVIATIONS:
         return True
 
-    # Initials like "A." or "U.S.".
-    if re.search(r"(?:\b[A-Za-z]\.){1,4}$", lowered):
+    # Initials like "A." or "U.S.": a single ASCII letter that does not continue a word.
+    letter_index = dot_index - 1
+    if letter_index < start:
+        return False
+    letter = body[letter_index].lower()
+    if len(letter) != 1 or not ("a" <= letter <= "z"):
+        return False
+    if letter_index - 1 < start:
         return True
-
-    return False
+    previous = body[letter_index - 1].lower()[-1:]
+    return not (previous.isalnum() or previous == "_")
 
 
 def split_sentences(text: str) -> List[str]:
@@ -63,37 +68,26 @@ def split_sentences(text: str) -> List[str]:
         return []
 
     sentences: List[str] = []
-    buffer: List[str] = []
-
-    for idx, char in enumerate(body):
-        buffer.append(char)
-        if char not in ".?!。！？":
-            continue
-
-        if char == "." and _is_decimal_point(body, idx):
-            continue
-
-        fragment = "".join(buffer)
-        if char == "." and _is_abbreviation(fragment):
-            continue
+    start = 0
 
-        next_char = body[idx + 1] if idx + 1 < len(body) else ""
-        if next_char and next_char not in {" ", "\n", "\t", '"', "'", ")", "]", "}"}:
+    for match in _BOUNDARY_RE.finditer(body):
+        end = match.start()
+        if body[end] == "." and _is_abbreviation(body, end, start):
             continue
 
-        sentence = fragment.strip()
+        sentence = body[start : end + 1].strip()
         if sentence:
             sentences.append(sentence)
-        buffer = []
+        start = end + 1
 
-    tail = "".join(buffer).strip()
+    tail = body[start:].strip()
     if tail:
         sentences.append(tail)
 
     # Fallback: keep long runs from line breaks as sentence boundaries.
     final_sentences: List[str] = []
     for sentence in sentences:
-        pieces = [item.strip() for item in re.split(r"\n+", sentence) if item.strip()]
+        pieces = [item.strip() for item in _LINE_BREAKS_RE.split(sentence) if item.strip()]
         final_sentences.extend(pieces)
 
     return final_sentences
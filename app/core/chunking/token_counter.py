@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import Callable, Optional
+
+# Scripts/runs that subword tokenizers (XLM-R sentencepiece for the default multilingual
+# MiniLM) split differently; the estimate is tuned to err on the high side so packed chunks
+# stay under the model limit when the real tokenizer is unavailable.
+_APPROX_TOKEN_RE = re.compile(
+    r"(?P<latin>[A-Za-z]+)|(?P<digits>\d+)"
+    r"|(?P<cjk>[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u9fff\uac00-\ud7a3]+)|(?P<other>\S)"
+)
+# [CLS]/<s> and [SEP]/</s> are added around every input by sentence-transformers.
+_SPECIAL_TOKENS = 2
+
+
+def approximate_token_count(text: str) -> int:
+    tokens = 0
+    for match in _APPROX_TOKEN_RE.finditer(text or ""):
+        kind = match.lastgroup
+        length = match.end() - match.start()
+        if kind == "latin":
+            tokens += max(1, math.ceil(length / 4))
+        elif kind == "digits":
+            tokens += max(1, math.ceil(length / 2))
+        elif kind == "cjk":
+            tokens += max(1, math.ceil(length * 0.8))
+        else:
+            tokens += 1
+    return tokens
+
+
+class TokenCounter:
+    """Counts tokens for chunk sizing; `max_tokens` is the content budget per chunk."""
+
+    def __init__(self, name: str, max_tokens: int, count: Optional[Callable[[str], int]] = None):
+        self.name = name
+        self.max_tokens = max(1, int(max_tokens))
+        self._count = count or approximate_token_count
+
+    def count(self, text: str) -> int:
+        return self._count(text or "")
+
+
+def token_counter_for_model(model, model_name: str, max_tokens: int = 0) -> Optional[TokenCounter]:
+    """Counter sized to the embedding model's sequence limit, or None when there is no limit.
+
+    Uses the model's own tokenizer when it has one and the approximate counter otherwise.
+    `max_tokens` > 0 overrides the budget derived from the model's `max_seq_length`; models
+    without a sequence limit (the deterministic fallback embedder) only get a budget then.
+    """
+    max_seq_length = int(getattr(model, "max_seq_length", 0) or 0)
+    if max_tokens > 0:
+        budget = max_tokens
+    elif max_seq_length > 0:
+        budget = max(16, max_seq_length - _SPECIAL_TOKENS)
+    else:
+        return None
+
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None and hasattr(tokenizer, "encode"):
+        def _count(text: str) -> int:
+            return len(tokenizer.encode(text, add_special_tokens=False))
+
+        try:
+            _count("tokenizer probe")
+            return TokenCounter(f"tokenizer:{model_name}", budget, _count)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[chunker] tokenizer unavailable for {model_name}, using approximate token counts: {exc}")
+
+    return TokenCounter("approximate", budget)
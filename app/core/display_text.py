@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import html
+import re
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Display helpers shared by indexing (which stores the derived fields on every chunk) and
+# the search hot path (which reads them back instead of recomputing them per hit).
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。！？])\s+|\s+\|\s+|\n+")
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_HORIZONTAL_SPACE_PATTERN = re.compile(r"[ \t]+")
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
+def clean_display_text(value: str) -> str:
+    text = html.unescape(value or "")
+    text = _HTML_TAG_PATTERN.sub(" ", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _HORIZONTAL_SPACE_PATTERN.sub(" ", text)
+    text = _EXCESS_NEWLINES_PATTERN.sub("\n\n", text)
+    return text.strip()
+
+
+def reclean_display_text(text: str) -> str:
+    # Cleaning is idempotent unless the cleaned text still holds entities or tags
+    # (double-escaped markup), so already-clean text skips the regex passes.
+    if "&" in text or "<" in text:
+        cleaned = clean_display_text(text)
+        return text if cleaned == text else cleaned
+    return text
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of the non-empty, stripped sentences of `text`."""
+    spans: List[Tuple[int, int]] = []
+    position = 0
+    for separator in SENTENCE_SPLIT_PATTERN.finditer(text):
+        _append_sentence_span(spans, text, position, separator.start())
+        position = separator.end()
+    _append_sentence_span(spans, text, position, len(text))
+    return spans
+
+
+def _append_sentence_span(spans: List[Tuple[int, int]], text: str, start: int, end: int) -> None:
+    segment = text[start:end]
+    stripped = segment.lstrip()
+    if not stripped:
+        return
+    start += len(segment) - len(stripped)
+    spans.append((start, start + len(stripped.rstrip())))
+
+
+def alnum_ratio(text: str) -> float:
+    if not text:
+        return 0.0
+    return sum(map(str.isalnum, text)) / len(text)
+
+
+def build_display_fields(content: str) -> Dict[str, Any]:
+    """Chunk fields stored at index time: cleaned text, sentence offsets and alnum ratio.
+
+    Offsets refer to the text snippets and evidence are cut from; they are left empty in
+    the rare case that text still changes when cleaned again and is recomputed per search.
+    """
+    display_text = clean_display_text(content)
+    offsets: List[int] = []
+    if reclean_display_text(display_text) is display_text:
+        for start, end in sentence_spans(display_text):
+            offsets.extend((start, end))
+    return {
+        "display_text": display_text,
+        "sentence_offsets": offsets,
+        "alnum_ratio": alnum_ratio(display_text),
+    }
+
+
+@dataclass
+class HitDisplay:
+    text: str  # cleaned chunk content, used for scoring
+    evidence_text: str  # text snippets and evidence sentences are cut from
+    spans: Optional[List[Tuple[int, int]]]  # sentence spans of `evidence_text`, None = not stored
+    alnum_ratio: float
+
+
+def hit_display(source: Mapping[str, Any]) -> HitDisplay:
+    """Display fields of a search hit, recomputed for chunks indexed before they were stored."""
+    text = source.get("display_text")
+    if not isinstance(text, str):
+        text = clean_display_text(source.get("content") or "")
+        evidence_text = reclean_display_text(text)
+        return HitDisplay(text, evidence_text, None, alnum_ratio(text))
+
+    evidence_text = reclean_display_text(text)
+    spans = None
+    offsets = source.get("sentence_offsets")
+    if evidence_text is text and isinstance(offsets, list) and len(offsets) % 2 == 0:
+        pairs = list(zip(offsets[0::2], offsets[1::2]))
+        if all(0 <= start < end <= len(text) for start, end in pairs) and (pairs or not text.strip()):
+            spans = pairs
+    ratio = source.get("alnum_ratio")
+    if not isinstance(ratio, (int, float)):
+        ratio = alnum_ratio(text)
+    return HitDisplay(text, evidence_text, spans, float(ratio))
@@ -28,6 +28,9 @@ DOC_SUMMARY_TITLE_MAX_CHARS = max(24, int(os.getenv("DOC_SUMMARY_TITLE_MAX_CHARS
 DOC_SUMMARY_SHORT_MAX_CHARS = max(80, int(os.getenv("DOC_SUMMARY_SHORT_MAX_CHARS", "220")))
 DOC_SUMMARY_LLM_MAX_RETRIES = max(1, int(os.getenv("DOC_SUMMARY_LLM_MAX_RETRIES", "3")))
 DOC_TYPE_MAX_LABELS = max(1, int(os.getenv("DOC_TYPE_MAX_LABELS", "3")))
+# Type signals sit in the first pages; very long documents are only inspected up to these lengths.
+DOC_TYPE_SCAN_MAX_CHARS = max(1000, int(os.getenv("DOC_TYPE_SCAN_MAX_CHARS", "200000")))
+DOC_TYPE_FIELD_SCAN_MAX_CHARS = max(1000, int(os.getenv("DOC_TYPE_FIELD_SCAN_MAX_CHARS", "20000")))
 
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。！？])\s+|\n+")
 _MODEL_LINE_RE = re.compile(r"\bLJ[-\s]?[A-Z]?\d{3,4}\b", re.IGNORECASE)
@@ -103,6 +106,58 @@ _DOC_TYPE_RULES = {
         "정격",
     ),
 }
+
+
+def _keyword_trie_pattern(keywords: Sequence[str]) -> str:
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _build(node: dict) -> str:
+        branches = [
+            (r"[ \t]+" if char == " " else re.escape(char)) + _build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 and "" not in node else f"(?:{'|'.join(branches)})"
+        return f"{body}?" if "" in node else body
+
+    return _build(trie)
+
+
+def _compile_keyword_matcher(rules: dict[str, tuple[str, ...]]):
+    """Build one trie-shaped regex that reports every rule keyword occurring in a text.
+
+    The pattern is a capturing lookahead tried at each position and yields the longest
+    keyword starting there, so overlapping keywords are found in a single scan; a matched
+    keyword also implies every keyword contained in it ("maintenance report" ->
+    "maintenance"). Spaces inside keywords match runs of spaces/tabs, mirroring
+    `_clean_text` without copying the input.
+    """
+    keywords = sorted({keyword for items in rules.values() for keyword in items})
+    pattern = re.compile(f"(?=({_keyword_trie_pattern(keywords)}))")
+    implied = {keyword: frozenset(other for other in keywords if other in keyword) for keyword in keywords}
+    return pattern, implied
+
+
+_DOC_TYPE_KEYWORD_RE, _DOC_TYPE_KEYWORD_IMPLIES = _compile_keyword_matcher(_DOC_TYPE_RULES)
+
+
+def _matched_type_keywords(lowered_text: str) -> set[str]:
+    found: set[str] = set()
+    for match in _DOC_TYPE_KEYWORD_RE.finditer(lowered_text):
+        keyword = match.group(1)
+        if " " in keyword or "\t" in keyword:
+            keyword = " ".join(keyword.split())
+        found |= _DOC_TYPE_KEYWORD_IMPLIES[keyword]
+    return found
+
+
 _DOC_TYPE_PROMPT_GUIDE = {
     DOC_TYPE_FAILURE_REPORT: (
         "설비 장애 조치보고서 문서로 보고 고객사/대상설비/작업일/작업내용/작성자/작업장소를 우선 추출해 요약하라."
@@ -176,9 +231,11 @@ def parse_document_types(value: str | Sequence[str] | None) -> list[str]:
     return _normalize_document_types([item.strip() for item in raw.split(",") if item.strip()])
 
 
-def classify_document_types(filename: str, content_text: str) -> list[str]:
+def score_document_types(filename: str, content_text: str) -> dict[str, int]:
+    """Per-type keyword scores: +3 per keyword in the filename, +1 per keyword only in the text."""
     normalized_filename = re.sub(r"[_\-]+", " ", (filename or "")).lower()
-    normalized_text = _clean_text(content_text).lower()
+    text = (content_text or "")[:DOC_TYPE_SCAN_MAX_CHARS]
+    text_keywords = _matched_type_keywords(text.lower())
 
     scores = {}
     for doc_type, keywords in _DOC_TYPE_RULES.items():
@@ -186,19 +243,25 @@ def classify_document_types(filename: str, content_text: str) -> list[str]:
         for keyword in keywords:
             if keyword in normalized_filename:
                 score += 3
-            elif keyword in normalized_text:
+            elif keyword in text_keywords:
                 score += 1
         if score > 0:
             scores[doc_type] = score
 
-    if _is_keyence_lj_catalog(content_text):
+    if _is_keyence_lj_catalog(text):
         scores[DOC_TYPE_CATALOG] = scores.get(DOC_TYPE_CATALOG, 0) + 2
 
-    failure_fields = _extract_failure_report_fields(content_text)
+    # Report forms carry their labelled fields (customer, equipment, date...) up front.
+    failure_fields = _extract_failure_report_fields(text[:DOC_TYPE_FIELD_SCAN_MAX_CHARS])
     failure_field_count = sum(1 for value in failure_fields.values() if value)
     if failure_field_count >= 3:
         scores[DOC_TYPE_FAILURE_REPORT] = scores.get(DOC_TYPE_FAILURE_REPORT, 0) + 4
 
+    return scores
+
+
+def classify_document_types(filename: str, content_text: str) -> list[str]:
+    scores = score_document_types(filename, content_text)
     selected = [
         doc_type
         for doc_type, score in sorted(
@@ -797,10 +860,37 @@ def _summarize_with_local_llm(
     return None
 
 
+def llm_summary_enabled() -> bool:
+    return bool(DOC_SUMMARY_ENABLED and DOC_SUMMARY_USE_LOCAL_LLM and DOC_SUMMARY_OLLAMA_URL and DOC_SUMMARY_OLLAMA_MODEL)
+
+
+def needs_llm_summary(document_types: Sequence[str] | None) -> bool:
+    """Whether the local LLM would be asked for this document (failure reports stay structured)."""
+    if not llm_summary_enabled():
+        return False
+    return DOC_TYPE_FAILURE_REPORT not in _normalize_document_types(document_types)
+
+
+def build_llm_document_summary(
+    filename: str,
+    content_text: str,
+    document_types: Sequence[str] | None = None,
+) -> Optional[Tuple[str, str]]:
+    """LLM title/summary only; None when the LLM is not used or gives nothing usable."""
+    if not needs_llm_summary(document_types):
+        return None
+    return _summarize_with_local_llm(
+        filename=filename,
+        text=content_text,
+        document_types=_normalize_document_types(document_types),
+    )
+
+
 def build_document_summary(
     filename: str,
     content_text: str,
     document_types: Sequence[str] | None = None,
+    use_llm: bool = True,
 ) -> Tuple[str, str]:
     if not DOC_SUMMARY_ENABLED:
         return _title_from_filename(filename), ""
@@ -812,6 +902,9 @@ def build_document_summary(
     if DOC_TYPE_FAILURE_REPORT in normalized_types:
         return _build_failure_report_summary(filename=filename, text=content_text)
 
+    if not use_llm:
+        return _extractive_summary(filename=filename, text=content_text)
+
     llm_result = _summarize_with_local_llm(
         filename=filename,
         text=content_text,
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+from .document_summary import classify_document_types, serialize_document_types
+from .vector_store import vector_store
+
+# Classifies documents stored without `document_types` (indexed before classification, or
+# by older pipelines) off the request path; search only reads the stored types.
+DOC_TYPE_BACKFILL_ON_STARTUP = (
+    os.getenv("DOC_TYPE_BACKFILL_ON_STARTUP", "true").strip().lower() in {"1", "true", "yes", "on"}
+)
+DOC_TYPE_BACKFILL_BATCH_SIZE = max(1, int(os.getenv("DOC_TYPE_BACKFILL_BATCH_SIZE", "200")))
+
+# Stored for documents the classifier found no type for, so they are not rescanned on every
+# run; parse_document_types reads it as "no types" like the empty string.
+DOC_TYPES_NONE = "[]"
+
+
+def backfill_document_types(batch_size: int = DOC_TYPE_BACKFILL_BATCH_SIZE, db=None) -> Dict[str, int]:
+    """Classify completed documents without `document_types`, one committed batch at a time.
+
+    Each batch updates the DB rows, then patches `document_types` on the indexed chunks of
+    the documents that got types (one update_by_query per batch).
+    """
+    from sqlalchemy import or_
+
+    from .. import models
+    from ..database import SessionLocal
+
+    batch_size = max(1, int(batch_size))
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
+    stats = {"documents": 0, "classified": 0, "batches": 0}
+    last_id = 0
+    try:
+        while True:
+            docs = (
+                db.query(models.Document)
+                .filter(
+                    models.Document.id > last_id,
+                    models.Document.status == "completed",
+                    or_(models.Document.document_types.is_(None), models.Document.document_types == ""),
+                )
+                .order_by(models.Document.id.asc())
+                .limit(batch_size)
+                .all()
+            )
+            if not docs:
+                break
+            last_id = docs[-1].id
+
+            updates: Dict[int, List[str]] = {}
+            for doc in docs:
+                document_types = classify_document_types(
+                    filename=doc.filename or "",
+                    content_text=doc.content_text or "",
+                )
+                if document_types:
+                    doc.document_types = serialize_document_types(document_types)
+                    updates[doc.id] = document_types
+                else:
+                    doc.document_types = DOC_TYPES_NONE
+            db.commit()
+            vector_store.update_document_types(updates)
+
+            stats["documents"] += len(docs)
+            stats["classified"] += len(updates)
+            stats["batches"] += 1
+            if len(docs) < batch_size:
+                break
+        return stats
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if owns_session:
+            db.close()
+
+
+_backfill_thread: Optional[threading.Thread] = None
+_backfill_lock = threading.Lock()
+
+
+def _run_backfill() -> None:
+    try:
+        stats = backfill_document_types()
+    except Exception as exc:  # noqa: BLE001
+        print(f"[doc-type-backfill] failed: {exc}")
+    else:
+        if stats["documents"]:
+            print(
+                f"[doc-type-backfill] classified {stats['classified']}/{stats['documents']} documents "
+                f"in {stats['batches']} batches"
+            )
+
+
+def start_document_type_backfill() -> bool:
+    """Run the backfill once on a daemon thread; returns False if disabled or already running."""
+    global _backfill_thread
+    if not DOC_TYPE_BACKFILL_ON_STARTUP:
+        return False
+    with _backfill_lock:
+        if _backfill_thread is not None and _backfill_thread.is_alive():
+            return False
+        _backfill_thread = threading.Thread(target=_run_backfill, name="doc-type-backfill", daemon=True)
+        _backfill_thread.start()
+    return True
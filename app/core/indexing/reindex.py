@@ -25,8 +25,8 @@ def _parse_doc_ids(values: Iterable[str]) -> List[int]:
     return sorted(set(ids))
 
 
-def _run_dry_file(file_path: str, filename: str, preview_chunks: int) -> None:
-    raw_text, clean_text, chunk_records = generate_chunk_records(file_path)
+def _run_dry_file(file_path: str, filename: str, preview_chunks: int, use_parse_cache: bool = True) -> None:
+    raw_text, clean_text, chunk_records = generate_chunk_records(file_path, use_cache=use_parse_cache)
     print(
         f"[dry-run:file] filename={filename} "
         f"raw_chars={len(raw_text)} clean_chars={len(clean_text)} chunks={len(chunk_records)}"
@@ -62,8 +62,12 @@ def _load_documents(db, doc_ids: List[int], limit: int):
     return query.all()
 
 
-def _run_dry_doc(doc, preview_chunks: int) -> None:
-    raw_text, clean_text, chunk_records = generate_chunk_records(doc.file_path)
+def _run_dry_doc(doc, preview_chunks: int, use_parse_cache: bool = True) -> None:
+    raw_text, clean_text, chunk_records = generate_chunk_records(
+        doc.file_path,
+        file_sha256=getattr(doc, "file_sha256", None),
+        use_cache=use_parse_cache,
+    )
 
     print(
         f"[dry-run] doc_id={doc.id} filename={doc.filename} "
@@ -82,7 +86,13 @@ def _run_dry_doc(doc, preview_chunks: int) -> None:
         )
 
 
-def _run_reindex(db, doc, dedup_mode: str | None, index_policy: str | None) -> None:
+def _run_reindex(
+    db,
+    doc,
+    dedup_mode: str | None,
+    index_policy: str | None,
+    use_parse_cache: bool = True,
+) -> None:
     from ..pipeline import process_document_with_session
 
     process_document_with_session(
@@ -90,6 +100,7 @@ def _run_reindex(db, doc, dedup_mode: str | None, index_policy: str | None) -> N
         db,
         dedup_mode_override=dedup_mode,
         index_policy_override=index_policy,
+        use_parse_cache=use_parse_cache,
     )
     db.refresh(doc)
     print(
@@ -107,6 +118,7 @@ def _run_db_mode(
     preview_chunks: int,
     dedup_mode: str | None,
     index_policy: str | None,
+    use_parse_cache: bool = True,
 ) -> int:
     try:
         from ...database import SessionLocal, ensure_runtime_schema
@@ -128,24 +140,38 @@ def _run_db_mode(
         for doc in documents:
             try:
                 if dry_run:
-                    _run_dry_doc(doc, preview_chunks=preview_chunks)
+                    _run_dry_doc(doc, preview_chunks=preview_chunks, use_parse_cache=use_parse_cache)
                 else:
                     _run_reindex(
                         db,
                         doc,
                         dedup_mode=dedup_mode,
                         index_policy=index_policy,
+                        use_parse_cache=use_parse_cache,
                     )
             except Exception as exc:  # noqa: BLE001
                 print(f"[reindex] doc_id={doc.id} failed: {type(exc).__name__}: {exc}")
                 if not dry_run:
                     db.rollback()
 
+        if not dry_run:
+            _wait_for_summary_enrichment()
         return 0
     finally:
         db.close()
 
 
+def _wait_for_summary_enrichment() -> None:
+    # Deferred LLM summaries run on a daemon thread; finish them before the process exits so
+    # documents are not left pending until an API worker picks them up.
+    from ..summary_enrichment import summary_enrichment_queue
+
+    pending = summary_enrichment_queue.pending_count()
+    if pending:
+        print(f"[reindex] waiting for {pending} deferred LLM summaries")
+    summary_enrichment_queue.drain()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Reindex documents with reflow + sentence-aware chunk schema.",
@@ -199,13 +225,23 @@ def main() -> int:
         default="all",
         help="Index policy: all|primary-only|prefer.",
     )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Re-run parsing/OCR/chunking even when a cached chunk artifact matches.",
+    )
 
     args = parser.parse_args()
     preview_chunks = max(1, args.preview_chunks)
 
     if args.file_path:
         display_name = args.filename.strip() or args.file_path
-        _run_dry_file(args.file_path, display_name, preview_chunks=preview_chunks)
+        _run_dry_file(
+            args.file_path,
+            display_name,
+            preview_chunks=preview_chunks,
+            use_parse_cache=not args.no_parse_cache,
+        )
         return 0
 
     doc_ids = _parse_doc_ids(args.doc_id)
@@ -219,6 +255,7 @@ def main() -> int:
         preview_chunks=preview_chunks,
         dedup_mode=dedup_mode,
         index_policy=index_policy,
+        use_parse_cache=not args.no_parse_cache,
     )
 
 
@@ -1,5 +1,6 @@
 import json
 import os
+import time
 from urllib import error, request
 from urllib.parse import urlparse, urlunparse
 
@@ -7,8 +8,21 @@ OCR_WORKER_URL = os.getenv("OCR_WORKER_URL", "").strip()
 if not OCR_WORKER_URL:
     OCR_WORKER_URL = "http://ocr-worker:8100/ocr"
 
+# Blocking POST /ocr (old workers, or OCR_ASYNC_JOBS=false) and the health probe; not OCR jobs.
 OCR_TIMEOUT_SECONDS = float(os.getenv("OCR_TIMEOUT_SECONDS", "60"))
 OCR_HEALTH_URL = os.getenv("OCR_WORKER_HEALTH_URL", "").strip()
+OCR_JOBS_URL = os.getenv("OCR_WORKER_JOBS_URL", "").strip()
+OCR_ASYNC_JOBS = (
+    os.getenv("OCR_ASYNC_JOBS", "true").strip().lower()
+    in {"1", "true", "yes", "on"}
+)
+OCR_JOB_POLL_WAIT_SECONDS = max(1.0, float(os.getenv("OCR_JOB_POLL_WAIT_SECONDS", "20")))
+OCR_JOB_REQUEST_TIMEOUT_SECONDS = max(1.0, float(os.getenv("OCR_JOB_REQUEST_TIMEOUT_SECONDS", "10")))
+# Total wait for one OCR job. Polling holds no long-lived socket, so this only has to cover
+# the slowest expected scan.
+OCR_JOB_TIMEOUT_SECONDS = max(1.0, float(os.getenv("OCR_JOB_TIMEOUT_SECONDS", "3600")))
+# Worker-side engine, read from the shared env file; only used to key cached parse output.
+OCR_PROVIDER = os.getenv("OCR_PROVIDER", "").strip().lower()
 
 
 def _read_non_negative_int(name: str, default: str) -> int:
@@ -97,6 +111,17 @@ def _resolve_ocr_request_options() -> dict:
     }
 
 
+def ocr_output_identity() -> dict:
+    """Everything on this side that changes what OCR returns for the same file."""
+    return {
+        "worker_url": OCR_WORKER_URL,
+        "jobs_url": _resolve_jobs_url(),
+        "provider": OCR_PROVIDER,
+        "profile": OCR_PROFILE,
+        "options": _resolve_ocr_request_options(),
+    }
+
+
 def _resolve_health_url() -> str:
     if OCR_HEALTH_URL:
         return OCR_HEALTH_URL
@@ -118,36 +143,122 @@ def _resolve_health_url() -> str:
     )
 
 
-def _call_ocr_worker(file_path: str) -> str:
-    if not OCR_WORKER_URL:
+def _resolve_jobs_url() -> str:
+    if OCR_JOBS_URL:
+        return OCR_JOBS_URL.rstrip("/")
+
+    parsed = urlparse(OCR_WORKER_URL)
+    if not parsed.scheme or not parsed.netloc:
         return ""
 
+    return urlunparse(
+        (
+            parsed.scheme,
+            parsed.netloc,
+            parsed.path.rstrip("/") + "/jobs",
+            "",
+            "",
+            "",
+        )
+    )
+
+
+def _build_ocr_payload(file_path: str, file_sha256: str | None) -> bytes:
     payload_obj = {
         "file_path": file_path,
         **_resolve_ocr_request_options(),
     }
-    payload = json.dumps(payload_obj).encode("utf-8")
-    req = request.Request(
-        OCR_WORKER_URL,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    if file_sha256:
+        # Lets the worker key its cache without re-hashing the file.
+        payload_obj["file_sha256"] = file_sha256
+    return json.dumps(payload_obj).encode("utf-8")
+
 
-    with request.urlopen(req, timeout=OCR_TIMEOUT_SECONDS) as resp:
+def _read_json_response(req, timeout: float) -> dict:
+    with request.urlopen(req, timeout=timeout) as resp:
         body = resp.read().decode("utf-8")
 
     try:
         data = json.loads(body)
     except json.JSONDecodeError:
-        return ""
+        return {}
+    return data if isinstance(data, dict) else {}
+
 
+def _extract_ocr_text(data: dict) -> str:
     text = data.get("text")
     if isinstance(text, str):
         return text.strip()
     return ""
 
 
+def _call_ocr_worker_sync(file_path: str, file_sha256: str | None = None) -> str:
+    req = request.Request(
+        OCR_WORKER_URL,
+        data=_build_ocr_payload(file_path, file_sha256),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    return _extract_ocr_text(_read_json_response(req, OCR_TIMEOUT_SECONDS))
+
+
+def _call_ocr_worker_job(jobs_url: str, file_path: str, file_sha256: str | None = None) -> str:
+    """Submit an OCR job and long-poll for it instead of holding one socket open.
+
+    `OCR_JOB_TIMEOUT_SECONDS` bounds the whole wait. The job keeps running on the worker after a
+    client timeout, so a pipeline retry coalesces onto it (or hits the cache) rather than
+    starting the OCR again.
+    """
+    submit_req = request.Request(
+        jobs_url,
+        data=_build_ocr_payload(file_path, file_sha256),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    job = _read_json_response(submit_req, OCR_JOB_REQUEST_TIMEOUT_SECONDS)
+    job_id = str(job.get("job_id") or "").strip()
+    if not job_id:
+        raise ValueError("OCR worker did not return a job id.")
+
+    deadline = time.monotonic() + OCR_JOB_TIMEOUT_SECONDS
+    while True:
+        status = str(job.get("status") or "").strip().lower()
+        if status == "completed":
+            result = job.get("result")
+            return _extract_ocr_text(result) if isinstance(result, dict) else ""
+        if status == "failed":
+            raise ValueError(f"OCR job failed: {job.get('error') or 'unknown error'}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"OCR job {job_id} did not finish within {OCR_JOB_TIMEOUT_SECONDS:.0f}s.")
+
+        wait_seconds = min(OCR_JOB_POLL_WAIT_SECONDS, remaining)
+        poll_req = request.Request(
+            f"{jobs_url}/{job_id}?wait_seconds={wait_seconds:.1f}",
+            headers={"Accept": "application/json"},
+            method="GET",
+        )
+        job = _read_json_response(poll_req, wait_seconds + OCR_JOB_REQUEST_TIMEOUT_SECONDS)
+
+
+def _call_ocr_worker(file_path: str, file_sha256: str | None = None) -> str:
+    if not OCR_WORKER_URL:
+        return ""
+
+    jobs_url = _resolve_jobs_url() if OCR_ASYNC_JOBS else ""
+    if not jobs_url:
+        return _call_ocr_worker_sync(file_path, file_sha256=file_sha256)
+
+    try:
+        return _call_ocr_worker_job(jobs_url, file_path, file_sha256=file_sha256)
+    except error.HTTPError as exc:
+        if exc.code not in {404, 405}:
+            raise
+        # Older workers only expose the blocking endpoint.
+        return _call_ocr_worker_sync(file_path, file_sha256=file_sha256)
+
+
 def get_ocr_worker_health() -> dict:
     health_url = _resolve_health_url()
     if not health_url:
@@ -177,13 +288,13 @@ def get_ocr_worker_health() -> dict:
         }
 
 
-def perform_ocr(file_path: str) -> str:
+def perform_ocr(file_path: str, file_sha256: str | None = None) -> str:
     """
     Run OCR via external worker when configured.
     If worker is unavailable, return empty text so caller can decide fallback.
     """
     try:
-        return _call_ocr_worker(file_path)
+        return _call_ocr_worker(file_path, file_sha256=file_sha256)
     except (error.URLError, TimeoutError, OSError, ValueError) as exc:
         print(f"[ocr] OCR worker call failed: {exc}")
         return ""
@@ -9,6 +9,8 @@ _MULTISPACE_RE = re.compile(r"[ \t]+")
 _TRAILING_PAGE_RE = re.compile(r"^\s*(page\s*\d+|\d+\s*/\s*\d+)\s*$", re.IGNORECASE)
 _LIST_PREFIX_RE = re.compile(r"^(?:[-*]|\d+[\.)\]])\s+")
 _HYPHEN_JOIN_RE = re.compile(r"([A-Za-z]{2,})-$")
+_HYPHEN_CONTINUATION_RE = re.compile(r"^[A-Za-z]{2,}")
+_SENTENCE_TERMINALS = (".", "?", "!", "。", "！", "？")
 
 
 def normalize_line(text: str) -> str:
@@ -25,7 +27,10 @@ def normalize_text(text: str) -> str:
 
 
 def _is_short_repeatable(text: str) -> bool:
-    line = normalize_line(text)
+    return _is_short_repeatable_line(normalize_line(text))
+
+
+def _is_short_repeatable_line(line: str) -> bool:
     if not line:
         return False
 
@@ -39,6 +44,20 @@ def _is_short_repeatable(text: str) -> bool:
     return alnum >= 2
 
 
+def _count_edge_lines(lines: Sequence[str], counts: Dict[str, int], repeatable: Dict[str, bool]) -> None:
+    seen = set()
+    for line in lines:
+        if line in seen:
+            continue
+        is_repeatable = repeatable.get(line)
+        if is_repeatable is None:
+            is_repeatable = repeatable[line] = _is_short_repeatable_line(line)
+        if not is_repeatable:
+            continue
+        seen.add(line)
+        counts[line] = counts.get(line, 0) + 1
+
+
 def remove_repeating_headers_footers(
     pages: Sequence[Sequence[str]],
     edge_depth: int = 2,
@@ -47,57 +66,51 @@ def remove_repeating_headers_footers(
     if not pages:
         return []
 
-    normalized_pages = [[normalize_line(line) for line in page if normalize_line(line)] for page in pages]
+    # Single normalization pass; edge lines are then counted in per-document hash tables
+    # (with the repeatable check memoized per distinct line) and dropped by position.
+    normalized_pages: List[List[str]] = []
+    for page in pages:
+        normalized = []
+        for line in page:
+            text = normalize_line(line)
+            if text:
+                normalized.append(text)
+        normalized_pages.append(normalized)
     page_count = len(normalized_pages)
     min_repeat = max(2, int(math.ceil(page_count * min_repeat_ratio)))
+    if edge_depth <= 0:
+        return normalized_pages
 
     header_counts: Dict[str, int] = {}
     footer_counts: Dict[str, int] = {}
-
+    repeatable: Dict[str, bool] = {}
     for page in normalized_pages:
-        head_candidates = page[:edge_depth]
-        tail_candidates = page[-edge_depth:] if edge_depth > 0 else []
-
-        seen_head = set()
-        for line in head_candidates:
-            if not _is_short_repeatable(line) or line in seen_head:
-                continue
-            seen_head.add(line)
-            header_counts[line] = header_counts.get(line, 0) + 1
-
-        seen_tail = set()
-        for line in tail_candidates:
-            if not _is_short_repeatable(line) or line in seen_tail:
-                continue
-            seen_tail.add(line)
-            footer_counts[line] = footer_counts.get(line, 0) + 1
+        _count_edge_lines(page[:edge_depth], header_counts, repeatable)
+        _count_edge_lines(page[-edge_depth:], footer_counts, repeatable)
 
     repeated_headers = {line for line, count in header_counts.items() if count >= min_repeat}
     repeated_footers = {line for line, count in footer_counts.items() if count >= min_repeat}
+    if not repeated_headers and not repeated_footers:
+        return normalized_pages
 
     cleaned_pages: List[List[str]] = []
     for page in normalized_pages:
-        if not page:
-            cleaned_pages.append([])
-            continue
-
-        cleaned = list(page)
-        for line in list(cleaned[:edge_depth]):
-            if line in repeated_headers:
-                cleaned.remove(line)
-
-        for line in reversed(cleaned[-edge_depth:]):
-            if line in repeated_footers and line in cleaned:
-                idx = len(cleaned) - 1 - cleaned[::-1].index(line)
-                cleaned.pop(idx)
-
+        # Header lines are dropped from the first `edge_depth` slots, footers from the last
+        # `edge_depth` slots of what remains; duplicates inside those windows all go.
+        cleaned = [line for index, line in enumerate(page) if index >= edge_depth or line not in repeated_headers]
+        tail_start = len(cleaned) - edge_depth
+        if repeated_footers:
+            cleaned = [
+                line
+                for index, line in enumerate(cleaned)
+                if index < tail_start or line not in repeated_footers
+            ]
         cleaned_pages.append(cleaned)
 
     return cleaned_pages
 
 
-def _looks_like_heading(line: str) -> bool:
-    text = normalize_line(line)
+def _is_heading_text(text: str) -> bool:
     if not text:
         return False
 
@@ -114,58 +127,59 @@ def _looks_like_heading(line: str) -> bool:
     return False
 
 
+def _looks_like_heading(line: str) -> bool:
+    return _is_heading_text(normalize_line(line))
+
+
 def _is_sentence_terminal(line: str) -> bool:
     text = normalize_line(line)
     if not text:
         return False
 
-    if text.endswith((".", "?", "!", "。", "！", "？")):
+    if text.endswith(_SENTENCE_TERMINALS):
         return True
 
     return False
 
 
-def _should_join_lines(prev_line: str, next_line: str) -> bool:
-    prev_text = normalize_line(prev_line)
-    next_text = normalize_line(next_line)
-
+def _should_join_normalized(prev_text: str, next_text: str) -> bool:
     if not prev_text or not next_text:
         return False
 
-    if _looks_like_heading(prev_text) or _looks_like_heading(next_text):
+    if _is_heading_text(prev_text) or _is_heading_text(next_text):
         return False
 
     if _LIST_PREFIX_RE.match(prev_text) or _LIST_PREFIX_RE.match(next_text):
         return False
 
-    if _is_sentence_terminal(prev_text):
+    if prev_text.endswith(_SENTENCE_TERMINALS):
         return False
 
-    if prev_text.endswith((":", ";", ",")):
-        return True
-
     return True
 
 
-def restore_hyphenation(lines: Sequence[str]) -> List[str]:
+def _should_join_lines(prev_line: str, next_line: str) -> bool:
+    return _should_join_normalized(normalize_line(prev_line), normalize_line(next_line))
+
+
+def _restore_hyphenation_normalized(lines: Sequence[str]) -> List[str]:
+    """`restore_hyphenation` over already-normalized lines (empty entries are kept as gaps)."""
     restored: List[str] = []
     index = 0
+    count = len(lines)
 
-    while index < len(lines):
-        current = normalize_line(lines[index])
+    while index < count:
+        current = lines[index]
         if not current:
             index += 1
             continue
 
-        if index + 1 < len(lines):
-            match = _HYPHEN_JOIN_RE.search(current)
-            if match:
-                nxt = normalize_line(lines[index + 1])
-                if nxt and re.match(r"^[A-Za-z]{2,}", nxt):
-                    joined = current[:-1] + nxt
-                    restored.append(joined)
-                    index += 2
-                    continue
+        if index + 1 < count and current.endswith("-") and _HYPHEN_JOIN_RE.search(current):
+            nxt = lines[index + 1]
+            if nxt and _HYPHEN_CONTINUATION_RE.match(nxt):
+                restored.append(current[:-1] + nxt)
+                index += 2
+                continue
 
         restored.append(current)
         index += 1
@@ -173,44 +187,47 @@ def restore_hyphenation(lines: Sequence[str]) -> List[str]:
     return restored
 
 
-def merge_soft_linebreaks(lines: Sequence[str]) -> str:
-    merged_lines = restore_hyphenation(lines)
+def restore_hyphenation(lines: Sequence[str]) -> List[str]:
+    return _restore_hyphenation_normalized([normalize_line(line) for line in lines])
+
+
+def _merge_normalized_lines(lines: Sequence[str]) -> str:
+    merged_lines = _restore_hyphenation_normalized(lines)
     if not merged_lines:
         return ""
 
+    # Restored lines are normalized and non-empty, and joining two of them with one space
+    # keeps the buffer normalized, so the join checks never re-normalize the growing buffer.
     paragraphs: List[str] = []
     buffer = ""
 
-    for line in merged_lines:
-        cleaned = normalize_line(line)
-        if not cleaned:
-            if buffer:
-                paragraphs.append(buffer.strip())
-                buffer = ""
-            continue
-
+    for cleaned in merged_lines:
         if not buffer:
             buffer = cleaned
             continue
 
-        if _should_join_lines(buffer, cleaned):
-            buffer = f"{buffer} {cleaned}".strip()
+        if _should_join_normalized(buffer, cleaned):
+            buffer = f"{buffer} {cleaned}"
         else:
-            paragraphs.append(buffer.strip())
+            paragraphs.append(buffer)
             buffer = cleaned
 
     if buffer:
-        paragraphs.append(buffer.strip())
+        paragraphs.append(buffer)
 
     return "\n".join(paragraphs).strip()
 
 
+def merge_soft_linebreaks(lines: Sequence[str]) -> str:
+    return _merge_normalized_lines([normalize_line(line) for line in lines])
+
+
 def build_clean_page_texts(page_lines: Sequence[Sequence[str]]) -> List[str]:
     without_headers = remove_repeating_headers_footers(page_lines)
     clean_texts: List[str] = []
 
     for lines in without_headers:
-        clean = merge_soft_linebreaks(lines)
+        clean = _merge_normalized_lines(lines)
         clean_texts.append(normalize_text(clean))
 
     return clean_texts
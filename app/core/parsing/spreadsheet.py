@@ -4,9 +4,9 @@ import csv
 import os
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
-from ..chunking.chunker import SourceSegment, table_group_to_structured_text
+from ..chunking.chunker import SourceSegment, is_header_row, table_entity_id, table_group_to_structured_text
 from .cleaning import normalize_line, normalize_text
 
 try:
@@ -14,6 +14,8 @@ try:
 except ImportError:  # pragma: no cover
     load_workbook = None
 
+SPREADSHEET_ROW_WINDOW = max(1, int(os.getenv("SPREADSHEET_ROW_WINDOW", "200")))
+
 _SUPPORTED_SPREADSHEET_EXTENSIONS = {
     ".xlsx",
     ".xlsm",
@@ -46,13 +48,119 @@ def _normalize_cell(value) -> str:  # noqa: ANN001
     return normalize_line(str(value).replace("\n", " ").strip())
 
 
-def _build_sheet_segments(
+def _table_window_segments(
+    sheet_name: str,
+    sheet_index: int,
+    window_lines: Sequence[str],
+    header_line: str,
+    row_offset: int,
+    table_index: int,
+) -> Tuple[List[SourceSegment], str, str]:
+    table_lines = [header_line, *window_lines] if header_line else list(window_lines)
+    table_raw, row_sentences = table_group_to_structured_text(table_lines, row_offset=row_offset)
+    table_raw = normalize_text(table_raw)
+    raw_text = "\n".join(table_lines).strip()
+    table_id = table_entity_id(sheet_index, table_index)
+
+    segments: List[SourceSegment] = []
+    if table_raw:
+        segments.append(
+            SourceSegment(
+                page=sheet_index,
+                chunk_type="table_raw",
+                text=table_raw,
+                raw_text=raw_text,
+                section_title=sheet_name,
+                table_id=table_id,
+            )
+        )
+
+    for row_sentence in row_sentences:
+        cleaned = normalize_text(row_sentence.text)
+        if not cleaned:
+            continue
+        segments.append(
+            SourceSegment(
+                page=sheet_index,
+                chunk_type="table_row_sentence",
+                text=cleaned,
+                section_title=sheet_name,
+                table_cell_refs=",".join(row_sentence.cell_refs),
+                table_layout=row_sentence.layout,
+                table_id=table_id,
+            )
+        )
+
+    # The repeated header is context for the window only; document text keeps it once.
+    return segments, "\n".join(window_lines).strip(), table_raw
+
+
+def _key_value_segment(sheet_name: str, sheet_index: int, key_value_lines: Sequence[str]) -> SourceSegment | None:
+    paragraph_text = normalize_text("\n".join(key_value_lines))
+    if not paragraph_text:
+        return None
+    return SourceSegment(
+        page=sheet_index,
+        chunk_type="paragraph",
+        text=paragraph_text,
+        raw_text="\n".join(key_value_lines).strip(),
+        section_title=sheet_name,
+    )
+
+
+def _iter_sheet_segments(
     sheet_name: str,
     sheet_index: int,
     rows: Iterable[Sequence[object]],
-) -> Tuple[List[SourceSegment], List[str], List[str]]:
+    row_window: int | None = None,
+) -> Iterator[Tuple[List[SourceSegment], List[str], List[str]]]:
+    """Walk rows lazily and yield (segments, raw_parts, clean_parts) per bounded row window.
+
+    Table windows after the first repeat the sheet's header row so every window reads
+    as a standalone table; two-cell rows also feed a key/value paragraph per window.
+    """
+    row_window = max(1, row_window or SPREADSHEET_ROW_WINDOW)
+    header_line = ""
+    header_repeatable = False
+    consumed_lines = 0
+    table_index = 0
+    window_lines: List[str] = []
     key_value_lines: List[str] = []
-    table_lines: List[str] = []
+
+    def _flush() -> Tuple[List[SourceSegment], List[str], List[str]]:
+        nonlocal consumed_lines, table_index
+        segments: List[SourceSegment] = []
+        raw_parts: List[str] = []
+        clean_parts: List[str] = []
+
+        if key_value_lines:
+            paragraph = _key_value_segment(sheet_name, sheet_index, key_value_lines)
+            if paragraph is not None:
+                segments.append(paragraph)
+                raw_parts.append(paragraph.text)
+                clean_parts.append(paragraph.text)
+            key_value_lines.clear()
+
+        if window_lines:
+            repeat_header = header_repeatable and consumed_lines > 0
+            row_offset = consumed_lines - 1 if repeat_header else consumed_lines
+            table_segments, window_raw, window_clean = _table_window_segments(
+                sheet_name=sheet_name,
+                sheet_index=sheet_index,
+                window_lines=window_lines,
+                header_line=header_line if repeat_header else "",
+                row_offset=row_offset,
+                table_index=table_index,
+            )
+            segments.extend(table_segments)
+            if table_segments and table_segments[0].chunk_type == "table_raw":
+                raw_parts.append(window_raw)
+                clean_parts.append(window_clean)
+            consumed_lines += len(window_lines)
+            table_index += 1
+            window_lines.clear()
+
+        return segments, raw_parts, clean_parts
 
     for row in rows:
         cells = [_normalize_cell(cell) for cell in row]
@@ -64,77 +172,50 @@ def _build_sheet_segments(
             left, right = cells
             key_value_lines.append(f"{left}: {right}")
 
-        table_lines.append(" | ".join(cells))
+        line = " | ".join(cells)
+        if not header_line:
+            header_line = line
+            header_repeatable = is_header_row(cells)
+        window_lines.append(line)
+
+        if len(window_lines) >= row_window:
+            yield _flush()
 
-    if not key_value_lines and not table_lines:
-        return [], [], []
+    if window_lines or key_value_lines:
+        yield _flush()
 
+
+def _build_sheet_segments(
+    sheet_name: str,
+    sheet_index: int,
+    rows: Iterable[Sequence[object]],
+) -> Tuple[List[SourceSegment], List[str], List[str]]:
+    # Rows are read lazily and cut into windows, but the segments are collected for the whole
+    # sheet: chunk merge/dedup/budget, table entities, the chunk cache and the stored document
+    # text all work per document, so memory still grows with the row count.
     segments: List[SourceSegment] = []
     raw_parts: List[str] = []
     clean_parts: List[str] = []
 
-    if key_value_lines:
-        paragraph_text = normalize_text("\n".join(key_value_lines))
-        if paragraph_text:
-            segments.append(
-                SourceSegment(
-                    page=sheet_index,
-                    chunk_type="paragraph",
-                    text=paragraph_text,
-                    raw_text="\n".join(key_value_lines).strip(),
-                    section_title=sheet_name,
-                )
-            )
-            raw_parts.append(paragraph_text)
-            clean_parts.append(paragraph_text)
-
-    if table_lines:
-        table_raw, row_sentences = table_group_to_structured_text(table_lines)
-        table_raw = normalize_text(table_raw)
-        raw_text = "\n".join(table_lines).strip()
-
-        if table_raw:
-            segments.append(
-                SourceSegment(
-                    page=sheet_index,
-                    chunk_type="table_raw",
-                    text=table_raw,
-                    raw_text=raw_text,
-                    section_title=sheet_name,
-                )
-            )
-            raw_parts.append(raw_text)
-            clean_parts.append(table_raw)
-
-        for row_sentence in row_sentences:
-            cleaned = normalize_text(row_sentence.text)
-            if not cleaned:
-                continue
-            segments.append(
-                SourceSegment(
-                    page=sheet_index,
-                    chunk_type="table_row_sentence",
-                    text=cleaned,
-                    raw_text=raw_text,
-                    section_title=sheet_name,
-                    table_cell_refs=",".join(row_sentence.cell_refs),
-                    table_layout=row_sentence.layout,
-                )
-            )
+    for window_segments, window_raw_parts, window_clean_parts in _iter_sheet_segments(
+        sheet_name,
+        sheet_index,
+        rows,
+    ):
+        segments.extend(window_segments)
+        raw_parts.extend(window_raw_parts)
+        clean_parts.extend(window_clean_parts)
 
     return segments, raw_parts, clean_parts
 
 
 def _extract_from_csv(file_path: str) -> Tuple[str, str, List[SourceSegment]]:
     with open(file_path, "r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.reader(handle)
-        rows = [row for row in reader]
-
-    segments, raw_parts, clean_parts = _build_sheet_segments(
-        sheet_name="CSV",
-        sheet_index=1,
-        rows=rows,
-    )
+        segments, raw_parts, clean_parts = _build_sheet_segments(
+            sheet_name="CSV",
+            sheet_index=1,
+            rows=csv.reader(handle),
+        )
 
     raw_text = normalize_text("\n\n".join(raw_parts))
     clean_text = normalize_text("\n\n".join(clean_parts))
@@ -3,29 +3,50 @@ from __future__ import annotations
 import hashlib
 import os
 import re
+import json
 import time
+from datetime import datetime, timezone
 from typing import List, Sequence, Tuple
 
+from .chunking import chunk_cache
 from .chunking.chunker import (
     ChunkRecord,
     SourceSegment,
+    TableEntity,
     build_chunks,
     chunker_from_env,
+    collect_table_entities,
+    table_entity_id,
     table_group_to_structured_text,
 )
+from .chunking.token_counter import TokenCounter, token_counter_for_model
 from .document_summary import (
     build_document_summary,
+    build_llm_document_summary,
     classify_document_types,
+    needs_llm_summary,
     parse_document_types,
     serialize_document_types,
 )
+from .dedup.hash import safe_file_sha256
 from .dedup.policies import resolve_policy, should_index_document
 from .dedup.service import (
     compute_document_hashes,
     run_exact_for_document,
     run_near_for_document,
 )
-from .ocr import perform_ocr
+from .display_text import build_display_fields
+from .ocr import ocr_output_identity, perform_ocr
+from .pipeline_profiler import profile_stage, profiling, set_count
+from .search_filters import normalize_created_at
+from .summary_cache import load_cached_summary, store_cached_summary
+from .summary_enrichment import (
+    SUMMARY_STATUS_EXTRACTIVE,
+    SUMMARY_STATUS_LLM,
+    SUMMARY_STATUS_PENDING,
+    defer_llm_summary,
+    enqueue_summary_enrichment,
+)
 from .parsing.cleaning import build_clean_page_texts, merge_soft_linebreaks, normalize_line, normalize_text
 from .parsing.reflow import ReflowConfig, is_table_like_line, reflow_pdf
 from .parsing.spreadsheet import extract_spreadsheet_segments, is_spreadsheet_file
@@ -70,6 +91,8 @@ class _FallbackEmbedder:
 
 def _load_embedder():
     model_name = os.getenv("EMBEDDING_MODEL_NAME", "paraphrase-multilingual-MiniLM-L12-v2")
+    if os.getenv("EMBEDDING_FALLBACK_ONLY", "false").strip().lower() in {"1", "true", "yes", "on"}:
+        return _FallbackEmbedder(), "fallback", "fallback-deterministic", "1"
     if SentenceTransformer is None:
         print("[pipeline] sentence-transformers is unavailable, using fallback embedder.")
         return _FallbackEmbedder(), "fallback", "fallback-deterministic", "1"
@@ -85,6 +108,17 @@ def _load_embedder():
 
 model, EMBEDDING_BACKEND, EMBEDDING_MODEL_NAME, EMBEDDING_MODEL_VERSION = _load_embedder()
 
+
+def _load_token_counter() -> TokenCounter | None:
+    config = chunker_from_env()
+    if not config["token_sizing"]:
+        return None
+    return token_counter_for_model(model, EMBEDDING_MODEL_NAME, config["max_tokens"])
+
+
+# Paragraph chunks are packed up to the embedding model's sequence limit (see chunker).
+CHUNK_TOKEN_COUNTER = _load_token_counter()
+
 PIPELINE_MAX_RETRIES = max(0, int(os.getenv("PIPELINE_MAX_RETRIES", "2")))
 PIPELINE_RETRY_BACKOFF_SECONDS = float(os.getenv("PIPELINE_RETRY_BACKOFF_SECONDS", "1.5"))
 OCR_MIN_TEXT_LENGTH = int(os.getenv("OCR_MIN_TEXT_LENGTH", "24"))
@@ -249,8 +283,10 @@ def _prepare_plain_lines(plain_text: str) -> List[str]:
 
 
 def _build_segments_from_reflow(file_path: str) -> Tuple[str, str, List[SourceSegment]]:
-    reflow_result = reflow_pdf(file_path, config=ReflowConfig.from_env())
+    with profile_stage("reflow"):
+        reflow_result = reflow_pdf(file_path, config=ReflowConfig.from_env())
     pages = reflow_result.pages
+    set_count("pages", len(pages))
 
     page_paragraph_lines = [page.paragraph_lines for page in pages]
     clean_page_texts = build_clean_page_texts(page_paragraph_lines)
@@ -298,10 +334,11 @@ def _build_segments_from_reflow(file_path: str) -> Tuple[str, str, List[SourceSe
                 )
                 clean_text_parts.append(right_text)
 
-        for table_lines in page.table_groups:
+        for table_index, table_lines in enumerate(page.table_groups):
             table_raw, row_sentences = table_group_to_structured_text(table_lines)
             table_raw = normalize_text(table_raw)
             raw_text = "\n".join(table_lines).strip()
+            table_id = table_entity_id(page_number, table_index)
 
             if table_raw:
                 segments.append(
@@ -310,6 +347,7 @@ def _build_segments_from_reflow(file_path: str) -> Tuple[str, str, List[SourceSe
                         chunk_type="table_raw",
                         text=table_raw,
                         raw_text=raw_text,
+                        table_id=table_id,
                     )
                 )
                 clean_text_parts.append(table_raw)
@@ -323,9 +361,9 @@ def _build_segments_from_reflow(file_path: str) -> Tuple[str, str, List[SourceSe
                         page=page_number,
                         chunk_type="table_row_sentence",
                         text=cleaned_row,
-                        raw_text=raw_text,
                         table_cell_refs=",".join(row_sentence.cell_refs),
                         table_layout=row_sentence.layout,
+                        table_id=table_id,
                     )
                 )
 
@@ -357,10 +395,11 @@ def _build_segments_from_plain_text(plain_text: str) -> Tuple[str, str, List[Sou
         )
         clean_text_parts.append(paragraph_text)
 
-    for table_lines in table_groups:
+    for table_index, table_lines in enumerate(table_groups):
         table_raw, row_sentences = table_group_to_structured_text(table_lines)
         table_raw = normalize_text(table_raw)
         raw_text = "\n".join(table_lines).strip()
+        table_id = table_entity_id(1, table_index)
 
         if table_raw:
             segments.append(
@@ -369,6 +408,7 @@ def _build_segments_from_plain_text(plain_text: str) -> Tuple[str, str, List[Sou
                     chunk_type="table_raw",
                     text=table_raw,
                     raw_text=raw_text,
+                    table_id=table_id,
                 )
             )
             clean_text_parts.append(table_raw)
@@ -382,9 +422,9 @@ def _build_segments_from_plain_text(plain_text: str) -> Tuple[str, str, List[Sou
                     page=1,
                     chunk_type="table_row_sentence",
                     text=cleaned_row,
-                    raw_text=raw_text,
                     table_cell_refs=",".join(row_sentence.cell_refs),
                     table_layout=row_sentence.layout,
+                    table_id=table_id,
                 )
             )
 
@@ -392,41 +432,122 @@ def _build_segments_from_plain_text(plain_text: str) -> Tuple[str, str, List[Sou
     return body, clean_text, segments
 
 
-def generate_chunk_records(file_path: str) -> Tuple[str, str, List[ChunkRecord]]:
+def _parse_chunk_records(
+    file_path: str,
+    file_sha256: str | None = None,
+) -> Tuple[str, str, List[ChunkRecord], List[TableEntity], bool]:
+    # The trailing flag is False when OCR was needed but returned nothing, so a
+    # transient worker outage never gets persisted in the chunk cache.
+    ocr_complete = True
     if is_spreadsheet_file(file_path):
-        raw_text, clean_text, segments = extract_spreadsheet_segments(file_path)
+        with profile_stage("segments"):
+            raw_text, clean_text, segments = extract_spreadsheet_segments(file_path)
+        set_count("pages", len({segment.page for segment in segments}))
     else:
-        raw_text, clean_text, segments = _build_segments_from_reflow(file_path)
+        with profile_stage("segments"):
+            raw_text, clean_text, segments = _build_segments_from_reflow(file_path)
 
         if _needs_ocr(raw_text, clean_text) or not segments:
-            ocr_text = perform_ocr(file_path)
+            with profile_stage("ocr"):
+                ocr_text = perform_ocr(file_path, file_sha256=file_sha256)
             if ocr_text.strip():
-                raw_text, clean_text, segments = _build_segments_from_plain_text(ocr_text)
+                with profile_stage("segments"):
+                    raw_text, clean_text, segments = _build_segments_from_plain_text(ocr_text)
+            else:
+                ocr_complete = False
 
         if not segments and raw_text.strip():
-            raw_text, clean_text, segments = _build_segments_from_plain_text(raw_text)
+            with profile_stage("segments"):
+                raw_text, clean_text, segments = _build_segments_from_plain_text(raw_text)
 
     if not raw_text and not clean_text:
         placeholder = "[OCR pending] No extractable text found. Configure OCR worker for scanned PDFs."
-        return placeholder, "", []
+        return placeholder, "", [], [], False
 
     chunk_cfg = chunker_from_env()
-    chunk_records = build_chunks(
-        segments=segments,
-        embedding_model_name=EMBEDDING_MODEL_NAME,
-        embedding_model_version=EMBEDDING_MODEL_VERSION,
-        max_chars=chunk_cfg["max_chars"],
-        overlap_sentences=chunk_cfg["overlap_sentences"],
-        min_chunk_chars=chunk_cfg["min_chunk_chars"],
-        noise_threshold=chunk_cfg["noise_threshold"],
-        chunk_schema_version=chunk_cfg["chunk_schema_version"],
-        dedup_identical_chunks=chunk_cfg["dedup_identical_chunks"],
-        dedup_identical_chunks_min_chars=chunk_cfg["dedup_identical_chunks_min_chars"],
-        max_chunks_per_doc=chunk_cfg["max_chunks_per_doc"],
-        table_row_sentence_max_per_table=chunk_cfg["table_row_sentence_max_per_table"],
-        table_row_sentence_merge_size=chunk_cfg["table_row_sentence_merge_size"],
+    with profile_stage("chunking"):
+        chunk_records = build_chunks(
+            segments=segments,
+            embedding_model_name=EMBEDDING_MODEL_NAME,
+            embedding_model_version=EMBEDDING_MODEL_VERSION,
+            max_chars=chunk_cfg["max_chars"],
+            overlap_sentences=chunk_cfg["overlap_sentences"],
+            min_chunk_chars=chunk_cfg["min_chunk_chars"],
+            noise_threshold=chunk_cfg["noise_threshold"],
+            chunk_schema_version=chunk_cfg["chunk_schema_version"],
+            dedup_identical_chunks=chunk_cfg["dedup_identical_chunks"],
+            dedup_identical_chunks_min_chars=chunk_cfg["dedup_identical_chunks_min_chars"],
+            max_chunks_per_doc=chunk_cfg["max_chunks_per_doc"],
+            table_row_sentence_max_per_table=chunk_cfg["table_row_sentence_max_per_table"],
+            table_row_sentence_merge_size=chunk_cfg["table_row_sentence_merge_size"],
+            token_counter=CHUNK_TOKEN_COUNTER,
+        )
+        tables = collect_table_entities(segments)
+
+    return raw_text, clean_text, chunk_records, tables, ocr_complete
+
+
+def _parse_fingerprint() -> str:
+    return chunk_cache.build_parse_fingerprint(
+        {
+            "ocr_min_text_length": OCR_MIN_TEXT_LENGTH,
+            "ocr_skip_min_chars": OCR_SKIP_MIN_CHARS,
+            "ocr": ocr_output_identity(),
+            "token_counter": CHUNK_TOKEN_COUNTER.name if CHUNK_TOKEN_COUNTER else "",
+            "max_tokens": CHUNK_TOKEN_COUNTER.max_tokens if CHUNK_TOKEN_COUNTER else 0,
+        }
     )
 
+
+def generate_parse_result(
+    file_path: str,
+    file_sha256: str | None = None,
+    use_cache: bool = True,
+) -> Tuple[str, str, List[ChunkRecord], List[TableEntity]]:
+    """Parse and chunk a file, reusing the chunk cache when file and parser config match.
+
+    Returns raw/clean text, chunk records and the document's table entities; table row
+    chunks reference their table by `table_id` rather than carrying its text.
+    """
+    if not (use_cache and chunk_cache.CHUNK_CACHE_ENABLED):
+        raw_text, clean_text, chunk_records, tables, _ = _parse_chunk_records(file_path, file_sha256=file_sha256)
+        return raw_text, clean_text, chunk_records, tables
+
+    if not file_sha256:
+        with profile_stage("hash"):
+            file_sha256 = safe_file_sha256(file_path)
+    fingerprint = _parse_fingerprint()
+    with profile_stage("parse_cache"):
+        cached = chunk_cache.load_chunk_records(
+            file_sha256,
+            fingerprint,
+            embedding_model_name=EMBEDDING_MODEL_NAME,
+            embedding_model_version=EMBEDDING_MODEL_VERSION,
+        )
+    set_count("parse_cache_hit", int(cached is not None))
+    if cached is not None:
+        return cached
+
+    raw_text, clean_text, chunk_records, tables, ocr_complete = _parse_chunk_records(
+        file_path,
+        file_sha256=file_sha256,
+    )
+    if ocr_complete and chunk_records:
+        with profile_stage("parse_cache"):
+            chunk_cache.store_chunk_records(file_sha256, fingerprint, raw_text, clean_text, chunk_records, tables)
+    return raw_text, clean_text, chunk_records, tables
+
+
+def generate_chunk_records(
+    file_path: str,
+    file_sha256: str | None = None,
+    use_cache: bool = True,
+) -> Tuple[str, str, List[ChunkRecord]]:
+    raw_text, clean_text, chunk_records, _ = generate_parse_result(
+        file_path,
+        file_sha256=file_sha256,
+        use_cache=use_cache,
+    )
     return raw_text, clean_text, chunk_records
 
 
@@ -435,15 +556,22 @@ def _index_chunks(doc, chunk_records: Sequence[ChunkRecord]) -> None:
         raise ValueError("No indexable chunks created from document text.")
 
     chunk_texts = [record.content for record in chunk_records]
-    embeddings = _embed_texts(chunk_texts)
+    with profile_stage("embedding"):
+        embeddings = _embed_texts(chunk_texts)
 
     if len(embeddings) != len(chunk_records):
         raise ValueError("Embedding generation count mismatch.")
 
+    with profile_stage("indexing"):
+        _write_chunks_to_index(doc, chunk_records, embeddings)
+
+
+def _write_chunks_to_index(doc, chunk_records: Sequence[ChunkRecord], embeddings: Sequence[List[float]]) -> None:
     vector_store.create_index_if_not_exists()
     vector_store.delete_document(doc.id)
 
     for record, embedding in zip(chunk_records, embeddings):
+        display_fields = build_display_fields(record.content)
         is_primary = (
             doc.dedup_primary_doc_id is None
             or int(doc.dedup_primary_doc_id) == int(doc.id)
@@ -465,6 +593,7 @@ def _index_chunks(doc, chunk_records: Sequence[ChunkRecord]) -> None:
             raw_text=record.raw_text,
             table_cell_refs=record.table_cell_refs,
             table_layout=record.table_layout,
+            table_id=record.table_id,
             chunk_schema_version=record.chunk_schema_version,
             embedding_model_name=record.embedding_model_name,
             embedding_model_version=record.embedding_model_version,
@@ -472,11 +601,36 @@ def _index_chunks(doc, chunk_records: Sequence[ChunkRecord]) -> None:
             dedup_primary_doc_id=doc.dedup_primary_doc_id,
             dedup_cluster_id=doc.dedup_cluster_id,
             dedup_is_primary=is_primary,
+            project_id=getattr(doc, "project_id", None),
+            created_at=normalize_created_at(getattr(doc, "created_at", None)),
+            **display_fields,
+        )
+
+
+def _store_document_tables(db, doc, tables: Sequence[TableEntity]) -> None:
+    """Replace the document's table entities; row chunks in the index reference them by table_id."""
+    from .. import models
+
+    db.query(models.DocumentTable).filter(models.DocumentTable.doc_id == doc.id).delete(
+        synchronize_session=False
+    )
+    for table in tables:
+        db.add(
+            models.DocumentTable(
+                doc_id=doc.id,
+                table_id=table.table_id,
+                page=table.page,
+                table_index=table.table_index,
+                section_title=table.section_title or "",
+                raw_text=table.raw_text or "",
+                markdown=table.markdown or "",
+            )
         )
 
 
 def _apply_dedup_policy(doc, db, clean_text: str, dedup_mode_override: str | None, index_policy_override: str | None):
-    file_hash, text_hash, _ = compute_document_hashes(doc.file_path, clean_text or "")
+    with profile_stage("hash"):
+        file_hash, text_hash, _ = compute_document_hashes(doc.file_path, clean_text or "")
     if file_hash:
         doc.file_sha256 = file_hash
     if text_hash:
@@ -491,10 +645,12 @@ def _apply_dedup_policy(doc, db, clean_text: str, dedup_mode_override: str | Non
     )
 
     if policy_config.dedup_mode in {"exact_only", "exact_and_near"}:
-        run_exact_for_document(db, doc, dry_run=False)
+        with profile_stage("dedup_exact"):
+            run_exact_for_document(db, doc, dry_run=False)
 
     if policy_config.dedup_mode == "exact_and_near":
-        run_near_for_document(db, doc, dry_run=False)
+        with profile_stage("dedup_near"):
+            run_near_for_document(db, doc, dry_run=False)
 
     should_index, reason = should_index_document(doc, policy_config)
     return should_index, reason, policy_config
@@ -513,7 +669,8 @@ def _precheck_exact_duplicate_by_file_hash(
     if policy_config.dedup_mode not in {"exact_only", "exact_and_near"}:
         return False, "dedup_off_or_near_only", policy_config
 
-    file_hash, _, _ = compute_document_hashes(doc.file_path, "")
+    with profile_stage("hash"):
+        file_hash, _, _ = compute_document_hashes(doc.file_path, "")
     if file_hash:
         doc.file_sha256 = file_hash
 
@@ -521,19 +678,60 @@ def _precheck_exact_duplicate_by_file_hash(
         doc.dedup_status = "unique"
 
     if file_hash:
-        run_exact_for_document(db, doc, dry_run=False)
+        with profile_stage("dedup_exact"):
+            run_exact_for_document(db, doc, dry_run=False)
 
     should_index, reason = should_index_document(doc, policy_config)
     should_skip = (not should_index) and (doc.dedup_status or "").strip().lower() == "exact_dup"
     return should_skip, reason, policy_config
 
 
+def _apply_document_summary(doc, db, doc_types: Sequence[str]) -> bool:
+    """Set ai_title/ai_summary_short; returns True when LLM enrichment is deferred to the queue."""
+    # The LLM summary can take tens of seconds; when deferred, index with the extractive one
+    # and let the enrichment queue patch the LLM title/summary in afterwards. Documents with
+    # the same normalized text reuse a cached LLM summary instead of calling the model again.
+    use_llm = needs_llm_summary(doc_types)
+    text_hash = doc.normalized_text_sha256 or ""
+    with profile_stage("summary"):
+        llm_summary = (
+            load_cached_summary(db, text_hash, doc_types, doc.filename or "", doc.content_text or "")
+            if use_llm
+            else None
+        )
+        defer_summary = use_llm and not llm_summary and defer_llm_summary()
+        if use_llm and not llm_summary and not defer_summary:
+            llm_summary = build_llm_document_summary(
+                filename=doc.filename or "",
+                content_text=doc.content_text or "",
+                document_types=doc_types,
+            )
+            if llm_summary:
+                store_cached_summary(db, text_hash, doc_types, doc.filename or "", *llm_summary)
+        if llm_summary:
+            doc.ai_title, doc.ai_summary_short = llm_summary
+            doc.ai_summary_status = SUMMARY_STATUS_LLM
+        else:
+            doc.ai_title, doc.ai_summary_short = build_document_summary(
+                filename=doc.filename or "",
+                content_text=doc.content_text or "",
+                document_types=doc_types,
+                use_llm=False,
+            )
+            doc.ai_summary_status = SUMMARY_STATUS_PENDING if defer_summary else SUMMARY_STATUS_EXTRACTIVE
+        # Any in-flight enrichment batch holds the previous claim and no longer applies its result.
+        doc.ai_summary_claimed_at = None
+    return defer_summary
+
+
 def _process_document_once(
     doc,
     db,
     dedup_mode_override: str | None = None,
     index_policy_override: str | None = None,
-):
+    use_parse_cache: bool = True,
+) -> str:
+    """Run one processing attempt; returns "indexed" or "skipped" (dedup policy)."""
     should_skip, reason, _ = _precheck_exact_duplicate_by_file_hash(
         doc=doc,
         db=db,
@@ -545,27 +743,28 @@ def _process_document_once(
         doc.status = "completed"
         db.commit()
         print(f"[pipeline] doc_id={doc.id} indexing skipped before OCR by dedup policy: {reason}")
-        return
+        return "skipped"
 
-    raw_text, clean_text, chunk_records = generate_chunk_records(doc.file_path)
+    raw_text, clean_text, chunk_records, tables = generate_parse_result(
+        doc.file_path,
+        file_sha256=doc.file_sha256,
+        use_cache=use_parse_cache,
+    )
 
     if _is_non_indexable_text(raw_text) and _is_non_indexable_text(clean_text):
         raise ValueError("No extractable text found after parser and OCR fallback.")
 
     if not chunk_records:
         raise ValueError("No indexable chunks created from document text.")
+    set_count("chunks", len(chunk_records))
 
     doc.content_text = clean_text or raw_text
-    doc_types = classify_document_types(
-        filename=doc.filename or "",
-        content_text=doc.content_text or "",
-    )
+    with profile_stage("classification"):
+        doc_types = classify_document_types(
+            filename=doc.filename or "",
+            content_text=doc.content_text or "",
+        )
     doc.document_types = serialize_document_types(doc_types)
-    doc.ai_title, doc.ai_summary_short = build_document_summary(
-        filename=doc.filename or "",
-        content_text=doc.content_text or "",
-        document_types=doc_types,
-    )
     should_index, reason, _ = _apply_dedup_policy(
         doc=doc,
         db=db,
@@ -573,18 +772,62 @@ def _process_document_once(
         dedup_mode_override=dedup_mode_override,
         index_policy_override=index_policy_override,
     )
+    # After dedup so the normalized text hash is known for the summary cache.
+    defer_summary = _apply_document_summary(doc, db, doc_types)
 
     if not should_index:
         vector_store.delete_document(doc.id)
+        _store_document_tables(db, doc, [])
         doc.status = "completed"
         db.commit()
+        if defer_summary:
+            enqueue_summary_enrichment([doc.id])
         print(f"[pipeline] doc_id={doc.id} indexing skipped by dedup policy: {reason}")
-        return
+        return "skipped"
 
     _index_chunks(doc, chunk_records)
+    with profile_stage("indexing"):
+        _store_document_tables(db, doc, tables)
+    set_count("tables", len(tables))
 
     doc.status = "completed"
     db.commit()
+    if defer_summary:
+        enqueue_summary_enrichment([doc.id])
+    return "indexed"
+
+
+def _record_pipeline_run(db, doc_id: int, profile, status: str, attempt: int = 1, error: str = "") -> None:
+    """Persist one attempt's stage timings; profiling problems never fail the document."""
+    if profile is None:
+        return
+    from .. import models
+
+    try:
+        profile.finish()
+        payload = profile.as_dict()
+        counts = payload["counts"]
+        db.add(
+            models.DocumentPipelineRun(
+                doc_id=doc_id,
+                attempt=attempt,
+                status=status,
+                total_ms=payload["total_ms"],
+                page_count=counts.get("pages"),
+                chunk_count=counts.get("chunks"),
+                stages_json=json.dumps(payload["stages"], sort_keys=False),
+                counts_json=json.dumps(counts, sort_keys=True),
+                error=error or None,
+                created_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            )
+        )
+        db.commit()
+    except Exception as exc:  # noqa: BLE001
+        print(f"[pipeline] failed to record pipeline run doc_id={doc_id}: {exc}")
+        try:
+            db.rollback()
+        except Exception:  # noqa: BLE001
+            pass
 
 
 def process_document(
@@ -601,6 +844,7 @@ def process_document(
     for attempt in range(1, PIPELINE_MAX_RETRIES + 2):
         db = SessionLocal()
         should_retry = False
+        profile = None
 
         try:
             doc = db.query(models.Document).filter(models.Document.id == doc_id).first()
@@ -610,12 +854,14 @@ def process_document(
             doc.status = "processing"
             db.commit()
 
-            _process_document_once(
-                doc,
-                db,
-                dedup_mode_override=dedup_mode_override,
-                index_policy_override=index_policy_override,
-            )
+            with profiling() as profile:
+                outcome = _process_document_once(
+                    doc,
+                    db,
+                    dedup_mode_override=dedup_mode_override,
+                    index_policy_override=index_policy_override,
+                )
+            _record_pipeline_run(db, doc_id, profile, outcome, attempt=attempt)
             return
         except Exception as exc:  # noqa: BLE001
             last_error = f"{type(exc).__name__}: {exc}"
@@ -624,6 +870,7 @@ def process_document(
                 db.rollback()
             except Exception:  # noqa: BLE001
                 pass
+            _record_pipeline_run(db, doc_id, profile, "failed", attempt=attempt, error=last_error)
 
             is_non_retryable = _is_non_retryable_error(exc)
 
@@ -656,6 +903,7 @@ def process_document_with_session(
     db,
     dedup_mode_override: str | None = None,
     index_policy_override: str | None = None,
+    use_parse_cache: bool = True,
 ):
     """Compatibility wrapper for legacy callers that pass an existing DB session."""
     from .. import models
@@ -664,17 +912,23 @@ def process_document_with_session(
     if not doc:
         return
 
-    try:
-        doc.status = "processing"
-        db.commit()
-        _process_document_once(
-            doc,
-            db,
-            dedup_mode_override=dedup_mode_override,
-            index_policy_override=index_policy_override,
-        )
-    except Exception as exc:  # noqa: BLE001
-        doc.status = "failed"
-        doc.content_text = f"[PIPELINE ERROR] {type(exc).__name__}: {exc}"
-        db.commit()
-        print(f"[pipeline] legacy session path failed doc_id={doc_id}: {exc}")
+    with profiling() as profile:
+        try:
+            doc.status = "processing"
+            db.commit()
+            outcome = _process_document_once(
+                doc,
+                db,
+                dedup_mode_override=dedup_mode_override,
+                index_policy_override=index_policy_override,
+                use_parse_cache=use_parse_cache,
+            )
+            error = ""
+        except Exception as exc:  # noqa: BLE001
+            outcome = "failed"
+            error = f"{type(exc).__name__}: {exc}"
+            doc.status = "failed"
+            doc.content_text = f"[PIPELINE ERROR] {error}"
+            db.commit()
+            print(f"[pipeline] legacy session path failed doc_id={doc_id}: {exc}")
+    _record_pipeline_run(db, doc_id, profile, outcome, error=error)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import math
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+PIPELINE_PROFILE_ENABLED = os.getenv("PIPELINE_PROFILE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+# Display order for reports; unknown stage names are appended after these.
+PIPELINE_STAGES = (
+    "hash",
+    "parse_cache",
+    "reflow",
+    "ocr",
+    "segments",
+    "chunking",
+    "classification",
+    "dedup_exact",
+    "dedup_near",
+    "summary",
+    "embedding",
+    "indexing",
+)
+
+_current_profile: ContextVar[Optional["PipelineProfile"]] = ContextVar("pipeline_profile", default=None)
+
+
+class PipelineProfile:
+    """Per-document stage timings in milliseconds.
+
+    Stages report self time: a stage opened inside another stage (for example `ocr` inside
+    `segments`) is subtracted from its parent, so stage totals add up to the profiled time.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._stack: List[list] = []
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self.stages[name] = self.stages.get(name, 0.0) + (elapsed - frame[2]) * 1000.0
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def set_count(self, name: str, value: int) -> None:
+        self.counts[name] = int(value)
+
+    def finish(self) -> None:
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+    @property
+    def total_ms(self) -> float:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return (end - self._started) * 1000.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round(self.total_ms, 2),
+            "stages": {name: round(value, 2) for name, value in _ordered(self.stages).items()},
+            "counts": dict(self.counts),
+        }
+
+
+def _ordered(stages: Dict[str, Any]) -> Dict[str, Any]:
+    names = [name for name in PIPELINE_STAGES if name in stages]
+    names.extend(sorted(name for name in stages if name not in PIPELINE_STAGES))
+    return {name: stages[name] for name in names}
+
+
+@contextmanager
+def profiling() -> Iterator[Optional[PipelineProfile]]:
+    """Activate a profile for the current context; yields None when profiling is disabled."""
+    if not PIPELINE_PROFILE_ENABLED:
+        yield None
+        return
+    profile = PipelineProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        profile.finish()
+        _current_profile.reset(token)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.stage(name):
+        yield
+
+
+def set_count(name: str, value: int) -> None:
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.set_count(name, value)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (`q` in 0..1) of an ascending list; 0.0 when empty."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 0.50), 2),
+        "p95_ms": round(percentile(values, 0.95), 2),
+        "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+        "sum_ms": round(sum(values), 2),
+    }
+
+
+def summarize_pipeline_runs(runs: Iterable[Any]) -> Dict[str, Any]:
+    """Aggregate stored runs (objects with `total_ms` and `stages_json`) into per-stage p50/p95."""
+    totals: List[float] = []
+    per_stage: Dict[str, List[float]] = {}
+    for run in runs:
+        totals.append(float(run.total_ms or 0.0))
+        try:
+            stages = json.loads(run.stages_json or "{}")
+        except (TypeError, ValueError):
+            stages = {}
+        for name, value in stages.items():
+            per_stage.setdefault(name, []).append(float(value or 0.0))
+
+    grand_total = sum(totals)
+    stages_summary = {}
+    for name, values in _ordered(per_stage).items():
+        summary = _distribution(values)
+        summary["share"] = round(summary["sum_ms"] / grand_total, 4) if grand_total else 0.0
+        stages_summary[name] = summary
+
+    return {
+        "runs": len(totals),
+        "total": _distribution(totals),
+        "stages": stages_summary,
+    }
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence
+
+from .pipeline import EMBEDDING_BACKEND, EMBEDDING_MODEL_NAME, EMBEDDING_MODEL_VERSION, model
+from .search_cache import normalize_search_query
+
+QUERY_EMBEDDING_CACHE_ENABLED = os.getenv("QUERY_EMBEDDING_CACHE_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = max(1, int(os.getenv("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", "4096")))
+# Vectors only change with the model (part of the key); the TTL just lets one-off queries age out.
+QUERY_EMBEDDING_CACHE_TTL_SECONDS = max(1.0, float(os.getenv("QUERY_EMBEDDING_CACHE_TTL_SECONDS", "86400")))
+# Top-queries log used to pre-warm the cache at startup: one query per line, optionally
+# prefixed with a count and a tab ("<count>\t<query>"); repeated lines add up.
+QUERY_EMBEDDING_WARM_FILE = os.getenv("QUERY_EMBEDDING_WARM_FILE", "").strip()
+QUERY_EMBEDDING_WARM_LIMIT = max(0, int(os.getenv("QUERY_EMBEDDING_WARM_LIMIT", "500")))
+QUERY_EMBEDDING_WARM_BATCH_SIZE = 32
+
+
+@dataclass
+class _CachedVector:
+    vector: array  # float32 ("f"): ~1.5 KB for 384 dims instead of ~12 KB as a list of floats
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class QueryEmbeddingCache:
+    def __init__(
+        self,
+        max_entries: int = QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+        enabled: bool = QUERY_EMBEDDING_CACHE_ENABLED,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, _CachedVector]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "warmed": 0}
+
+    def get(self, key: Hashable) -> Optional[List[float]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if time.monotonic() - entry.created_at > self.ttl_seconds:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            vector = entry.vector
+        # A fresh list per caller, so nobody can mutate the cached vector.
+        return vector.tolist()
+
+    def put(self, key: Hashable, vector: Sequence[float]) -> None:
+        if not self.enabled:
+            return
+        entry = _CachedVector(array("f", vector))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def contains(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def record_warmed(self, count: int) -> None:
+        with self._lock:
+            self._stats["warmed"] += count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            entries = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "lookups": lookups,
+                "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+        )
+        return stats
+
+
+query_embedding_cache = QueryEmbeddingCache()
+
+
+def query_embedding_key(query: str) -> tuple:
+    return (EMBEDDING_MODEL_NAME, EMBEDDING_MODEL_VERSION, query)
+
+
+def _to_float_list(vector) -> List[float]:
+    if hasattr(vector, "tolist"):
+        vector = vector.tolist()
+    return [float(value) for value in vector]
+
+
+def encode_query(query: str) -> List[float]:
+    """Query vector for search, memoized per normalized query and embedding model.
+
+    Returns [] while the deterministic fallback embedder is active (keyword-only search).
+    Only whitespace is normalized: the tokenizer splits on it anyway, while case and
+    punctuation can change the vector.
+    """
+    if EMBEDDING_BACKEND == "fallback":
+        return []
+    normalized = normalize_search_query(query)
+    if not normalized:
+        return []
+    key = query_embedding_key(normalized)
+    cached = query_embedding_cache.get(key)
+    if cached is not None:
+        return cached
+    vector = _to_float_list(model.encode(normalized))
+    query_embedding_cache.put(key, vector)
+    return vector
+
+
+def load_top_queries(lines: Iterable[str], limit: int) -> List[str]:
+    counts: Counter = Counter()
+    for line in lines:
+        count = 1
+        text = line.rstrip("\n")
+        head, sep, tail = text.partition("\t")
+        if sep and head.strip().isdigit():
+            count = int(head.strip())
+            text = tail
+        query = normalize_search_query(text)
+        if query:
+            counts[query] += count
+    return [query for query, _ in counts.most_common(limit)]
+
+
+def warm_query_embeddings(queries: Sequence[str]) -> int:
+    """Encode `queries` in batches into the cache; returns the number of vectors added."""
+    if EMBEDDING_BACKEND == "fallback" or not query_embedding_cache.enabled:
+        return 0
+    pending = [
+        query
+        for query in dict.fromkeys(normalize_search_query(item) for item in queries)
+        if query and not query_embedding_cache.contains(query_embedding_key(query))
+    ][: query_embedding_cache.max_entries]
+    warmed = 0
+    for start in range(0, len(pending), QUERY_EMBEDDING_WARM_BATCH_SIZE):
+        batch = pending[start : start + QUERY_EMBEDDING_WARM_BATCH_SIZE]
+        vectors = model.encode(batch)
+        if hasattr(vectors, "tolist"):
+            vectors = vectors.tolist()
+        for query, vector in zip(batch, vectors):
+            query_embedding_cache.put(query_embedding_key(query), _to_float_list(vector))
+            warmed += 1
+    query_embedding_cache.record_warmed(warmed)
+    return warmed
+
+
+def _warm_from_file(path: str, limit: int) -> None:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            queries = load_top_queries(handle, limit)
+        warmed = warm_query_embeddings(queries)
+        print(f"[query-embedding] pre-warmed {warmed} query vectors from {path}")
+    except Exception as exc:  # noqa: BLE001
+        print(f"[query-embedding] pre-warm from {path} failed: {exc}")
+
+
+def start_query_embedding_warmup() -> bool:
+    """Pre-warm from QUERY_EMBEDDING_WARM_FILE in a background thread; False when not configured."""
+    if not QUERY_EMBEDDING_WARM_FILE or QUERY_EMBEDDING_WARM_LIMIT <= 0:
+        return False
+    if EMBEDDING_BACKEND == "fallback" or not query_embedding_cache.enabled:
+        return False
+    thread = threading.Thread(
+        target=_warm_from_file,
+        args=(QUERY_EMBEDDING_WARM_FILE, QUERY_EMBEDDING_WARM_LIMIT),
+        name="query-embedding-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return True
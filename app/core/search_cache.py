@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+SEARCH_RESULT_CACHE_ENABLED = os.getenv("SEARCH_RESULT_CACHE_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+SEARCH_RESULT_CACHE_MAX_ENTRIES = max(1, int(os.getenv("SEARCH_RESULT_CACHE_MAX_ENTRIES", "256")))
+# Index writes from other processes (reindex CLI, other API workers) do not bump this
+# process's generation, so entries also expire after a TTL.
+SEARCH_RESULT_CACHE_TTL_SECONDS = max(1.0, float(os.getenv("SEARCH_RESULT_CACHE_TTL_SECONDS", "120")))
+
+
+def normalize_search_query(query: str) -> str:
+    return " ".join((query or "").split())
+
+
+@dataclass
+class CachedSearch:
+    """Reranked candidates for one query; any page inside `results` is served by slicing."""
+
+    results: List[dict]
+    generation: int
+    exhausted: bool  # the store returned fewer candidates than requested; nothing lies beyond
+    created_at: float = field(default_factory=time.monotonic)
+
+    def covers(self, end_index: int) -> bool:
+        return self.exhausted or len(self.results) >= end_index
+
+
+class SearchResultCache:
+    def __init__(
+        self,
+        max_entries: int = SEARCH_RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = SEARCH_RESULT_CACHE_TTL_SECONDS,
+        enabled: bool = SEARCH_RESULT_CACHE_ENABLED,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, CachedSearch]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "short": 0, "evictions": 0}
+
+    def get(self, key: Hashable, generation: int, end_index: int) -> Optional[CachedSearch]:
+        """Entry for `key` if it is current and covers results up to `end_index`."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.generation != generation or time.monotonic() - entry.created_at > self.ttl_seconds:
+                del self._entries[key]
+                self._stats["stale"] += 1
+                self._stats["misses"] += 1
+                return None
+            if not entry.covers(end_index):
+                self._stats["short"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def put(self, key: Hashable, entry: CachedSearch) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            entries = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "lookups": lookups,
+                "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+        )
+        return stats
+
+
+search_result_cache = SearchResultCache()
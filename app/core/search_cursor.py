@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import base64
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
+from typing import FrozenSet, Iterable, Optional, Set, Tuple
+
+SEARCH_CURSOR_VERSION = 2
+# Cursors only carry leg positions and a settled-state key, so they stay small at any depth;
+# longer tokens are rejected rather than decoded.
+SEARCH_CURSOR_MAX_TOKEN_CHARS = 1024
+# Settled documents/clusters of live cursors, kept in this process. Outlives the PIT keep-alive.
+SEARCH_CURSOR_STATE_TTL_SECONDS = max(1.0, float(os.getenv("SEARCH_CURSOR_STATE_TTL_SECONDS", "600")))
+SEARCH_CURSOR_STATE_MAX_ENTRIES = max(1, int(os.getenv("SEARCH_CURSOR_STATE_MAX_ENTRIES", "20000")))
+
+
+@dataclass
+class LegCursor:
+    """Position in one retrieval leg (keyword or vector) of a cursor search."""
+
+    after: Optional[list] = None  # sort values of the last consumed hit (ES search_after)
+    rank: int = 0  # hits consumed so far; RRF ranks of the next page continue from here
+    exhausted: bool = False
+
+
+@dataclass
+class SearchCursor:
+    """Fused and reranked state carried between pages of a cursor search.
+
+    Documents already served or dropped by reranking/cluster diversity (and the clusters
+    served) are kept server-side in `search_cursor_states` under `settled`, so later pages
+    neither repeat nor resurrect them; hits of other documents that were ranked but not
+    served stay ahead of both leg positions and come back.
+    """
+
+    query_key: str
+    backend: Optional[str] = None  # "elasticsearch" | "memory", fixed by the first page
+    pit_id: Optional[str] = None
+    keyword: LegCursor = field(default_factory=LegCursor)
+    vector: LegCursor = field(default_factory=LegCursor)
+    settled: Optional[str] = None  # search_cursor_states key of the previous page
+    page: int = 0
+    served: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.keyword.exhausted and self.vector.exhausted
+
+
+def search_cursor_key(query: str, *parts: str) -> str:
+    """Binds a cursor to its query and the dedup policy it was ranked under."""
+    raw = "\x1f".join([query, *parts])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def encode_search_cursor(cursor: SearchCursor) -> str:
+    payload = {"v": SEARCH_CURSOR_VERSION, **asdict(cursor)}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(zlib.compress(raw)).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(token: str) -> SearchCursor:
+    """Parse an opaque cursor; raises ValueError for anything that is not a valid cursor."""
+    if len(token) > SEARCH_CURSOR_MAX_TOKEN_CHARS:
+        raise ValueError("cursor too long")
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(zlib.decompress(base64.urlsafe_b64decode(padded.encode("ascii"))))
+        if not isinstance(payload, dict) or payload.pop("v", None) != SEARCH_CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
+        keyword = LegCursor(**payload.pop("keyword"))
+        vector = LegCursor(**payload.pop("vector"))
+        cursor = SearchCursor(keyword=keyword, vector=vector, **payload)
+    except ValueError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError(f"malformed cursor: {exc}") from exc
+    if not isinstance(cursor.query_key, str) or not isinstance(cursor.settled, (str, type(None))):
+        raise ValueError("malformed cursor")
+    return cursor
+
+
+class SearchCursorStateExpired(LookupError):
+    """The settled state a cursor points to was evicted or belongs to another process."""
+
+
+@dataclass(frozen=True)
+class _SettledPage:
+    parent: Optional[str]
+    doc_ids: FrozenSet[int]
+    cluster_ids: FrozenSet[str]
+
+
+class SearchCursorStates:
+    """Settled documents/clusters per cursor page, as a chain of per-page additions.
+
+    Every page stores only what it settled and points at the previous page, so an older
+    cursor (back button, retry) still resolves to its own state. LRU + TTL bounded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SEARCH_CURSOR_STATE_MAX_ENTRIES,
+        ttl_seconds: float = SEARCH_CURSOR_STATE_TTL_SECONDS,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, _SettledPage]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, key: Optional[str]) -> Tuple[Set[int], Set[str]]:
+        doc_ids: Set[int] = set()
+        cluster_ids: Set[str] = set()
+        now = time.monotonic()
+        with self._lock:
+            while key is not None:
+                item = self._entries.get(key)
+                if item is None or item[0] < now:
+                    self._entries.pop(key, None)
+                    raise SearchCursorStateExpired(key)
+                page = item[1]
+                self._entries[key] = (now + self.ttl_seconds, page)
+                self._entries.move_to_end(key)
+                doc_ids.update(page.doc_ids)
+                cluster_ids.update(page.cluster_ids)
+                key = page.parent
+        return doc_ids, cluster_ids
+
+    def save(self, parent: Optional[str], doc_ids: Iterable[int], cluster_ids: Iterable[str]) -> str:
+        key = uuid.uuid4().hex[:20]
+        page = _SettledPage(parent=parent, doc_ids=frozenset(doc_ids), cluster_ids=frozenset(cluster_ids))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, page)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return key
+
+
+search_cursor_states = SearchCursorStates()
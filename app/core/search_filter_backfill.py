@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional
+
+from .search_filters import normalize_created_at
+from .vector_store import vector_store
+
+# One-shot migration: copies project_id/created_at onto chunks indexed before search filters
+# stored them. Once no chunk is missing `created_at` the startup run is a single count query.
+SEARCH_FILTER_BACKFILL_ON_STARTUP = (
+    os.getenv("SEARCH_FILTER_BACKFILL_ON_STARTUP", "true").strip().lower() in {"1", "true", "yes", "on"}
+)
+SEARCH_FILTER_BACKFILL_BATCH_SIZE = max(1, int(os.getenv("SEARCH_FILTER_BACKFILL_BATCH_SIZE", "200")))
+
+
+def backfill_filter_fields(batch_size: int = SEARCH_FILTER_BACKFILL_BATCH_SIZE, db=None) -> Dict[str, int]:
+    """Patch `project_id`/`created_at` onto indexed chunks that predate those fields.
+
+    Skipped entirely when the index has no chunk without `created_at` (or cannot be counted).
+    """
+    from .. import models
+    from ..database import SessionLocal
+
+    stats = {"missing_chunks": 0, "documents": 0, "batches": 0}
+    missing = vector_store.count_chunks_missing_filter_fields()
+    if not missing:
+        return stats
+    stats["missing_chunks"] = missing
+
+    batch_size = max(1, int(batch_size))
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
+    last_id = 0
+    try:
+        while True:
+            rows = (
+                db.query(models.Document.id, models.Document.project_id, models.Document.created_at)
+                .filter(models.Document.id > last_id, models.Document.status == "completed")
+                .order_by(models.Document.id.asc())
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            vector_store.update_document_filter_fields(
+                {
+                    doc_id: {"project_id": project_id, "created_at": normalize_created_at(created_at)}
+                    for doc_id, project_id, created_at in rows
+                }
+            )
+            stats["documents"] += len(rows)
+            stats["batches"] += 1
+            if len(rows) < batch_size:
+                break
+        return stats
+    finally:
+        if owns_session:
+            db.close()
+
+
+_backfill_thread: Optional[threading.Thread] = None
+_backfill_lock = threading.Lock()
+
+
+def _run_backfill() -> None:
+    try:
+        stats = backfill_filter_fields()
+    except Exception as exc:  # noqa: BLE001
+        print(f"[search-filter-backfill] failed: {exc}")
+        return
+    if stats["missing_chunks"]:
+        print(
+            f"[search-filter-backfill] {stats['missing_chunks']} chunks without filter fields; "
+            f"patched {stats['documents']} documents in {stats['batches']} batches"
+        )
+
+
+def start_search_filter_backfill() -> bool:
+    """Run the backfill once on a daemon thread; returns False if disabled or already running."""
+    global _backfill_thread
+    if not SEARCH_FILTER_BACKFILL_ON_STARTUP:
+        return False
+    with _backfill_lock:
+        if _backfill_thread is not None and _backfill_thread.is_alive():
+            return False
+        _backfill_thread = threading.Thread(target=_run_backfill, name="search-filter-backfill", daemon=True)
+        _backfill_thread.start()
+    return True
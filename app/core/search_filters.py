@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .document_summary import parse_document_types
+
+# Chunk fields the filters run on. `project_id` and `created_at` are copied from the
+# Document row at index time; `document_types` is kept in sync by the type backfill.
+FILTER_FIELD_MAPPINGS = {
+    "project_id": {"type": "integer"},
+    "created_at": {"type": "date"},
+}
+
+
+def normalize_created_at(value: Any) -> Optional[str]:
+    """Document.created_at (ISO string or datetime) as a UTC ISO timestamp, None if unparsable."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0).isoformat()
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """Search restrictions applied inside the index (ES `filter` clauses, memory-store index).
+
+    Within a field any value matches; fields combine with AND. Dates are inclusive UTC days.
+    """
+
+    project_ids: Tuple[int, ...] = ()
+    document_types: Tuple[str, ...] = ()
+    created_from: Optional[date] = None
+    created_to: Optional[date] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.project_ids or self.document_types or self.created_from or self.created_to)
+
+    @property
+    def key(self) -> Tuple:
+        """Hashable identity for result caches and cursor binding."""
+        return (
+            tuple(sorted(self.project_ids)),
+            tuple(sorted(self.document_types)),
+            self.created_from.isoformat() if self.created_from else "",
+            self.created_to.isoformat() if self.created_to else "",
+        )
+
+    def as_params(self) -> Dict[str, str]:
+        """Query parameters of /documents/search that reproduce these filters."""
+        params = {}
+        if self.project_ids:
+            params["project_id"] = ",".join(str(project_id) for project_id in sorted(self.project_ids))
+        if self.document_types:
+            params["doc_types"] = ",".join(sorted(self.document_types))
+        if self.created_from:
+            params["date_from"] = self.created_from.isoformat()
+        if self.created_to:
+            params["date_to"] = self.created_to.isoformat()
+        return params
+
+    def created_bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        # [lower, upper) as ISO strings; UTC ISO timestamps compare correctly as strings.
+        lower = self.created_from.isoformat() if self.created_from else None
+        upper = (self.created_to + timedelta(days=1)).isoformat() if self.created_to else None
+        return lower, upper
+
+    def es_clauses(self) -> List[dict]:
+        clauses: List[dict] = []
+        if self.project_ids:
+            clauses.append({"terms": {"project_id": sorted(self.project_ids)}})
+        if self.document_types:
+            clauses.append({"terms": {"document_types": sorted(self.document_types)}})
+        lower, upper = self.created_bounds()
+        if lower or upper:
+            bounds: Dict[str, str] = {}
+            if lower:
+                bounds["gte"] = lower
+            if upper:
+                bounds["lt"] = upper
+            clauses.append({"range": {"created_at": bounds}})
+        return clauses
+
+    def matches(self, source: Mapping[str, Any]) -> bool:
+        if self.project_ids and source.get("project_id") not in self.project_ids:
+            return False
+        if self.document_types and not set(self.document_types) & set(source.get("document_types") or []):
+            return False
+        lower, upper = self.created_bounds()
+        if lower or upper:
+            created_at = source.get("created_at")
+            if not created_at:
+                return False
+            if (lower and created_at < lower) or (upper and created_at >= upper):
+                return False
+        return True
+
+
+NO_FILTERS = SearchFilters()
+
+
+def _split_csv(value: Optional[str]) -> List[str]:
+    return [token.strip() for token in str(value or "").split(",") if token.strip()]
+
+
+def _parse_day(name: str, value: Optional[str]) -> Optional[date]:
+    if not (value or "").strip():
+        return None
+    try:
+        return date.fromisoformat(value.strip()[:10])
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD): {value}")
+
+
+def parse_search_filters(
+    project_id: Optional[str] = None,
+    doc_types: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> SearchFilters:
+    """Filters from comma-separated query parameters; raises ValueError for invalid values."""
+    project_ids = set()
+    for token in _split_csv(project_id):
+        try:
+            project_ids.add(int(token))
+        except ValueError:
+            raise ValueError(f"Invalid project_id: {token}")
+
+    document_types = set()
+    for token in _split_csv(doc_types):
+        normalized = parse_document_types([token])
+        if not normalized:
+            raise ValueError(f"Unsupported document type: {token}")
+        document_types.update(normalized)
+
+    created_from = _parse_day("date_from", date_from)
+    created_to = _parse_day("date_to", date_to)
+    if created_from and created_to and created_from > created_to:
+        raise ValueError("date_from cannot be after date_to.")
+    return SearchFilters(
+        project_ids=tuple(sorted(project_ids)),
+        document_types=tuple(sorted(document_types)),
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+class MemoryFilterIndex:
+    """Postings over the memory store's filter fields, so filtered searches score only matches."""
+
+    def __init__(self, docs: Mapping[str, Mapping[str, Any]]):
+        self.by_project: Dict[Any, Set[str]] = {}
+        self.by_type: Dict[str, Set[str]] = {}
+        # Insertion order of the store, so filtered scans rank ties like unfiltered ones.
+        self.positions: Dict[str, int] = {}
+        dated: List[Tuple[str, str]] = []
+        for position, (key, doc) in enumerate(docs.items()):
+            self.positions[key] = position
+            project_id = doc.get("project_id")
+            if project_id is not None:
+                self.by_project.setdefault(project_id, set()).add(key)
+            for document_type in doc.get("document_types") or []:
+                self.by_type.setdefault(document_type, set()).add(key)
+            created_at = doc.get("created_at")
+            if created_at:
+                dated.append((created_at, key))
+        dated.sort()
+        self._dates = [item[0] for item in dated]
+        self._dated_keys = [item[1] for item in dated]
+
+    def candidate_keys(self, filters: SearchFilters) -> List[str]:
+        sets: List[Set[str]] = []
+        if filters.project_ids:
+            sets.append(_union(self.by_project.get(project_id, ()) for project_id in filters.project_ids))
+        if filters.document_types:
+            sets.append(_union(self.by_type.get(document_type, ()) for document_type in filters.document_types))
+        lower, upper = filters.created_bounds()
+        if lower or upper:
+            start = bisect.bisect_left(self._dates, lower) if lower else 0
+            end = bisect.bisect_left(self._dates, upper) if upper else len(self._dates)
+            sets.append(set(self._dated_keys[start:end]))
+        sets.sort(key=len)
+        keys = set(sets[0]) if sets else set()
+        for other in sets[1:]:
+            keys &= other
+        return sorted(keys, key=self.positions.__getitem__)
+
+
+def _union(groups: Iterable[Iterable[str]]) -> Set[str]:
+    keys: Set[str] = set()
+    for group in groups:
+        keys.update(group)
+    return keys
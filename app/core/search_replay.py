@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import atexit
+from contextlib import contextmanager
+import gzip
+import json
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .pipeline_profiler import percentile
+
+# Captured /documents/search requests (query, page, result doc ids, per-stage latency) as
+# compact JSON lines, replayed offline by `python -m benchmarks.replay`. Empty path = off.
+SEARCH_REPLAY_LOG_PATH = os.getenv("SEARCH_REPLAY_LOG_PATH", "").strip()
+SEARCH_REPLAY_LOG_SAMPLE_RATE = min(1.0, max(0.0, float(os.getenv("SEARCH_REPLAY_LOG_SAMPLE_RATE", "1.0"))))
+# Records waiting for the writer thread; beyond this they are dropped rather than queued.
+SEARCH_REPLAY_LOG_MAX_PENDING = max(1, int(os.getenv("SEARCH_REPLAY_LOG_MAX_PENDING", "10000")))
+
+# Display order for reports; unknown stage names are appended after these.
+SEARCH_STAGES = ("encode", "keyword", "vector", "fuse", "rerank", "display", "db")
+
+
+class SearchTrace:
+    """Wall-clock milliseconds per search stage.
+
+    Stages may run concurrently in threadpool workers, so they overlap and do not add up to
+    `total_ms`; a stage entered more than once (cursor rounds) accumulates.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def timed(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        with self.stage(name):
+            return func(*args)
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000.0
+
+
+def _ordered(stages: Dict[str, Any]) -> Dict[str, Any]:
+    names = [name for name in SEARCH_STAGES if name in stages]
+    names.extend(sorted(name for name in stages if name not in SEARCH_STAGES))
+    return {name: stages[name] for name in names}
+
+
+def search_record(
+    query: str,
+    page: int,
+    page_size: int,
+    mode: str,
+    doc_ids: Sequence[Any],
+    trace: SearchTrace,
+    cached: bool = False,
+    filters: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    record = {
+        "ts": round(time.time(), 3),
+        "q": query,
+        "page": page,
+        "page_size": page_size,
+        "mode": mode,  # "page" | "cursor"
+        "cached": cached,
+        "doc_ids": list(doc_ids),
+        "total_ms": round(trace.total_ms, 2),
+        "stages": {name: round(value, 2) for name, value in _ordered(trace.stages).items()},
+    }
+    if filters:
+        record["filters"] = dict(filters)  # /documents/search query parameters
+    return record
+
+
+class SearchReplayLog:
+    """Appends sampled search records to a JSON-lines file (or to `records`, for replays).
+
+    `record` is called on the event loop, so it only enqueues; a daemon thread writes the
+    lines. When the writer falls `max_pending` records behind, new records are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str = SEARCH_REPLAY_LOG_PATH,
+        sample_rate: float = SEARCH_REPLAY_LOG_SAMPLE_RATE,
+        records: Optional[List[Dict[str, Any]]] = None,
+        max_pending: int = SEARCH_REPLAY_LOG_MAX_PENDING,
+    ):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.records = records
+        self.dropped = 0
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._unwritten = 0
+        self._written = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return (bool(self.path) or self.records is not None) and self.sample_rate > 0.0
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        if not self.enabled or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            return
+        if self.records is not None:
+            self.records.append(entry)
+            return
+        with self._written:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                self.dropped += 1
+                return
+            self._unwritten += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="search-replay-log", daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued records are written; False if they were not within `timeout`."""
+        deadline = time.monotonic() + timeout
+        with self._written:
+            while self._unwritten:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._written.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                with self._written:
+                    self._unwritten -= len(batch)
+                    self._written.notify_all()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in batch)
+        try:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+        except OSError as exc:
+            print(f"[search_replay] Failed to append {len(batch)} records to {self.path}: {exc}")
+
+
+search_replay_log = SearchReplayLog()
+atexit.register(search_replay_log.flush)
+
+
+def read_search_records(path: str) -> List[Dict[str, Any]]:
+    """Records of a captured log (`.gz` allowed) or the `records` of a replay report."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        text = handle.read()
+    try:
+        document = json.loads(text)
+    except ValueError:
+        document = None  # more than one line: a captured log
+    if isinstance(document, dict):
+        return list(document["records"]) if "records" in document else [document]
+    records = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            records.append(json.loads(line))
+    return records
+
+
+def latency_distribution(values: Iterable[float]) -> Dict[str, float]:
+    values = sorted(float(value) for value in values)
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 0.50), 2),
+        "p95_ms": round(percentile(values, 0.95), 2),
+        "p99_ms": round(percentile(values, 0.99), 2),
+        "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+    }
+
+
+def summarize_search_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """p50/p95/p99 of the total and of every stage over the given records."""
+    totals: List[float] = []
+    per_stage: Dict[str, List[float]] = {}
+    cached = 0
+    for record in records:
+        totals.append(float(record.get("total_ms") or 0.0))
+        cached += bool(record.get("cached"))
+        for name, value in (record.get("stages") or {}).items():
+            per_stage.setdefault(name, []).append(float(value or 0.0))
+    return {
+        "requests": len(totals),
+        "cached": cached,
+        "total": latency_distribution(totals),
+        "stages": {name: latency_distribution(values) for name, values in _ordered(per_stage).items()},
+    }
+
+
+def overlap_at_k(baseline: Sequence[Any], candidate: Sequence[Any], k: int) -> float:
+    """Share of the top-k results both rankings have in common (1.0 when both are empty)."""
+    top_baseline = list(baseline)[:k]
+    top_candidate = list(candidate)[:k]
+    size = max(len(top_baseline), len(top_candidate))
+    if size == 0:
+        return 1.0
+    return len(set(top_baseline) & set(top_candidate)) / size
+
+
+def _request_key(record: Dict[str, Any]) -> tuple:
+    filters = tuple(sorted((record.get("filters") or {}).items()))
+    return (record.get("q"), record.get("page"), record.get("page_size"), filters)
+
+
+def compare_rankings(
+    baseline: Sequence[Dict[str, Any]],
+    candidate: Sequence[Dict[str, Any]],
+    ks: Sequence[int] = (1, 5, 10),
+    worst: int = 10,
+) -> Dict[str, Any]:
+    """Mean overlap@k between two runs over the same requests, matched in order per request."""
+    pending: Dict[tuple, List[Dict[str, Any]]] = {}
+    for record in baseline:
+        pending.setdefault(_request_key(record), []).append(record)
+
+    overlaps: Dict[int, List[float]] = {k: [] for k in ks}
+    diffs = []
+    unmatched = 0
+    for record in candidate:
+        matches = pending.get(_request_key(record))
+        if not matches:
+            unmatched += 1
+            continue
+        base = matches.pop(0)
+        scores = {k: overlap_at_k(base.get("doc_ids") or [], record.get("doc_ids") or [], k) for k in ks}
+        for k, score in scores.items():
+            overlaps[k].append(score)
+        diffs.append(
+            {
+                "q": record.get("q"),
+                "page": record.get("page"),
+                "overlap": {str(k): round(score, 4) for k, score in scores.items()},
+                "baseline": list(base.get("doc_ids") or [])[: max(ks)],
+                "candidate": list(record.get("doc_ids") or [])[: max(ks)],
+            }
+        )
+
+    primary_k = max(ks)
+    diffs.sort(key=lambda item: item["overlap"][str(primary_k)])
+    return {
+        "compared": len(diffs),
+        "unmatched": unmatched,
+        "overlap_at_k": {
+            str(k): round(sum(values) / len(values), 4) if values else None for k, values in overlaps.items()
+        },
+        "identical": sum(1 for item in diffs if item["baseline"] == item["candidate"]),
+        "worst": [item for item in diffs[:worst] if item["overlap"][str(primary_k)] < 1.0],
+    }
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Tuple
+
+from . import document_summary
+
+SUMMARY_CACHE_ENABLED = os.getenv("DOC_SUMMARY_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+# Bump when the LLM prompt or post-processing changes so stale summaries are not reused.
+SUMMARY_CACHE_VERSION = "2"
+
+
+def summary_fingerprint(document_types: Sequence[str] | None) -> str:
+    """Hash of everything besides the text that shapes an LLM summary."""
+    payload = {
+        "version": SUMMARY_CACHE_VERSION,
+        "model": document_summary.DOC_SUMMARY_OLLAMA_MODEL,
+        "max_input_chars": document_summary.DOC_SUMMARY_MAX_INPUT_CHARS,
+        "title_max_chars": document_summary.DOC_SUMMARY_TITLE_MAX_CHARS,
+        "short_max_chars": document_summary.DOC_SUMMARY_SHORT_MAX_CHARS,
+        "document_types": sorted(document_summary.parse_document_types(list(document_types or []))),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def summary_cache_key(text_sha256: str, document_types: Sequence[str] | None) -> str:
+    fingerprint = summary_fingerprint(document_types)
+    return hashlib.sha256(f"{text_sha256}:{fingerprint}".encode("utf-8")).hexdigest()
+
+
+def load_cached_summary(
+    db,
+    text_sha256: str,
+    document_types: Sequence[str] | None,
+    filename: str,
+    content_text: str,
+) -> Optional[Tuple[str, str]]:
+    """Cached (title, summary) for this text and summary config.
+
+    The LLM prompt includes the filename, so the cached title is only reused for the same name;
+    a copy uploaded under another name keeps the summary and gets an extractive title.
+    """
+    if not SUMMARY_CACHE_ENABLED or not text_sha256:
+        return None
+    from .. import models
+
+    try:
+        row = (
+            db.query(models.DocumentSummaryCache)
+            .filter(models.DocumentSummaryCache.cache_key == summary_cache_key(text_sha256, document_types))
+            .first()
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[summary-cache] lookup failed: {exc}")
+        return None
+    if row is None or not (row.ai_title or "").strip():
+        return None
+    title = row.ai_title
+    if (row.source_filename or "") != (filename or ""):
+        title, _ = document_summary.build_document_summary(
+            filename=filename or "",
+            content_text=content_text or "",
+            document_types=document_types,
+            use_llm=False,
+        )
+    return title, row.ai_summary_short or ""
+
+
+def store_cached_summary(
+    db,
+    text_sha256: str,
+    document_types: Sequence[str] | None,
+    filename: str,
+    title: str,
+    summary: str,
+) -> None:
+    """Add an LLM summary generated for `filename` to the cache; the caller's commit persists it."""
+    if not SUMMARY_CACHE_ENABLED or not text_sha256 or not (title or "").strip():
+        return
+    from .. import models
+
+    try:
+        # Savepoint: a concurrent writer inserting the same key must not roll back the caller.
+        with db.begin_nested():
+            db.add(
+                models.DocumentSummaryCache(
+                    cache_key=summary_cache_key(text_sha256, document_types),
+                    text_sha256=text_sha256,
+                    fingerprint=summary_fingerprint(document_types),
+                    ai_title=title,
+                    ai_summary_short=summary or "",
+                    source_filename=filename or "",
+                    created_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                )
+            )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[summary-cache] store skipped: {exc}")
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from .document_summary import (
+    build_document_summary,
+    build_llm_document_summary,
+    llm_summary_enabled,
+    parse_document_types,
+)
+from .summary_cache import load_cached_summary, store_cached_summary, summary_cache_key
+from .vector_store import vector_store
+
+# Indexing stores an extractive title/summary right away; the LLM version is patched in later.
+DOC_SUMMARY_DEFERRED = os.getenv("DOC_SUMMARY_DEFERRED", "true").strip().lower() in {"1", "true", "yes", "on"}
+DOC_SUMMARY_ENRICH_BATCH_SIZE = max(1, int(os.getenv("DOC_SUMMARY_ENRICH_BATCH_SIZE", "8")))
+DOC_SUMMARY_ENRICH_CONCURRENCY = max(1, int(os.getenv("DOC_SUMMARY_ENRICH_CONCURRENCY", "2")))
+# A claim older than this is considered abandoned (process died mid-batch) and may be taken over.
+DOC_SUMMARY_CLAIM_TTL_SECONDS = max(60, int(os.getenv("DOC_SUMMARY_CLAIM_TTL_SECONDS", "900")))
+# How often the API re-queues pending/abandoned documents (e.g. left by the reindex CLI); 0 = startup only.
+DOC_SUMMARY_RESUME_INTERVAL_SECONDS = max(0, int(os.getenv("DOC_SUMMARY_RESUME_INTERVAL_SECONDS", "300")))
+
+SUMMARY_STATUS_PENDING = "pending"  # extractive summary stored, LLM enrichment queued
+SUMMARY_STATUS_RUNNING = "running"  # claimed by an enrichment batch (see ai_summary_claimed_at)
+SUMMARY_STATUS_LLM = "llm"  # LLM title/summary applied
+SUMMARY_STATUS_EXTRACTIVE = "extractive"  # final summary is extractive (LLM off, skipped or failed)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def defer_llm_summary() -> bool:
+    return DOC_SUMMARY_DEFERRED and llm_summary_enabled()
+
+
+def _llm_executor() -> ThreadPoolExecutor:
+    # One shared pool bounds concurrent requests against the LLM endpoint across batches.
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DOC_SUMMARY_ENRICH_CONCURRENCY,
+                thread_name_prefix="summary-enrich",
+            )
+        return _executor
+
+
+def _summarize(item: Tuple[int, str, str, List[str]]) -> Optional[Tuple[str, str]]:
+    doc_id, filename, content_text, document_types = item
+    try:
+        return build_llm_document_summary(
+            filename=filename,
+            content_text=content_text,
+            document_types=document_types,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[summary-enrich] doc_id={doc_id} LLM summary failed: {exc}")
+        return None
+
+
+def _claim_documents(db, ids: List[int]) -> Tuple[str, List[Tuple[int, str, str, str, str]]]:
+    """Mark pending documents as running for this caller; returns the claim token and the claimed rows.
+
+    The conditional UPDATE makes concurrent callers (other API workers, the reindex CLI) skip documents
+    someone else is already enriching. A claim older than DOC_SUMMARY_CLAIM_TTL_SECONDS is taken over.
+    """
+    from .. import models
+
+    document = models.Document
+    now = datetime.now(timezone.utc)
+    claim = now.isoformat(timespec="microseconds")
+    stale_before = (now - timedelta(seconds=DOC_SUMMARY_CLAIM_TTL_SECONDS)).isoformat(timespec="microseconds")
+    db.query(document).filter(
+        document.id.in_(ids),
+        document.status == "completed",
+        or_(
+            document.ai_summary_status == SUMMARY_STATUS_PENDING,
+            and_(
+                document.ai_summary_status == SUMMARY_STATUS_RUNNING,
+                or_(document.ai_summary_claimed_at.is_(None), document.ai_summary_claimed_at < stale_before),
+            ),
+        ),
+    ).update(
+        {document.ai_summary_status: SUMMARY_STATUS_RUNNING, document.ai_summary_claimed_at: claim},
+        synchronize_session=False,
+    )
+    db.commit()
+    rows = (
+        db.query(
+            document.id,
+            document.filename,
+            document.content_text,
+            document.document_types,
+            document.normalized_text_sha256,
+        )
+        .filter(
+            document.id.in_(ids),
+            document.ai_summary_status == SUMMARY_STATUS_RUNNING,
+            document.ai_summary_claimed_at == claim,
+        )
+        .all()
+    )
+    return claim, [tuple(row) for row in rows]
+
+
+def _extractive_title(item: Tuple[int, str, str, List[str], str]) -> str:
+    _, filename, content_text, document_types, _ = item
+    title, _ = build_document_summary(
+        filename=filename,
+        content_text=content_text,
+        document_types=document_types,
+        use_llm=False,
+    )
+    return title
+
+
+def enrich_document_summaries(doc_ids: Sequence[int], db=None) -> Dict[str, int]:
+    """Generate LLM summaries for pending documents and patch the DB rows and indexed chunks."""
+    from .. import models
+    from ..database import SessionLocal
+
+    ids = sorted({int(doc_id) for doc_id in doc_ids})
+    if not ids:
+        return {"documents": 0, "enriched": 0}
+
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
+    try:
+        claim, docs = _claim_documents(db, ids)
+        # Cached summaries (same normalized text and summary config) are applied directly; documents
+        # sharing a cache key in this batch are summarized once, and copies under another filename
+        # take the summary with an extractive title. Worker threads only see plain values.
+        cached: Dict[int, Optional[Tuple[str, str]]] = {}
+        groups: Dict[str, List[Tuple[int, str, str, List[str], str]]] = {}
+        for doc_id, filename, content_text, raw_types, text_hash in docs:
+            document_types = parse_document_types(raw_types)
+            item = (doc_id, filename or "", content_text or "", document_types, text_hash or "")
+            cached[doc_id] = load_cached_summary(db, item[4], document_types, item[1], item[2])
+            if cached[doc_id] is None:
+                group_key = summary_cache_key(item[4], document_types) if item[4] else f"doc:{doc_id}"
+                groups.setdefault(group_key, []).append(item)
+        # No transaction stays open across the LLM calls; results are applied only to rows that are
+        # still ours and still hold the text that was summarized.
+        db.rollback()
+
+        inputs = [group[0][:4] for group in groups.values()]
+        for group, item, result in zip(groups.values(), inputs, _llm_executor().map(_summarize, inputs)):
+            if result:
+                store_cached_summary(db, group[0][4], item[3], item[1], *result)
+            for member in group:
+                cached[member[0]] = result
+                if result and member[1] != item[1]:
+                    cached[member[0]] = (_extractive_title(member), result[1])
+
+        document = models.Document
+        updates: Dict[int, Tuple[str, str]] = {}
+        for doc_id, _, _, _, text_hash in docs:
+            result = cached.get(doc_id)
+            values = {document.ai_summary_status: SUMMARY_STATUS_EXTRACTIVE, document.ai_summary_claimed_at: None}
+            if result:
+                values.update(
+                    {
+                        document.ai_title: result[0],
+                        document.ai_summary_short: result[1],
+                        document.ai_summary_status: SUMMARY_STATUS_LLM,
+                    }
+                )
+            text_match = (
+                document.normalized_text_sha256 == text_hash
+                if text_hash is not None
+                else document.normalized_text_sha256.is_(None)
+            )
+            applied = (
+                db.query(document)
+                .filter(
+                    document.id == doc_id,
+                    document.ai_summary_status == SUMMARY_STATUS_RUNNING,
+                    document.ai_summary_claimed_at == claim,
+                    text_match,
+                )
+                .update(values, synchronize_session=False)
+            )
+            if applied and result:
+                updates[doc_id] = result
+        db.commit()
+        vector_store.update_document_summaries(updates)
+        return {"documents": len(docs), "enriched": len(updates)}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if owns_session:
+            db.close()
+
+
+class SummaryEnrichmentQueue:
+    """Background worker that drains queued doc ids in batches of up to `batch_size`."""
+
+    def __init__(
+        self,
+        batch_size: int = DOC_SUMMARY_ENRICH_BATCH_SIZE,
+        enrich: Callable[[Sequence[int]], object] = enrich_document_summaries,
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self._enrich = enrich
+        self._queue: "queue.Queue[int]" = queue.Queue()
+        self._queued: set[int] = set()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._running = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, doc_id: int) -> bool:
+        """Queue a doc id; False if it is already waiting."""
+        with self._lock:
+            if doc_id in self._queued:
+                return False
+            self._queued.add(doc_id)
+            self._queue.put(doc_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="summary-enrich-queue", daemon=True)
+                self._thread.start()
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._queued)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued doc id has been processed; False if `timeout` ran out first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queued and not self._running, timeout)
+
+    def _next_batch(self) -> List[int]:
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        with self._lock:
+            # A doc re-queued while its batch runs (e.g. reprocessed) is enriched again afterwards.
+            self._queued.difference_update(batch)
+            self._running += 1
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._enrich(batch)
+            except Exception as exc:  # noqa: BLE001
+                print(f"[summary-enrich] batch failed doc_ids={batch}: {exc}")
+            finally:
+                with self._idle:
+                    self._running -= 1
+                    self._idle.notify_all()
+
+
+summary_enrichment_queue = SummaryEnrichmentQueue()
+
+
+def enqueue_summary_enrichment(doc_ids: Iterable[int]) -> int:
+    return sum(1 for doc_id in doc_ids if summary_enrichment_queue.enqueue(int(doc_id)))
+
+
+def resume_pending_summary_enrichment() -> int:
+    """Queue documents still pending (or whose claim went stale); returns the number queued."""
+    from .. import models
+    from ..database import SessionLocal
+
+    document = models.Document
+    stale_before = (datetime.now(timezone.utc) - timedelta(seconds=DOC_SUMMARY_CLAIM_TTL_SECONDS)).isoformat(
+        timespec="microseconds"
+    )
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(document.id)
+            .filter(
+                or_(
+                    document.ai_summary_status == SUMMARY_STATUS_PENDING,
+                    and_(
+                        document.ai_summary_status == SUMMARY_STATUS_RUNNING,
+                        or_(document.ai_summary_claimed_at.is_(None), document.ai_summary_claimed_at < stale_before),
+                    ),
+                )
+            )
+            .all()
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[summary-enrich] failed to load pending documents: {exc}")
+        return 0
+    finally:
+        db.close()
+
+    queued = enqueue_summary_enrichment(row[0] for row in rows)
+    if queued:
+        print(f"[summary-enrich] resumed {queued} pending document summaries")
+    return queued
+
+
+_resume_thread: Optional[threading.Thread] = None
+_resume_lock = threading.Lock()
+
+
+def _resume_loop() -> None:
+    while True:
+        resume_pending_summary_enrichment()
+        if DOC_SUMMARY_RESUME_INTERVAL_SECONDS <= 0:
+            return
+        time.sleep(DOC_SUMMARY_RESUME_INTERVAL_SECONDS)
+
+
+def start_summary_enrichment_resume() -> bool:
+    """Periodically re-queue pending summaries on a daemon thread; False if already running.
+
+    Every API worker runs this loop; the claim in enrich_document_summaries keeps them from
+    summarizing the same document twice.
+    """
+    global _resume_thread
+    with _resume_lock:
+        if _resume_thread is not None and _resume_thread.is_alive():
+            return False
+        _resume_thread = threading.Thread(target=_resume_loop, name="summary-enrich-resume", daemon=True)
+        _resume_thread.start()
+    return True
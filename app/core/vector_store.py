@@ -1,21 +1,42 @@
+from dataclasses import dataclass
+import functools
 import math
 import os
 import re
 import time
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+from .search_filters import FILTER_FIELD_MAPPINGS, MemoryFilterIndex, SearchFilters
+
 load_dotenv()
 
 ES_HOST = os.getenv("ES_HOST", "http://elasticsearch:9200")
 INDEX_NAME = "documents_index"
-RRF_K = 60
+RRF_K = max(1, int(os.getenv("SEARCH_RRF_K", "60")))
 HYBRID_REQUIRE_KEYWORD_MATCH = (
     os.getenv("HYBRID_REQUIRE_KEYWORD_MATCH", "true").strip().lower()
     in {"1", "true", "yes", "on"}
 )
 QUERY_TERM_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+_KEYWORD_HIGHLIGHT = {
+    "pre_tags": ["<em>"],
+    "post_tags": ["</em>"],
+    "fields": {
+        "content": {
+            "fragment_size": 200,
+            "number_of_fragments": 1,
+        }
+    },
+}
+# Search-time display fields precomputed at index time (see core/display_text.py); only read
+# back from _source, so they are neither searchable nor aggregatable.
+_DISPLAY_FIELD_MAPPINGS = {
+    "display_text": {"type": "text", "index": False},
+    "sentence_offsets": {"type": "integer", "index": False, "doc_values": False},
+    "alnum_ratio": {"type": "float", "index": False},
+}
 
 def _env_float(name: str, default: float) -> float:
     raw = str(os.getenv(name, "")).strip()
@@ -30,6 +51,15 @@ def _env_float(name: str, default: float) -> float:
 ES_CONNECT_TIMEOUT_SEC = _env_float("ES_CONNECT_TIMEOUT_SEC", 1.0)
 ES_RECONNECT_BACKOFF_INITIAL_SEC = _env_float("ES_RECONNECT_BACKOFF_INITIAL_SEC", 1.0)
 ES_RECONNECT_BACKOFF_MAX_SEC = _env_float("ES_RECONNECT_BACKOFF_MAX_SEC", 30.0)
+# Collapse the keyword and vector legs of `search` on doc_id in Elasticsearch, so each leg
+# returns one (best) chunk per document instead of over-fetching duplicate chunks.
+ES_SEARCH_COLLAPSE = os.getenv("ES_SEARCH_COLLAPSE", "true").strip().lower() in {"1", "true", "yes", "on"}
+# Next-best chunks per collapsed document returned as inner_hits (0 = off).
+ES_COLLAPSE_INNER_HITS = max(0, int(os.getenv("ES_COLLAPSE_INNER_HITS", "0")))
+# Point-in-time lifetime between two cursor pages of /documents/search.
+SEARCH_PIT_KEEP_ALIVE = os.getenv("SEARCH_PIT_KEEP_ALIVE", "2m").strip() or "2m"
+# Score order with a deterministic tie-break, usable for search_after with or without a PIT.
+_CURSOR_SORT = [{"_score": "desc"}, {"doc_id": "asc"}, {"chunk_index": "asc"}]
 
 try:
     from elasticsearch import Elasticsearch
@@ -37,19 +67,66 @@ except ImportError:  # pragma: no cover - runtime fallback for lightweight envir
     Elasticsearch = None
 
 
+def _doc_collapse() -> dict:
+    collapse: dict = {"field": "doc_id"}
+    if ES_COLLAPSE_INNER_HITS > 0:
+        collapse["inner_hits"] = {
+            "name": "best_chunks",
+            "size": ES_COLLAPSE_INNER_HITS,
+            "_source": ["chunk_id", "chunk_index", "page", "chunk_type"],
+        }
+    return collapse
+
+
+def _filtered_query(query: dict, filters: Optional[SearchFilters]) -> dict:
+    # Non-scoring filter context: cached as bitsets by ES and applied before scoring.
+    if filters is None or not filters.active:
+        return query
+    return {"bool": {"must": [query], "filter": filters.es_clauses()}}
+
+
+def _collapsed_leg_size(top_k: int) -> int:
+    # One hit per document, so top_k hits are top_k candidate documents.
+    return max(1, min(top_k, 100))
+
+
+def _chunk_leg_size(top_k: int) -> int:
+    # Several chunks per document: over-fetch so enough distinct documents survive.
+    return max(1, min(max(top_k * 4, 10), 100))
+
+
+@dataclass
+class SearchLeg:
+    hits: List[dict]
+    collapsed: bool  # one hit per doc_id (ES collapse); fused per document
+
+
+class SearchCursorExpired(Exception):
+    """A cursor page cannot continue (PIT expired or Elasticsearch went away mid-cursor)."""
+
+
+def _hit_id(hit: dict):
+    return hit.get("_id")
+
+
+def _hit_doc_id(hit: dict):
+    return hit.get("_source", {}).get("doc_id")
+
+
 def _rrf_fuse(
     keyword_hits: List[dict],
     vector_hits: List[dict],
     top_k: int,
-) -> Dict[str, dict]:
-    """Reciprocal Rank Fusion over hit ids."""
-    fused: Dict[str, dict] = {}
+    key: Callable[[dict], object] = _hit_id,
+) -> Dict[object, dict]:
+    """Reciprocal Rank Fusion over hit ids (or another `key`, e.g. doc_id for collapsed legs)."""
+    fused: Dict[object, dict] = {}
     rankings = [keyword_hits, vector_hits]
 
     for hit_list in rankings:
         for rank, hit in enumerate(hit_list, start=1):
-            hit_id = hit.get("_id")
-            if not hit_id:
+            hit_id = key(hit)
+            if hit_id is None or hit_id == "":
                 continue
 
             if hit_id not in fused:
@@ -84,6 +161,20 @@ def _cosine_similarity(lhs: List[float], rhs: List[float]) -> float:
     return _dot(lhs, rhs) / denom
 
 
+def _bumps_index_generation(method):
+    """Bump `index_generation` once the write finished (or failed) so searches cached before
+    it are treated as stale."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.index_generation += 1
+
+    return wrapper
+
+
 class VectorStore:
     def __init__(self):
         self.index_name = INDEX_NAME
@@ -92,6 +183,10 @@ class VectorStore:
         self._memory_docs: Dict[str, dict] = {}
         self._connect_failures = 0
         self._next_connect_attempt_at = 0.0
+        # Bumped after every index write so cached search results can be invalidated.
+        self.index_generation = 0
+        self._memory_filter_index: Optional[MemoryFilterIndex] = None
+        self._memory_filter_signature: Optional[Tuple[int, int]] = None
 
         if self.memory_mode:
             print("[vector_store] elasticsearch package not found, using in-memory store.")
@@ -142,6 +237,9 @@ class VectorStore:
                         "properties": {
                             "table_cell_refs": {"type": "keyword"},
                             "table_layout": {"type": "keyword"},
+                            "table_id": {"type": "keyword"},
+                            **_DISPLAY_FIELD_MAPPINGS,
+                            **FILTER_FIELD_MAPPINGS,
                         }
                     },
                 )
@@ -171,6 +269,7 @@ class VectorStore:
                     "quality_score": {"type": "float"},
                     "table_cell_refs": {"type": "keyword"},
                     "table_layout": {"type": "keyword"},
+                    "table_id": {"type": "keyword"},
                     "chunk_schema_version": {"type": "keyword"},
                     "embedding_model_name": {"type": "keyword"},
                     "embedding_model_version": {"type": "keyword"},
@@ -182,6 +281,7 @@ class VectorStore:
                     "ai_title": {"type": "text"},
                     "ai_summary_short": {"type": "text"},
                     "filename": {"type": "keyword"},
+                    **FILTER_FIELD_MAPPINGS,
                     "content": {
                         "type": "text",
                         "analyzer": "nori_analyzer",
@@ -189,6 +289,7 @@ class VectorStore:
                     "raw_text": {
                         "type": "text",
                     },
+                    **_DISPLAY_FIELD_MAPPINGS,
                     "embedding": {
                         "type": "dense_vector",
                         "dims": 384,
@@ -206,6 +307,7 @@ class VectorStore:
             self.memory_mode = True
             print(f"[vector_store] Failed to create index, switching to memory mode: {exc}")
 
+    @_bumps_index_generation
     def delete_document(self, doc_id: int):
         for key in list(self._memory_docs.keys()):
             if self._memory_docs[key].get("doc_id") == doc_id:
@@ -226,6 +328,149 @@ class VectorStore:
             self.memory_mode = True
             print(f"[vector_store] Delete by doc_id failed, switching to memory mode: {exc}")
 
+    @_bumps_index_generation
+    def update_document_summaries(self, summaries: Dict[int, Tuple[str, str]]) -> None:
+        """Patch ai_title/ai_summary_short on every chunk of the given docs without reindexing."""
+        if not summaries:
+            return
+        for doc in self._memory_docs.values():
+            summary = summaries.get(doc.get("doc_id"))
+            if summary is not None:
+                doc["ai_title"], doc["ai_summary_short"] = summary
+
+        if not self._ensure_client():
+            return
+
+        params = {
+            str(doc_id): {"ai_title": title or "", "ai_summary_short": summary or ""}
+            for doc_id, (title, summary) in summaries.items()
+        }
+        try:
+            self.client.update_by_query(
+                index=self.index_name,
+                body={
+                    "query": {"terms": {"doc_id": [int(doc_id) for doc_id in summaries]}},
+                    "script": {
+                        "lang": "painless",
+                        "source": (
+                            "def item = params.summaries[String.valueOf(ctx._source.doc_id)];"
+                            " if (item == null) { ctx.op = 'noop'; return; }"
+                            " ctx._source.ai_title = item.ai_title;"
+                            " ctx._source.ai_summary_short = item.ai_summary_short;"
+                        ),
+                        "params": {"summaries": params},
+                    },
+                },
+                refresh=True,
+                conflicts="proceed",
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.client = None
+            self.memory_mode = True
+            print(f"[vector_store] Summary update failed, switching to memory mode: {exc}")
+
+    @_bumps_index_generation
+    def update_document_types(self, document_types: Dict[int, List[str]]) -> None:
+        """Patch document_types on every chunk of the given docs without reindexing."""
+        if not document_types:
+            return
+        for doc in self._memory_docs.values():
+            types = document_types.get(doc.get("doc_id"))
+            if types is not None:
+                doc["document_types"] = list(types)
+
+        if not self._ensure_client():
+            return
+
+        params = {str(doc_id): list(types) for doc_id, types in document_types.items()}
+        try:
+            self.client.update_by_query(
+                index=self.index_name,
+                body={
+                    "query": {"terms": {"doc_id": [int(doc_id) for doc_id in document_types]}},
+                    "script": {
+                        "lang": "painless",
+                        "source": (
+                            "def item = params.types[String.valueOf(ctx._source.doc_id)];"
+                            " if (item == null) { ctx.op = 'noop'; return; }"
+                            " ctx._source.document_types = item;"
+                        ),
+                        "params": {"types": params},
+                    },
+                },
+                refresh=True,
+                conflicts="proceed",
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.client = None
+            self.memory_mode = True
+            print(f"[vector_store] Document type update failed, switching to memory mode: {exc}")
+
+    def count_chunks_missing_filter_fields(self) -> Optional[int]:
+        """Number of chunks without `created_at` (indexed before filter fields); None if the count failed."""
+        if not self._ensure_client():
+            return sum(1 for doc in self._memory_docs.values() if not doc.get("created_at"))
+        try:
+            response = self.client.count(
+                index=self.index_name,
+                body={"query": {"bool": {"must_not": [{"exists": {"field": "created_at"}}]}}},
+            )
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Filter field count failed: {exc}")
+            return None
+        return int(response.get("count", 0))
+
+    @_bumps_index_generation
+    def update_document_filter_fields(self, fields: Dict[int, Dict[str, object]]) -> None:
+        """Copy project_id/created_at onto chunks indexed before they were stored on chunks.
+
+        Only chunks without `created_at` are rewritten, so repeated runs are cheap no-ops.
+        """
+        if not fields:
+            return
+        for doc in self._memory_docs.values():
+            item = fields.get(doc.get("doc_id"))
+            if item is not None and not doc.get("created_at"):
+                doc["project_id"] = item.get("project_id")
+                doc["created_at"] = item.get("created_at")
+
+        if not self._ensure_client():
+            return
+
+        params = {
+            str(doc_id): {"project_id": item.get("project_id"), "created_at": item.get("created_at")}
+            for doc_id, item in fields.items()
+        }
+        try:
+            self.client.update_by_query(
+                index=self.index_name,
+                body={
+                    "query": {
+                        "bool": {
+                            "filter": [{"terms": {"doc_id": [int(doc_id) for doc_id in fields]}}],
+                            "must_not": [{"exists": {"field": "created_at"}}],
+                        }
+                    },
+                    "script": {
+                        "lang": "painless",
+                        "source": (
+                            "def item = params.fields[String.valueOf(ctx._source.doc_id)];"
+                            " if (item == null) { ctx.op = 'noop'; return; }"
+                            " ctx._source.project_id = item.project_id;"
+                            " ctx._source.created_at = item.created_at;"
+                        ),
+                        "params": {"fields": params},
+                    },
+                },
+                refresh=True,
+                conflicts="proceed",
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.client = None
+            self.memory_mode = True
+            print(f"[vector_store] Filter field update failed, switching to memory mode: {exc}")
+
+    @_bumps_index_generation
     def index_document(
         self,
         doc_id,
@@ -244,6 +489,7 @@ class VectorStore:
         raw_text="",
         table_cell_refs="",
         table_layout="",
+        table_id="",
         chunk_schema_version="",
         embedding_model_name="",
         embedding_model_version="",
@@ -251,6 +497,11 @@ class VectorStore:
         dedup_primary_doc_id=None,
         dedup_cluster_id=None,
         dedup_is_primary=True,
+        display_text=None,
+        sentence_offsets=None,
+        alnum_ratio=None,
+        project_id=None,
+        created_at=None,
     ):
         chunk_key = f"{doc_id}:{chunk_id}"
         doc = {
@@ -263,6 +514,7 @@ class VectorStore:
             "quality_score": quality_score,
             "table_cell_refs": table_cell_refs,
             "table_layout": table_layout,
+            "table_id": table_id,
             "chunk_schema_version": chunk_schema_version,
             "embedding_model_name": embedding_model_name,
             "embedding_model_version": embedding_model_version,
@@ -274,10 +526,16 @@ class VectorStore:
             "ai_title": ai_title,
             "ai_summary_short": ai_summary_short,
             "filename": filename,
+            "project_id": project_id,
+            "created_at": created_at,
             "content": content,
             "raw_text": raw_text,
             "embedding": embedding,
         }
+        if display_text is not None:
+            doc["display_text"] = display_text
+            doc["sentence_offsets"] = list(sentence_offsets or [])
+            doc["alnum_ratio"] = float(alnum_ratio or 0.0)
         self._memory_docs[chunk_key] = doc
 
         if not self._ensure_client():
@@ -295,13 +553,25 @@ class VectorStore:
             self.memory_mode = True
             print(f"[vector_store] Indexing failed, switching to memory mode: {exc}")
 
-    def _memory_keyword_hits(self, query_text: str, size: int) -> List[dict]:
+    def _memory_items(self, filters: Optional[SearchFilters] = None) -> Iterable[Tuple[str, dict]]:
+        """Memory-store chunks to score: all of them, or only filter matches via postings."""
+        if filters is None or not filters.active:
+            return self._memory_docs.items()
+        # Rebuilt lazily after writes (generation bump) or direct inserts (size change).
+        signature = (self.index_generation, len(self._memory_docs))
+        if getattr(self, "_memory_filter_signature", None) != signature:
+            self._memory_filter_index = MemoryFilterIndex(self._memory_docs)
+            self._memory_filter_signature = signature
+        keys = self._memory_filter_index.candidate_keys(filters)
+        return [(key, self._memory_docs[key]) for key in keys if key in self._memory_docs]
+
+    def _memory_keyword_hits(self, query_text: str, size: int, filters: Optional[SearchFilters] = None) -> List[dict]:
         keyword = (query_text or "").strip().lower()
         if not keyword:
             return []
 
         scored = []
-        for chunk_key, doc in self._memory_docs.items():
+        for chunk_key, doc in self._memory_items(filters):
             content = (doc.get("content") or "").lower()
             filename = (doc.get("filename") or "").lower()
 
@@ -324,12 +594,17 @@ class VectorStore:
         scored.sort(key=lambda item: item.get("_score", 0.0), reverse=True)
         return scored[:size]
 
-    def _memory_vector_hits(self, query_vector: List[float], size: int) -> List[dict]:
+    def _memory_vector_hits(
+        self,
+        query_vector: List[float],
+        size: int,
+        filters: Optional[SearchFilters] = None,
+    ) -> List[dict]:
         if not query_vector:
             return []
 
         scored = []
-        for chunk_key, doc in self._memory_docs.items():
+        for chunk_key, doc in self._memory_items(filters):
             embedding = doc.get("embedding") or []
             similarity = _cosine_similarity(query_vector, embedding)
             score = similarity + 1.0
@@ -345,10 +620,27 @@ class VectorStore:
         scored.sort(key=lambda item: item.get("_score", 0.0), reverse=True)
         return scored[:size]
 
-    def _keyword_search(self, query_text: str, size: int) -> List[dict]:
+    def _keyword_search(
+        self,
+        query_text: str,
+        size: int,
+        collapse: bool = False,
+        filters: Optional[SearchFilters] = None,
+    ) -> List[dict]:
         if not query_text.strip():
             return []
 
+        body = {
+            "size": size,
+            "query": _filtered_query(self._keyword_query(query_text), filters),
+            "highlight": _KEYWORD_HIGHLIGHT,
+        }
+        if collapse:
+            body["collapse"] = _doc_collapse()
+        response = self.client.search(index=self.index_name, body=body)
+        return response.get("hits", {}).get("hits", [])
+
+    def _keyword_query(self, query_text: str) -> dict:
         normalized_query = query_text.strip()
         wildcard_query = normalized_query.replace("*", " ").replace("?", " ").strip()
         query_terms = []
@@ -463,29 +755,20 @@ class VectorStore:
                 }
             )
 
-        body = {
-            "size": size,
-            "query": {
-                "bool": {
-                    "should": should_clauses,
-                    "minimum_should_match": 1,
-                }
-            },
-            "highlight": {
-                "pre_tags": ["<em>"],
-                "post_tags": ["</em>"],
-                "fields": {
-                    "content": {
-                        "fragment_size": 200,
-                        "number_of_fragments": 1,
-                    }
-                },
-            },
+        return {
+            "bool": {
+                "should": should_clauses,
+                "minimum_should_match": 1,
+            }
         }
-        response = self.client.search(index=self.index_name, body=body)
-        return response.get("hits", {}).get("hits", [])
 
-    def _vector_search(self, query_vector: List[float], size: int) -> List[dict]:
+    def _vector_search(
+        self,
+        query_vector: List[float],
+        size: int,
+        collapse: bool = False,
+        filters: Optional[SearchFilters] = None,
+    ) -> List[dict]:
         if not query_vector:
             return []
 
@@ -493,7 +776,8 @@ class VectorStore:
             "size": size,
             "query": {
                 "script_score": {
-                    "query": {"match_all": {}},
+                    # Filters narrow the chunks scored, so narrow searches cost less.
+                    "query": _filtered_query({"match_all": {}}, filters),
                     "script": {
                         "source": "cosineSimilarity(params.query_vector, 'embedding') + 1.0",
                         "params": {"query_vector": query_vector},
@@ -501,6 +785,8 @@ class VectorStore:
                 }
             },
         }
+        if collapse:
+            body["collapse"] = _doc_collapse()
         response = self.client.search(index=self.index_name, body=body)
         return response.get("hits", {}).get("hits", [])
 
@@ -589,12 +875,71 @@ class VectorStore:
             "fused_hits": fused_hits,
         }
 
-    def search(self, query_text, query_vector, top_k=5):
-        candidate_size = max(top_k * 4, 10)
-        debug_payload = self.debug_search(query_text, query_vector, top_k=candidate_size)
-        keyword_hits = debug_payload.get("keyword_hits", [])
-        vector_hits = debug_payload.get("vector_hits", [])
+    def search_keyword_leg(
+        self,
+        query_text: str,
+        top_k: int,
+        filters: Optional[SearchFilters] = None,
+    ) -> SearchLeg:
+        """Keyword leg of `search`; independent of the query vector, so it can run first."""
+        if ES_SEARCH_COLLAPSE and self._ensure_client():
+            try:
+                hits = self._keyword_search(query_text, _collapsed_leg_size(top_k), collapse=True, filters=filters)
+                return SearchLeg(hits, True)
+            except Exception as exc:  # noqa: BLE001
+                print(f"[vector_store] Collapsed keyword search failed, falling back to chunk search: {exc}")
 
+        size = _chunk_leg_size(top_k)
+        if not self._ensure_client():
+            return SearchLeg(self._memory_keyword_hits(query_text, size, filters), False)
+        try:
+            return SearchLeg(self._keyword_search(query_text, size, filters=filters), False)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Keyword search failed: {exc}")
+            return SearchLeg([], False)
+
+    def search_vector_leg(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        filters: Optional[SearchFilters] = None,
+    ) -> SearchLeg:
+        if ES_SEARCH_COLLAPSE and self._ensure_client():
+            try:
+                hits = self._vector_search(query_vector, _collapsed_leg_size(top_k), collapse=True, filters=filters)
+                return SearchLeg(hits, True)
+            except Exception as exc:  # noqa: BLE001
+                print(f"[vector_store] Collapsed vector search failed, falling back to chunk search: {exc}")
+
+        size = _chunk_leg_size(top_k)
+        if not self._ensure_client():
+            return SearchLeg(self._memory_vector_hits(query_vector, size, filters), False)
+        try:
+            return SearchLeg(self._vector_search(query_vector, size, filters=filters), False)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Vector search failed: {exc}")
+            return SearchLeg([], False)
+
+    def fuse_search_legs(self, query_text: str, keyword: SearchLeg, vector: SearchLeg, top_k: int) -> Dict[str, dict]:
+        """RRF over both legs, one hit per document, in the shape `search` returns."""
+        keyword_hits = keyword.hits
+        vector_hits = vector.hits
+        if keyword.collapsed and vector.collapsed:
+            if HYBRID_REQUIRE_KEYWORD_MATCH and query_text.strip() and keyword_hits and vector_hits:
+                keyword_doc_ids = {_hit_doc_id(hit) for hit in keyword_hits}
+                vector_hits = [hit for hit in vector_hits if _hit_doc_id(hit) in keyword_doc_ids]
+
+            # The keyword leg is fused first, so a doc found by both legs keeps the keyword
+            # chunk and its highlight.
+            fused = _rrf_fuse(keyword_hits, vector_hits, top_k=top_k, key=_hit_doc_id)
+            fused_hits = []
+            for payload in fused.values():
+                base_hit = dict(payload["hit"])
+                base_hit["_score"] = payload["score"]
+                fused_hits.append(base_hit)
+            return {"hits": {"hits": fused_hits}}
+
+        candidate_size = max(top_k * 4, 10)
         if HYBRID_REQUIRE_KEYWORD_MATCH and query_text.strip() and keyword_hits and vector_hits:
             keyword_ids = {hit.get("_id") for hit in keyword_hits if hit.get("_id")}
             vector_hits = [hit for hit in vector_hits if hit.get("_id") in keyword_ids]
@@ -624,5 +969,135 @@ class VectorStore:
         collapsed = self._collapse_doc_hits(fused_hits, top_k=top_k)
         return {"hits": {"hits": collapsed}}
 
+    def search(self, query_text, query_vector, top_k=5, filters: Optional[SearchFilters] = None):
+        keyword = self.search_keyword_leg(query_text, top_k, filters)
+        vector = self.search_vector_leg(query_vector, top_k, filters)
+        return self.fuse_search_legs(query_text, keyword, vector, top_k)
+
+    def open_point_in_time(self) -> Optional[str]:
+        """PIT id for a cursor search, or None in memory mode or when ES refuses one."""
+        if not self._ensure_client():
+            return None
+        try:
+            response = self.client.open_point_in_time(index=self.index_name, keep_alive=SEARCH_PIT_KEEP_ALIVE)
+            return response.get("id")
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Failed to open point in time, paging without one: {exc}")
+            return None
+
+    def close_point_in_time(self, pit_id: Optional[str]) -> None:
+        if not pit_id or not self._ensure_client():
+            return
+        try:
+            self.client.close_point_in_time(body={"id": pit_id})
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Failed to close point in time: {exc}")
+
+    def search_leg_page(
+        self,
+        leg: str,
+        query_text: str,
+        query_vector: List[float],
+        size: int,
+        backend: Optional[str] = None,
+        pit_id: Optional[str] = None,
+        search_after: Optional[list] = None,
+        filters: Optional[SearchFilters] = None,
+    ) -> Dict[str, object]:
+        """Next `size` hits of the keyword or vector leg in score order, for cursor pagination.
+
+        Every hit carries its `sort` values; pass the last one back as `search_after` with the
+        returned `backend`/`pit_id` to continue. The vector leg only ranks chunks matching the
+        keyword query when HYBRID_REQUIRE_KEYWORD_MATCH is on, the cursor counterpart of the
+        keyword-id filter in `search`.
+        """
+        continuing = search_after is not None
+        if backend == "memory" or not self._ensure_client():
+            if continuing and backend == "elasticsearch":
+                raise SearchCursorExpired("Elasticsearch is unavailable.")
+            return {
+                "hits": self._memory_leg_page(leg, query_text, query_vector, size, search_after, filters),
+                "backend": "memory",
+                "pit_id": None,
+            }
+
+        if leg == "keyword":
+            if not query_text.strip():
+                return {"hits": [], "backend": "elasticsearch", "pit_id": pit_id}
+            body = {
+                "query": _filtered_query(self._keyword_query(query_text), filters),
+                "highlight": _KEYWORD_HIGHLIGHT,
+            }
+        else:
+            if not query_vector:
+                return {"hits": [], "backend": "elasticsearch", "pit_id": pit_id}
+            candidates = (
+                self._keyword_query(query_text)
+                if HYBRID_REQUIRE_KEYWORD_MATCH and query_text.strip()
+                else {"match_all": {}}
+            )
+            body = {
+                "query": {
+                    "script_score": {
+                        "query": _filtered_query(candidates, filters),
+                        "script": {
+                            "source": "cosineSimilarity(params.query_vector, 'embedding') + 1.0",
+                            "params": {"query_vector": query_vector},
+                        },
+                    }
+                }
+            }
+        body.update({"size": size, "sort": _CURSOR_SORT, "track_total_hits": False})
+        if continuing:
+            body["search_after"] = search_after
+
+        try:
+            if pit_id:
+                body["pit"] = {"id": pit_id, "keep_alive": SEARCH_PIT_KEEP_ALIVE}
+                response = self.client.search(body=body)
+            else:
+                response = self.client.search(index=self.index_name, body=body)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[vector_store] Cursor {leg} search failed: {exc}")
+            if continuing:
+                raise SearchCursorExpired(str(exc)) from exc
+            self.client = None
+            self.memory_mode = True
+            return {
+                "hits": self._memory_leg_page(leg, query_text, query_vector, size, None, filters),
+                "backend": "memory",
+                "pit_id": None,
+            }
+
+        return {
+            "hits": response.get("hits", {}).get("hits", []),
+            "backend": "elasticsearch",
+            "pit_id": response.get("pit_id") or pit_id,
+        }
+
+    def _memory_leg_page(
+        self,
+        leg: str,
+        query_text: str,
+        query_vector: List[float],
+        size: int,
+        search_after: Optional[list],
+        filters: Optional[SearchFilters] = None,
+    ) -> List[dict]:
+        # The memory store has no snapshot: rank the live documents and slice by position.
+        total = len(self._memory_docs)
+        if leg == "keyword":
+            ranked = self._memory_keyword_hits(query_text, total, filters)
+        else:
+            ranked = self._memory_vector_hits(query_vector, total, filters)
+            if HYBRID_REQUIRE_KEYWORD_MATCH and query_text.strip():
+                keyword_ids = {hit["_id"] for hit in self._memory_keyword_hits(query_text, total, filters)}
+                ranked = [hit for hit in ranked if hit["_id"] in keyword_ids]
+        offset = int(search_after[0]) if search_after else 0
+        page = ranked[offset : offset + size]
+        for position, hit in enumerate(page, start=offset + 1):
+            hit["sort"] = [position]
+        return page
+
 
 vector_store = VectorStore()
@@ -23,9 +23,15 @@ _DOCUMENT_COLUMN_SPECS = {
     "document_types": "VARCHAR(255)",
     "ai_title": "VARCHAR(255)",
     "ai_summary_short": "VARCHAR(512)",
+    "ai_summary_status": "VARCHAR(16)",
+    "ai_summary_claimed_at": "VARCHAR(40)",
     "project_id": "INTEGER",
 }
 
+_SUMMARY_CACHE_COLUMN_SPECS = {
+    "source_filename": "VARCHAR(255)",
+}
+
 _BUDGET_VERSION_COLUMN_SPECS = {
     "budget_detail_json": "TEXT",
 }
@@ -99,6 +105,20 @@ def ensure_runtime_schema() -> None:
                 connection,
                 "CREATE INDEX IF NOT EXISTS idx_documents_project_id ON documents (project_id)",
             )
+            _run_schema_statement(
+                connection,
+                "CREATE INDEX IF NOT EXISTS idx_documents_ai_summary_status ON documents (ai_summary_status)",
+            )
+
+        if "document_summary_cache" in table_names:
+            existing_columns = {column["name"] for column in inspector.get_columns("document_summary_cache")}
+            for column_name, column_spec in _SUMMARY_CACHE_COLUMN_SPECS.items():
+                if column_name in existing_columns:
+                    continue
+                _run_schema_statement(
+                    connection,
+                    f"ALTER TABLE document_summary_cache ADD COLUMN {column_name} {column_spec}",
+                )
 
         if "budget_versions" in table_names:
             existing_columns = {column["name"] for column in inspector.get_columns("budget_versions")}
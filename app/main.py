@@ -4,13 +4,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from . import models
+from .core.document_type_backfill import start_document_type_backfill
 from .core.ocr import get_ocr_worker_health
+from .core.query_embedding_cache import start_query_embedding_warmup
+from .core.search_filter_backfill import start_search_filter_backfill
+from .core.summary_enrichment import start_summary_enrichment_resume
 from .core.vector_store import vector_store
 from .database import engine, ensure_runtime_schema
 from .api import admin_debug, admin_dedup, agenda, auth, budget, data_hub, documents
 
 # Create tables / keep runtime schema compatibility (idempotent).
 ensure_runtime_schema()
+# Summaries still waiting for LLM enrichment (previous process, reindex CLI), re-checked periodically.
+start_summary_enrichment_resume()
+# Popular query vectors from QUERY_EMBEDDING_WARM_FILE, encoded off the request path.
+start_query_embedding_warmup()
+# Document types for documents stored without them; search requests never classify or write.
+start_document_type_backfill()
+# project_id/created_at for chunks indexed before search filters; a no-op once none are missing.
+start_search_filter_backfill()
 
 def _parse_cors_origins() -> list[str]:
     raw = os.getenv(
@@ -14,6 +14,8 @@ class Document(Base):
     document_types = Column(String, nullable=True)
     ai_title = Column(String, nullable=True)
     ai_summary_short = Column(String, nullable=True)
+    ai_summary_status = Column(String, nullable=True, index=True)  # pending, running, llm, extractive
+    ai_summary_claimed_at = Column(String, nullable=True)
     created_at = Column(String)
     project_id = Column(Integer, ForeignKey("budget_projects.id"), nullable=True, index=True)
 
@@ -24,6 +26,48 @@ class Document(Base):
     dedup_cluster_id = Column(Integer, ForeignKey("dedup_clusters.id"), nullable=True, index=True)
 
 
+class DocumentTable(Base):
+    __tablename__ = "document_tables"
+
+    id = Column(Integer, primary_key=True, index=True)
+    doc_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    table_id = Column(String, nullable=False, index=True)  # p{page}-t{table_index}
+    page = Column(Integer, nullable=True)
+    table_index = Column(Integer, nullable=False, default=0)
+    section_title = Column(String, nullable=True)
+    raw_text = Column(Text, nullable=False, default="")
+    markdown = Column(Text, nullable=False, default="")
+
+
+class DocumentPipelineRun(Base):
+    __tablename__ = "document_pipeline_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    doc_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    attempt = Column(Integer, nullable=False, default=1)
+    status = Column(String, nullable=False, index=True)  # indexed|skipped|failed
+    total_ms = Column(Float, nullable=False, default=0.0)
+    page_count = Column(Integer, nullable=True)
+    chunk_count = Column(Integer, nullable=True)
+    stages_json = Column(Text, nullable=False, default="{}")  # stage name -> self time (ms)
+    counts_json = Column(Text, nullable=False, default="{}")
+    error = Column(Text, nullable=True)
+    created_at = Column(String, nullable=False, index=True)
+
+
+class DocumentSummaryCache(Base):
+    __tablename__ = "document_summary_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)  # sha256(text hash + fingerprint)
+    text_sha256 = Column(String(64), nullable=False, index=True)
+    fingerprint = Column(String(64), nullable=False)
+    ai_title = Column(String, nullable=False, default="")
+    ai_summary_short = Column(String, nullable=False, default="")
+    source_filename = Column(String, nullable=True)  # the LLM title may lean on this name
+    created_at = Column(String, nullable=False)
+
+
 class DedupCluster(Base):
     __tablename__ = "dedup_clusters"
 
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS ocr_cache_entries (
+        cache_key TEXT PRIMARY KEY,
+        file_sha256 TEXT NOT NULL,
+        provider TEXT NOT NULL,
+        page_index INTEGER NOT NULL DEFAULT -1,
+        options_json TEXT NOT NULL DEFAULT '{}',
+        payload_json TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        last_access_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_ocr_cache_last_access ON ocr_cache_entries (last_access_at)",
+    "CREATE INDEX IF NOT EXISTS idx_ocr_cache_file_sha256 ON ocr_cache_entries (file_sha256, provider)",
+)
+
+DOCUMENT_PAGE_INDEX = -1
+
+
+class OCRCacheStore:
+    """SQLite index of OCR results keyed by (file_sha256, provider, options).
+
+    Whole-document responses are stored with ``page_index=-1``; per-page texts use the
+    zero-based page index so partial OCR runs can be reused. The index file lives in the
+    cache directory and is shared by every worker process mounted on the same volume.
+    Entries are evicted in least-recently-used order once the byte or entry budget is hit.
+    """
+
+    def __init__(self, cache_dir: str, *, max_bytes: int = 0, max_entries: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / "ocr_cache_index.sqlite3"
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(0, int(max_entries))
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "page_hits": 0,
+            "page_misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.index_path), timeout=10.0, isolation_level=None)
+        if not self._schema_ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA_STATEMENTS:
+                connection.execute(statement)
+            self._schema_ready = True
+        return connection
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def get(self, cache_key: str, *, page: bool = False) -> dict[str, Any] | None:
+        hit_counter, miss_counter = ("page_hits", "page_misses") if page else ("hits", "misses")
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT payload_json FROM ocr_cache_entries WHERE cache_key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE ocr_cache_entries SET last_access_at = ? WHERE cache_key = ?",
+                        (time.time(), cache_key),
+                    )
+            finally:
+                connection.close()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[ocr-cache] lookup failed: {exc}")
+            self._count("errors")
+            return None
+
+        if row is None:
+            self._count(miss_counter)
+            return None
+
+        try:
+            payload = json.loads(row[0])
+        except Exception:  # noqa: BLE001
+            self._count(miss_counter)
+            return None
+        if not isinstance(payload, dict):
+            self._count(miss_counter)
+            return None
+
+        self._count(hit_counter)
+        return payload
+
+    def put(
+        self,
+        cache_key: str,
+        payload: dict[str, Any],
+        *,
+        file_sha256: str,
+        provider: str,
+        options: dict[str, Any] | None = None,
+        page_index: int = DOCUMENT_PAGE_INDEX,
+    ) -> None:
+        payload_json = json.dumps(payload, ensure_ascii=False)
+        options_json = json.dumps(options or {}, sort_keys=True, ensure_ascii=False)
+        size_bytes = len(payload_json.encode("utf-8"))
+        now = time.time()
+        try:
+            connection = self._connect()
+            try:
+                connection.execute(
+                    """
+                    INSERT OR REPLACE INTO ocr_cache_entries (
+                        cache_key, file_sha256, provider, page_index, options_json,
+                        payload_json, size_bytes, created_at, last_access_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        cache_key,
+                        file_sha256,
+                        provider,
+                        int(page_index),
+                        options_json,
+                        payload_json,
+                        size_bytes,
+                        now,
+                        now,
+                    ),
+                )
+                evicted = self._evict(connection)
+            finally:
+                connection.close()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[ocr-cache] store failed: {exc}")
+            self._count("errors")
+            return
+
+        with self._lock:
+            self._counters["stores"] += 1
+            self._counters["evictions"] += evicted
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        if self.max_bytes <= 0 and self.max_entries <= 0:
+            return 0
+
+        total_entries, total_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM ocr_cache_entries"
+        ).fetchone()
+        over_entries = self.max_entries > 0 and total_entries > self.max_entries
+        over_bytes = self.max_bytes > 0 and total_bytes > self.max_bytes
+        if not over_entries and not over_bytes:
+            return 0
+
+        evicted_keys: list[str] = []
+        cursor = connection.execute(
+            "SELECT cache_key, size_bytes FROM ocr_cache_entries ORDER BY last_access_at ASC"
+        )
+        for cache_key, size_bytes in cursor:
+            if not (
+                (self.max_entries > 0 and total_entries > self.max_entries)
+                or (self.max_bytes > 0 and total_bytes > self.max_bytes)
+            ):
+                break
+            evicted_keys.append(cache_key)
+            total_entries -= 1
+            total_bytes -= int(size_bytes or 0)
+
+        if evicted_keys:
+            connection.executemany(
+                "DELETE FROM ocr_cache_entries WHERE cache_key = ?",
+                [(key,) for key in evicted_keys],
+            )
+        return len(evicted_keys)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+
+        lookups = counters["hits"] + counters["misses"]
+        page_lookups = counters["page_hits"] + counters["page_misses"]
+        snapshot: dict[str, Any] = {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            "page_hit_rate": round(counters["page_hits"] / page_lookups, 4) if page_lookups else 0.0,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "index_path": str(self.index_path),
+        }
+        try:
+            connection = self._connect()
+            try:
+                total_entries, total_bytes, page_entries = connection.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(size_bytes), 0),
+                           COALESCE(SUM(CASE WHEN page_index >= 0 THEN 1 ELSE 0 END), 0)
+                    FROM ocr_cache_entries
+                    """
+                ).fetchone()
+            finally:
+                connection.close()
+            snapshot.update(
+                {
+                    "entries": int(total_entries),
+                    "page_entries": int(page_entries),
+                    "total_bytes": int(total_bytes),
+                }
+            )
+        except Exception as exc:  # noqa: BLE001
+            snapshot["error"] = str(exc)
+        return snapshot
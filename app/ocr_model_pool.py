@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any
+
+
+class OCRModelPoolBusyError(RuntimeError):
+    """Raised when no queue slot frees up within the submit timeout."""
+
+
+class OCRModelPoolTimeoutError(RuntimeError):
+    """Raised when a task has no result within the task timeout."""
+
+
+# Task ids are uuid4 hex strings.
+_TASK_ID_SIZE = 32
+# How often the listener checks for worker processes that died.
+_PROCESS_CHECK_INTERVAL_SECONDS = 1.0
+
+
+def _pool_worker_main(worker_index: int, tasks, events, warmup: bool, current_task) -> None:
+    # Imported in the child so each process builds and owns its model instance.
+    from . import ocr_worker
+
+    pid = os.getpid()
+    try:
+        pipeline = ocr_worker._get_paddle_pipeline()
+        if warmup:
+            ocr_worker._warmup_paddle_pipeline(pipeline)
+    except Exception as exc:  # noqa: BLE001
+        events.put(("init_failed", worker_index, "", {"pid": pid, "error": str(exc)}))
+        return
+
+    events.put(("ready", worker_index, "", {"pid": pid}))
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, page_paths = task
+        # Shared memory is visible to the parent at once, unlike events (flushed by a feeder
+        # thread), so a task is not lost if this process is killed before "started" is sent.
+        current_task.value = task_id.encode("ascii")
+        events.put(("started", worker_index, task_id, {"pid": pid}))
+        try:
+            result = ocr_worker._predict_paddle_page_texts(pipeline, page_paths)
+            events.put(("done", worker_index, task_id, {"result": result}))
+        except Exception as exc:  # noqa: BLE001
+            events.put(("failed", worker_index, task_id, {"error": f"{type(exc).__name__}: {exc}"}))
+        current_task.value = b""
+
+
+class OCRModelPool:
+    """Pool of OCR model processes, each holding its own warmed Paddle pipeline.
+
+    Rendered pages are dispatched one task per page through a bounded queue, so a single
+    document is spread across processes and callers block (up to `submit_timeout_seconds`)
+    when every slot is taken. A dead process fails its in-flight task and is respawned; a
+    task without a result after `task_timeout_seconds` fails its caller and the process
+    running it is terminated (and respawned), so a hung model call cannot block forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        queue_size: int,
+        submit_timeout_seconds: float,
+        warmup: bool,
+        task_timeout_seconds: float = 300.0,
+    ):
+        self.size = max(0, int(size))
+        self.queue_size = max(1, int(queue_size))
+        self.submit_timeout_seconds = max(0.1, float(submit_timeout_seconds))
+        self.warmup = bool(warmup)
+        self.task_timeout_seconds = max(0.01, float(task_timeout_seconds))
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks = None
+        self._events = None
+        self._processes: dict[int, Any] = {}
+        self._current_tasks: dict[int, Any] = {}
+        self._workers: dict[int, dict[str, Any]] = {}
+        self._pending: dict[str, Future] = {}
+        self._task_owner: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._started_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None and self._listener.is_alive()
+
+    def start(self) -> None:
+        if not self.enabled or self.running:
+            return
+        self._tasks = self._context.Queue(maxsize=self.queue_size)
+        self._events = self._context.Queue()
+        self._stopping.clear()
+        self._started_at = time.time()
+        for worker_index in range(self.size):
+            self._spawn(worker_index)
+        self._listener = threading.Thread(target=self._listen, name="ocr-model-pool", daemon=True)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping.set()
+        for _ in self._processes:
+            try:
+                self._tasks.put_nowait(None)
+            except queue.Full:
+                break
+        for process in self._processes.values():
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._fail_pending("OCR model pool stopped.")
+
+    def _spawn(self, worker_index: int) -> None:
+        current_task = self._context.Array("c", _TASK_ID_SIZE)
+        process = self._context.Process(
+            target=_pool_worker_main,
+            args=(worker_index, self._tasks, self._events, self.warmup, current_task),
+            name=f"ocr-model-{worker_index}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_index] = process
+        self._current_tasks[worker_index] = current_task
+        with self._lock:
+            previous = self._workers.get(worker_index, {})
+            self._workers[worker_index] = {
+                "pid": process.pid,
+                "state": "starting",
+                "current_task": None,
+                "busy_since": None,
+                "busy_seconds": previous.get("busy_seconds", 0.0),
+                "tasks_completed": previous.get("tasks_completed", 0),
+                "tasks_failed": previous.get("tasks_failed", 0),
+                "restarts": previous.get("restarts", -1) + 1,
+                "error": None,
+            }
+
+    def submit(self, page_paths: list[str]) -> Future:
+        return self._submit(page_paths)[1]
+
+    def _submit(self, page_paths: list[str]) -> tuple[str, Future]:
+        if not self.running:
+            raise RuntimeError("OCR model pool is not running.")
+        with self._lock:
+            errors = [worker.get("error") for worker in self._workers.values() if worker.get("state") == "failed"]
+            if self._workers and len(errors) == len(self._workers):
+                raise RuntimeError(f"No OCR model process could load its model: {errors[0]}")
+
+        task_id = uuid.uuid4().hex
+        future: Future = Future()
+        with self._lock:
+            self._pending[task_id] = future
+        try:
+            self._tasks.put((task_id, list(page_paths)), timeout=self.submit_timeout_seconds)
+        except queue.Full as exc:
+            with self._lock:
+                self._pending.pop(task_id, None)
+            raise OCRModelPoolBusyError("OCR model pool queue is full.") from exc
+        return task_id, future
+
+    def recognize(self, paths: list[str]) -> list[tuple[str, float | None]]:
+        """Run one task over `paths` (e.g. a whole document) and wait for it."""
+        return self._wait([self._submit(paths)])[0]
+
+    def recognize_pages(self, page_paths: list[str]) -> list[tuple[str, float | None]]:
+        tasks = [self._submit([page_path]) for page_path in page_paths]
+        return [page_result[0] if page_result else ("", None) for page_result in self._wait(tasks)]
+
+    def _wait(self, tasks: list[tuple[str, Future]]) -> list[Any]:
+        # Each page gets its own deadline, counted once the previous page has resolved.
+        results = []
+        for index, (task_id, future) in enumerate(tasks):
+            try:
+                results.append(future.result(timeout=self.task_timeout_seconds))
+            except FutureTimeoutError:
+                self._terminate_owner(task_id)
+                self._abandon([item[0] for item in tasks[index:]])
+                raise OCRModelPoolTimeoutError(
+                    f"OCR model task produced no result within {self.task_timeout_seconds:g}s."
+                )
+            except BaseException:
+                self._abandon([item[0] for item in tasks[index + 1 :]])
+                raise
+        return results
+
+    def _abandon(self, task_ids: list[str]) -> None:
+        # Results that still arrive for these tasks are dropped by _handle_event.
+        with self._lock:
+            futures = [self._pending.pop(task_id, None) for task_id in task_ids]
+        for future in futures:
+            if future is not None and not future.done():
+                future.set_exception(OCRModelPoolTimeoutError("OCR model task abandoned."))
+
+    def _terminate_owner(self, task_id: str) -> None:
+        # A process stuck in a model call is only recovered by restarting it; the listener
+        # respawns it like a crashed one.
+        with self._lock:
+            owner = self._task_owner.get(task_id)
+        if owner is None:
+            owner = next((index for index in self._current_tasks if self._current_task(index) == task_id), None)
+        process = self._processes.get(owner) if owner is not None else None
+        if process is not None and process.is_alive():
+            print(f"[ocr-model-pool] worker={owner} timed out on a task; terminating for respawn.")
+            process.terminate()
+
+    def _current_task(self, worker_index: int) -> str:
+        current_task = self._current_tasks.get(worker_index)
+        if current_task is None:
+            return ""
+        return current_task.value.decode("ascii", errors="ignore")
+
+    def _listen(self) -> None:
+        # Liveness is checked on a timer, not only when the event queue goes quiet: under steady
+        # traffic from the other workers a crashed worker would otherwise never be noticed.
+        next_check = time.monotonic() + _PROCESS_CHECK_INTERVAL_SECONDS
+        while not self._stopping.is_set():
+            try:
+                kind, worker_index, task_id, payload = self._events.get(timeout=_PROCESS_CHECK_INTERVAL_SECONDS)
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                break
+            else:
+                self._handle_event(kind, worker_index, task_id, payload)
+            if time.monotonic() >= next_check:
+                self._check_processes()
+                next_check = time.monotonic() + _PROCESS_CHECK_INTERVAL_SECONDS
+
+    def _handle_event(self, kind: str, worker_index: int, task_id: str, payload: dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            worker = self._workers.setdefault(worker_index, {})
+            if kind == "ready":
+                worker.update({"state": "idle", "pid": payload.get("pid"), "error": None})
+                return
+            if kind == "init_failed":
+                worker.update({"state": "failed", "error": payload.get("error")})
+                return
+            if kind == "started":
+                worker.update({"state": "busy", "current_task": task_id, "busy_since": now})
+                self._task_owner[task_id] = worker_index
+                return
+
+            busy_since = worker.get("busy_since")
+            if busy_since:
+                worker["busy_seconds"] = worker.get("busy_seconds", 0.0) + (now - busy_since)
+            worker.update({"state": "idle", "current_task": None, "busy_since": None})
+            self._task_owner.pop(task_id, None)
+            future = self._pending.pop(task_id, None)
+            if kind == "done":
+                worker["tasks_completed"] = worker.get("tasks_completed", 0) + 1
+            else:
+                worker["tasks_failed"] = worker.get("tasks_failed", 0) + 1
+
+        if future is None:
+            return
+        if kind == "done":
+            future.set_result(payload.get("result") or [])
+        else:
+            future.set_exception(RuntimeError(payload.get("error") or "OCR model task failed."))
+
+    def _check_processes(self) -> None:
+        for worker_index, process in list(self._processes.items()):
+            if process.is_alive() or self._stopping.is_set():
+                continue
+            current_task = self._current_task(worker_index)
+            with self._lock:
+                state = self._workers.get(worker_index, {}).get("state")
+                orphaned = [task_id for task_id, owner in self._task_owner.items() if owner == worker_index]
+                if current_task and current_task not in orphaned:
+                    # Dequeued, but killed before its "started" event reached the listener.
+                    orphaned.append(current_task)
+                for task_id in orphaned:
+                    self._task_owner.pop(task_id, None)
+                futures = [self._pending.pop(task_id, None) for task_id in orphaned]
+            for future in futures:
+                if future is not None:
+                    future.set_exception(RuntimeError("OCR model process exited during recognition."))
+            if state == "failed":
+                continue
+            print(f"[ocr-model-pool] worker={worker_index} exited (code={process.exitcode}); respawning.")
+            self._spawn(worker_index)
+
+    def _fail_pending(self, message: str) -> None:
+        with self._lock:
+            futures = list(self._pending.values())
+            self._pending.clear()
+            self._task_owner.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError(message))
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.time()
+        uptime = max(1e-6, now - self._started_at) if self._started_at else 0.0
+        with self._lock:
+            workers = []
+            for worker_index in sorted(self._workers):
+                worker = dict(self._workers[worker_index])
+                busy_seconds = worker.get("busy_seconds", 0.0)
+                if worker.get("busy_since"):
+                    busy_seconds += now - worker["busy_since"]
+                workers.append(
+                    {
+                        "worker": worker_index,
+                        "pid": worker.get("pid"),
+                        "state": worker.get("state"),
+                        "tasks_completed": worker.get("tasks_completed", 0),
+                        "tasks_failed": worker.get("tasks_failed", 0),
+                        "restarts": max(0, worker.get("restarts", 0)),
+                        "busy_seconds": round(busy_seconds, 3),
+                        "utilization": round(busy_seconds / uptime, 4) if uptime else 0.0,
+                        "error": worker.get("error"),
+                    }
+                )
+            pending = len(self._pending)
+
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "size": self.size,
+            "queue_size": self.queue_size,
+            "pending_tasks": pending,
+            "workers": workers,
+        }
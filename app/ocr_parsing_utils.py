@@ -313,3 +313,47 @@ def _extract_pages_from_prediction_item(item: Any) -> int:
         if isinstance(value, (int, float)) and value > 0:
             return int(value)
     return 0
+
+
+def _extract_confidence_from_prediction_item(item: Any) -> float | None:
+    """Mean recognition score (`rec_scores`/`rec_score`) when the engine reports one."""
+    payload: Any = item
+    if not isinstance(payload, (dict, list)):
+        if hasattr(payload, "res"):
+            payload = getattr(payload, "res")
+        elif hasattr(payload, "to_dict"):
+            try:
+                payload = payload.to_dict()
+            except Exception:  # noqa: BLE001
+                return None
+        elif hasattr(payload, "get"):
+            payload = {"rec_scores": payload.get("rec_scores")}
+        else:
+            return None
+
+    scores: list[float] = []
+
+    def _collect(node: Any, depth: int = 0) -> None:
+        if depth > 6:
+            return
+        if isinstance(node, dict):
+            rec_scores = node.get("rec_scores")
+            if isinstance(rec_scores, (list, tuple)):
+                scores.extend(float(value) for value in rec_scores if isinstance(value, (int, float)))
+            rec_score = node.get("rec_score")
+            if isinstance(rec_score, (int, float)):
+                scores.append(float(rec_score))
+            for key, value in node.items():
+                if key in {"rec_scores", "rec_score"}:
+                    continue
+                if isinstance(value, (dict, list)):
+                    _collect(value, depth + 1)
+        elif isinstance(node, list):
+            for value in node:
+                if isinstance(value, (dict, list)):
+                    _collect(value, depth + 1)
+
+    _collect(payload)
+    if not scores:
+        return None
+    return sum(scores) / len(scores)
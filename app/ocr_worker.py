@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import importlib.util
@@ -7,20 +8,27 @@ import inspect
 import json
 import mimetypes
 import os
+import re
 import tempfile
+import threading
+import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib import error, request
 from urllib.parse import urlparse, urlunparse
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
+from .ocr_cache_store import DOCUMENT_PAGE_INDEX, OCRCacheStore
+from .ocr_model_pool import OCRModelPool, OCRModelPoolBusyError
 from .ocr_parsing_utils import (
     _extract_by_path,
+    _extract_confidence_from_prediction_item,
     _extract_ollama_text,
     _extract_pages_from_prediction_item,
     _extract_pages_recursive,
@@ -94,6 +102,20 @@ OCR_ACCELERATOR = os.getenv("OCR_ACCELERATOR", "cpu").strip().lower()
 OCR_PROVIDER = os.getenv("OCR_PROVIDER", "pypdf").strip().lower()
 OCR_CACHE_ENABLED = _read_bool_env("OCR_CACHE_ENABLED", "true")
 OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", "/app/.cache/ocr_worker").strip() or "/app/.cache/ocr_worker"
+OCR_CACHE_MAX_BYTES = max(0, int(os.getenv("OCR_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024))))
+OCR_CACHE_MAX_ENTRIES = max(0, int(os.getenv("OCR_CACHE_MAX_ENTRIES", "0")))
+OCR_PAGE_CACHE_ENABLED = _read_bool_env("OCR_PAGE_CACHE_ENABLED", "true")
+OCR_JOB_MAX_CONCURRENCY = max(0, int(os.getenv("OCR_JOB_MAX_CONCURRENCY", "0")))
+if OCR_JOB_MAX_CONCURRENCY <= 0:
+    OCR_JOB_MAX_CONCURRENCY = max(1, min(4, (os.cpu_count() or 2) // 2))
+OCR_JOB_MAX_PENDING = max(1, int(os.getenv("OCR_JOB_MAX_PENDING", "64")))
+OCR_JOB_RESULT_TTL_SECONDS = max(30.0, _read_float_env("OCR_JOB_RESULT_TTL_SECONDS", "900"))
+OCR_JOB_MAX_WAIT_SECONDS = max(1.0, _read_float_env("OCR_JOB_MAX_WAIT_SECONDS", "30"))
+OCR_JOB_POLL_INTERVAL_SECONDS = 0.2
+OCR_MODEL_POOL_SIZE = max(0, int(os.getenv("OCR_MODEL_POOL_SIZE", "0")))
+OCR_MODEL_POOL_QUEUE_SIZE = max(1, int(os.getenv("OCR_MODEL_POOL_QUEUE_SIZE", str(max(1, OCR_MODEL_POOL_SIZE) * 4))))
+OCR_MODEL_POOL_SUBMIT_TIMEOUT_SECONDS = max(0.1, _read_float_env("OCR_MODEL_POOL_SUBMIT_TIMEOUT_SECONDS", "30"))
+OCR_MODEL_POOL_TASK_TIMEOUT_SECONDS = max(1.0, _read_float_env("OCR_MODEL_POOL_TASK_TIMEOUT_SECONDS", "300"))
 
 GLM_OCR_ENDPOINT = os.getenv("GLM_OCR_ENDPOINT", "").strip()
 GLM_OCR_API_KEY = os.getenv("GLM_OCR_API_KEY", "").strip()
@@ -201,6 +223,16 @@ PADDLE_FAST_MODE_DEFAULT = (
 PADDLE_FAST_FIRST_PAGES = max(1, int(os.getenv("PADDLE_FAST_FIRST_PAGES", "2")))
 PADDLE_FAST_RENDER_DPI = max(96, int(os.getenv("PADDLE_FAST_RENDER_DPI", "120")))
 PADDLE_FAST_MIN_TEXT_CHARS = max(64, int(os.getenv("PADDLE_FAST_MIN_TEXT_CHARS", "180")))
+OCR_ADAPTIVE_DPI_ENABLED = _read_bool_env("OCR_ADAPTIVE_DPI_ENABLED", "true")
+OCR_ADAPTIVE_DPI_LADDER = sorted(
+    {
+        max(96, int(value))
+        for value in os.getenv("OCR_ADAPTIVE_DPI_LADDER", "120").split(",")
+        if value.strip().isdigit()
+    }
+)
+OCR_ADAPTIVE_MIN_PAGE_CHARS = max(0, int(os.getenv("OCR_ADAPTIVE_MIN_PAGE_CHARS", "40")))
+OCR_ADAPTIVE_MIN_CONFIDENCE = max(0.0, min(1.0, _read_float_env("OCR_ADAPTIVE_MIN_CONFIDENCE", "0.85")))
 PADDLE_SKIP_PDF_OCR_ON_CPU = (
     os.getenv("PADDLE_SKIP_PDF_OCR_ON_CPU", "true").strip().lower() in {"1", "true", "yes", "on"}
 )
@@ -217,10 +249,25 @@ _PADDLE_PIPELINE: Any = None
 _PADDLE_PIPELINE_ERROR = ""
 _PADDLE_LITE_OCR: Any = None
 _PADDLE_LITE_OCR_ERROR = ""
+_SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
+
+_OCR_CACHE_STORE = OCRCacheStore(
+    OCR_CACHE_DIR,
+    max_bytes=OCR_CACHE_MAX_BYTES,
+    max_entries=OCR_CACHE_MAX_ENTRIES,
+)
+_OCR_MODEL_POOL = OCRModelPool(
+    size=OCR_MODEL_POOL_SIZE if OCR_PROVIDER == "paddle" else 0,
+    queue_size=OCR_MODEL_POOL_QUEUE_SIZE,
+    submit_timeout_seconds=OCR_MODEL_POOL_SUBMIT_TIMEOUT_SECONDS,
+    task_timeout_seconds=OCR_MODEL_POOL_TASK_TIMEOUT_SECONDS,
+    warmup=PADDLE_WARMUP_ON_STARTUP,
+)
 
 
 class OCRRequest(BaseModel):
     file_path: str
+    file_sha256: str | None = None
     max_pages: int | None = None
     render_dpi: int | None = None
     max_tokens: int | None = None
@@ -229,12 +276,32 @@ class OCRRequest(BaseModel):
     pypdf_preflight: bool | None = None
 
 
+class OCRPageDetail(BaseModel):
+    page: int
+    render_dpi: int
+    chars: int
+    confidence: float | None = None
+    attempts: int = 1
+    outcome: str
+    cached: bool = False
+
+
 class OCRResponse(BaseModel):
     text: str
     engine: str
     pages: int
     used_fallback: bool
     error: str | None = None
+    page_details: list[OCRPageDetail] = []
+
+
+class OCRJobResponse(BaseModel):
+    job_id: str
+    status: str
+    coalesced: bool = False
+    result: OCRResponse | None = None
+    error: str | None = None
+    status_code: int | None = None
 
 
 @dataclass(frozen=True)
@@ -254,6 +321,23 @@ class OCRResolvedOptions:
     force_render_pdf: bool
     use_pypdf_preflight: bool
     should_skip_heavy_paddle_pdf: bool
+    file_sha256: str = ""
+
+
+@dataclass(frozen=True)
+class OCRPageRecognition:
+    page_index: int
+    text: str
+    confidence: float | None
+    render_dpi: int
+    cached: bool = False
+
+
+def _normalize_sha256(value: str | None) -> str:
+    candidate = (value or "").strip().lower()
+    if _SHA256_HEX_RE.match(candidate):
+        return candidate
+    return ""
 
 
 def _sha256_file(file_path: str) -> str:
@@ -267,6 +351,42 @@ def _sha256_file(file_path: str) -> str:
     return hasher.hexdigest()
 
 
+def _provider_cache_fingerprint(provider: str) -> dict[str, Any]:
+    if provider == "paddle":
+        return {
+            "pipeline_version": PADDLE_PIPELINE_VERSION,
+            "model_name": PADDLE_MODEL_NAME,
+            "device": _paddle_effective_device(PADDLE_DEVICE),
+            "use_layout_detection": PADDLE_USE_LAYOUT_DETECTION,
+            "use_chart_recognition": PADDLE_USE_CHART_RECOGNITION,
+            "use_seal_recognition": PADDLE_USE_SEAL_RECOGNITION,
+            "use_ocr_for_image_block": PADDLE_USE_OCR_FOR_IMAGE_BLOCK,
+            "format_block_content": PADDLE_FORMAT_BLOCK_CONTENT,
+            "merge_layout_blocks": PADDLE_MERGE_LAYOUT_BLOCKS,
+            "layout_shape_mode": PADDLE_LAYOUT_SHAPE_MODE,
+            "prompt_label": PADDLE_PROMPT_LABEL,
+            "predict_max_new_tokens": PADDLE_PREDICT_MAX_NEW_TOKENS,
+            "predict_min_pixels": PADDLE_PREDICT_MIN_PIXELS,
+            "predict_max_pixels": PADDLE_PREDICT_MAX_PIXELS,
+            "predict_repetition_penalty": PADDLE_PREDICT_REPETITION_PENALTY,
+        }
+    if provider == "glm":
+        return {
+            "glm_mode": GLM_OCR_MODE,
+            "glm_model": GLM_OCR_MODEL,
+            "glm_prompt": GLM_OCR_PROMPT,
+            "glm_max_tokens": GLM_OCR_MAX_TOKENS,
+            "glm_temperature": GLM_OCR_TEMPERATURE,
+            "glm_top_p": GLM_OCR_TOP_P,
+        }
+    return {}
+
+
+def _hash_cache_payload(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
 def _build_ocr_cache_key(
     *,
     file_path: str,
@@ -277,8 +397,9 @@ def _build_ocr_cache_key(
     requested_fast_mode: bool,
     force_render_pdf: bool,
     use_pypdf_preflight: bool,
+    file_sha256: str | None = None,
 ) -> str:
-    file_hash = _sha256_file(file_path)
+    file_hash = _normalize_sha256(file_sha256) or _sha256_file(file_path)
     payload: dict[str, Any] = {
         "provider": provider,
         "file_sha256": file_hash,
@@ -289,55 +410,41 @@ def _build_ocr_cache_key(
         "force_render_pdf": force_render_pdf,
         "pypdf_preflight": use_pypdf_preflight,
     }
-    if provider == "paddle":
-        payload.update(
-            {
-                "pipeline_version": PADDLE_PIPELINE_VERSION,
-                "model_name": PADDLE_MODEL_NAME,
-                "device": _paddle_effective_device(PADDLE_DEVICE),
-                "use_layout_detection": PADDLE_USE_LAYOUT_DETECTION,
-                "use_chart_recognition": PADDLE_USE_CHART_RECOGNITION,
-                "use_seal_recognition": PADDLE_USE_SEAL_RECOGNITION,
-                "use_ocr_for_image_block": PADDLE_USE_OCR_FOR_IMAGE_BLOCK,
-                "format_block_content": PADDLE_FORMAT_BLOCK_CONTENT,
-                "merge_layout_blocks": PADDLE_MERGE_LAYOUT_BLOCKS,
-                "layout_shape_mode": PADDLE_LAYOUT_SHAPE_MODE,
-                "prompt_label": PADDLE_PROMPT_LABEL,
-                "predict_max_new_tokens": PADDLE_PREDICT_MAX_NEW_TOKENS,
-                "predict_min_pixels": PADDLE_PREDICT_MIN_PIXELS,
-                "predict_max_pixels": PADDLE_PREDICT_MAX_PIXELS,
-                "predict_repetition_penalty": PADDLE_PREDICT_REPETITION_PENALTY,
-            }
-        )
-    elif provider == "glm":
-        payload.update(
-            {
-                "glm_mode": GLM_OCR_MODE,
-                "glm_model": GLM_OCR_MODEL,
-                "glm_prompt": GLM_OCR_PROMPT,
-                "glm_max_tokens": GLM_OCR_MAX_TOKENS,
-                "glm_temperature": GLM_OCR_TEMPERATURE,
-                "glm_top_p": GLM_OCR_TOP_P,
-            }
-        )
+    payload.update(_provider_cache_fingerprint(provider))
+    return _hash_cache_payload(payload)
 
-    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
 
+def _build_ocr_page_cache_options(provider: str, render_dpi: int, max_tokens: int = 0) -> dict[str, Any]:
+    return {
+        "render_dpi": int(render_dpi),
+        "max_tokens": int(max_tokens),
+        **_provider_cache_fingerprint(provider),
+    }
 
-def _ocr_cache_path(cache_key: str) -> Path:
-    return Path(OCR_CACHE_DIR) / f"{cache_key}.json"
+
+def _build_ocr_page_cache_key(
+    *,
+    file_sha256: str,
+    provider: str,
+    page_index: int,
+    page_options: dict[str, Any],
+) -> str:
+    return _hash_cache_payload(
+        {
+            "scope": "page",
+            "provider": provider,
+            "file_sha256": file_sha256,
+            "page_index": int(page_index),
+            **page_options,
+        }
+    )
 
 
 def _load_cached_ocr_response(cache_key: str) -> OCRResponse | None:
     if not OCR_CACHE_ENABLED:
         return None
-    cache_path = _ocr_cache_path(cache_key)
-    if not cache_path.exists():
-        return None
-    try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
-    except Exception:  # noqa: BLE001
+    payload = _OCR_CACHE_STORE.get(cache_key)
+    if payload is None:
         return None
 
     text = payload.get("text")
@@ -353,6 +460,12 @@ def _load_cached_ocr_response(cache_key: str) -> OCRResponse | None:
         used_fallback = False
     if error_message is not None and not isinstance(error_message, str):
         error_message = None
+    page_details: list[OCRPageDetail] = []
+    for detail in payload.get("page_details") or []:
+        try:
+            page_details.append(OCRPageDetail(**detail))
+        except Exception:  # noqa: BLE001
+            continue
 
     return OCRResponse(
         text=text,
@@ -360,26 +473,48 @@ def _load_cached_ocr_response(cache_key: str) -> OCRResponse | None:
         pages=max(0, pages),
         used_fallback=used_fallback,
         error=error_message,
+        page_details=page_details,
     )
 
 
-def _store_cached_ocr_response(cache_key: str, response: OCRResponse) -> None:
+def _store_cached_ocr_response(
+    cache_key: str,
+    response: OCRResponse,
+    *,
+    file_sha256: str = "",
+    provider: str = "",
+) -> None:
     if not OCR_CACHE_ENABLED:
         return
-    try:
-        cache_dir = Path(OCR_CACHE_DIR)
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_path = _ocr_cache_path(cache_key)
-        payload = {
-            "text": response.text,
-            "engine": response.engine,
-            "pages": response.pages,
-            "used_fallback": response.used_fallback,
-            "error": response.error,
-        }
-        cache_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-    except Exception:  # noqa: BLE001
-        return
+    payload = {
+        "text": response.text,
+        "engine": response.engine,
+        "pages": response.pages,
+        "used_fallback": response.used_fallback,
+        "error": response.error,
+        "page_details": [detail.model_dump() for detail in response.page_details],
+    }
+    _OCR_CACHE_STORE.put(
+        cache_key,
+        payload,
+        file_sha256=file_sha256,
+        provider=provider or OCR_PROVIDER,
+    )
+
+
+def _load_cached_page(cache_key: str) -> tuple[str, float | None] | None:
+    payload = _OCR_CACHE_STORE.get(cache_key, page=True)
+    if payload is None:
+        return None
+    text = payload.get("text")
+    if not isinstance(text, str):
+        return None
+    confidence = payload.get("confidence")
+    return text, float(confidence) if isinstance(confidence, (int, float)) else None
+
+
+def _page_cache_active(file_sha256: str) -> bool:
+    return OCR_CACHE_ENABLED and OCR_PAGE_CACHE_ENABLED and bool(file_sha256)
 
 
 def _read_extra_headers() -> dict[str, str]:
@@ -654,7 +789,13 @@ def _file_to_data_uri(file_path: str) -> str:
     return f"data:{mime_type};base64,{encoded}"
 
 
-def _call_glm(file_path: str, max_pages: int, render_dpi: int, max_tokens: int) -> tuple[str, int]:
+def _call_glm(
+    file_path: str,
+    max_pages: int,
+    render_dpi: int,
+    max_tokens: int,
+    file_sha256: str = "",
+) -> tuple[str, int, list[OCRPageDetail]]:
     if not GLM_OCR_ENDPOINT:
         raise ValueError("GLM_OCR_ENDPOINT is not configured.")
 
@@ -664,30 +805,37 @@ def _call_glm(file_path: str, max_pages: int, render_dpi: int, max_tokens: int)
 
     lower_path = file_path.lower()
     if lower_path.endswith(".pdf"):
-        page_images = _render_pdf_pages_for_ollama(
+        def _recognize_page(page_path: str) -> tuple[str, float | None]:
+            try:
+                return _call_glm_openai_chat(_file_to_data_uri(page_path), max_tokens=max_tokens).strip(), None
+            except ValueError:
+                # Blank page at this resolution; the ladder may retry it at a higher DPI.
+                return "", None
+
+        def _recognize_pages(page_paths: list[str]) -> list[tuple[str, float | None]]:
+            return [_recognize_page(page_path) for page_path in page_paths]
+
+        parts, page_count, page_details = _ocr_pdf_pages_with_cache(
             file_path=file_path,
-            max_pages=max_pages,
-            render_dpi=render_dpi,
+            file_sha256=file_sha256,
+            provider="glm",
+            start_page=0,
+            page_count=max_pages,
+            render_dpi=max(96, render_dpi),
+            recognize_pages=_recognize_pages,
+            max_tokens=max_tokens,
         )
-        if not page_images:
+        if page_count <= 0:
             raise ValueError("No rendered pages generated from PDF input.")
-        parts: list[str] = []
-        for page_base64 in page_images:
-            text = _call_glm_openai_chat(
-                f"data:image/png;base64,{page_base64}",
-                max_tokens=max_tokens,
-            )
-            if text.strip():
-                parts.append(text.strip())
         merged = "\n".join(parts).strip()
         if merged:
-            return merged, len(page_images)
+            return merged, page_count, page_details
         raise ValueError("GLM response did not include extractable text.")
 
     data_url = _file_to_data_uri(file_path)
     text = _call_glm_openai_chat(data_url, max_tokens=max_tokens).strip()
     if text:
-        return text, 1
+        return text, 1, []
     raise ValueError("GLM response did not include extractable text.")
 
 
@@ -736,7 +884,6 @@ def _render_pdf_pages_to_pngs(
     if pdfium is None:
         raise RuntimeError("pypdfium2 is not installed.")
 
-    page_paths: list[str] = []
     document = pdfium.PdfDocument(file_path)
     page_total = len(document)
     start_index = max(0, int(start_page))
@@ -744,9 +891,46 @@ def _render_pdf_pages_to_pngs(
         end_index = page_total
     else:
         end_index = min(page_total, start_index + max_pages)
+
+    try:
+        return _render_document_pages_to_pngs(
+            document,
+            output_dir=output_dir,
+            page_indices=range(start_index, end_index),
+            render_dpi=render_dpi,
+        )
+    finally:
+        if hasattr(document, "close"):
+            document.close()
+
+
+def _render_pdf_page_indices_to_pngs(
+    file_path: str,
+    output_dir: str,
+    page_indices: list[int],
+    render_dpi: int,
+) -> list[str]:
+    if pdfium is None:
+        raise RuntimeError("pypdfium2 is not installed.")
+
+    document = pdfium.PdfDocument(file_path)
+    try:
+        return _render_document_pages_to_pngs(
+            document,
+            output_dir=output_dir,
+            page_indices=page_indices,
+            render_dpi=render_dpi,
+        )
+    finally:
+        if hasattr(document, "close"):
+            document.close()
+
+
+def _render_document_pages_to_pngs(document, *, output_dir: str, page_indices, render_dpi: int) -> list[str]:
+    page_paths: list[str] = []
     scale = render_dpi / 72.0
 
-    for page_index in range(start_index, end_index):
+    for page_index in page_indices:
         page = document[page_index]
         bitmap = page.render(scale=scale)
         image = bitmap.to_pil()
@@ -760,12 +944,203 @@ def _render_pdf_pages_to_pngs(
         if hasattr(page, "close"):
             page.close()
 
-    if hasattr(document, "close"):
-        document.close()
-
     return page_paths
 
 
+def _pdf_page_count(file_path: str) -> int:
+    if pdfium is None:
+        raise RuntimeError("pypdfium2 is not installed.")
+
+    document = pdfium.PdfDocument(file_path)
+    try:
+        return len(document)
+    finally:
+        if hasattr(document, "close"):
+            document.close()
+
+
+def _recognize_pdf_pages_with_cache(
+    *,
+    file_path: str,
+    file_sha256: str,
+    provider: str,
+    page_indices: list[int],
+    render_dpi: int,
+    recognize_pages: Callable[[list[str]], list[tuple[str, float | None]]],
+    max_tokens: int = 0,
+) -> list[OCRPageRecognition]:
+    """Render and recognize the given pages at one DPI, reusing per-page cache entries.
+
+    `recognize_pages` returns one `(text, confidence)` per rendered image; if the count does
+    not line up, the merged output is attributed to the first rendered page and nothing is
+    cached per page.
+    """
+    use_cache = _page_cache_active(file_sha256)
+    page_options = _build_ocr_page_cache_options(provider, render_dpi, max_tokens)
+    page_keys: dict[int, str] = {}
+    results: dict[int, OCRPageRecognition] = {}
+    missing_indices: list[int] = []
+    for page_index in page_indices:
+        if not use_cache:
+            missing_indices.append(page_index)
+            continue
+        page_keys[page_index] = _build_ocr_page_cache_key(
+            file_sha256=file_sha256,
+            provider=provider,
+            page_index=page_index,
+            page_options=page_options,
+        )
+        cached_page = _load_cached_page(page_keys[page_index])
+        if cached_page is None:
+            missing_indices.append(page_index)
+        else:
+            results[page_index] = OCRPageRecognition(
+                page_index=page_index,
+                text=cached_page[0],
+                confidence=cached_page[1],
+                render_dpi=render_dpi,
+                cached=True,
+            )
+
+    if missing_indices:
+        with tempfile.TemporaryDirectory(prefix="sync-hub-ocr-pages-") as temp_dir:
+            page_paths = _render_pdf_page_indices_to_pngs(
+                file_path=file_path,
+                output_dir=temp_dir,
+                page_indices=missing_indices,
+                render_dpi=render_dpi,
+            )
+            recognized = recognize_pages(page_paths) if page_paths else []
+
+        if len(recognized) == len(missing_indices):
+            for page_index, (text, confidence) in zip(missing_indices, recognized):
+                results[page_index] = OCRPageRecognition(
+                    page_index=page_index,
+                    text=text,
+                    confidence=confidence,
+                    render_dpi=render_dpi,
+                )
+                if use_cache and text.strip():
+                    _OCR_CACHE_STORE.put(
+                        page_keys[page_index],
+                        {"text": text, "confidence": confidence},
+                        file_sha256=file_sha256,
+                        provider=provider,
+                        options=page_options,
+                        page_index=page_index,
+                    )
+        else:
+            merged = "\n".join(text for text, _ in recognized if text).strip()
+            for position, page_index in enumerate(missing_indices):
+                results[page_index] = OCRPageRecognition(
+                    page_index=page_index,
+                    text=merged if position == 0 else "",
+                    confidence=None,
+                    render_dpi=render_dpi,
+                )
+
+    return [results[page_index] for page_index in page_indices if page_index in results]
+
+
+def _resolve_dpi_ladder(target_dpi: int) -> list[int]:
+    target = max(96, int(target_dpi))
+    if not OCR_ADAPTIVE_DPI_ENABLED:
+        return [target]
+    return [dpi for dpi in OCR_ADAPTIVE_DPI_LADDER if dpi < target] + [target]
+
+
+def _page_meets_yield(page: OCRPageRecognition) -> bool:
+    if len(page.text.strip()) < OCR_ADAPTIVE_MIN_PAGE_CHARS:
+        return False
+    if page.confidence is not None and page.confidence < OCR_ADAPTIVE_MIN_CONFIDENCE:
+        return False
+    return True
+
+
+def _prefer_page_result(previous: OCRPageRecognition, current: OCRPageRecognition) -> OCRPageRecognition:
+    # A higher DPI normally wins, but never trade a usable low-DPI page for an emptier one.
+    if _page_meets_yield(current):
+        return current
+    if len(current.text.strip()) >= len(previous.text.strip()):
+        return current
+    return previous
+
+
+def _ocr_pdf_pages_with_cache(
+    *,
+    file_path: str,
+    file_sha256: str,
+    provider: str,
+    start_page: int,
+    page_count: int,
+    render_dpi: int,
+    recognize_pages: Callable[[list[str]], list[tuple[str, float | None]]],
+    max_tokens: int = 0,
+) -> tuple[list[str], int, list[OCRPageDetail]]:
+    """OCR a page range with an adaptive resolution ladder.
+
+    Every page starts on the lowest rung of `OCR_ADAPTIVE_DPI_LADDER` below `render_dpi`;
+    only pages whose character yield or recognition confidence falls short are re-rendered
+    at the next rung, ending at `render_dpi`. `page_count <= 0` means every page from
+    `start_page` to the end of the document.
+    """
+    page_total = _pdf_page_count(file_path)
+    start_index = max(0, int(start_page))
+    end_index = page_total if page_count <= 0 else min(page_total, start_index + page_count)
+    page_indices = list(range(start_index, end_index))
+    if not page_indices:
+        return [], 0, []
+
+    ladder = _resolve_dpi_ladder(render_dpi)
+    best: dict[int, OCRPageRecognition] = {}
+    attempts: dict[int, int] = {page_index: 0 for page_index in page_indices}
+    pending = page_indices
+    for rung_index, dpi in enumerate(ladder):
+        recognized = _recognize_pdf_pages_with_cache(
+            file_path=file_path,
+            file_sha256=file_sha256,
+            provider=provider,
+            page_indices=pending,
+            render_dpi=dpi,
+            recognize_pages=recognize_pages,
+            max_tokens=max_tokens,
+        )
+        for page in recognized:
+            attempts[page.page_index] += 1
+            previous = best.get(page.page_index)
+            best[page.page_index] = page if previous is None else _prefer_page_result(previous, page)
+
+        is_last_rung = rung_index == len(ladder) - 1
+        pending = [] if is_last_rung else [page.page_index for page in recognized if not _page_meets_yield(page)]
+        if not pending:
+            break
+
+    texts: list[str] = []
+    details: list[OCRPageDetail] = []
+    for page_index in page_indices:
+        page = best.get(page_index)
+        if page is None:
+            continue
+        if page.text:
+            texts.append(page.text)
+        if _page_meets_yield(page):
+            outcome = "accepted" if attempts[page_index] <= 1 else "escalated"
+        else:
+            outcome = "below_threshold"
+        details.append(
+            OCRPageDetail(
+                page=page_index + 1,
+                render_dpi=page.render_dpi,
+                chars=len(page.text.strip()),
+                confidence=round(page.confidence, 4) if page.confidence is not None else None,
+                attempts=attempts[page_index],
+                outcome=outcome,
+                cached=page.cached,
+            )
+        )
+    return texts, len(page_indices), details
+
+
 def _paddle_gpu_available() -> bool:
     try:
         import paddle  # type: ignore
@@ -1018,7 +1393,7 @@ def _build_paddle_predict_kwargs(pipeline) -> dict[str, Any]:
     return predict_kwargs
 
 
-def _call_paddle_predict(pipeline, input_path: str | list[str]) -> tuple[str, int]:
+def _paddle_prediction_items(pipeline, input_path: str | list[str]) -> list[Any]:
     predict_signature = inspect.signature(pipeline.predict)
     predict_kwargs = _build_paddle_predict_kwargs(pipeline)
 
@@ -1028,9 +1403,12 @@ def _call_paddle_predict(pipeline, input_path: str | list[str]) -> tuple[str, in
         prediction_output = pipeline.predict(input_path, **predict_kwargs)
 
     if isinstance(prediction_output, list):
-        prediction_items = prediction_output
-    else:
-        prediction_items = list(prediction_output)
+        return prediction_output
+    return list(prediction_output)
+
+
+def _call_paddle_predict(pipeline, input_path: str | list[str]) -> tuple[str, int]:
+    prediction_items = _paddle_prediction_items(pipeline, input_path)
 
     texts: list[str] = []
     pages = 0
@@ -1049,15 +1427,41 @@ def _call_paddle_predict(pipeline, input_path: str | list[str]) -> tuple[str, in
     return "\n".join(texts).strip(), pages
 
 
+def _predict_paddle_page_texts(pipeline, page_paths: list[str]) -> list[tuple[str, float | None]]:
+    return [
+        (
+            (_extract_text_from_prediction_item(item) or "").strip(),
+            _extract_confidence_from_prediction_item(item),
+        )
+        for item in _paddle_prediction_items(pipeline, page_paths)
+    ]
+
+
 def _call_paddle(
     file_path: str,
     max_pages: int = PADDLE_MAX_PAGES,
     render_dpi: int = PADDLE_RENDER_DPI,
     force_render_pdf: bool = PADDLE_FORCE_RENDER_PDF_DEFAULT,
     fast_mode: bool = PADDLE_FAST_MODE_DEFAULT,
-) -> tuple[str, int]:
-    pipeline = _get_paddle_pipeline()
+    file_sha256: str = "",
+) -> tuple[str, int, list[OCRPageDetail]]:
+    # With the model pool running, recognition happens in the warmed pool processes
+    # and this process never loads its own pipeline.
+    use_pool = _OCR_MODEL_POOL.running
+    pipeline = None if use_pool else _get_paddle_pipeline()
     lower_path = file_path.lower()
+    page_details: list[OCRPageDetail] = []
+
+    def _recognize_pages(page_paths: list[str]) -> list[tuple[str, float | None]]:
+        if use_pool:
+            return _OCR_MODEL_POOL.recognize_pages(page_paths)
+        return _predict_paddle_page_texts(pipeline, page_paths)
+
+    def _predict_document() -> tuple[str, int]:
+        if use_pool:
+            items = _OCR_MODEL_POOL.recognize([file_path])
+            return "\n".join(text for text, _ in items if text).strip(), len(items)
+        return _call_paddle_predict(pipeline, file_path)
 
     def _ocr_rendered_pages(
         *,
@@ -1068,29 +1472,27 @@ def _call_paddle(
         if page_count < 0:
             return [], 0
 
-        with tempfile.TemporaryDirectory(prefix="sync-hub-paddle-") as temp_dir:
-            page_paths = _render_pdf_pages_to_pngs(
-                file_path=file_path,
-                output_dir=temp_dir,
-                max_pages=page_count,
-                render_dpi=dpi,
-                start_page=start_page,
-            )
-            if not page_paths:
-                return [], 0
-
-            chunk, _ = _call_paddle_predict(pipeline, page_paths)
-            if not chunk:
-                return [], len(page_paths)
-            return [chunk], len(page_paths)
+        texts, processed_pages, details = _ocr_pdf_pages_with_cache(
+            file_path=file_path,
+            file_sha256=file_sha256,
+            provider="paddle",
+            start_page=start_page,
+            page_count=page_count,
+            render_dpi=dpi,
+            recognize_pages=_recognize_pages,
+        )
+        page_details.extend(details)
+        return texts, processed_pages
 
     if lower_path.endswith(".pdf"):
         direct_error: Exception | None = None
         if not force_render_pdf:
             try:
-                text, pages = _call_paddle_predict(pipeline, file_path)
+                text, pages = _predict_document()
                 if text:
-                    return text, pages
+                    return text, pages, []
+            except OCRModelPoolBusyError:
+                raise
             except Exception as exc:  # noqa: BLE001
                 direct_error = exc
 
@@ -1113,7 +1515,7 @@ def _call_paddle(
             exhausted_pages = max_pages > 0 and total_processed_pages >= max_pages
             if enough_text or exhausted_pages:
                 if fast_text:
-                    return fast_text, total_processed_pages
+                    return fast_text, total_processed_pages, page_details
 
         remaining_pages = 0 if max_pages <= 0 else max(0, max_pages - total_processed_pages)
         if max_pages <= 0 or remaining_pages > 0:
@@ -1127,16 +1529,16 @@ def _call_paddle(
 
         text = "\n".join(texts).strip()
         if text:
-            return text, total_processed_pages
+            return text, total_processed_pages, page_details
         if direct_error is not None:
             raise RuntimeError(
                 f"Paddle direct PDF predict failed: {direct_error}"
             ) from direct_error
         raise ValueError("PaddleOCR response did not include extractable text.")
 
-    text, pages = _call_paddle_predict(pipeline, file_path)
+    text, pages = _predict_document()
     if text:
-        return text, pages
+        return text, pages, []
     raise ValueError("PaddleOCR response did not include extractable text.")
 
 
@@ -1470,6 +1872,7 @@ def _resolve_ocr_options(payload: OCRRequest) -> OCRResolvedOptions:
         force_render_pdf=force_render_pdf,
         use_pypdf_preflight=use_pypdf_preflight,
         should_skip_heavy_paddle_pdf=should_skip_heavy_paddle_pdf,
+        file_sha256=_normalize_sha256(payload.file_sha256),
     )
 
 
@@ -1486,12 +1889,29 @@ def _build_cache_key_if_enabled(options: OCRResolvedOptions) -> str | None:
         requested_fast_mode=options.requested_fast_mode,
         force_render_pdf=options.force_render_pdf,
         use_pypdf_preflight=options.use_pypdf_preflight,
+        file_sha256=options.file_sha256 or None,
     )
 
 
-def _store_response_if_cacheable(cache_key: str | None, response: OCRResponse) -> OCRResponse:
+def _with_cache_file_sha256(options: OCRResolvedOptions) -> OCRResolvedOptions:
+    # The API forwards the hash it computed at upload; only hash here when it is missing.
+    if not OCR_CACHE_ENABLED or options.file_sha256:
+        return options
+    return replace(options, file_sha256=_sha256_file(str(options.file_path)))
+
+
+def _store_response_if_cacheable(
+    cache_key: str | None,
+    response: OCRResponse,
+    options: OCRResolvedOptions | None = None,
+) -> OCRResponse:
     if cache_key and response.text.strip():
-        _store_cached_ocr_response(cache_key, response)
+        _store_cached_ocr_response(
+            cache_key,
+            response,
+            file_sha256=options.file_sha256 if options else "",
+            provider=OCR_PROVIDER,
+        )
     return response
 
 
@@ -1530,11 +1950,12 @@ def _run_provider_ocr(options: OCRResolvedOptions) -> tuple[OCRResponse | None,
         if not GLM_OCR_ENDPOINT:
             raise HTTPException(status_code=503, detail="GLM_OCR_ENDPOINT is not configured.")
         try:
-            text, pages = _call_glm(
+            text, pages, page_details = _call_glm(
                 str(options.file_path),
                 max_pages=options.requested_max_pages,
                 render_dpi=options.requested_render_dpi,
                 max_tokens=options.requested_max_tokens,
+                file_sha256=options.file_sha256,
             )
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=502, detail=f"GLM OCR failed: {exc}") from exc
@@ -1546,6 +1967,7 @@ def _run_provider_ocr(options: OCRResolvedOptions) -> tuple[OCRResponse | None,
                     engine="glm-ocr",
                     pages=pages,
                     used_fallback=False,
+                    page_details=page_details,
                 ),
                 "",
             )
@@ -1573,12 +1995,13 @@ def _run_provider_ocr(options: OCRResolvedOptions) -> tuple[OCRResponse | None,
             fallback_error = str(exc)
     elif OCR_PROVIDER == "paddle":
         try:
-            text, pages = _call_paddle(
+            text, pages, page_details = _call_paddle(
                 str(options.file_path),
                 max_pages=options.requested_max_pages,
                 render_dpi=options.requested_render_dpi,
                 force_render_pdf=options.force_render_pdf,
                 fast_mode=options.requested_fast_mode,
+                file_sha256=options.file_sha256,
             )
             if text.strip():
                 return (
@@ -1587,9 +2010,12 @@ def _run_provider_ocr(options: OCRResolvedOptions) -> tuple[OCRResponse | None,
                         engine="paddleocr-vl",
                         pages=pages,
                         used_fallback=False,
+                        page_details=page_details,
                     ),
                     "",
                 )
+        except OCRModelPoolBusyError as exc:
+            raise HTTPException(status_code=503, detail=f"OCR model pool is saturated: {exc}") from exc
         except Exception as exc:  # noqa: BLE001
             fallback_error = str(exc)
 
@@ -1607,6 +2033,150 @@ def _build_pypdf_fallback_response(options: OCRResolvedOptions, fallback_error:
     )
 
 
+@dataclass
+class OCRJob:
+    job_id: str
+    coalesce_key: str
+    options: OCRResolvedOptions
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    result: OCRResponse | None = None
+    error: str | None = None
+    status_code: int | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class OCRJobQueue:
+    """Bounded OCR job runner that coalesces identical in-flight requests.
+
+    Jobs sharing a coalesce key (file hash + resolved options) while queued or running
+    return the existing job instead of starting a second OCR pass. Finished jobs are kept
+    for `OCR_JOB_RESULT_TTL_SECONDS` so clients can poll for the result.
+    """
+
+    def __init__(self, *, max_concurrency: int, max_pending: int, result_ttl_seconds: float):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_pending = max(1, int(max_pending))
+        self.result_ttl_seconds = float(result_ttl_seconds)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="ocr-job",
+        )
+        self._lock = threading.Lock()
+        self._jobs: dict[str, OCRJob] = {}
+        self._inflight: dict[str, str] = {}
+        self._coalesced_total = 0
+
+    def submit(self, coalesce_key: str, options: OCRResolvedOptions) -> tuple[OCRJob, bool]:
+        with self._lock:
+            self._prune_locked()
+            inflight_job_id = self._inflight.get(coalesce_key)
+            if inflight_job_id and inflight_job_id in self._jobs:
+                self._coalesced_total += 1
+                return self._jobs[inflight_job_id], True
+
+            if len(self._inflight) >= self.max_pending:
+                raise HTTPException(status_code=503, detail="OCR job queue is full. Retry later.")
+
+            job = OCRJob(job_id=uuid.uuid4().hex, coalesce_key=coalesce_key, options=options)
+            self._jobs[job.job_id] = job
+            self._inflight[coalesce_key] = job.job_id
+
+        self._executor.submit(self._run, job)
+        return job, False
+
+    def get(self, job_id: str) -> OCRJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: OCRJob) -> None:
+        job.status = "running"
+        try:
+            job.result = _run_ocr(job.options)
+            job.status = "completed"
+        except HTTPException as exc:
+            job.status = "failed"
+            job.status_code = exc.status_code
+            job.error = str(exc.detail)
+        except Exception as exc:  # noqa: BLE001
+            job.status = "failed"
+            job.status_code = 500
+            job.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._inflight.get(job.coalesce_key) == job.job_id:
+                    self._inflight.pop(job.coalesce_key, None)
+            job.done.set()
+
+    def _prune_locked(self) -> None:
+        expire_before = time.time() - self.result_ttl_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < expire_before
+        ]
+        for job_id in expired:
+            self._jobs.pop(job_id, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            coalesced_total = self._coalesced_total
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_pending": self.max_pending,
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "completed": statuses.count("completed"),
+            "failed": statuses.count("failed"),
+            "coalesced_total": coalesced_total,
+        }
+
+
+_OCR_JOB_QUEUE = OCRJobQueue(
+    max_concurrency=OCR_JOB_MAX_CONCURRENCY,
+    max_pending=OCR_JOB_MAX_PENDING,
+    result_ttl_seconds=OCR_JOB_RESULT_TTL_SECONDS,
+)
+
+
+def _build_job_coalesce_key(options: OCRResolvedOptions) -> str:
+    # Without a forwarded hash, coalesce on the path so a disabled cache never forces hashing.
+    file_identity = options.file_sha256 or f"path:{options.file_path.resolve()}"
+    return _hash_cache_payload(
+        {
+            "file": file_identity,
+            "provider": OCR_PROVIDER,
+            "max_pages": options.requested_max_pages,
+            "render_dpi": options.requested_render_dpi,
+            "max_tokens": options.requested_max_tokens,
+            "fast_mode": options.requested_fast_mode,
+            "force_render_pdf": options.force_render_pdf,
+            "pypdf_preflight": options.use_pypdf_preflight,
+        }
+    )
+
+
+def _job_response(job: OCRJob, *, coalesced: bool = False) -> OCRJobResponse:
+    return OCRJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        coalesced=coalesced,
+        result=job.result,
+        error=job.error,
+        status_code=job.status_code,
+    )
+
+
+def _submit_ocr_job(payload: OCRRequest) -> tuple[OCRJob, bool]:
+    options = _resolve_ocr_options(payload)
+    if not options.file_path.exists() or not options.file_path.is_file():
+        raise HTTPException(status_code=404, detail="File not found.")
+    return _OCR_JOB_QUEUE.submit(_build_job_coalesce_key(options), options)
+
+
 @app.get("/health")
 def health():
     provider_health = _provider_health_snapshot()
@@ -1625,6 +2195,10 @@ def health():
         "provider": OCR_PROVIDER,
         "ocr_cache_enabled": OCR_CACHE_ENABLED,
         "ocr_cache_dir": OCR_CACHE_DIR,
+        "ocr_page_cache_enabled": OCR_PAGE_CACHE_ENABLED,
+        "ocr_jobs": _OCR_JOB_QUEUE.snapshot(),
+        "ocr_model_pool": _OCR_MODEL_POOL.snapshot(),
+        "ocr_cache_stats": _OCR_CACHE_STORE.stats() if OCR_CACHE_ENABLED else None,
         "gpu_runtime_ready": gpu_runtime_ready,
         "gpu_runtime_warning": gpu_runtime_warning,
         "ocr_disable_preflight_for_image_pdf": OCR_DISABLE_PREFLIGHT_FOR_IMAGE_PDF,
@@ -1635,6 +2209,10 @@ def health():
         "ocr_image_pdf_tuned_render_dpi": OCR_IMAGE_PDF_TUNED_RENDER_DPI,
         "ocr_image_pdf_tuned_fast_mode": OCR_IMAGE_PDF_TUNED_FAST_MODE,
         "ocr_image_pdf_force_render_pdf": OCR_IMAGE_PDF_FORCE_RENDER_PDF,
+        "ocr_adaptive_dpi_enabled": OCR_ADAPTIVE_DPI_ENABLED,
+        "ocr_adaptive_dpi_ladder": OCR_ADAPTIVE_DPI_LADDER,
+        "ocr_adaptive_min_page_chars": OCR_ADAPTIVE_MIN_PAGE_CHARS,
+        "ocr_adaptive_min_confidence": OCR_ADAPTIVE_MIN_CONFIDENCE,
         **paddle_runtime,
         **provider_health,
     }
@@ -1694,21 +2272,30 @@ def health():
     return details
 
 
+def _warmup_paddle_pipeline(pipeline) -> None:
+    from PIL import Image  # type: ignore
+
+    with tempfile.TemporaryDirectory(prefix="sync-hub-paddle-warmup-") as temp_dir:
+        warmup_path = os.path.join(temp_dir, "warmup.png")
+        Image.new("RGB", (256, 256), "white").save(warmup_path, format="PNG")
+        _call_paddle_predict(pipeline, warmup_path)
+
+
 @app.on_event("startup")
 def preload_provider_models() -> None:
     # Load heavy OCR models during startup to avoid first-request timeout.
+    if _OCR_MODEL_POOL.enabled:
+        # Each pool process loads (and optionally warms) its own pipeline.
+        _OCR_MODEL_POOL.start()
+        print(f"[ocr-worker] OCR model pool started with {_OCR_MODEL_POOL.size} processes.")
+        return
     if OCR_PROVIDER == "paddle" and PADDLE_PRELOAD_ON_STARTUP:
         try:
             pipeline = _get_paddle_pipeline()
             print("[ocr-worker] Paddle pipeline preloaded on startup.")
             if PADDLE_WARMUP_ON_STARTUP:
                 try:
-                    from PIL import Image  # type: ignore
-
-                    with tempfile.TemporaryDirectory(prefix="sync-hub-paddle-warmup-") as temp_dir:
-                        warmup_path = os.path.join(temp_dir, "warmup.png")
-                        Image.new("RGB", (256, 256), "white").save(warmup_path, format="PNG")
-                        _call_paddle_predict(pipeline, warmup_path)
+                    _warmup_paddle_pipeline(pipeline)
                     print("[ocr-worker] Paddle warmup inference completed on startup.")
                 except Exception as warmup_exc:  # noqa: BLE001
                     print(f"[ocr-worker] Paddle warmup skipped: {warmup_exc}")
@@ -1716,12 +2303,13 @@ def preload_provider_models() -> None:
             print(f"[ocr-worker] Paddle preload failed: {exc}")
 
 
-@app.post("/ocr", response_model=OCRResponse)
-def ocr(payload: OCRRequest):
-    options = _resolve_ocr_options(payload)
-    if not options.file_path.exists() or not options.file_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found.")
+@app.on_event("shutdown")
+def stop_model_pool() -> None:
+    _OCR_MODEL_POOL.stop()
 
+
+def _run_ocr(options: OCRResolvedOptions) -> OCRResponse:
+    options = _with_cache_file_sha256(options)
     cache_key = _build_cache_key_if_enabled(options)
     cached_response = _load_cached_ocr_response(cache_key) if cache_key else None
     if cached_response is not None:
@@ -1729,17 +2317,47 @@ def ocr(payload: OCRRequest):
 
     preflight_response = _run_pypdf_preflight(options)
     if preflight_response is not None:
-        return _store_response_if_cacheable(cache_key, preflight_response)
+        return _store_response_if_cacheable(cache_key, preflight_response, options)
 
     skip_response = _run_skip_heavy_paddle_fallback(options)
     if skip_response is not None:
-        return _store_response_if_cacheable(cache_key, skip_response)
+        return _store_response_if_cacheable(cache_key, skip_response, options)
 
     provider_response, fallback_error = _run_provider_ocr(options)
     if provider_response is not None:
-        return _store_response_if_cacheable(cache_key, provider_response)
+        return _store_response_if_cacheable(cache_key, provider_response, options)
 
     return _store_response_if_cacheable(
         cache_key,
         _build_pypdf_fallback_response(options, fallback_error),
+        options,
     )
+
+
+@app.post("/ocr/jobs", response_model=OCRJobResponse, status_code=202)
+def submit_ocr_job(payload: OCRRequest):
+    job, coalesced = _submit_ocr_job(payload)
+    return _job_response(job, coalesced=coalesced)
+
+
+@app.get("/ocr/jobs/{job_id}", response_model=OCRJobResponse)
+async def get_ocr_job(job_id: str, wait_seconds: float = 0):
+    job = _OCR_JOB_QUEUE.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="OCR job not found.")
+
+    # Long-poll without pinning a threadpool slot while the job is still running.
+    deadline = time.monotonic() + max(0.0, min(float(wait_seconds), OCR_JOB_MAX_WAIT_SECONDS))
+    while not job.done.is_set() and time.monotonic() < deadline:
+        await asyncio.sleep(OCR_JOB_POLL_INTERVAL_SECONDS)
+    return _job_response(job)
+
+
+@app.post("/ocr", response_model=OCRResponse)
+def ocr(payload: OCRRequest):
+    """Synchronous compatibility endpoint; runs through the same bounded job queue."""
+    job, _ = _submit_ocr_job(payload)
+    job.done.wait()
+    if job.result is not None:
+        return job.result
+    raise HTTPException(status_code=job.status_code or 500, detail=job.error or "OCR job failed.")
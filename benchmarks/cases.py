@@ -0,0 +1,369 @@
+"""Benchmark cases for ingest and search hot paths.
+
+Each case prepares its inputs outside the timed region and returns the callable to time
+plus the number of items one call processes (pages, rows, chars, queries, ...), so the
+runner can report throughput next to latency.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from . import corpora
+
+# Case sizes per scale; "quick" keeps a full run around ten seconds for smoke checks.
+SCALES: Dict[str, Dict[str, int]] = {
+    "quick": {
+        "text_pdf_pages": 8,
+        "table_pdf_pages": 4,
+        "xlsx_rows": 2000,
+        "sentence_chars": 100_000,
+        "clean_pages": 40,
+        "chunk_segments": 60,
+        "dedup_docs": 20,
+        "dedup_chars": 1500,
+        "store_chunks": 1000,
+        "queries": 10,
+        "budget_projects": 60,
+        "agenda_threads": 200,
+    },
+    "default": {
+        "text_pdf_pages": 40,
+        "table_pdf_pages": 20,
+        "xlsx_rows": 20000,
+        "sentence_chars": 1_000_000,
+        "clean_pages": 300,
+        "chunk_segments": 400,
+        "dedup_docs": 120,
+        "dedup_chars": 3000,
+        "store_chunks": 8000,
+        "queries": 30,
+        "budget_projects": 300,
+        "agenda_threads": 2000,
+    },
+}
+
+QUERIES = [
+    "LJ-X8000",
+    "측정 범위",
+    "calibration filter pressure",
+    "장애 조치",
+    "sensor resolution mm",
+    "교정 주기",
+    "torque value",
+    "blue laser",
+    "설치 위치 전원",
+    "controller cable",
+]
+
+
+@dataclass
+class Case:
+    name: str
+    group: str
+    setup: Callable[[Dict[str, int], Path], Tuple[Callable[[], object], int, str]]
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, group: str):
+    def decorator(setup):
+        CASES.append(Case(name=name, group=group, setup=setup))
+        return setup
+
+    return decorator
+
+
+def _queries(size: Dict[str, int]) -> List[str]:
+    count = size["queries"]
+    return [QUERIES[index % len(QUERIES)] for index in range(count)]
+
+
+def _memory_store(size: Dict[str, int]):
+    from app.core import vector_store as vector_store_module
+    from app.core.display_text import build_display_fields
+    from app.core.pipeline import _FallbackEmbedder
+
+    # A fresh store built while the client class is unavailable never tries to reach ES.
+    client_class = vector_store_module.Elasticsearch
+    vector_store_module.Elasticsearch = None
+    try:
+        store = vector_store_module.VectorStore()
+    finally:
+        vector_store_module.Elasticsearch = client_class
+
+    embedder = _FallbackEmbedder()
+    sentences = corpora.mixed_sentences(size["store_chunks"] * 3, seed=11)
+    for index in range(size["store_chunks"]):
+        content = " ".join(sentences[index * 3 : index * 3 + 3])
+        store._memory_docs[f"{index // 20 + 1}:{index % 20}"] = {
+            "doc_id": index // 20 + 1,
+            "chunk_id": index % 20,
+            "chunk_index": index % 20,
+            "page": 1 + index % 7,
+            "chunk_type": "paragraph",
+            "document_types": [],
+            "filename": f"manual-{index // 20 + 1}.pdf",
+            "content": content,
+            "raw_text": content,
+            "dedup_status": "unique",
+            "embedding": embedder.encode(content),
+            # Stored by the pipeline at index time, read back by the search hot path.
+            **build_display_fields(content),
+        }
+    return store, embedder
+
+
+@case("reflow_pdf_text", "ingest")
+def _reflow_text(size, workdir):
+    from app.core.parsing.reflow import reflow_pdf
+
+    path = corpora.write_text_pdf(workdir / "text.pdf", size["text_pdf_pages"])
+    return (lambda: reflow_pdf(str(path))), size["text_pdf_pages"], "pages"
+
+
+@case("reflow_pdf_tables", "ingest")
+def _reflow_tables(size, workdir):
+    from app.core.parsing.reflow import reflow_pdf
+
+    path = corpora.write_table_pdf(workdir / "tables.pdf", size["table_pdf_pages"])
+    return (lambda: reflow_pdf(str(path))), size["table_pdf_pages"], "pages"
+
+
+@case("spreadsheet_xlsx", "ingest")
+def _spreadsheet(size, workdir):
+    from app.core.parsing.spreadsheet import extract_spreadsheet_segments
+
+    path = corpora.write_xlsx(workdir / "large.xlsx", size["xlsx_rows"])
+    return (lambda: extract_spreadsheet_segments(str(path))), size["xlsx_rows"], "rows"
+
+
+@case("split_sentences", "ingest")
+def _split_sentences(size, workdir):
+    from app.core.chunking.sentence_splitter import split_sentences
+
+    text = corpora.mixed_text(size["sentence_chars"])
+    return (lambda: split_sentences(text)), len(text), "chars"
+
+
+@case("clean_page_texts", "ingest")
+def _clean_page_texts(size, workdir):
+    from app.core.parsing.cleaning import build_clean_page_texts
+
+    # Wrapped manual prose between a repeating header and a page-number footer.
+    pages = []
+    for index in range(size["clean_pages"]):
+        words = corpora.mixed_text(3000, seed=index).split()
+        lines = [" ".join(words[start : start + 10]) for start in range(0, len(words), 10)]
+        pages.append(["KEYENCE LJ-X8000 Series User Manual", "Rev. 3", *lines, f"Page {index + 1}"])
+    return (lambda: build_clean_page_texts(pages)), len(pages), "pages"
+
+
+@case("build_chunks", "ingest")
+def _build_chunks(size, workdir):
+    from app.core.chunking.chunker import SourceSegment, build_chunks, chunker_from_env
+
+    segments = [
+        SourceSegment(page=1 + index // 4, chunk_type="paragraph", text=corpora.mixed_text(1800, seed=index))
+        for index in range(size["chunk_segments"])
+    ]
+    config = chunker_from_env()
+
+    def run():
+        return build_chunks(
+            segments=segments,
+            embedding_model_name="fallback-deterministic",
+            embedding_model_version="1",
+            max_chars=config["max_chars"],
+            overlap_sentences=config["overlap_sentences"],
+            min_chunk_chars=config["min_chunk_chars"],
+            noise_threshold=config["noise_threshold"],
+            chunk_schema_version=config["chunk_schema_version"],
+            dedup_identical_chunks=config["dedup_identical_chunks"],
+            dedup_identical_chunks_min_chars=config["dedup_identical_chunks_min_chars"],
+            max_chunks_per_doc=0,
+            table_row_sentence_max_per_table=config["table_row_sentence_max_per_table"],
+            table_row_sentence_merge_size=config["table_row_sentence_merge_size"],
+        )
+
+    return run, size["chunk_segments"], "segments"
+
+
+@case("build_chunks_tokens", "ingest")
+def _build_chunks_tokens(size, workdir):
+    from app.core.chunking.chunker import SourceSegment, build_chunks, chunker_from_env
+    from app.core.chunking.token_counter import TokenCounter
+
+    segments = [
+        SourceSegment(page=1 + index // 4, chunk_type="paragraph", text=corpora.mixed_text(1800, seed=index))
+        for index in range(size["chunk_segments"])
+    ]
+    config = chunker_from_env()
+    # Approximate counter at the default MiniLM budget (128 - 2 special tokens).
+    counter = TokenCounter("approximate", 126)
+
+    def run():
+        return build_chunks(
+            segments=segments,
+            embedding_model_name="fallback-deterministic",
+            embedding_model_version="1",
+            max_chars=config["max_chars"],
+            overlap_sentences=config["overlap_sentences"],
+            min_chunk_chars=config["min_chunk_chars"],
+            noise_threshold=config["noise_threshold"],
+            chunk_schema_version=config["chunk_schema_version"],
+            max_chunks_per_doc=config["max_chunks_per_doc"],
+            token_counter=counter,
+        )
+
+    return run, size["chunk_segments"], "segments"
+
+
+@case("classify_document_types", "ingest")
+def _classify_document_types(size, workdir):
+    from app.core.document_summary import classify_document_types
+
+    text = corpora.mixed_text(size["sentence_chars"])
+    return (lambda: classify_document_types("manual.pdf", text)), len(text), "chars"
+
+
+@case("dedup_minhash", "dedup")
+def _dedup_minhash(size, workdir):
+    from app.core.dedup.minhash import find_near_duplicate_pairs
+
+    texts = corpora.document_texts(size["dedup_docs"], size["dedup_chars"])
+    return (lambda: find_near_duplicate_pairs(texts, threshold=0.8)), len(texts), "docs"
+
+
+@case("dedup_simhash", "dedup")
+def _dedup_simhash(size, workdir):
+    from app.core.dedup.doc_embedding import candidate_pairs_from_simhash
+
+    texts = corpora.document_texts(size["dedup_docs"], size["dedup_chars"])
+    return (lambda: candidate_pairs_from_simhash(texts)), len(texts), "docs"
+
+
+@case("memory_vector_hits", "search")
+def _memory_vector_hits(size, workdir):
+    store, embedder = _memory_store(size)
+    vectors = [embedder.encode(query) for query in _queries(size)]
+    return (lambda: [store._memory_vector_hits(vector, 40) for vector in vectors]), len(vectors), "queries"
+
+
+@case("memory_keyword_hits", "search")
+def _memory_keyword_hits(size, workdir):
+    store, _ = _memory_store(size)
+    queries = _queries(size)
+    return (lambda: [store._memory_keyword_hits(query, 40) for query in queries]), len(queries), "queries"
+
+
+@case("rerank_hits", "search")
+def _rerank_hits(size, workdir):
+    from app.api.documents import _rerank_hits as rerank
+
+    store, embedder = _memory_store(size)
+    batches = []
+    for query in _queries(size):
+        hits = store._memory_keyword_hits(query, 60) or store._memory_vector_hits(embedder.encode(query), 60)
+        batches.append((query, hits))
+    return (lambda: [rerank(hits, query) for query, hits in batches]), len(batches), "queries"
+
+
+@case("budget_project_list", "api")
+def _budget_project_list(size, workdir):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app import models
+    from app.api.budget import _get_current_versions_for_projects, _serialize_projects_bulk
+    from app.database import Base
+
+    engine = create_engine(f"sqlite:///{workdir / 'budget.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    now = "2026-01-01T00:00:00+00:00"
+    manager = models.User(email="bench@example.com", full_name="Bench", password_hash="x", created_at=now, updated_at=now)
+    db.add(manager)
+    db.flush()
+    for index in range(size["budget_projects"]):
+        project = models.BudgetProject(
+            name=f"Line {index}",
+            code=f"P-{index:05d}",
+            customer_name="Customer",
+            created_by_user_id=manager.id,
+            manager_user_id=manager.id,
+            current_stage="review",
+            created_at=now,
+            updated_at=now,
+        )
+        db.add(project)
+        db.flush()
+        version = models.BudgetVersion(
+            project_id=project.id, stage="review", status="draft", is_current=True, created_at=now, updated_at=now
+        )
+        db.add(version)
+        db.flush()
+        for item in range(10):
+            db.add(
+                models.BudgetEquipment(
+                    version_id=version.id,
+                    equipment_name=f"Inspection unit {item}",
+                    material_fab_cost=1000.0 * (item + 1),
+                    labor_fab_cost=300.0,
+                    sort_order=item,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+    db.commit()
+    projects = db.query(models.BudgetProject).all()
+
+    def run():
+        current_versions = _get_current_versions_for_projects(projects, db)
+        return _serialize_projects_bulk(projects, db, manager, current_versions)
+
+    return run, len(projects), "projects"
+
+
+@case("agenda_thread_list", "api")
+def _agenda_thread_list(size, workdir):
+    from app import models
+    from app.api.agenda import _serialize_thread
+
+    now = "2026-01-01T00:00:00+00:00"
+    user = models.User(id=1, email="bench@example.com", full_name="Bench", password_hash="x")
+    notes = corpora.mixed_sentences(size["agenda_threads"] * 2, seed=5)
+    rows = []
+    for index in range(size["agenda_threads"]):
+        thread = models.AgendaThread(
+            id=index + 1,
+            project_id=1,
+            thread_kind="general",
+            record_status="published",
+            progress_status="in_progress",
+            agenda_code=f"AG-{index:06d}",
+            created_by_user_id=1,
+            title=f"Agenda {index}",
+            summary_plain=notes[index * 2],
+            created_at=now,
+            last_updated_at=now,
+            updated_at=now,
+        )
+        entry = models.AgendaEntry(
+            id=index + 1,
+            thread_id=index + 1,
+            project_id=1,
+            entry_kind="root",
+            created_by_user_id=1,
+            title=f"Agenda {index}",
+            content_html=f"<p>{notes[index * 2 + 1]}</p>",
+            content_plain=notes[index * 2 + 1],
+            created_at=now,
+            updated_at=now,
+        )
+        rows.append((thread, entry))
+    user_map = {1: user}
+    return (lambda: [_serialize_thread(thread, entry, entry, user_map, {}) for thread, entry in rows]), len(rows), "threads"
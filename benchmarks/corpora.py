@@ -0,0 +1,189 @@
+"""Deterministic synthetic corpora for the benchmark suite.
+
+Every generator is seeded, so the same arguments always produce byte-identical output and
+timings stay comparable between commits. PDFs are written by hand with the standard
+Helvetica font (no extra dependencies); Hangul cannot be shown without an embedded CID
+font, so Korean/English mixes are exercised through the text and XLSX corpora.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List, Sequence
+
+EN_SENTENCES = [
+    "Dr. Kim verified the torque value of {num} N m on the U.S. test bench.",
+    "The sensor range is {num} mm with a resolution of 0.001 mm, i.e. the reference rig.",
+    "See Fig. {small} and Vol. {small} for mounting holes before installation.",
+    "Replace the filter every {small} months or when the pressure drop exceeds {num} kPa.",
+    "Model LJ-X{model} supports line scanning at {num} kHz with blue laser optics.",
+    "Is the controller connected? Check cable CH-{small} and restart the unit.",
+]
+KO_SENTENCES = [
+    "측정 범위는 {num} mm 이며 분해능은 0.001 mm 입니다.",
+    "교정 주기는 {small}개월이며 점검 결과를 보고서에 기록합니다.",
+    "장비 LJ-X{model} 의 설치 위치와 전원 조건을 확인하십시오.",
+    "경고: 전원을 차단한 후 커버를 여십시오.",
+    "장애 발생 시 조치 내역과 원인을 {small}일 이내에 등록합니다.",
+    "검사 라인 {small}번의 처리 속도는 분당 {num} 개입니다.",
+]
+SECTION_TITLES = ["Overview", "Installation", "Specifications", "Maintenance", "Troubleshooting"]
+TABLE_HEADER = ["Model", "Range", "Resolution", "Speed", "Weight", "Status"]
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(
+        num=f"{rng.uniform(0.1, 999.9):.2f}",
+        small=rng.randint(1, 12),
+        model=rng.randint(1000, 9999),
+    )
+
+
+def mixed_sentences(count: int, seed: int = 7, korean_ratio: float = 0.5) -> List[str]:
+    rng = random.Random(seed)
+    output = []
+    for _ in range(count):
+        pool = KO_SENTENCES if rng.random() < korean_ratio else EN_SENTENCES
+        output.append(_fill(rng.choice(pool), rng))
+    return output
+
+
+def mixed_text(chars: int, seed: int = 7, korean_ratio: float = 0.5) -> str:
+    """Paragraphs of Korean/English manual sentences, at least `chars` long."""
+    rng = random.Random(seed)
+    paragraphs: List[str] = []
+    total = 0
+    while total < chars:
+        sentences = mixed_sentences(rng.randint(3, 7), seed=rng.randint(0, 1 << 30), korean_ratio=korean_ratio)
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def document_texts(count: int, chars: int, seed: int = 7, near_duplicate_every: int = 5) -> dict[int, str]:
+    """Documents keyed by id; every `near_duplicate_every`-th one is a light edit of its predecessor."""
+    rng = random.Random(seed)
+    output: dict[int, str] = {}
+    for doc_id in range(1, count + 1):
+        if near_duplicate_every and doc_id % near_duplicate_every == 0 and doc_id - 1 in output:
+            output[doc_id] = output[doc_id - 1] + " " + _fill(rng.choice(EN_SENTENCES), rng)
+        else:
+            output[doc_id] = mixed_text(chars, seed=rng.randint(0, 1 << 30))
+    return output
+
+
+def table_rows(count: int, seed: int = 7) -> List[List[str]]:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        rows.append(
+            [
+                f"LJ-X{8000 + index % 900}",
+                f"+{rng.uniform(0.1, 50.0):.3f}mm",
+                f"{rng.uniform(0.001, 0.05):.3f}mm",
+                f"{rng.randint(1, 64)}kHz",
+                f"{rng.uniform(0.2, 9.9):.1f}kg",
+                rng.choice(["OK", "NG", "REW"]),
+            ]
+        )
+    return rows
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _text_ops(lines: Sequence[tuple[float, float, float, str]]) -> bytes:
+    ops = []
+    for x, y, size, text in lines:
+        ops.append(f"BT /F1 {size:g} Tf 1 0 0 1 {x:.1f} {y:.1f} Tm ({_pdf_escape(text)}) Tj ET")
+    return "\n".join(ops).encode("latin-1", errors="replace")
+
+
+def write_pdf(path: Path, pages: Sequence[Sequence[tuple[float, float, float, str]]]) -> Path:
+    """Write a minimal PDF; each page is a list of (x, y, font_size, text) runs."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # pages tree, filled once page object ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_ids = []
+    for page_lines in pages:
+        stream = _text_ops(page_lines)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("ascii")
+
+    body = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for index, item in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n" % index + item + b"\nendobj\n"
+    xref_at = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        body += b"%010d 00000 n \n" % offset
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_at)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(body))
+    return path
+
+
+def write_text_pdf(path: Path, page_count: int, lines_per_page: int = 40, seed: int = 7) -> Path:
+    """Multi-page manual: a section title per page followed by wrapped English sentences."""
+    rng = random.Random(seed)
+    pages = []
+    for page_index in range(page_count):
+        lines = [(72.0, 740.0, 14, f"{page_index + 1}. {SECTION_TITLES[page_index % len(SECTION_TITLES)]}")]
+        y = 716.0
+        for _ in range(lines_per_page):
+            lines.append((72.0, y, 10, _fill(rng.choice(EN_SENTENCES), rng)))
+            y -= 15.0
+        pages.append(lines)
+    return write_pdf(path, pages)
+
+
+def write_table_pdf(path: Path, page_count: int, rows_per_page: int = 36, seed: int = 7) -> Path:
+    """Table-heavy pages: a caption, a pipe-delimited spec table and a footnote per page."""
+    rows = table_rows(page_count * rows_per_page, seed=seed)
+    pages = []
+    for page_index in range(page_count):
+        lines = [
+            (60.0, 750.0, 12, f"Table {page_index + 1}. Sensor head specifications"),
+            (60.0, 724.0, 9, " | ".join(TABLE_HEADER)),
+        ]
+        y = 724.0
+        for row in rows[page_index * rows_per_page : (page_index + 1) * rows_per_page]:
+            y -= 18.0
+            lines.append((60.0, y, 9, " | ".join(row)))
+        lines.append((60.0, y - 30.0, 10, "Values are measured at 20 C after a 30 minute warm-up."))
+        pages.append(lines)
+    return write_pdf(path, pages)
+
+
+def write_xlsx(path: Path, row_count: int, sheet_count: int = 1, seed: int = 7) -> Path:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    header = ["모델", "측정 범위", "분해능", "속도", "중량", "상태", "비고"]
+    for sheet_index in range(sheet_count):
+        sheet = workbook.create_sheet(f"Sheet{sheet_index + 1}")
+        sheet.append(header)
+        notes = mixed_sentences(row_count, seed=seed + sheet_index)
+        for row, note in zip(table_rows(row_count, seed=seed + sheet_index), notes):
+            sheet.append(row + [note])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    return path
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Replay captured /documents/search requests offline and report stage latency and ranking diffs.
+
+Capture with SEARCH_REPLAY_LOG_PATH=/path/search.jsonl on the API, then:
+    python -m benchmarks.replay search.jsonl --summarize
+    python -m benchmarks.replay search.jsonl --chunks chunks.jsonl --output before.json
+    python -m benchmarks.replay search.jsonl --chunks chunks.jsonl --compare before.json
+    python -m benchmarks.replay search.jsonl --es-host http://localhost:9200 --compare search.jsonl
+
+Page-mode requests are replayed through the real endpoint with the search result cache off.
+The store is the memory store (chunks from --chunks, else the synthetic benchmark corpus) or
+an Elasticsearch instance restored from a snapshot (--es-host).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay captured search requests.")
+    parser.add_argument("log", help="Captured search log (JSON lines, .gz allowed)")
+    parser.add_argument("--summarize", action="store_true", help="Only report the latencies recorded in the log")
+    parser.add_argument("--chunks", help="Memory store chunks: JSON lines of indexed chunk sources")
+    parser.add_argument("--scale", default="default", help="Synthetic corpus scale when --chunks is not given")
+    parser.add_argument("--es-host", help="Replay against this Elasticsearch instead of the memory store")
+    parser.add_argument("--database-url", help="Database for the document lookup (default: in-memory SQLite)")
+    parser.add_argument("--real-embedder", action="store_true", help="Encode queries with the configured model")
+    parser.add_argument("--keep-caches", action="store_true", help="Keep search result / query embedding caches on")
+    parser.add_argument("--limit", type=int, default=0, help="Replay at most this many requests")
+    parser.add_argument("--k", default="1,5,10", help="Cut-offs for overlap@k (default: 1,5,10)")
+    parser.add_argument("--output", help="Write the JSON report to this path (default: stdout)")
+    parser.add_argument("--compare", help="Baseline replay report or captured log; reports overlap@k")
+    return parser.parse_args()
+
+
+def _configure_environment(args: argparse.Namespace) -> None:
+    # Applied before any app module is imported (module-level settings read the environment).
+    os.environ.setdefault("ES_HOST", args.es_host or "http://127.0.0.1:9")
+    os.environ.setdefault("DATABASE_URL", args.database_url or "sqlite://")
+    os.environ.setdefault("CHUNK_CACHE_ENABLED", "false")
+    os.environ.setdefault("PIPELINE_PROFILE_ENABLED", "false")
+    if not args.real_embedder:
+        os.environ.setdefault("EMBEDDING_FALLBACK_ONLY", "true")
+    if not args.keep_caches:
+        os.environ["SEARCH_RESULT_CACHE_ENABLED"] = "false"
+        os.environ["QUERY_EMBEDDING_CACHE_ENABLED"] = "false"
+
+    root = Path(__file__).resolve().parents[1]
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+
+
+def _memory_store(args: argparse.Namespace):
+    from app.core import vector_store as vector_store_module
+
+    if not args.chunks:
+        from benchmarks.cases import SCALES, _memory_store
+
+        store, _ = _memory_store(SCALES[args.scale])
+        return store
+
+    client_class = vector_store_module.Elasticsearch
+    vector_store_module.Elasticsearch = None
+    try:
+        store = vector_store_module.VectorStore()
+    finally:
+        vector_store_module.Elasticsearch = client_class
+    with open(args.chunks, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            source = json.loads(line)
+            source = source.get("_source", source)
+            store._memory_docs[f"{source.get('doc_id')}:{source.get('chunk_id')}"] = source
+    return store
+
+
+def _database(args: argparse.Namespace, store):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app import models
+    from app.database import Base
+
+    if args.database_url:
+        return sessionmaker(bind=create_engine(args.database_url))()
+
+    # One shared connection, so lookups from threadpool workers see the seeded rows.
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine, tables=[models.Document.__table__])
+    db = sessionmaker(bind=engine)()
+    documents = {}
+    for source in getattr(store, "_memory_docs", {}).values():
+        doc_id = source.get("doc_id")
+        if isinstance(doc_id, int) and doc_id not in documents:
+            documents[doc_id] = models.Document(
+                id=doc_id,
+                filename=source.get("filename"),
+                status="completed",
+                ai_title=source.get("ai_title"),
+                ai_summary_short=source.get("ai_summary_short"),
+            )
+    db.add_all(documents.values())
+    db.commit()
+    return db
+
+
+def replay(records: list, store, db) -> tuple[list, int]:
+    from unittest.mock import patch
+
+    from app.api import documents
+    from app.core.search_replay import SearchReplayLog
+
+    captured: list = []
+    skipped = 0
+    recorder = SearchReplayLog(path="", sample_rate=1.0, records=captured)
+    with patch.object(documents, "vector_store", store), patch.object(documents, "search_replay_log", recorder):
+        for index, record in enumerate(records, start=1):
+            if record.get("mode", "page") != "page" or not record.get("q"):
+                # Cursor tokens are bound to a point-in-time of the capturing cluster.
+                skipped += 1
+                continue
+            asyncio.run(
+                documents.search_documents(
+                    q=record["q"],
+                    page=int(record.get("page") or 1),
+                    page_size=int(record.get("page_size") or 10),
+                    db=db,
+                    **(record.get("filters") or {}),
+                )
+            )
+            if index % 100 == 0:
+                print(f"[replay] {index}/{len(records)} requests", file=sys.stderr)
+    return captured, skipped
+
+
+def _print_summary(summary: dict) -> None:
+    rows = [("total", summary["total"])] + list(summary["stages"].items())
+    for name, stats in rows:
+        print(
+            f"{name:<10} n={stats['count']:<6} p50={stats['p50_ms']:>9.2f}ms "
+            f"p95={stats['p95_ms']:>9.2f}ms p99={stats['p99_ms']:>9.2f}ms",
+            file=sys.stderr,
+        )
+
+
+def _print_comparison(comparison: dict) -> None:
+    overlaps = " ".join(f"overlap@{k}={value}" for k, value in comparison["overlap_at_k"].items())
+    print(
+        f"[replay] compared={comparison['compared']} identical={comparison['identical']} "
+        f"unmatched={comparison['unmatched']} {overlaps}",
+        file=sys.stderr,
+    )
+    for item in comparison["worst"]:
+        print(f"  {item['overlap']} q={item['q']!r} page={item['page']}", file=sys.stderr)
+
+
+def main() -> None:
+    args = parse_args()
+    _configure_environment(args)
+
+    from app.core.search_replay import compare_rankings, read_search_records, summarize_search_records
+    from benchmarks.run import _git_commit
+
+    records = read_search_records(args.log)
+    if args.limit > 0:
+        records = records[: args.limit]
+
+    if args.summarize:
+        summary = summarize_search_records(records)
+        _print_summary(summary)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return
+
+    if args.es_host:
+        from app.core.vector_store import vector_store as store
+
+        if not store._ensure_client():
+            raise SystemExit(f"Elasticsearch at {args.es_host} is not reachable.")
+    else:
+        store = _memory_store(args)
+    db = _database(args, store)
+    try:
+        replayed, skipped = replay(records, store, db)
+    finally:
+        db.close()
+
+    summary = summarize_search_records(replayed)
+    _print_summary(summary)
+    report = {
+        "suite": "search_replay",
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "log": args.log,
+        "store": "elasticsearch" if args.es_host else (args.chunks or f"synthetic:{args.scale}"),
+        "skipped": skipped,
+        "latency": summary,
+        "records": replayed,
+    }
+    if args.compare:
+        ks = [int(item) for item in args.k.split(",") if item.strip()]
+        report["comparison"] = compare_rankings(read_search_records(args.compare), replayed, ks=ks)
+        _print_comparison(report["comparison"])
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Run the offline benchmark suite and write timings as JSON.
+
+Usage:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --scale quick --only split_sentences,build_chunks
+    python -m benchmarks.run --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Offline defaults, applied before any app module is imported: fallback embedder, an
+# in-memory SQLite database and an unroutable ES host so nothing touches the network.
+os.environ.setdefault("EMBEDDING_FALLBACK_ONLY", "true")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ES_HOST", "http://127.0.0.1:9")
+os.environ.setdefault("CHUNK_CACHE_ENABLED", "false")
+os.environ.setdefault("PIPELINE_PROFILE_ENABLED", "false")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.cases import CASES, SCALES  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ingest and search hot paths.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default", help="Corpus size preset")
+    parser.add_argument("--only", default="", help="Comma-separated case names or groups to run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default: 5)")
+    parser.add_argument("--output", help="Write the JSON report to this path (default: stdout)")
+    parser.add_argument("--compare", help="Baseline JSON report; prints per-case median ratios")
+    return parser.parse_args()
+
+
+def _git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception:  # noqa: BLE001
+        return ""
+    return result.stdout.strip()
+
+
+def run_case(case, size: dict, repeat: int, workdir: Path) -> dict:
+    setup_started = time.perf_counter()
+    func, items, unit = case.setup(size, workdir)
+    setup_seconds = time.perf_counter() - setup_started
+
+    func()  # warm-up: imports, regex compilation, file cache
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+
+    median = statistics.median(samples)
+    return {
+        "name": case.name,
+        "group": case.group,
+        "items": items,
+        "unit": unit,
+        "setup_seconds": round(setup_seconds, 4),
+        "min_ms": round(min(samples) * 1000.0, 3),
+        "median_ms": round(median * 1000.0, 3),
+        "max_ms": round(max(samples) * 1000.0, 3),
+        "items_per_second": round(items / median, 1) if median > 0 else None,
+    }
+
+
+def compare(report: dict, baseline: dict) -> list[str]:
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    lines = []
+    for item in report["results"]:
+        base = previous.get(item["name"])
+        if not base or not base.get("median_ms"):
+            lines.append(f"{item['name']:<24} {item['median_ms']:>10.3f} ms  (new)")
+            continue
+        ratio = item["median_ms"] / base["median_ms"]
+        lines.append(f"{item['name']:<24} {item['median_ms']:>10.3f} ms  x{ratio:.2f} vs {base['median_ms']:.3f} ms")
+    return lines
+
+
+def main() -> None:
+    args = parse_args()
+    selected = {item.strip() for item in args.only.split(",") if item.strip()}
+    cases = [case for case in CASES if not selected or case.name in selected or case.group in selected]
+    size = SCALES[args.scale]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        for case in cases:
+            result = run_case(case, size, args.repeat, Path(workdir))
+            print(f"[bench] {result['name']}: median={result['median_ms']}ms", file=sys.stderr)
+            results.append(result)
+
+    report = {
+        "suite": "ingest_search_hot_paths",
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "sizes": size,
+        "results": results,
+    }
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare(report, baseline)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark sentence splitting throughput on manual-sized text."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.core.chunking.sentence_splitter import split_sentences  # noqa: E402
+
+
+PARAGRAPHS = [
+    "Dr. Kim verified the torque value of 3.14 N·m on the U.S. test bench, i.e. the reference rig.",
+    "측정 범위는 0.5 mm 에서 25.4 mm 이며 분해능은 0.001 mm 입니다. 교정 주기는 12개월입니다!",
+    "See Fig. 3 and Vol. 2 for details (e.g. mounting holes, no. 4 to no. 9) etc. before use.",
+    "Is the sensor connected? Check the cable \"CH-1\" and restart the unit.",
+    "경고: 전원을 차단한 후 커버를 여십시오.\n주의: 습기가 있는 장소에서 사용하지 마십시오.",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark split_sentences on large text.")
+    parser.add_argument("--file", help="Plain-text file to split instead of the synthetic manual")
+    parser.add_argument(
+        "--sizes",
+        default="10000,100000,1000000",
+        help="Comma-separated synthetic text sizes in characters (default: 10000,100000,1000000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; best time is reported (default: 3)")
+    return parser.parse_args()
+
+
+def synthetic_manual(size: int) -> str:
+    parts: list[str] = []
+    total = 0
+    index = 0
+    while total < size:
+        paragraph = PARAGRAPHS[index % len(PARAGRAPHS)]
+        parts.append(paragraph)
+        total += len(paragraph) + 2
+        index += 1
+    return "\n\n".join(parts)[:size]
+
+
+def measure(text: str, repeat: int) -> dict:
+    best = float("inf")
+    sentence_count = 0
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        sentence_count = len(split_sentences(text))
+        best = min(best, time.perf_counter() - started)
+    return {
+        "chars": len(text),
+        "sentences": sentence_count,
+        "seconds": round(best, 4),
+        "chars_per_second": int(len(text) / best) if best > 0 else None,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    if args.file:
+        results = [measure(Path(args.file).read_text(encoding="utf-8"), args.repeat)]
+    else:
+        sizes = [int(item) for item in args.sizes.split(",") if item.strip()]
+        results = [measure(synthetic_manual(size), args.repeat) for size in sizes]
+    print(json.dumps({"benchmark": "sentence_splitter", "results": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.core.parsing.reflow import reflow_pdf
+from benchmarks import corpora
+from benchmarks.cases import CASES, SCALES
+
+
+class BenchmarkCorporaTests(unittest.TestCase):
+    def test_generators_are_deterministic(self):
+        self.assertEqual(corpora.mixed_text(3000, seed=3), corpora.mixed_text(3000, seed=3))
+        self.assertEqual(corpora.document_texts(6, 500), corpora.document_texts(6, 500))
+
+        with tempfile.TemporaryDirectory() as workdir:
+            first = corpora.write_table_pdf(Path(workdir) / "a.pdf", 2).read_bytes()
+            second = corpora.write_table_pdf(Path(workdir) / "b.pdf", 2).read_bytes()
+        self.assertEqual(first, second)
+
+    def test_synthetic_pdfs_reflow_into_paragraphs_and_tables(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            text_result = reflow_pdf(str(corpora.write_text_pdf(Path(workdir) / "text.pdf", 3)))
+            table_result = reflow_pdf(str(corpora.write_table_pdf(Path(workdir) / "tables.pdf", 2)))
+
+        self.assertEqual(len(text_result.pages), 3)
+        self.assertTrue(text_result.pages[0].paragraph_lines)
+        self.assertEqual(len(table_result.pages), 2)
+        self.assertEqual(len(table_result.pages[0].table_groups), 1)
+
+    def test_every_scale_defines_every_case_size(self):
+        keys = set(SCALES["default"])
+        self.assertEqual(set(SCALES["quick"]), keys)
+        self.assertEqual(len({case.name for case in CASES}), len(CASES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.core import ocr, pipeline
+from app.core.chunking import chunk_cache
+from app.core.chunking.chunker import ChunkRecord, TableEntity
+
+
+def _record(index: int) -> ChunkRecord:
+    return ChunkRecord(
+        chunk_index=index,
+        chunk_type="paragraph",
+        content=f"측정 범위 {index} mm 본문",
+        page=1,
+        section_title="",
+        quality_score=0.9,
+        raw_text="raw",
+        chunk_schema_version="v2_reflow_sentence_table",
+        embedding_model_name="old-model",
+        embedding_model_version="1",
+    )
+
+
+class ChunkCacheTests(unittest.TestCase):
+    def test_round_trip_restamps_embedding_model(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            table = TableEntity("p1-t0", 1, 0, "", "model | range", "| model | range |")
+            chunk_cache.store_chunk_records(
+                "a" * 64,
+                "f" * 64,
+                "raw",
+                "clean",
+                [_record(0), _record(1)],
+                [table],
+                cache_dir=cache_dir,
+            )
+            cached = chunk_cache.load_chunk_records(
+                "a" * 64,
+                "f" * 64,
+                embedding_model_name="new-model",
+                embedding_model_version="2",
+                cache_dir=cache_dir,
+            )
+            missed = chunk_cache.load_chunk_records(
+                "a" * 64,
+                "e" * 64,
+                embedding_model_name="new-model",
+                embedding_model_version="2",
+                cache_dir=cache_dir,
+            )
+
+        self.assertIsNone(missed)
+        raw_text, clean_text, records, tables = cached
+        self.assertEqual(tables, [table])
+        self.assertEqual((raw_text, clean_text), ("raw", "clean"))
+        self.assertEqual([record.content for record in records], [_record(0).content, _record(1).content])
+        self.assertEqual({record.embedding_model_name for record in records}, {"new-model"})
+        self.assertEqual({record.embedding_model_version for record in records}, {"2"})
+
+    def test_store_evicts_least_recently_used_entries_past_the_budget(self):
+        def _store(file_sha256, cache_dir):
+            chunk_cache.store_chunk_records(file_sha256, "f" * 64, "raw", "clean", [_record(0)], cache_dir=cache_dir)
+            return chunk_cache._cache_path(file_sha256, "f" * 64, cache_dir)
+
+        def _load(file_sha256, cache_dir):
+            return chunk_cache.load_chunk_records(
+                file_sha256, "f" * 64, embedding_model_name="m", embedding_model_version="1", cache_dir=cache_dir
+            )
+
+        with tempfile.TemporaryDirectory() as cache_dir, patch.dict(chunk_cache._cache_bytes, clear=True):
+            first = _store("a" * 64, cache_dir)
+            entry_size = first.stat().st_size
+            with patch.object(chunk_cache, "CHUNK_CACHE_MAX_BYTES", entry_size * 2 + entry_size // 2):
+                second = _store("b" * 64, cache_dir)
+                os.utime(first, (1, 1))
+                os.utime(second, (2, 2))
+                # Reading "a" makes "b" the least recently used entry.
+                self.assertIsNotNone(_load("a" * 64, cache_dir))
+                _store("c" * 64, cache_dir)
+
+            self.assertIsNotNone(_load("a" * 64, cache_dir))
+            self.assertIsNone(_load("b" * 64, cache_dir))
+            self.assertIsNotNone(_load("c" * 64, cache_dir))
+
+    def test_store_replaces_parses_under_an_older_fingerprint(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for fingerprint in ("e" * 64, "f" * 64):
+                chunk_cache.store_chunk_records(
+                    "a" * 64, fingerprint, "raw", "clean", [_record(0)], cache_dir=cache_dir
+                )
+            shard = chunk_cache._cache_path("a" * 64, "f" * 64, cache_dir).parent
+            names = sorted(path.name for path in shard.iterdir())
+
+            self.assertEqual(names, [f"{'a' * 64}-{'f' * 24}.jsonl"])
+            self.assertEqual(chunk_cache.remove_chunk_records("a" * 64, cache_dir=cache_dir), 1)
+
+    def test_fingerprint_tracks_chunker_config(self):
+        base = chunk_cache.build_parse_fingerprint()
+        with patch.dict(os.environ, {"MAX_CHARS": "1200"}):
+            changed = chunk_cache.build_parse_fingerprint()
+        self.assertNotEqual(base, changed)
+        self.assertEqual(base, chunk_cache.build_parse_fingerprint())
+
+    def test_parse_fingerprint_tracks_ocr_profile_and_worker(self):
+        base = pipeline._parse_fingerprint()
+        with patch.object(ocr, "OCR_PROFILE", "quality"):
+            self.assertNotEqual(base, pipeline._parse_fingerprint())
+        with patch.object(ocr, "OCR_RENDER_DPI", ocr.OCR_RENDER_DPI + 72):
+            self.assertNotEqual(base, pipeline._parse_fingerprint())
+        with patch.object(ocr, "OCR_PROVIDER", "other-engine"):
+            self.assertNotEqual(base, pipeline._parse_fingerprint())
+        with patch.object(ocr, "OCR_WORKER_URL", "http://other-worker:8100/ocr"):
+            self.assertNotEqual(base, pipeline._parse_fingerprint())
+        self.assertEqual(base, pipeline._parse_fingerprint())
+
+    def test_generate_chunk_records_skips_parsing_on_cache_hit(self):
+        parsed = ("raw", "clean", [_record(0)], [], True)
+        with tempfile.TemporaryDirectory() as cache_dir, patch.object(
+            chunk_cache, "CHUNK_CACHE_DIR", cache_dir
+        ), patch.object(chunk_cache, "CHUNK_CACHE_ENABLED", True), patch.object(
+            pipeline, "_parse_chunk_records", return_value=parsed
+        ) as parse:
+            first = pipeline.generate_chunk_records("doc.pdf", file_sha256="b" * 64)
+            second = pipeline.generate_chunk_records("doc.pdf", file_sha256="b" * 64)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(first[2][0].content, second[2][0].content)
+
+    def test_incomplete_ocr_result_is_not_cached(self):
+        parsed = ("raw", "clean", [_record(0)], [], False)
+        with tempfile.TemporaryDirectory() as cache_dir, patch.object(
+            chunk_cache, "CHUNK_CACHE_DIR", cache_dir
+        ), patch.object(chunk_cache, "CHUNK_CACHE_ENABLED", True), patch.object(
+            pipeline, "_parse_chunk_records", return_value=parsed
+        ) as parse:
+            pipeline.generate_chunk_records("scan.pdf", file_sha256="c" * 64)
+            pipeline.generate_chunk_records("scan.pdf", file_sha256="c" * 64)
+
+        self.assertEqual(parse.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from app.core.parsing.cleaning import (
+    build_clean_page_texts,
+    merge_soft_linebreaks,
+    remove_repeating_headers_footers,
+    restore_hyphenation,
+)
+
+
+class CleaningTests(unittest.TestCase):
+    def test_repeating_edge_lines_are_removed_by_position(self):
+        pages = [
+            ["ACME  Manual", "Intro text one", "Body", "Page 1"],
+            ["ACME\xa0Manual", "Intro text two", "ACME Manual", "Page 2"],
+            ["ACME Manual", "Intro text three", "Page 3"],
+        ]
+        cleaned = remove_repeating_headers_footers(pages)
+
+        # The header repeats on every page; the mid-page copy on page 2 falls in the footer
+        # window but is not a repeated footer, so it stays. Page numbers differ per page.
+        self.assertEqual(cleaned[0], ["Intro text one", "Body", "Page 1"])
+        self.assertEqual(cleaned[1], ["Intro text two", "ACME Manual", "Page 2"])
+        self.assertEqual(cleaned[2], ["Intro text three", "Page 3"])
+
+    def test_duplicate_footer_lines_in_window_are_all_removed(self):
+        pages = [["Body A", "Confidential", "Confidential"], ["Body B", "Confidential"]]
+        self.assertEqual(remove_repeating_headers_footers(pages), [["Body A"], ["Body B"]])
+
+    def test_hyphenation_and_soft_linebreaks(self):
+        self.assertEqual(restore_hyphenation(["meas-", "", "urement"]), ["meas-", "urement"])
+        self.assertEqual(restore_hyphenation(["meas-", " urement range"]), ["measurement range"])
+        self.assertEqual(
+            merge_soft_linebreaks(["SPECIFICATIONS", "The sensor meas-", "ures height", "and width.", "- item"]),
+            "SPECIFICATIONS\nThe sensor measures height and width.\n- item",
+        )
+
+    def test_long_paragraph_is_merged_into_one_line(self):
+        lines = [f"word{index} continues the same paragraph" for index in range(2000)]
+        text = build_clean_page_texts([lines])[0]
+
+        self.assertNotIn("\n", text)
+        self.assertTrue(text.startswith("word0 continues"))
+        self.assertTrue(text.endswith("word1999 continues the same paragraph"))
+
+
+if __name__ == "__main__":
+    unittest.main()
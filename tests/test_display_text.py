@@ -0,0 +1,52 @@
+import unittest
+
+from app.api import documents
+from app.core.display_text import build_display_fields, clean_display_text, hit_display, sentence_spans
+
+
+class DisplayTextTests(unittest.TestCase):
+    def test_index_time_fields_match_search_time_cleaning(self):
+        content = "Sensor &amp; head  spec.\r\n<b>Range</b> 10 mm | Accuracy ±0.1"
+        fields = build_display_fields(content)
+        text = fields["display_text"]
+
+        self.assertEqual(text, clean_display_text(content))
+        offsets = fields["sentence_offsets"]
+        self.assertEqual(
+            [text[start:end] for start, end in zip(offsets[0::2], offsets[1::2])],
+            ["Sensor & head spec.", "Range 10 mm", "Accuracy ±0.1"],
+        )
+        self.assertAlmostEqual(fields["alnum_ratio"], sum(ch.isalnum() for ch in text) / len(text))
+
+    def test_offsets_are_skipped_when_text_still_changes_on_recleaning(self):
+        fields = build_display_fields("a &amp;lt;b&amp;gt; c. Next")
+        self.assertEqual(fields["display_text"], "a &lt;b&gt; c. Next")
+        self.assertEqual(fields["sentence_offsets"], [])
+
+        display = hit_display(fields)
+        self.assertIsNone(display.spans)
+        self.assertEqual(display.evidence_text, "a c. Next")
+
+    def test_hits_without_stored_fields_are_recomputed(self):
+        display = hit_display({"content": "First one.  Second <i>two</i>."})
+
+        self.assertEqual(display.text, "First one. Second two .")
+        self.assertIsNone(display.spans)
+        self.assertEqual(sentence_spans(display.text), [(0, 10), (11, 23)])
+
+    def test_rerank_uses_stored_fields(self):
+        content = "Intro text.\nThe sensor supports calibration."
+        source = {"doc_id": 1, "filename": "manual.pdf", "content": content, **build_display_fields(content)}
+        stored = documents._rerank_hits([{"_score": 1.0, "_source": source}], "calibration")[0]
+        legacy = documents._rerank_hits(
+            [{"_score": 1.0, "_source": {"doc_id": 1, "filename": "manual.pdf", "content": content}}],
+            "calibration",
+        )[0]
+
+        self.assertEqual(stored["evidence"], ["The sensor supports calibration."])
+        for key in ("snippet", "evidence", "summary", "matched_terms", "rerank_score"):
+            self.assertEqual(stored[key], legacy[key])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -245,6 +245,21 @@ class DocumentSummaryTests(unittest.TestCase):
             )
         )
 
+    def test_type_keyword_matcher_finds_overlapping_and_spaced_keywords(self):
+        found = document_summary._matched_type_keywords("see the maintenance   report and data\tsheet.")
+
+        self.assertTrue({"maintenance report", "maintenance", "data sheet"} <= found)
+        self.assertNotIn("troubleshooting", found)
+
+    def test_score_document_types_inspects_capped_prefix(self):
+        text = "x " * 600 + "datasheet specifications"
+        with patch.object(document_summary, "DOC_TYPE_SCAN_MAX_CHARS", 1000):
+            capped = document_summary.score_document_types("notes.pdf", text)
+        full = document_summary.score_document_types("notes.pdf", text)
+
+        self.assertEqual(capped, {})
+        self.assertEqual(full, {document_summary.DOC_TYPE_DATASHEET: 3})
+
     def test_classify_document_types_detects_equipment_failure_report(self):
         filename = "설비_장애_조치보고서_2026_01_09.xlsx"
         text = (
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.core import document_type_backfill
+from app.core.document_summary import parse_document_types
+from app.core.vector_store import VectorStore
+from app.database import Base
+
+
+class DocumentTypeBackfillTests(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine, tables=[models.Document.__table__])
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+
+    def _add(self, doc_id: int, filename: str, document_types=None, status="completed"):
+        self.db.add(
+            models.Document(
+                id=doc_id,
+                filename=filename,
+                status=status,
+                content_text="LJ-X8000 설치 및 교정 절차",
+                document_types=document_types,
+            )
+        )
+
+    def test_missing_types_are_classified_in_batches_and_patched_in_index(self):
+        self._add(1, "LJ-X8000_manual.pdf")
+        self._add(2, "notes.pdf", document_types="")
+        self._add(3, "datasheet.pdf", document_types='["catalog"]')
+        self._add(4, "LJ-X8000_manual_v2.pdf", status="processing")
+        self._add(5, "LJ-X8000_user_manual.pdf", document_types="")
+        self.db.commit()
+
+        def classify(filename, content_text):
+            return ["manual"] if "manual" in filename else []
+
+        with patch.object(document_type_backfill, "classify_document_types", side_effect=classify), patch.object(
+            document_type_backfill.vector_store, "update_document_types"
+        ) as update:
+            stats = document_type_backfill.backfill_document_types(batch_size=2, db=self.db)
+            rerun = document_type_backfill.backfill_document_types(batch_size=2, db=self.db)
+
+        self.assertEqual(stats, {"documents": 3, "classified": 2, "batches": 2})
+        self.assertEqual(rerun["documents"], 0)
+        self.assertEqual([call.args[0] for call in update.call_args_list], [{1: ["manual"]}, {5: ["manual"]}])
+        types = {doc.id: doc.document_types for doc in self.db.query(models.Document).all()}
+        self.assertEqual(parse_document_types(types[1]), ["manual"])
+        self.assertEqual(types[2], document_type_backfill.DOC_TYPES_NONE)
+        self.assertEqual(parse_document_types(types[2]), [])
+        self.assertEqual(types[3], '["catalog"]')
+        self.assertIsNone(types[4])
+
+    def test_memory_store_type_update_patches_all_doc_chunks(self):
+        store = VectorStore.__new__(VectorStore)
+        store.client = None
+        store.memory_mode = True
+        store.index_generation = 0
+        store._connect = lambda: False
+        store._memory_docs = {
+            "1:0": {"doc_id": 1},
+            "1:1": {"doc_id": 1, "document_types": []},
+            "2:0": {"doc_id": 2, "document_types": ["catalog"]},
+        }
+
+        store.update_document_types({1: ["manual"]})
+
+        self.assertEqual(store._memory_docs["1:0"]["document_types"], ["manual"])
+        self.assertEqual(store._memory_docs["1:1"]["document_types"], ["manual"])
+        self.assertEqual(store._memory_docs["2:0"]["document_types"], ["catalog"])
+        self.assertEqual(store.index_generation, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import queue
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import app.ocr_worker as ocr_worker
+from app.ocr_model_pool import OCRModelPool, OCRModelPoolBusyError, OCRModelPoolTimeoutError
+
+
+def _pool(queue_size: int = 2, task_timeout_seconds: float = 5.0) -> OCRModelPool:
+    pool = OCRModelPool(
+        size=2,
+        queue_size=queue_size,
+        submit_timeout_seconds=0.1,
+        warmup=False,
+        task_timeout_seconds=task_timeout_seconds,
+    )
+    # Drive the bookkeeping in-process: a plain queue stands in for the IPC task queue
+    # and a parked thread keeps the pool reporting as running.
+    pool._tasks = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    pool._listener = threading.Thread(target=stop.wait, daemon=True)
+    pool._listener.start()
+    pool._started_at = 1.0
+    pool._test_stop = stop  # type: ignore[attr-defined]
+    return pool
+
+
+class OCRModelPoolTests(unittest.TestCase):
+    def test_completed_tasks_resolve_futures_and_track_utilization(self):
+        pool = _pool()
+        try:
+            future = pool.submit(["page-1.png"])
+            task_id, page_paths = pool._tasks.get_nowait()
+            self.assertEqual(page_paths, ["page-1.png"])
+
+            pool._handle_event("ready", 0, "", {"pid": 101})
+            with patch("app.ocr_model_pool.time.time", return_value=10.0):
+                pool._handle_event("started", 0, task_id, {"pid": 101})
+            with patch("app.ocr_model_pool.time.time", return_value=12.0):
+                pool._handle_event("done", 0, task_id, {"result": [("page text", 0.9)]})
+                snapshot = pool.snapshot()
+        finally:
+            pool._test_stop.set()  # type: ignore[attr-defined]
+
+        self.assertEqual(future.result(timeout=1), [("page text", 0.9)])
+        worker = snapshot["workers"][0]
+        self.assertEqual(worker["pid"], 101)
+        self.assertEqual(worker["state"], "idle")
+        self.assertEqual(worker["tasks_completed"], 1)
+        self.assertEqual(worker["busy_seconds"], 2.0)
+        self.assertAlmostEqual(worker["utilization"], 2.0 / 11.0, places=3)
+        self.assertEqual(snapshot["pending_tasks"], 0)
+
+    def test_full_queue_applies_back_pressure(self):
+        pool = _pool(queue_size=1)
+        try:
+            pool.submit(["page-1.png"])
+            with self.assertRaises(OCRModelPoolBusyError):
+                pool.submit(["page-2.png"])
+            self.assertEqual(pool.snapshot()["pending_tasks"], 1)
+        finally:
+            pool._test_stop.set()  # type: ignore[attr-defined]
+
+    def test_task_without_result_times_out_and_terminates_its_process(self):
+        pool = _pool(queue_size=4, task_timeout_seconds=0.2)
+        process = MagicMock()
+        process.is_alive.return_value = True
+        pool._processes[0] = process
+        pool._current_tasks[0] = SimpleNamespace(value=b"")
+
+        def _hung_worker():  # type: ignore[no-untyped-def]
+            # Dequeues the first page and never reports back, not even "started".
+            task_id, _ = pool._tasks.get(timeout=1)
+            pool._current_tasks[0].value = task_id.encode("ascii")
+
+        worker = threading.Thread(target=_hung_worker, daemon=True)
+        worker.start()
+        try:
+            with self.assertRaises(OCRModelPoolTimeoutError):
+                pool.recognize_pages(["p0.png", "p1.png"])
+            snapshot = pool.snapshot()
+        finally:
+            pool._test_stop.set()  # type: ignore[attr-defined]
+            worker.join(timeout=1)
+
+        process.terminate.assert_called_once()
+        self.assertEqual(snapshot["pending_tasks"], 0)
+
+    def test_killed_process_fails_dequeued_task_without_started_event(self):
+        pool = _pool()
+        try:
+            future = pool.submit(["page-1.png"])
+            task_id, _ = pool._tasks.get_nowait()
+            pool._processes[0] = SimpleNamespace(is_alive=lambda: False, exitcode=-9)
+            pool._current_tasks[0] = SimpleNamespace(value=task_id.encode("ascii"))
+            with patch.object(pool, "_spawn") as spawn:
+                pool._check_processes()
+        finally:
+            pool._test_stop.set()  # type: ignore[attr-defined]
+
+        spawn.assert_called_once_with(0)
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=1)
+        self.assertEqual(pool.snapshot()["pending_tasks"], 0)
+
+    def test_listener_detects_dead_process_under_steady_traffic(self):
+        pool = _pool()
+        pool._events = queue.Queue()
+        pool._processes[0] = SimpleNamespace(is_alive=lambda: False, exitcode=-9)
+        pool._current_tasks[0] = SimpleNamespace(value=b"")
+        respawned = threading.Event()
+
+        def _feed():  # type: ignore[no-untyped-def]
+            # Another worker keeps reporting, so the event queue never goes quiet.
+            while not pool._stopping.is_set():
+                pool._events.put(("ready", 1, "", {"pid": 102}))
+                threading.Event().wait(0.005)
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+        listener = threading.Thread(target=pool._listen, daemon=True)
+        with patch("app.ocr_model_pool._PROCESS_CHECK_INTERVAL_SECONDS", 0.05), patch.object(
+            pool, "_spawn", side_effect=lambda index: respawned.set()
+        ):
+            feeder.start()
+            listener.start()
+            try:
+                self.assertTrue(respawned.wait(2))
+            finally:
+                pool._stopping.set()
+                pool._test_stop.set()  # type: ignore[attr-defined]
+                feeder.join(timeout=1)
+                listener.join(timeout=1)
+
+    def test_paddle_ocr_routes_pages_through_running_pool(self):
+        recognized: list[list[str]] = []
+
+        def _fake_pool_recognize(page_paths):  # type: ignore[no-untyped-def]
+            recognized.append(list(page_paths))
+            return [("pooled text for page", 0.95) for _ in page_paths]
+
+        def _fake_ladder(**kwargs):  # type: ignore[no-untyped-def]
+            results = kwargs["recognize_pages"](["p0.png"])
+            return [text for text, _ in results], 1, []
+
+        with patch.object(OCRModelPool, "running", new_callable=PropertyMock, return_value=True), patch.object(
+            ocr_worker._OCR_MODEL_POOL, "recognize_pages", side_effect=_fake_pool_recognize
+        ), patch.object(ocr_worker, "_get_paddle_pipeline") as get_pipeline, patch.object(
+            ocr_worker, "_ocr_pdf_pages_with_cache", side_effect=_fake_ladder
+        ):
+            text, pages, _ = ocr_worker._call_paddle(
+                "scan.pdf",
+                max_pages=1,
+                render_dpi=120,
+                force_render_pdf=True,
+                fast_mode=False,
+            )
+
+        get_pipeline.assert_not_called()
+        self.assertEqual(recognized, [["p0.png"]])
+        self.assertEqual(text, "pooled text for page")
+        self.assertEqual(pages, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
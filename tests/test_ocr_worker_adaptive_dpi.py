@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import patch
+
+import app.ocr_worker as ocr_worker
+
+
+class OCRWorkerAdaptiveDpiTests(unittest.TestCase):
+    def _run_ladder(self, page_results):  # type: ignore[no-untyped-def]
+        rendered: list[tuple[int, list[int]]] = []
+
+        def _fake_render(file_path, output_dir, page_indices, render_dpi):  # type: ignore[no-untyped-def]
+            rendered.append((render_dpi, list(page_indices)))
+            return [f"{render_dpi}:{index}" for index in page_indices]
+
+        def _recognize(page_paths):  # type: ignore[no-untyped-def]
+            outputs = []
+            for path in page_paths:
+                dpi, index = path.split(":")
+                outputs.append(page_results[(int(dpi), int(index))])
+            return outputs
+
+        with patch.object(ocr_worker, "OCR_ADAPTIVE_DPI_ENABLED", True), patch.object(
+            ocr_worker, "OCR_ADAPTIVE_DPI_LADDER", [120]
+        ), patch.object(ocr_worker, "OCR_ADAPTIVE_MIN_PAGE_CHARS", 20), patch.object(
+            ocr_worker, "OCR_ADAPTIVE_MIN_CONFIDENCE", 0.8
+        ), patch.object(ocr_worker, "_pdf_page_count", return_value=3), patch.object(
+            ocr_worker, "_render_pdf_page_indices_to_pngs", side_effect=_fake_render
+        ):
+            texts, pages, details = ocr_worker._ocr_pdf_pages_with_cache(
+                file_path="scan.pdf",
+                file_sha256="",
+                provider="paddle",
+                start_page=0,
+                page_count=0,
+                render_dpi=180,
+                recognize_pages=_recognize,
+            )
+        return texts, pages, details, rendered
+
+    def test_only_low_yield_pages_are_rerendered_at_higher_dpi(self):
+        dense = "Measurement range 10 mm to 20 mm"
+        page_results = {
+            (120, 0): (dense, 0.95),
+            (120, 1): ("Sparse", 0.9),
+            (120, 2): (dense, 0.4),
+            (180, 1): ("Sparse page now readable at higher DPI", 0.92),
+            (180, 2): (dense + " with detail", 0.9),
+        }
+
+        texts, pages, details, rendered = self._run_ladder(page_results)
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(rendered, [(120, [0, 1, 2]), (180, [1, 2])])
+        self.assertEqual(texts[1], "Sparse page now readable at higher DPI")
+        self.assertEqual([detail.render_dpi for detail in details], [120, 180, 180])
+        self.assertEqual([detail.outcome for detail in details], ["accepted", "escalated", "escalated"])
+        self.assertEqual([detail.attempts for detail in details], [1, 2, 2])
+
+    def test_keeps_low_dpi_text_when_high_dpi_yields_less(self):
+        page_results = {
+            (120, 0): ("Readable line one", None),
+            (120, 1): ("Readable line two", None),
+            (120, 2): ("Readable line three", None),
+            (180, 0): ("", None),
+            (180, 1): ("", None),
+            (180, 2): ("", None),
+        }
+
+        texts, _, details, _ = self._run_ladder(page_results)
+
+        self.assertEqual(texts, ["Readable line one", "Readable line two", "Readable line three"])
+        self.assertEqual({detail.outcome for detail in details}, {"below_threshold"})
+        self.assertEqual({detail.render_dpi for detail in details}, {120})
+
+
+if __name__ == "__main__":
+    unittest.main()
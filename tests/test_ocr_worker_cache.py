@@ -3,6 +3,7 @@ import unittest
 from pathlib import Path
 
 import app.ocr_worker as ocr_worker
+from app.ocr_cache_store import OCRCacheStore
 
 
 class OCRWorkerCacheTests(unittest.TestCase):
@@ -100,6 +101,105 @@ class OCRWorkerCacheTests(unittest.TestCase):
                 ocr_worker.GLM_OCR_TEMPERATURE = original_temperature
                 ocr_worker.GLM_OCR_TOP_P = original_top_p
 
+    def test_cache_key_uses_forwarded_file_sha256_without_rehash(self):
+        original_hasher = ocr_worker._sha256_file
+
+        def _raise_if_called(_path):  # type: ignore[no-untyped-def]
+            raise AssertionError("worker must not re-hash when the API forwards file_sha256")
+
+        try:
+            ocr_worker._sha256_file = _raise_if_called  # type: ignore[assignment]
+            key = ocr_worker._build_ocr_cache_key(
+                file_path="/does/not/exist.pdf",
+                provider="paddle",
+                requested_max_pages=1,
+                requested_render_dpi=144,
+                requested_max_tokens=0,
+                requested_fast_mode=True,
+                force_render_pdf=True,
+                use_pypdf_preflight=False,
+                file_sha256="a" * 64,
+            )
+        finally:
+            ocr_worker._sha256_file = original_hasher  # type: ignore[assignment]
+
+        self.assertEqual(len(key), 64)
+
+    def test_cache_store_counts_hits_and_evicts_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = OCRCacheStore(temp_dir, max_entries=2)
+            store.put("key-a", {"text": "a"}, file_sha256="f" * 64, provider="paddle")
+            store.put("key-b", {"text": "b"}, file_sha256="f" * 64, provider="paddle", page_index=0)
+            self.assertEqual(store.get("key-a"), {"text": "a"})
+
+            store.put("key-c", {"text": "c"}, file_sha256="f" * 64, provider="paddle")
+
+            self.assertIsNone(store.get("key-b", page=True))
+            self.assertEqual(store.get("key-c"), {"text": "c"})
+            stats = store.stats()
+            self.assertEqual(stats["hits"], 2)
+            self.assertEqual(stats["page_misses"], 1)
+            self.assertEqual(stats["evictions"], 1)
+            self.assertEqual(stats["entries"], 2)
+
+    def test_page_cache_reuses_recognized_pages(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_store = ocr_worker._OCR_CACHE_STORE
+            original_page_count = ocr_worker._pdf_page_count
+            original_renderer = ocr_worker._render_pdf_page_indices_to_pngs
+            original_cache_enabled = ocr_worker.OCR_CACHE_ENABLED
+            original_adaptive = ocr_worker.OCR_ADAPTIVE_DPI_ENABLED
+            rendered_batches: list[list[int]] = []
+
+            def _fake_render(file_path, output_dir, page_indices, render_dpi):  # type: ignore[no-untyped-def]
+                rendered_batches.append(list(page_indices))
+                return [f"{output_dir}/page_{index + 1:03d}.png" for index in page_indices]
+
+            def _recognize(page_paths):  # type: ignore[no-untyped-def]
+                return [(f"text of {Path(path).stem}", None) for path in page_paths]
+
+            try:
+                ocr_worker._OCR_CACHE_STORE = OCRCacheStore(temp_dir)
+                ocr_worker._pdf_page_count = lambda _path: 3  # type: ignore[assignment]
+                ocr_worker._render_pdf_page_indices_to_pngs = _fake_render  # type: ignore[assignment]
+                ocr_worker.OCR_CACHE_ENABLED = True
+                ocr_worker.OCR_ADAPTIVE_DPI_ENABLED = False
+
+                first_texts, first_pages, _ = ocr_worker._ocr_pdf_pages_with_cache(
+                    file_path="scan.pdf",
+                    file_sha256="b" * 64,
+                    provider="paddle",
+                    start_page=0,
+                    page_count=2,
+                    render_dpi=120,
+                    recognize_pages=_recognize,
+                )
+                second_texts, second_pages, second_details = ocr_worker._ocr_pdf_pages_with_cache(
+                    file_path="scan.pdf",
+                    file_sha256="b" * 64,
+                    provider="paddle",
+                    start_page=0,
+                    page_count=0,
+                    render_dpi=120,
+                    recognize_pages=_recognize,
+                )
+            finally:
+                ocr_worker._OCR_CACHE_STORE = original_store
+                ocr_worker._pdf_page_count = original_page_count  # type: ignore[assignment]
+                ocr_worker._render_pdf_page_indices_to_pngs = original_renderer  # type: ignore[assignment]
+                ocr_worker.OCR_CACHE_ENABLED = original_cache_enabled
+                ocr_worker.OCR_ADAPTIVE_DPI_ENABLED = original_adaptive
+
+        self.assertEqual(first_pages, 2)
+        self.assertEqual(second_pages, 3)
+        self.assertEqual(rendered_batches, [[0, 1], [2]])
+        self.assertEqual(
+            second_texts,
+            ["text of page_001", "text of page_002", "text of page_003"],
+        )
+        self.assertEqual(first_texts, second_texts[:2])
+        self.assertEqual([detail.cached for detail in second_details], [True, True, False])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+import io
+import json
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import app.core.ocr as ocr_client
+import app.ocr_worker as ocr_worker
+
+
+def _options() -> ocr_worker.OCRResolvedOptions:
+    return ocr_worker.OCRResolvedOptions(
+        file_path=Path(__file__),
+        requested_max_pages=1,
+        requested_render_dpi=120,
+        requested_max_tokens=0,
+        requested_fast_mode=True,
+        force_render_pdf=True,
+        use_pypdf_preflight=False,
+        should_skip_heavy_paddle_pdf=False,
+        file_sha256="c" * 64,
+    )
+
+
+class OCRWorkerJobQueueTests(unittest.TestCase):
+    def test_identical_inflight_requests_are_coalesced(self):
+        release = threading.Event()
+        calls: list[str] = []
+
+        def _slow_ocr(options):  # type: ignore[no-untyped-def]
+            calls.append(options.file_sha256)
+            release.wait(5)
+            return ocr_worker.OCRResponse(text="scan text", engine="test", pages=1, used_fallback=False)
+
+        queue = ocr_worker.OCRJobQueue(max_concurrency=2, max_pending=4, result_ttl_seconds=60)
+        options = _options()
+        key = ocr_worker._build_job_coalesce_key(options)
+        with patch.object(ocr_worker, "_run_ocr", side_effect=_slow_ocr):
+            first_job, first_coalesced = queue.submit(key, options)
+            second_job, second_coalesced = queue.submit(key, options)
+            release.set()
+            self.assertTrue(first_job.done.wait(5))
+
+        self.assertFalse(first_coalesced)
+        self.assertTrue(second_coalesced)
+        self.assertEqual(first_job.job_id, second_job.job_id)
+        self.assertEqual(calls, ["c" * 64])
+        self.assertEqual(first_job.status, "completed")
+        self.assertEqual(queue.snapshot()["coalesced_total"], 1)
+
+    def test_failed_job_records_status_code(self):
+        def _missing_provider(_options):  # type: ignore[no-untyped-def]
+            raise ocr_worker.HTTPException(status_code=503, detail="GLM_OCR_ENDPOINT is not configured.")
+
+        queue = ocr_worker.OCRJobQueue(max_concurrency=1, max_pending=4, result_ttl_seconds=60)
+        options = _options()
+        with patch.object(ocr_worker, "_run_ocr", side_effect=_missing_provider):
+            job, _ = queue.submit(ocr_worker._build_job_coalesce_key(options), options)
+            self.assertTrue(job.done.wait(5))
+
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.status_code, 503)
+
+
+class _FakeHTTPResponse(io.BytesIO):
+    def __enter__(self):  # type: ignore[no-untyped-def]
+        return self
+
+    def __exit__(self, *args):  # type: ignore[no-untyped-def]
+        self.close()
+
+
+class OCRClientJobPollingTests(unittest.TestCase):
+    def test_client_submits_job_and_polls_until_completed(self):
+        responses = [
+            {"job_id": "job-1", "status": "queued"},
+            {"job_id": "job-1", "status": "running"},
+            {"job_id": "job-1", "status": "completed", "result": {"text": "  recognized  "}},
+        ]
+        requested: list[tuple[str, str]] = []
+
+        def _fake_urlopen(req, timeout):  # type: ignore[no-untyped-def]
+            requested.append((req.get_method(), req.full_url))
+            return _FakeHTTPResponse(json.dumps(responses.pop(0)).encode("utf-8"))
+
+        with patch.object(ocr_client.request, "urlopen", side_effect=_fake_urlopen):
+            text = ocr_client._call_ocr_worker_job(
+                "http://ocr-worker:8100/ocr/jobs",
+                "/tmp/scan.pdf",
+                file_sha256="d" * 64,
+            )
+
+        self.assertEqual(text, "recognized")
+        self.assertEqual(requested[0], ("POST", "http://ocr-worker:8100/ocr/jobs"))
+        self.assertTrue(requested[1][1].startswith("http://ocr-worker:8100/ocr/jobs/job-1?wait_seconds="))
+        self.assertEqual(len(requested), 3)
+
+    def test_job_wait_is_not_bounded_by_sync_timeout(self):
+        responses = [{"job_id": "job-2", "status": "running"}] * 3 + [
+            {"job_id": "job-2", "status": "completed", "result": {"text": "long scan"}}
+        ]
+        clock = iter(range(0, 1000, 50))
+
+        def _fake_urlopen(req, timeout):  # type: ignore[no-untyped-def]
+            return _FakeHTTPResponse(json.dumps(responses.pop(0)).encode("utf-8"))
+
+        # Each poll "takes" 50s, well past OCR_TIMEOUT_SECONDS in total.
+        with patch.object(ocr_client.request, "urlopen", side_effect=_fake_urlopen), patch.object(
+            ocr_client, "OCR_TIMEOUT_SECONDS", 60.0
+        ), patch.object(ocr_client, "OCR_JOB_TIMEOUT_SECONDS", 600.0), patch.object(
+            ocr_client.time, "monotonic", side_effect=lambda: float(next(clock))
+        ):
+            text = ocr_client._call_ocr_worker_job("http://ocr-worker:8100/ocr/jobs", "/tmp/scan.pdf")
+
+        self.assertEqual(text, "long scan")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app import models
+from app.core import pipeline, pipeline_profiler
+from app.core.pipeline_profiler import PipelineProfile, profile_stage, set_count, summarize_pipeline_runs
+
+
+class PipelineProfilerTests(unittest.TestCase):
+    def test_nested_stage_reports_self_time(self):
+        clock = iter([0.0, 1.0, 2.0, 5.0, 6.0, 6.0])
+        with patch.object(pipeline_profiler.time, "perf_counter", side_effect=lambda: next(clock)):
+            profile = PipelineProfile()
+            with profile.stage("segments"):
+                with profile.stage("ocr"):
+                    pass
+            profile.finish()
+
+        self.assertEqual(profile.stages, {"ocr": 3000.0, "segments": 2000.0})
+        self.assertEqual(profile.total_ms, 6000.0)
+
+    def test_stage_helpers_are_noops_without_active_profile(self):
+        with profile_stage("chunking"):
+            set_count("chunks", 3)
+
+    def test_summary_reports_stage_percentiles(self):
+        runs = [
+            SimpleNamespace(total_ms=float(index * 10), stages_json=json.dumps({"ocr": float(index), "hash": 1.0}))
+            for index in range(1, 21)
+        ]
+        summary = summarize_pipeline_runs(runs)
+
+        self.assertEqual(summary["runs"], 20)
+        self.assertEqual(list(summary["stages"]), ["hash", "ocr"])
+        self.assertEqual(summary["stages"]["ocr"]["p50_ms"], 10.0)
+        self.assertEqual(summary["stages"]["ocr"]["p95_ms"], 19.0)
+        self.assertEqual(summary["total"]["p95_ms"], 190.0)
+
+    def test_process_document_records_stage_breakdown(self):
+        def fake_process(doc, db, **kwargs):
+            with profile_stage("chunking"):
+                set_count("chunks", 3)
+                set_count("pages", 2)
+            return "indexed"
+
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = SimpleNamespace(status="", content_text="")
+        with patch.object(pipeline, "_process_document_once", side_effect=fake_process):
+            pipeline.process_document_with_session(7, db)
+
+        runs = [call.args[0] for call in db.add.call_args_list if isinstance(call.args[0], models.DocumentPipelineRun)]
+        self.assertEqual(len(runs), 1)
+        self.assertEqual((runs[0].doc_id, runs[0].status), (7, "indexed"))
+        self.assertEqual((runs[0].chunk_count, runs[0].page_count), (3, 2))
+        self.assertIn("chunking", json.loads(runs[0].stages_json))
+
+    def test_failed_attempt_records_error(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = SimpleNamespace(status="", content_text="")
+        with patch.object(pipeline, "_process_document_once", side_effect=ValueError("boom")):
+            pipeline.process_document_with_session(8, db)
+
+        runs = [call.args[0] for call in db.add.call_args_list if isinstance(call.args[0], models.DocumentPipelineRun)]
+        self.assertEqual(runs[0].status, "failed")
+        self.assertIn("boom", runs[0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
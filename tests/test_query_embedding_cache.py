@@ -0,0 +1,68 @@
+import unittest
+from array import array
+from unittest.mock import MagicMock, patch
+
+from app.core import query_embedding_cache as qec
+
+
+class QueryEmbeddingCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = qec.QueryEmbeddingCache(max_entries=2, ttl_seconds=60, enabled=True)
+        self.model = MagicMock()
+        self.model.encode.side_effect = lambda text: (
+            [[float(len(item)), 0.5] for item in text] if isinstance(text, list) else [float(len(text)), 0.5]
+        )
+        self.patches = [
+            patch.object(qec, "query_embedding_cache", self.cache),
+            patch.object(qec, "model", self.model),
+            patch.object(qec, "EMBEDDING_BACKEND", "sentence-transformers"),
+        ]
+        for item in self.patches:
+            item.start()
+
+    def tearDown(self):
+        for item in self.patches:
+            item.stop()
+
+    def test_repeated_queries_are_encoded_once_and_stored_as_float32(self):
+        first = qec.encode_query("LJ-X8000  측정 범위")
+        second = qec.encode_query(" LJ-X8000 측정 범위 ")
+        second.append(9.0)
+
+        self.assertEqual(first, [14.0, 0.5])
+        self.assertEqual(qec.encode_query("LJ-X8000 측정 범위"), [14.0, 0.5])
+        self.model.encode.assert_called_once_with("LJ-X8000 측정 범위")
+        entry = self.cache._entries[qec.query_embedding_key("LJ-X8000 측정 범위")]
+        self.assertIsInstance(entry.vector, array)
+        self.assertEqual(entry.vector.typecode, "f")
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_key_includes_embedding_model_and_lru_evicts(self):
+        qec.encode_query("a")
+        with patch.object(qec, "EMBEDDING_MODEL_VERSION", "2"):
+            qec.encode_query("a")
+        self.assertEqual(self.model.encode.call_count, 2)
+
+        qec.encode_query("b")
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_fallback_backend_skips_encoding(self):
+        with patch.object(qec, "EMBEDDING_BACKEND", "fallback"):
+            self.assertEqual(qec.encode_query("query"), [])
+            self.assertEqual(qec.warm_query_embeddings(["query"]), 0)
+        self.model.encode.assert_not_called()
+
+    def test_warmup_encodes_top_queries_from_log_in_batches(self):
+        log = ["3\tsensor\n", "calibration\n", "calibration\n", "1\tsensor  \n", "\n", "rare\n"]
+        queries = qec.load_top_queries(log, limit=2)
+        self.assertEqual(queries, ["sensor", "calibration"])
+
+        self.assertEqual(qec.warm_query_embeddings(queries), 2)
+        self.model.encode.assert_called_once_with(["sensor", "calibration"])
+        self.assertEqual(qec.encode_query("sensor"), [6.0, 0.5])
+        self.assertEqual(self.model.encode.call_count, 1)
+        self.assertEqual(self.cache.stats()["warmed"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
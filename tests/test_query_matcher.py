@@ -0,0 +1,49 @@
+import unittest
+
+from app.api import documents
+
+
+class QueryMatcherTests(unittest.TestCase):
+    def test_counts_and_first_hit_use_lowered_tokens(self):
+        matcher = documents._QueryMatcher("LJ-X8000 측정범위")
+        text = "측정범위 표 | lj-x8000 헤드, LJ-X8000 컨트롤러".lower()
+
+        counts = matcher.token_counts(text)
+        self.assertEqual(matcher.matched_terms(counts), ["LJ-X8000", "측정범위"])
+        self.assertEqual(sum(counts), 3)
+        self.assertEqual(matcher.first_hit(text), 0)
+        self.assertEqual(matcher.first_hit("no match here"), -1)
+
+    def test_only_sentences_with_hits_are_scored_and_keep_their_index(self):
+        matcher = documents._QueryMatcher("calibration")
+        body = "Overview of the head.\nCalibration runs daily. Cleaning | Calibration log\nEnd."
+
+        self.assertEqual(
+            matcher.sentences_with_hits(body, body.lower()),
+            [(1, "Calibration runs daily."), (3, "Calibration log")],
+        )
+        self.assertEqual(
+            documents._extract_evidence_sentences(body, matcher),
+            ["Calibration runs daily.", "Calibration log"],
+        )
+
+    def test_rerank_outputs_snippet_evidence_and_matched_terms(self):
+        hits = [
+            {
+                "_score": 1.0,
+                "_source": {
+                    "doc_id": 1,
+                    "filename": "manual.pdf",
+                    "content": "Intro text.\nThe sensor &amp; controller support calibration.",
+                },
+            }
+        ]
+        result = documents._rerank_hits(hits, "sensor calibration")[0]
+
+        self.assertEqual(result["matched_terms"], ["calibration", "sensor"])
+        self.assertEqual(result["evidence"], ["The sensor & controller support calibration."])
+        self.assertTrue(result["snippet"].startswith("Intro text."))
+
+
+if __name__ == "__main__":
+    unittest.main()
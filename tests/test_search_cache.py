@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.api import documents
+from app.core.vector_store import SearchLeg
+from app.core.search_cache import CachedSearch, SearchResultCache, normalize_search_query
+
+
+def _hits(count: int) -> list[dict]:
+    return [
+        {
+            "_id": f"{index}:0",
+            "_score": 1.0 / (index + 1),
+            "_source": {
+                "doc_id": index,
+                "chunk_id": 0,
+                "filename": f"manual-{index}.pdf",
+                "content": f"LJ-X8000 sensor calibration step {index} for the measurement head.",
+            },
+        }
+        for index in range(count)
+    ]
+
+
+class SearchResultCacheTests(unittest.TestCase):
+    def test_entry_is_served_while_generation_matches_and_window_is_covered(self):
+        cache = SearchResultCache(max_entries=4, ttl_seconds=60, enabled=True)
+        cache.put("q", CachedSearch(results=[{}] * 20, generation=3, exhausted=False))
+
+        self.assertIsNotNone(cache.get("q", generation=3, end_index=20))
+        self.assertIsNone(cache.get("q", generation=3, end_index=30))
+        self.assertIsNone(cache.get("q", generation=4, end_index=10))
+        self.assertIsNone(cache.get("q", generation=3, end_index=10))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stale"], stats["short"]), (1, 3, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.25)
+
+    def test_exhausted_entry_covers_any_page_and_lru_evicts_oldest(self):
+        cache = SearchResultCache(max_entries=2, ttl_seconds=60, enabled=True)
+        cache.put("a", CachedSearch(results=[{}] * 3, generation=0, exhausted=True))
+        cache.put("b", CachedSearch(results=[], generation=0, exhausted=True))
+        self.assertIsNotNone(cache.get("a", generation=0, end_index=50))
+        cache.put("c", CachedSearch(results=[], generation=0, exhausted=True))
+
+        self.assertIsNone(cache.get("b", generation=0, end_index=1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_query_normalization_collapses_whitespace(self):
+        self.assertEqual(normalize_search_query("  LJ-X8000 \t 측정  범위 "), "LJ-X8000 측정 범위")
+
+    def test_search_pages_are_sliced_from_cached_candidates(self):
+        cache = SearchResultCache(max_entries=8, ttl_seconds=60, enabled=True)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        search = MagicMock(return_value=SearchLeg(_hits(45), collapsed=True))
+
+        with patch.object(documents, "search_result_cache", cache), patch.object(
+            documents.vector_store, "search_keyword_leg", search
+        ), patch.object(
+            documents.vector_store, "search_vector_leg", return_value=SearchLeg([], collapsed=True)
+        ), patch.object(documents.vector_store, "index_generation", 0):
+            first = asyncio.run(documents.search_documents(q="LJ-X8000 calibration", page=1, page_size=10, db=db))
+            second = asyncio.run(documents.search_documents(q="LJ-X8000  calibration", page=2, page_size=10, db=db))
+            self.assertEqual(search.call_count, 1)
+
+            documents.vector_store.index_generation += 1
+            asyncio.run(documents.search_documents(q="LJ-X8000 calibration", page=2, page_size=10, db=db))
+            self.assertEqual(search.call_count, 2)
+
+        first_ids = [item["doc_id"] for item in first["items"]]
+        second_ids = [item["doc_id"] for item in second["items"]]
+        self.assertEqual(len(first_ids), 10)
+        self.assertEqual(len(second_ids), 10)
+        self.assertFalse(set(first_ids) & set(second_ids))
+        self.assertEqual(second["total"], 20)
+        db.commit.assert_not_called()
+
+    def test_keyword_leg_runs_while_query_is_encoded_and_only_the_page_gets_snippets(self):
+        cache = SearchResultCache(max_entries=8, ttl_seconds=60, enabled=True)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        keyword_started = threading.Event()
+        encoded_while_keyword_ran = []
+
+        def keyword_leg(query, top_k, filters=None):
+            keyword_started.set()
+            return SearchLeg(_hits(30), collapsed=True)
+
+        def encode(query):
+            encoded_while_keyword_ran.append(keyword_started.wait(timeout=5))
+            return [0.1]
+
+        vector_leg = MagicMock(return_value=SearchLeg([], collapsed=True))
+        with patch.object(documents, "search_result_cache", cache), patch.object(
+            documents, "encode_query", encode
+        ), patch.object(documents.vector_store, "search_keyword_leg", keyword_leg), patch.object(
+            documents.vector_store, "search_vector_leg", vector_leg
+        ), patch.object(documents.vector_store, "index_generation", 0):
+            response = asyncio.run(documents.search_documents(q="calibration", page=1, page_size=5, db=db))
+
+        self.assertEqual(encoded_while_keyword_ran, [True])
+        self.assertEqual(vector_leg.call_args.args[0], [0.1])
+        self.assertTrue(all(item["snippet"] and item["summary"] for item in response["items"]))
+        cached = next(iter(cache._entries.values())).results
+        self.assertEqual(sum("snippet" in result for result in cached), 5)
+
+    def test_display_fields_are_published_together(self):
+        results = documents._rerank_hits(_hits(2), "calibration", build_display=False)
+        build_summary = documents._build_summary
+        seen_while_building = []
+
+        def summary_probe(*args):
+            # Another request reading the shared entry now must not see a partial display.
+            seen_while_building.append(sorted(key for key in ("snippet", "evidence") if key in results[0]))
+            return build_summary(*args)
+
+        with patch.object(documents, "_build_summary", side_effect=summary_probe):
+            documents._attach_display(results[:1], "calibration")
+
+        self.assertEqual(seen_while_building, [[]])
+        formatted = documents._format_search_results(results[:1], {})
+        self.assertTrue(formatted[0]["snippet"] and formatted[0]["summary"])
+
+    def test_filters_reach_both_legs_and_are_cached_separately(self):
+        cache = SearchResultCache(max_entries=8, ttl_seconds=60, enabled=True)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        keyword_leg = MagicMock(return_value=SearchLeg(_hits(3), collapsed=True))
+        vector_leg = MagicMock(return_value=SearchLeg([], collapsed=True))
+
+        with patch.object(documents, "search_result_cache", cache), patch.object(
+            documents, "encode_query", return_value=[0.1]
+        ), patch.object(documents.vector_store, "search_keyword_leg", keyword_leg), patch.object(
+            documents.vector_store, "search_vector_leg", vector_leg
+        ), patch.object(documents.vector_store, "index_generation", 0):
+            asyncio.run(documents.search_documents(q="calibration", db=db))
+            asyncio.run(
+                documents.search_documents(
+                    q="calibration", project_id="7, 3", doc_types="manual", date_from="2026-01-01", db=db
+                )
+            )
+            with self.assertRaises(documents.HTTPException) as raised:
+                asyncio.run(documents.search_documents(q="calibration", project_id="seven", db=db))
+
+        self.assertEqual(raised.exception.status_code, 400)
+        self.assertEqual(keyword_leg.call_count, 2)
+        unfiltered, filtered = (call.args[2] for call in keyword_leg.call_args_list)
+        self.assertFalse(unfiltered.active)
+        self.assertEqual(filtered.project_ids, (3, 7))
+        self.assertEqual(filtered.document_types, ("manual",))
+        self.assertEqual(vector_leg.call_args.args[2], filtered)
+        self.assertEqual(len(cache._entries), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+
+from app.api import documents
+from app.core import vector_store as vector_store_module
+from app.core.search_cursor import (
+    LegCursor,
+    SearchCursor,
+    SearchCursorStates,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+
+
+def _memory_store(doc_count: int, chunks_per_doc: int = 2):
+    with patch.object(vector_store_module, "Elasticsearch", None):
+        store = vector_store_module.VectorStore()
+    for doc_id in range(1, doc_count + 1):
+        for chunk_id in range(chunks_per_doc):
+            store._memory_docs[f"{doc_id}:{chunk_id}"] = {
+                "doc_id": doc_id,
+                "chunk_id": chunk_id,
+                "filename": f"manual-{doc_id}.pdf",
+                "content": "LJ-X8000 calibration " * (1 + (doc_id * 7 + chunk_id) % 5) + f"step {doc_id}.",
+                "embedding": [],
+            }
+    return store
+
+
+class SearchCursorTests(unittest.TestCase):
+    def test_cursor_round_trips_and_rejects_garbage(self):
+        cursor = SearchCursor(query_key="k", keyword=LegCursor(after=[1.5, 3, 0], rank=12), settled="abc", page=2)
+        self.assertEqual(decode_search_cursor(encode_search_cursor(cursor)), cursor)
+        with self.assertRaises(ValueError):
+            decode_search_cursor("not-a-cursor")
+        with self.assertRaises(ValueError):
+            decode_search_cursor("A" * 5000)
+
+    def test_cursor_size_does_not_grow_with_depth(self):
+        store = _memory_store(300, chunks_per_doc=1)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        with patch.object(documents, "vector_store", store), patch.object(
+            documents, "search_cursor_states", SearchCursorStates()
+        ):
+            response = asyncio.run(documents.search_documents(q="calibration", page_size=20, use_cursor=True, db=db))
+            cursors = []
+            while response["next_cursor"]:
+                cursors.append(response["next_cursor"])
+                response = asyncio.run(
+                    documents.search_documents(q="calibration", page_size=20, cursor=response["next_cursor"], db=db)
+                )
+            self.assertEqual(response["total"], 300)
+
+            # An older cursor (back button) still resolves to its own page.
+            again = asyncio.run(documents.search_documents(q="calibration", page_size=20, cursor=cursors[0], db=db))
+
+        self.assertGreater(len(cursors), 10)
+        sizes = [len(cursor) for cursor in cursors]
+        self.assertLess(max(sizes), 400)
+        self.assertLessEqual(max(sizes) - min(sizes), 16)
+        self.assertEqual(again["page"], 2)
+        self.assertEqual(again["total"], 40)
+
+    def test_cursor_with_evicted_state_returns_gone(self):
+        store = _memory_store(30)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        with patch.object(documents, "vector_store", store), patch.object(
+            documents, "search_cursor_states", SearchCursorStates()
+        ):
+            response = asyncio.run(documents.search_documents(q="calibration", page_size=5, use_cursor=True, db=db))
+            documents.search_cursor_states._entries.clear()
+            with self.assertRaises(HTTPException) as raised:
+                asyncio.run(documents.search_documents(q="calibration", cursor=response["next_cursor"], db=db))
+        self.assertEqual(raised.exception.status_code, 410)
+
+    def test_cursor_pages_cover_every_document_once(self):
+        store = _memory_store(37)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        with patch.object(documents, "vector_store", store):
+            seen = []
+            response = asyncio.run(documents.search_documents(q="LJ-X8000 calibration", page_size=8, use_cursor=True, db=db))
+            pages = 1
+            while True:
+                seen.extend(item["doc_id"] for item in response["items"])
+                self.assertEqual(response["total"], len(seen))
+                if not response["next_cursor"]:
+                    break
+                self.assertEqual(len(response["items"]), 8)
+                response = asyncio.run(
+                    documents.search_documents(q="LJ-X8000  calibration", page_size=8, cursor=response["next_cursor"], db=db)
+                )
+                pages += 1
+
+        self.assertEqual(sorted(seen), list(range(1, 38)))
+        self.assertEqual(pages, 5)
+
+    def test_cursor_for_another_query_is_rejected(self):
+        store = _memory_store(12)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        with patch.object(documents, "vector_store", store):
+            response = asyncio.run(documents.search_documents(q="calibration", page_size=5, use_cursor=True, db=db))
+            with self.assertRaises(HTTPException) as raised:
+                asyncio.run(documents.search_documents(q="LJ-X8000", cursor=response["next_cursor"], db=db))
+        self.assertEqual(raised.exception.status_code, 400)
+
+    def test_expired_point_in_time_returns_gone(self):
+        cursor = encode_search_cursor(
+            SearchCursor(
+                query_key=documents.search_cursor_key("calibration", "off", "all"),
+                backend="elasticsearch",
+                pit_id="pit",
+                keyword=LegCursor(after=[1.0, 1, 0], rank=10),
+            )
+        )
+        store = MagicMock()
+        store.search_leg_page.side_effect = vector_store_module.SearchCursorExpired("pit expired")
+        policy = MagicMock(dedup_mode="off", index_policy="all")
+        with patch.object(documents, "vector_store", store), patch.object(documents, "resolve_policy", return_value=policy):
+            with self.assertRaises(HTTPException) as raised:
+                asyncio.run(documents.search_documents(q="calibration", cursor=cursor, db=MagicMock()))
+        self.assertEqual(raised.exception.status_code, 410)
+
+    def test_es_leg_page_uses_point_in_time_and_search_after(self):
+        store = _memory_store(0)
+        store.client = MagicMock()
+        store.client.search.return_value = {"pit_id": "pit-2", "hits": {"hits": [{"_id": "1:0", "sort": [2.0, 1, 0]}]}}
+        with patch.object(store, "_ensure_client", return_value=True), patch.object(
+            vector_store_module, "HYBRID_REQUIRE_KEYWORD_MATCH", True
+        ):
+            response = store.search_leg_page(
+                "vector", "calibration", [0.1, 0.2], 5, backend="elasticsearch", pit_id="pit-1", search_after=[3.0, 4, 1]
+            )
+
+        body = store.client.search.call_args.kwargs["body"]
+        self.assertNotIn("index", store.client.search.call_args.kwargs)
+        self.assertEqual(body["pit"]["id"], "pit-1")
+        self.assertEqual(body["search_after"], [3.0, 4, 1])
+        self.assertEqual(body["sort"][0], {"_score": "desc"})
+        self.assertIn("bool", body["query"]["script_score"]["query"])
+        self.assertEqual((response["backend"], response["pit_id"]), ("elasticsearch", "pit-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
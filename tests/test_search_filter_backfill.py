@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.core import search_filter_backfill
+from app.database import Base
+
+
+class SearchFilterBackfillTests(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine, tables=[models.Document.__table__])
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+
+    def _add(self, doc_id: int, status="completed", project_id=None, created_at=None):
+        self.db.add(
+            models.Document(
+                id=doc_id,
+                filename=f"doc-{doc_id}.pdf",
+                status=status,
+                project_id=project_id,
+                created_at=created_at,
+            )
+        )
+
+    def test_filter_fields_are_sent_for_completed_documents_in_batches(self):
+        self._add(1, project_id=7, created_at="2026-01-05T09:00:00+09:00")
+        self._add(2, status="processing")
+        self._add(3)
+        self._add(4)
+        self.db.commit()
+        store = search_filter_backfill.vector_store
+
+        with patch.object(store, "count_chunks_missing_filter_fields", return_value=5), patch.object(
+            store, "update_document_filter_fields"
+        ) as update:
+            stats = search_filter_backfill.backfill_filter_fields(batch_size=2, db=self.db)
+
+        self.assertEqual(stats, {"missing_chunks": 5, "documents": 3, "batches": 2})
+        first, second = (call.args[0] for call in update.call_args_list)
+        self.assertEqual(sorted(first), [1, 3])
+        self.assertEqual(first[1], {"project_id": 7, "created_at": "2026-01-05T00:00:00+00:00"})
+        self.assertEqual(sorted(second), [4])
+
+    def test_backfill_is_skipped_once_no_chunk_is_missing_fields(self):
+        self._add(1)
+        self.db.commit()
+        store = search_filter_backfill.vector_store
+
+        for missing in (0, None):
+            with patch.object(store, "count_chunks_missing_filter_fields", return_value=missing), patch.object(
+                store, "update_document_filter_fields"
+            ) as update:
+                stats = search_filter_backfill.backfill_filter_fields(db=self.db)
+
+            self.assertEqual(stats, {"missing_chunks": 0, "documents": 0, "batches": 0})
+            update.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
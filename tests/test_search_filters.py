@@ -0,0 +1,115 @@
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from app.core import vector_store as vector_store_module
+from app.core.search_filters import SearchFilters, normalize_created_at, parse_search_filters
+
+
+def _store():
+    with patch.object(vector_store_module, "Elasticsearch", None):
+        return vector_store_module.VectorStore()
+
+
+def _chunk(doc_id: int, project_id, document_types, created_at) -> dict:
+    return {
+        "doc_id": doc_id,
+        "chunk_id": 0,
+        "filename": f"doc-{doc_id}.pdf",
+        "content": "LJ-X8000 calibration procedure",
+        "embedding": [1.0, 0.0],
+        "document_types": document_types,
+        "project_id": project_id,
+        "created_at": created_at,
+    }
+
+
+class SearchFiltersTests(unittest.TestCase):
+    def test_query_parameters_are_parsed_and_validated(self):
+        filters = parse_search_filters("7, 3", "manual,datasheet", "2026-01-01", "2026-01-31")
+        self.assertEqual(filters.project_ids, (3, 7))
+        self.assertEqual(filters.document_types, ("datasheet", "manual"))
+        self.assertEqual(filters.created_bounds(), ("2026-01-01", "2026-02-01"))
+        self.assertFalse(parse_search_filters().active)
+
+        for args in (("x",), (None, "unknown"), (None, None, "2026-13-01"), (None, None, "2026-02-01", "2026-01-01")):
+            with self.assertRaises(ValueError):
+                parse_search_filters(*args)
+
+    def test_es_clauses_match_the_memory_predicate(self):
+        filters = SearchFilters(project_ids=(3,), document_types=("manual",), created_to=date(2026, 1, 31))
+        self.assertEqual(
+            filters.es_clauses(),
+            [
+                {"terms": {"project_id": [3]}},
+                {"terms": {"document_types": ["manual"]}},
+                {"range": {"created_at": {"lt": "2026-02-01"}}},
+            ],
+        )
+        created_at = normalize_created_at("2026-01-31T23:59:59.500+09:00")
+        self.assertEqual(created_at, "2026-01-31T14:59:59+00:00")
+        self.assertTrue(filters.matches({"project_id": 3, "document_types": ["manual"], "created_at": created_at}))
+        self.assertFalse(filters.matches({"project_id": 3, "document_types": ["manual"], "created_at": None}))
+        self.assertFalse(filters.matches({"project_id": 4, "document_types": ["manual"], "created_at": created_at}))
+
+    def test_memory_store_scores_only_matching_chunks(self):
+        store = _store()
+        store._memory_docs.update(
+            {
+                "1:0": _chunk(1, 3, ["manual"], "2026-01-05T00:00:00+00:00"),
+                "2:0": _chunk(2, 3, ["datasheet"], "2026-01-06T00:00:00+00:00"),
+                "3:0": _chunk(3, 4, ["manual"], "2026-02-01T00:00:00+00:00"),
+                "4:0": _chunk(4, 3, ["manual"], "2025-12-31T00:00:00+00:00"),
+            }
+        )
+        filters = SearchFilters(project_ids=(3,), document_types=("manual",), created_from=date(2026, 1, 1))
+
+        unfiltered = store.search("calibration", [1.0, 0.0], top_k=10)["hits"]["hits"]
+        filtered = store.search("calibration", [1.0, 0.0], top_k=10, filters=filters)["hits"]["hits"]
+
+        self.assertEqual(len(unfiltered), 4)
+        self.assertEqual([hit["_source"]["doc_id"] for hit in filtered], [1])
+
+        # A new chunk invalidates the postings.
+        store._memory_docs["5:0"] = _chunk(5, 3, ["manual"], "2026-03-01T00:00:00+00:00")
+        filtered = store.search("calibration", [1.0, 0.0], top_k=10, filters=filters)["hits"]["hits"]
+        self.assertEqual(sorted(hit["_source"]["doc_id"] for hit in filtered), [1, 5])
+
+    def test_es_legs_filter_inside_the_query(self):
+        store = _store()
+        store.client = MagicMock()
+        store.client.search.return_value = {"hits": {"hits": []}}
+        filters = SearchFilters(project_ids=(3,))
+
+        with patch.object(store, "_ensure_client", return_value=True), patch.object(
+            vector_store_module, "ES_SEARCH_COLLAPSE", False
+        ):
+            store.search("calibration", [0.1, 0.2], top_k=5, filters=filters)
+
+        keyword_body, vector_body = (call.kwargs["body"] for call in store.client.search.call_args_list)
+        self.assertEqual(keyword_body["query"]["bool"]["filter"], [{"terms": {"project_id": [3]}}])
+        inner = vector_body["query"]["script_score"]["query"]
+        self.assertEqual(inner["bool"]["filter"], [{"terms": {"project_id": [3]}}])
+
+    def test_filter_field_update_only_fills_missing_fields(self):
+        store = _store()
+        store._memory_docs["1:0"] = _chunk(1, None, [], None)
+        store._memory_docs["2:0"] = _chunk(2, 9, [], "2026-01-01T00:00:00+00:00")
+        generation = store.index_generation
+        self.assertEqual(store.count_chunks_missing_filter_fields(), 1)
+
+        store.update_document_filter_fields(
+            {
+                1: {"project_id": 3, "created_at": "2026-01-05T00:00:00+00:00"},
+                2: {"project_id": 3, "created_at": "2026-01-05T00:00:00+00:00"},
+            }
+        )
+
+        self.assertEqual(store._memory_docs["1:0"]["project_id"], 3)
+        self.assertEqual(store._memory_docs["2:0"]["project_id"], 9)
+        self.assertGreater(store.index_generation, generation)
+        self.assertEqual(store.count_chunks_missing_filter_fields(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
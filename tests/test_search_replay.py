@@ -0,0 +1,125 @@
+import asyncio
+import gzip
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.api import documents
+from app.core import search_replay
+from app.core.search_cache import SearchResultCache
+from app.core.vector_store import SearchLeg
+
+
+def _hits(count: int) -> list[dict]:
+    return [
+        {
+            "_id": f"{index}:0",
+            "_score": 1.0 / (index + 1),
+            "_source": {
+                "doc_id": index,
+                "chunk_id": 0,
+                "filename": f"manual-{index}.pdf",
+                "content": f"LJ-X8000 sensor calibration step {index}.",
+            },
+        }
+        for index in range(count)
+    ]
+
+
+class SearchReplayTests(unittest.TestCase):
+    def test_search_requests_are_logged_with_stage_latencies_and_read_back(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = []
+        with tempfile.TemporaryDirectory() as workdir:
+            path = str(Path(workdir) / "search.jsonl")
+            log = search_replay.SearchReplayLog(path=path)
+            with patch.object(documents, "search_replay_log", log), patch.object(
+                documents, "search_result_cache", SearchResultCache(max_entries=4, ttl_seconds=60, enabled=True)
+            ), patch.object(
+                documents.vector_store, "search_keyword_leg", return_value=SearchLeg(_hits(12), collapsed=True)
+            ), patch.object(
+                documents.vector_store, "search_vector_leg", return_value=SearchLeg([], collapsed=True)
+            ), patch.object(documents.vector_store, "index_generation", 0):
+                first = asyncio.run(documents.search_documents(q="calibration", page=1, page_size=5, db=db))
+                asyncio.run(documents.search_documents(q="calibration", page=2, page_size=5, db=db))
+
+            self.assertTrue(log.flush())
+            records = search_replay.read_search_records(path)
+            gz_path = path + ".gz"
+            with open(path, "rb") as source, gzip.open(gz_path, "wb") as target:
+                target.write(source.read())
+            self.assertEqual(search_replay.read_search_records(gz_path), records)
+
+        self.assertEqual([(record["q"], record["page"], record["cached"]) for record in records], [
+            ("calibration", 1, False),
+            ("calibration", 2, True),
+        ])
+        self.assertEqual(records[0]["doc_ids"], [item["doc_id"] for item in first["items"]])
+        self.assertEqual(
+            list(records[0]["stages"]),
+            ["encode", "keyword", "vector", "fuse", "rerank", "display", "db"],
+        )
+        self.assertEqual(list(records[1]["stages"]), ["display", "db"])
+
+        summary = search_replay.summarize_search_records(records)
+        self.assertEqual((summary["requests"], summary["cached"]), (2, 1))
+        self.assertEqual(summary["stages"]["keyword"]["count"], 1)
+        self.assertIn("p99_ms", summary["total"])
+
+    def test_recording_does_not_wait_for_the_file_write(self):
+        release = threading.Event()
+        with tempfile.TemporaryDirectory() as workdir:
+            path = str(Path(workdir) / "search.jsonl")
+            log = search_replay.SearchReplayLog(path=path, max_pending=2)
+            write = log._write
+
+            def slow_write(batch):
+                release.wait(timeout=5)
+                write(batch)
+
+            with patch.object(log, "_write", side_effect=slow_write):
+                for index in range(5):
+                    log.record({"q": f"q{index}"})
+                self.assertFalse(log.flush(timeout=0.05))
+                release.set()
+                self.assertTrue(log.flush())
+            records = search_replay.read_search_records(path)
+
+        # The writer holds at most one batch while blocked; the rest beyond max_pending is dropped.
+        self.assertEqual(len(records) + log.dropped, 5)
+        self.assertGreaterEqual(log.dropped, 2)
+        self.assertEqual(records[0], {"q": "q0"})
+
+    def test_rankings_are_compared_per_request_with_overlap_at_k(self):
+        baseline = [
+            {"q": "a", "page": 1, "page_size": 10, "doc_ids": [1, 2, 3, 4, 5]},
+            {"q": "b", "page": 1, "page_size": 10, "doc_ids": [7, 8]},
+            {"q": "a", "page": 1, "page_size": 10, "doc_ids": [1, 2, 3, 4, 5]},
+        ]
+        candidate = [
+            {"q": "a", "page": 1, "page_size": 10, "doc_ids": [1, 2, 3, 4, 5]},
+            {"q": "a", "page": 1, "page_size": 10, "doc_ids": [2, 1, 9, 4, 6]},
+            {"q": "b", "page": 1, "page_size": 10, "doc_ids": [7, 8]},
+            {"q": "c", "page": 1, "page_size": 10, "doc_ids": []},
+        ]
+
+        result = search_replay.compare_rankings(baseline, candidate, ks=(1, 5))
+
+        self.assertEqual((result["compared"], result["unmatched"], result["identical"]), (3, 1, 2))
+        self.assertEqual(result["overlap_at_k"], {"1": round(2 / 3, 4), "5": round((1 + 0.6 + 1) / 3, 4)})
+        self.assertEqual([item["candidate"] for item in result["worst"]], [[2, 1, 9, 4, 6]])
+        self.assertEqual(search_replay.overlap_at_k([], [], 10), 1.0)
+
+    def test_replay_report_records_are_read_as_a_baseline(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            path = Path(workdir) / "report.json"
+            records = [{"q": "a", "page": 1, "page_size": 10, "doc_ids": [1]}]
+            path.write_text(json.dumps({"suite": "search_replay", "records": records}, indent=2), encoding="utf-8")
+            self.assertEqual(search_replay.read_search_records(str(path)), records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 import unittest
 
-from app.core.chunking.chunker import SourceSegment, build_chunks, table_group_to_structured_text
+from app.core.chunking.chunker import (
+    SourceSegment,
+    build_chunks,
+    collect_table_entities,
+    table_entity_id,
+    table_group_to_structured_text,
+)
 from app.core.chunking.sentence_splitter import split_sentences
+from app.core.chunking.token_counter import TokenCounter, approximate_token_count, token_counter_for_model
 from app.core.parsing.reflow import LayoutBlock, ReflowConfig, reflow_page_blocks
 
 
@@ -14,6 +21,22 @@ class SentenceChunkerTests(unittest.TestCase):
         self.assertEqual(sentences[0], "Dr. Smith scored 3.14 points.")
         self.assertEqual(sentences[1], "This is next!")
 
+    def test_sentence_splitter_boundaries_initials_quotes_and_line_breaks(self):
+        text = 'Made in the U.S. by J. Kim. He said "stop." (see fig. 2) Next\n\n새 줄 문장'
+        sentences = split_sentences(text)
+
+        self.assertEqual(
+            sentences,
+            ["Made in the U.S. by J. Kim.", 'He said "stop.', '" (see fig. 2) Next', "새 줄 문장"],
+        )
+
+    def test_sentence_splitter_long_abbreviation_run_stays_one_sentence(self):
+        text = "see Fig. 3 no. 5 " * 20000
+        sentences = split_sentences(text)
+
+        self.assertEqual(len(sentences), 1)
+        self.assertTrue(sentences[0].endswith("no. 5"))
+
     def test_sentence_aware_chunking_with_overlap(self):
         segments = [
             SourceSegment(
@@ -84,12 +107,15 @@ class SentenceChunkerTests(unittest.TestCase):
 
         self.assertEqual(len(chunks), 2)
 
-    def test_max_chunks_cap_applies_even_sampling(self):
+    def test_max_chunks_budget_keeps_highest_quality_chunks_in_order(self):
+        noisy = {3, 7, 12, 18, 25, 31}
         segments = [
             SourceSegment(
                 page=1,
                 chunk_type="paragraph",
-                text=" ".join(f"Sentence {idx}." for idx in range(1, 41)),
+                text=" ".join(
+                    f"Noise #{idx} ~~ ** {idx}." if idx in noisy else f"Sentence {idx}." for idx in range(1, 41)
+                ),
             )
         ]
 
@@ -103,12 +129,65 @@ class SentenceChunkerTests(unittest.TestCase):
             noise_threshold=0.0,
             chunk_schema_version="test-v2",
             dedup_identical_chunks=False,
-            max_chunks_per_doc=5,
+            max_chunks_per_doc=34,
         )
 
-        self.assertEqual(len(chunks), 5)
-        self.assertEqual(chunks[0].chunk_index, 0)
-        self.assertEqual(chunks[-1].chunk_index, 4)
+        self.assertEqual(len(chunks), 34)
+        self.assertFalse(any(chunk.content.startswith("Noise") for chunk in chunks))
+        self.assertEqual(chunks[-1].content, "Sentence 40.")
+        self.assertEqual([chunk.chunk_index for chunk in chunks], list(range(34)))
+
+    def test_token_counter_packs_sentences_to_model_budget(self):
+        counter = TokenCounter("words", max_tokens=12, count=lambda text: len(text.split()))
+        sentence = "The sensor head measures the profile."  # 6 tokens
+        segments = [SourceSegment(page=1, chunk_type="paragraph", text=" ".join([sentence] * 5))]
+
+        chunks = build_chunks(
+            segments=segments,
+            embedding_model_name="test-model",
+            embedding_model_version="1",
+            max_chars=2000,
+            overlap_sentences=1,
+            min_chunk_chars=1,
+            noise_threshold=0.0,
+            chunk_schema_version="test-v2",
+            dedup_identical_chunks=False,
+            token_counter=counter,
+        )
+
+        self.assertTrue(all(counter.count(chunk.content) <= 12 for chunk in chunks))
+        self.assertEqual(counter.count(chunks[0].content), 12)
+
+    def test_token_counter_splits_overlong_sentence(self):
+        counter = TokenCounter("words", max_tokens=4, count=lambda text: len(text.split()))
+        chunks = build_chunks(
+            segments=[SourceSegment(page=1, chunk_type="paragraph", text="one two three four five six seven eight nine")],
+            embedding_model_name="test-model",
+            embedding_model_version="1",
+            max_chars=2000,
+            overlap_sentences=0,
+            min_chunk_chars=1,
+            noise_threshold=0.0,
+            chunk_schema_version="test-v2",
+            token_counter=counter,
+        )
+
+        self.assertEqual([chunk.content for chunk in chunks], ["one two three four", "five six seven eight", "nine"])
+
+    def test_approximate_token_counter_and_model_budget(self):
+        self.assertGreaterEqual(approximate_token_count("측정 범위는 넓다."), 5)
+        self.assertEqual(approximate_token_count(""), 0)
+        self.assertIsNone(token_counter_for_model(object(), "fallback"))
+
+        class _Tokenizer:
+            def encode(self, text, add_special_tokens=True):
+                return text.split()
+
+        model = type("Model", (), {"max_seq_length": 128, "tokenizer": _Tokenizer()})()
+        counter = token_counter_for_model(model, "mini")
+        self.assertEqual((counter.name, counter.max_tokens), ("tokenizer:mini", 126))
+        self.assertEqual(counter.count("a b c"), 3)
+        self.assertEqual(token_counter_for_model(object(), "fallback", max_tokens=64).name, "approximate")
 
     def test_reflow_does_not_merge_parallel_columns_on_same_row(self):
         blocks = [
@@ -250,6 +329,59 @@ class SentenceChunkerTests(unittest.TestCase):
         self.assertIn("row_9", all_text)
         self.assertIn("row_10", all_text)
 
+    def test_table_rows_reference_table_entity_and_group_by_table_id(self):
+        segments = [
+            SourceSegment(
+                page=1,
+                chunk_type="table_raw",
+                text="| model | range |",
+                raw_text="model | range",
+                table_id=table_entity_id(1, 0),
+            ),
+            *[
+                SourceSegment(
+                    page=1,
+                    chunk_type="table_row_sentence",
+                    text=f"model: A{idx} / range: {idx}mm",
+                    table_id=table_entity_id(1, 0),
+                )
+                for idx in range(2)
+            ],
+            *[
+                SourceSegment(
+                    page=1,
+                    chunk_type="table_row_sentence",
+                    text=f"model: B{idx} / range: {idx}mm",
+                    table_id=table_entity_id(1, 1),
+                )
+                for idx in range(2)
+            ],
+        ]
+
+        chunks = build_chunks(
+            segments=segments,
+            embedding_model_name="test-model",
+            embedding_model_version="1",
+            max_chars=900,
+            overlap_sentences=0,
+            min_chunk_chars=1,
+            noise_threshold=0.0,
+            chunk_schema_version="test-v2",
+            dedup_identical_chunks=False,
+            table_row_sentence_merge_size=3,
+            table_row_sentence_max_per_table=100,
+        )
+
+        row_chunks = [chunk for chunk in chunks if chunk.chunk_type == "table_row_sentence"]
+        self.assertEqual([chunk.table_id for chunk in row_chunks], ["p1-t0", "p1-t1"])
+        self.assertNotIn("B0", row_chunks[0].content)
+        self.assertEqual({chunk.raw_text for chunk in row_chunks}, {""})
+
+        tables = collect_table_entities(segments)
+        self.assertEqual(len(tables), 1)
+        self.assertEqual((tables[0].table_id, tables[0].page, tables[0].table_index), ("p1-t0", 1, 0))
+        self.assertEqual(tables[0].raw_text, "model | range")
+
 
 if __name__ == "__main__":
     unittest.main()
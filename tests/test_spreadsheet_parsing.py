@@ -3,6 +3,7 @@ import tempfile
 import unittest
 from unittest.mock import patch
 
+from app.core.parsing import spreadsheet
 from app.core.parsing.spreadsheet import extract_spreadsheet_segments
 from app.core.pipeline import generate_chunk_records
 
@@ -55,7 +56,7 @@ class SpreadsheetParsingTests(unittest.TestCase):
         file_path = self._build_sample_workbook()
         try:
             with patch("app.core.pipeline.perform_ocr", side_effect=AssertionError("OCR should not run")):
-                raw_text, clean_text, chunk_records = generate_chunk_records(file_path)
+                raw_text, clean_text, chunk_records = generate_chunk_records(file_path, use_cache=False)
         finally:
             os.unlink(file_path)
 
@@ -65,5 +66,45 @@ class SpreadsheetParsingTests(unittest.TestCase):
         self.assertTrue(any(record.page == 1 for record in chunk_records))
 
 
+class SpreadsheetRowWindowTests(unittest.TestCase):
+    def test_rows_are_emitted_in_windows_with_repeated_header(self):
+        rows = [["설비", "점검항목", "결과"]] + [[f"LJ-X{i}", f"항목{i}", "정상"] for i in range(5)]
+
+        windows = list(spreadsheet._iter_sheet_segments("점검", 1, iter(rows), row_window=2))
+
+        table_raws = [
+            segment
+            for window_segments, _, _ in windows
+            for segment in window_segments
+            if segment.chunk_type == "table_raw"
+        ]
+        self.assertEqual(len(table_raws), 3)
+        for segment in table_raws:
+            self.assertTrue(segment.raw_text.startswith("설비 | 점검항목 | 결과"))
+        self.assertNotIn("LJ-X0", table_raws[1].raw_text)
+
+        row_refs = [
+            segment.table_cell_refs
+            for window_segments, _, _ in windows
+            for segment in window_segments
+            if segment.table_layout == "horizontal_header" and "LJ-X4" in segment.text
+        ]
+        self.assertEqual(len(row_refs), 1)
+        self.assertIn("r6c1", row_refs[0].split(","))
+
+    def test_csv_document_text_keeps_header_once(self):
+        handle = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8", newline="")
+        handle.write("model,range\n" + "".join(f"LJ-{i},{i}mm\n" for i in range(7)))
+        handle.close()
+        try:
+            with patch.object(spreadsheet, "SPREADSHEET_ROW_WINDOW", 3):
+                raw_text, _, segments = extract_spreadsheet_segments(handle.name)
+        finally:
+            os.unlink(handle.name)
+
+        self.assertEqual(raw_text.count("model | range"), 1)
+        self.assertEqual(sum(1 for segment in segments if segment.chunk_type == "table_raw"), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.core import document_summary, summary_cache, summary_enrichment
+from app.database import Base
+
+
+_TEXT = "LJ-X8000 설치 절차와 교정 방법을 설명한다."
+
+
+class SummaryCacheTests(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            bind=engine, tables=[models.Document.__table__, models.DocumentSummaryCache.__table__]
+        )
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+
+    def _load(self, text_sha256, document_types, filename):
+        return summary_cache.load_cached_summary(self.db, text_sha256, document_types, filename, _TEXT)
+
+    def test_stored_summary_is_reused_for_same_text_and_config(self):
+        summary_cache.store_cached_summary(
+            self.db, "a" * 64, ["manual"], "LJX_manual.pdf", "LJ-X 매뉴얼", "설치 절차 요약"
+        )
+        self.db.commit()
+
+        self.assertEqual(self._load("a" * 64, ["manual"], "LJX_manual.pdf"), ("LJ-X 매뉴얼", "설치 절차 요약"))
+        self.assertIsNone(self._load("b" * 64, ["manual"], "LJX_manual.pdf"))
+        self.assertIsNone(self._load("a" * 64, ["catalog"], "LJX_manual.pdf"))
+
+    def test_renamed_copy_reuses_summary_with_extractive_title(self):
+        summary_cache.store_cached_summary(
+            self.db, "a" * 64, ["manual"], "LJX_manual.pdf", "LJ-X 매뉴얼", "설치 절차 요약"
+        )
+        self.db.commit()
+
+        title, summary = self._load("a" * 64, ["manual"], "other.pdf")
+        expected_title, _ = document_summary.build_document_summary(
+            filename="other.pdf", content_text=_TEXT, document_types=["manual"], use_llm=False
+        )
+
+        self.assertEqual(summary, "설치 절차 요약")
+        self.assertEqual(title, expected_title)
+
+    def test_model_change_invalidates_cached_summary(self):
+        summary_cache.store_cached_summary(
+            self.db, "a" * 64, ["manual"], "LJX_manual.pdf", "LJ-X 매뉴얼", "설치 절차 요약"
+        )
+        self.db.commit()
+
+        with patch.object(document_summary, "DOC_SUMMARY_OLLAMA_MODEL", "other-model:7b"):
+            self.assertIsNone(self._load("a" * 64, ["manual"], "LJX_manual.pdf"))
+
+    def test_duplicate_store_keeps_caller_transaction(self):
+        summary_cache.store_cached_summary(self.db, "a" * 64, ["manual"], "LJX_manual.pdf", "first", "first")
+        self.db.commit()
+        summary_cache.store_cached_summary(self.db, "a" * 64, ["manual"], "LJX_manual.pdf", "second", "second")
+        self.db.commit()
+
+        self.assertEqual(self.db.query(models.DocumentSummaryCache).count(), 1)
+        self.assertEqual(self._load("a" * 64, ["manual"], "LJX_manual.pdf"), ("first", "first"))
+
+    def test_enrichment_summarizes_identical_texts_once(self):
+        for doc_id, filename in ((1, "LJX_manual.pdf"), (2, "LJX_manual.pdf"), (3, "renamed.pdf")):
+            self.db.add(
+                models.Document(
+                    id=doc_id,
+                    filename=filename,
+                    status="completed",
+                    content_text="LJ-X8000 설치 절차",
+                    document_types='["manual"]',
+                    normalized_text_sha256="c" * 64,
+                    ai_summary_status=summary_enrichment.SUMMARY_STATUS_PENDING,
+                )
+            )
+        self.db.commit()
+        llm = MagicMock(return_value=("LJ-X8000 설치 매뉴얼", "설치 절차 요약"))
+
+        with patch.object(summary_enrichment, "load_cached_summary", return_value=None), patch.object(
+            summary_enrichment, "store_cached_summary"
+        ) as store, patch.object(summary_enrichment, "build_llm_document_summary", llm), patch.object(
+            summary_enrichment.vector_store, "update_document_summaries"
+        ):
+            result = summary_enrichment.enrich_document_summaries([1, 2, 3], db=self.db)
+
+        self.assertEqual(result, {"documents": 3, "enriched": 3})
+        llm.assert_called_once()
+        self.assertEqual(llm.call_args.kwargs["filename"], "LJX_manual.pdf")
+        self.assertEqual([call.args[3] for call in store.call_args_list], ["LJX_manual.pdf"])
+        self.db.expire_all()
+        docs = self.db.query(models.Document).order_by(models.Document.id).all()
+        self.assertEqual([doc.ai_summary_short for doc in docs], ["설치 절차 요약"] * 3)
+        # The renamed copy keeps the shared summary but not the title written for the other name.
+        self.assertEqual([doc.ai_title for doc in docs[:2]], ["LJ-X8000 설치 매뉴얼"] * 2)
+        self.assertNotEqual(docs[2].ai_title, "LJ-X8000 설치 매뉴얼")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.core import summary_enrichment
+from app.core.vector_store import VectorStore
+from app.database import Base
+
+
+def _pending_doc(doc_id: int, **fields) -> models.Document:
+    values = dict(
+        id=doc_id,
+        filename=f"manual-{doc_id}.pdf",
+        status="completed",
+        content_text="LJ-X8000 설치 및 교정 절차를 설명한다.",
+        document_types='["manual"]',
+        normalized_text_sha256=f"{doc_id:064x}",
+        ai_title="extractive title",
+        ai_summary_short="extractive summary",
+        ai_summary_status=summary_enrichment.SUMMARY_STATUS_PENDING,
+    )
+    values.update(fields)
+    return models.Document(**values)
+
+
+class SummaryEnrichmentTests(unittest.TestCase):
+    def setUp(self):
+        # One shared connection: the LLM fake runs on an executor thread and may write through its own session.
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(
+            bind=engine, tables=[models.Document.__table__, models.DocumentSummaryCache.__table__]
+        )
+        self.sessions = sessionmaker(bind=engine)
+        self.db = self.sessions()
+        self.addCleanup(self.db.close)
+
+    def _doc(self, doc_id: int) -> models.Document:
+        self.db.expire_all()
+        return self.db.get(models.Document, doc_id)
+
+    def test_enrich_patches_db_and_index(self):
+        self.db.add_all([_pending_doc(1), _pending_doc(2)])
+        self.db.commit()
+
+        def fake_llm(filename, content_text, document_types):
+            self.assertEqual(document_types, ["manual"])
+            return ("LJ-X8000 설치 매뉴얼", "설치와 교정 절차 요약") if filename == "manual-1.pdf" else None
+
+        with patch.object(summary_enrichment, "build_llm_document_summary", side_effect=fake_llm), patch.object(
+            summary_enrichment.vector_store, "update_document_summaries"
+        ) as update:
+            result = summary_enrichment.enrich_document_summaries([2, 1, 1], db=self.db)
+
+        self.assertEqual(result, {"documents": 2, "enriched": 1})
+        enriched, failed = self._doc(1), self._doc(2)
+        self.assertEqual(enriched.ai_title, "LJ-X8000 설치 매뉴얼")
+        self.assertEqual(enriched.ai_summary_status, summary_enrichment.SUMMARY_STATUS_LLM)
+        self.assertIsNone(enriched.ai_summary_claimed_at)
+        self.assertEqual(failed.ai_title, "extractive title")
+        self.assertEqual(failed.ai_summary_status, summary_enrichment.SUMMARY_STATUS_EXTRACTIVE)
+        update.assert_called_once_with({1: ("LJ-X8000 설치 매뉴얼", "설치와 교정 절차 요약")})
+
+    def test_reprocess_during_llm_call_is_not_overwritten(self):
+        self.db.add(_pending_doc(1))
+        self.db.commit()
+
+        def reprocess_then_summarize(filename, content_text, document_types):
+            other = self.sessions()
+            try:
+                doc = other.get(models.Document, 1)
+                doc.content_text = "새 본문"
+                doc.normalized_text_sha256 = "f" * 64
+                doc.ai_title = "new extractive title"
+                doc.ai_summary_status = summary_enrichment.SUMMARY_STATUS_PENDING
+                doc.ai_summary_claimed_at = None
+                other.commit()
+            finally:
+                other.close()
+            return ("stale title", "stale summary")
+
+        with patch.object(
+            summary_enrichment, "build_llm_document_summary", side_effect=reprocess_then_summarize
+        ), patch.object(summary_enrichment.vector_store, "update_document_summaries") as update:
+            result = summary_enrichment.enrich_document_summaries([1], db=self.db)
+
+        self.assertEqual(result, {"documents": 1, "enriched": 0})
+        doc = self._doc(1)
+        self.assertEqual(doc.ai_title, "new extractive title")
+        self.assertEqual(doc.ai_summary_status, summary_enrichment.SUMMARY_STATUS_PENDING)
+        update.assert_called_once_with({})
+
+    def test_documents_claimed_elsewhere_are_skipped_until_the_claim_is_stale(self):
+        fresh = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        stale = (
+            datetime.now(timezone.utc) - timedelta(seconds=summary_enrichment.DOC_SUMMARY_CLAIM_TTL_SECONDS + 60)
+        ).isoformat(timespec="microseconds")
+        running = summary_enrichment.SUMMARY_STATUS_RUNNING
+        self.db.add_all(
+            [
+                _pending_doc(1, ai_summary_status=running, ai_summary_claimed_at=fresh),
+                _pending_doc(2, ai_summary_status=running, ai_summary_claimed_at=stale),
+            ]
+        )
+        self.db.commit()
+        llm = MagicMock(return_value=("LJ-X8000 설치 매뉴얼", "설치 절차 요약"))
+
+        with patch.object(summary_enrichment, "build_llm_document_summary", llm), patch.object(
+            summary_enrichment.vector_store, "update_document_summaries"
+        ):
+            result = summary_enrichment.enrich_document_summaries([1, 2], db=self.db)
+
+        self.assertEqual(result, {"documents": 1, "enriched": 1})
+        self.assertEqual(self._doc(1).ai_summary_status, running)
+        self.assertEqual(self._doc(2).ai_summary_status, summary_enrichment.SUMMARY_STATUS_LLM)
+
+    def test_queue_drains_in_bounded_batches(self):
+        batches = []
+        done = threading.Event()
+
+        def fake_enrich(doc_ids):
+            batches.append(list(doc_ids))
+            if sum(len(batch) for batch in batches) >= 5:
+                done.set()
+
+        worker = summary_enrichment.SummaryEnrichmentQueue(batch_size=2, enrich=fake_enrich)
+        for doc_id in (1, 2, 3, 4, 5):
+            worker.enqueue(doc_id)
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(sorted(doc_id for batch in batches for doc_id in batch), [1, 2, 3, 4, 5])
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+
+    def test_drain_waits_for_the_running_batch(self):
+        release = threading.Event()
+        finished = []
+
+        def slow_enrich(doc_ids):
+            release.wait(5)
+            finished.extend(doc_ids)
+
+        worker = summary_enrichment.SummaryEnrichmentQueue(batch_size=4, enrich=slow_enrich)
+        worker.enqueue(1)
+        worker.enqueue(2)
+        self.assertFalse(worker.enqueue(2))
+
+        self.assertFalse(worker.drain(timeout=0.05))
+        release.set()
+        self.assertTrue(worker.drain(timeout=5))
+        self.assertEqual(sorted(finished), [1, 2])
+
+    def test_memory_store_summary_update_patches_all_doc_chunks(self):
+        store = VectorStore.__new__(VectorStore)
+        store.client = None
+        store.memory_mode = True
+        store.index_generation = 0
+        store._connect = lambda: False
+        store._memory_docs = {
+            "1:0": {"doc_id": 1, "ai_title": "old", "ai_summary_short": "old"},
+            "1:1": {"doc_id": 1, "ai_title": "old", "ai_summary_short": "old"},
+            "2:0": {"doc_id": 2, "ai_title": "keep", "ai_summary_short": "keep"},
+        }
+
+        store.update_document_summaries({1: ("new title", "new summary")})
+
+        self.assertEqual(store._memory_docs["1:1"]["ai_title"], "new title")
+        self.assertEqual(store._memory_docs["1:0"]["ai_summary_short"], "new summary")
+        self.assertEqual(store._memory_docs["2:0"]["ai_title"], "keep")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.core import vector_store as vector_store_module
+
+
+def _store():
+    with patch.object(vector_store_module, "Elasticsearch", None):
+        return vector_store_module.VectorStore()
+
+
+def _hit(doc_id: int, chunk_id: int, **extra) -> dict:
+    return {"_id": f"{doc_id}:{chunk_id}", "_score": 1.0, "_source": {"doc_id": doc_id, "chunk_id": chunk_id}, **extra}
+
+
+class CollapsedSearchTests(unittest.TestCase):
+    def test_es_legs_are_collapsed_on_doc_id_and_fused_per_document(self):
+        store = _store()
+        store.client = MagicMock()
+        keyword = [_hit(1, 4, highlight={"content": ["<em>x</em>"]}), _hit(2, 0)]
+        vector = [_hit(1, 7), _hit(3, 1), _hit(2, 5)]
+        store.client.search.side_effect = [{"hits": {"hits": keyword}}, {"hits": {"hits": vector}}]
+
+        with patch.object(store, "_ensure_client", return_value=True), patch.object(
+            vector_store_module, "ES_SEARCH_COLLAPSE", True
+        ), patch.object(vector_store_module, "HYBRID_REQUIRE_KEYWORD_MATCH", True):
+            hits = store.search("calibration", [0.1, 0.2], top_k=5)["hits"]["hits"]
+
+        bodies = [call.kwargs["body"] for call in store.client.search.call_args_list]
+        self.assertEqual([body["collapse"]["field"] for body in bodies], ["doc_id", "doc_id"])
+        # Doc 3 has no keyword match; doc 1's chunks from both legs fuse into one result
+        # that keeps the keyword chunk and its highlight.
+        self.assertEqual([hit["_id"] for hit in hits], ["1:4", "2:0"])
+        self.assertIn("highlight", hits[0])
+        self.assertGreater(hits[0]["_score"], hits[1]["_score"])
+
+    def test_failed_collapsed_search_falls_back_to_chunk_search(self):
+        store = _store()
+        store.client = MagicMock()
+        store.client.search.side_effect = [
+            RuntimeError("collapse unsupported"),
+            {"hits": {"hits": [_hit(1, 0), _hit(1, 1), _hit(2, 0)]}},
+            {"hits": {"hits": []}},
+        ]
+        with patch.object(store, "_ensure_client", return_value=True), patch.object(
+            vector_store_module, "ES_SEARCH_COLLAPSE", True
+        ):
+            hits = store.search("calibration", [0.1], top_k=5)["hits"]["hits"]
+
+        self.assertEqual([hit["_source"]["doc_id"] for hit in hits], [1, 2])
+        self.assertNotIn("collapse", store.client.search.call_args_list[1].kwargs["body"])
+
+
+if __name__ == "__main__":
+    unittest.main()